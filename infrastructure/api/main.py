@@ -7,15 +7,19 @@ Coordinates:
 - Ollama for URL ranking and PDF triage
 - File management for PDF storage
 - Learning loop pattern updates
+
+Operational metrics (Crawlee/Ollama latency, fallbacks, capture and triage
+outcomes, acquisitions in flight) are served at /metrics for Prometheus.
 """
 
 import logging
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
 
-from infrastructure.api.routes import acquire, triage, patterns
+from infrastructure.api.routes import acquire, triage, patterns, districts
 
 # Configure logging
 logging.basicConfig(
@@ -53,6 +57,7 @@ app.add_middleware(
 app.include_router(acquire.router, prefix="/acquire", tags=["acquisition"])
 app.include_router(triage.router, prefix="/triage", tags=["triage"])
 app.include_router(patterns.router, prefix="/patterns", tags=["patterns"])
+app.include_router(districts.router, prefix="/districts", tags=["districts"])
 
 
 @app.get("/")
@@ -67,6 +72,10 @@ async def root():
             "POST /triage/pdf": "Score a PDF for bell schedule content",
             "POST /patterns/learn": "Update learning patterns from feedback",
             "GET /patterns": "Get current learning patterns",
+            "GET /districts/{district_id}": "Look up a district in the enrichment reference",
+            "GET /districts?name=&state=": "Search districts by name and/or state",
+            "GET /districts/stats": "Enrichment statistics by state",
+            "GET /metrics": "Prometheus metrics",
         },
         "documentation": "/docs",
     }
@@ -78,6 +87,12 @@ async def health():
     return {"status": "healthy"}
 
 
+@app.get("/metrics")
+async def metrics():
+    """Prometheus text-format metrics."""
+    return Response(content=generate_latest(), media_type=CONTENT_TYPE_LATEST)
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
@@ -0,0 +1,54 @@
+"""
+Prometheus metrics for the acquisition API.
+
+Counters, gauges and histograms from prometheus_client, registered in its
+default registry and served in the text exposition format by GET /metrics
+(see main.py).
+
+Metrics live for the life of the process, like the rest of the API's
+in-memory state; Prometheus handles restarts through counter resets.
+
+Usage:
+    from infrastructure.api.metrics import OLLAMA_CALL_SECONDS
+
+    with OLLAMA_CALL_SECONDS.labels(model="phi3:mini", prompt="url_ranking").time():
+        response = ollama.chat(...)
+"""
+
+from prometheus_client import Counter, Gauge, Histogram
+
+
+# =============================================================================
+# ACQUISITION METRICS
+# =============================================================================
+
+ACQUISITIONS_IN_FLIGHT = Gauge(
+    "acquisitions_in_flight", "District acquisitions currently running")
+
+ACQUISITIONS = Counter(
+    "acquisitions", "Finished district acquisitions by final status", ["status"])
+
+CRAWLEE_MAP_SECONDS = Histogram(
+    "crawlee_map_duration_seconds", "Wall time of Crawlee website mapping requests", ["outcome"],
+    buckets=(1, 5, 10, 30, 60, 120, 180, 300, 600))
+
+CRAWLEE_PAGES_VISITED = Histogram(
+    "crawlee_pages_visited", "Pages visited per successful Crawlee mapping",
+    buckets=(1, 5, 10, 25, 50, 100, 200, 500))
+
+OLLAMA_CALL_SECONDS = Histogram(
+    "ollama_call_duration_seconds", "Latency of Ollama chat calls", ["model", "prompt"],
+    buckets=(0.25, 0.5, 1, 2.5, 5, 10, 20, 30, 60, 120))
+
+HEURISTIC_FALLBACKS = Counter(
+    "heuristic_fallbacks",
+    "Ollama tasks answered by the heuristic fallback (reason: unavailable, invalid_response, error)",
+    ["prompt", "reason"])
+
+PDF_CAPTURES = Counter(
+    "pdf_captures", "PDF capture attempts by method (google_drive, direct, crawlee) and outcome",
+    ["method", "outcome"])
+
+TRIAGE_OUTCOMES = Counter(
+    "pdf_triage_outcomes", "PDF triage results (active, quarantine, rejected) by entry point",
+    ["outcome", "source"])
@@ -1,5 +1,5 @@
 """API routes for bell schedule acquisition."""
 
-from infrastructure.api.routes import acquire, triage, patterns
+from infrastructure.api.routes import acquire, triage, patterns, districts
 
-__all__ = ["acquire", "triage", "patterns"]
+__all__ = ["acquire", "triage", "patterns", "districts"]
@@ -16,6 +16,7 @@ import requests
 from fastapi import APIRouter, HTTPException, BackgroundTasks
 from pydantic import BaseModel
 
+from infrastructure.api.metrics import ACQUISITIONS, ACQUISITIONS_IN_FLIGHT, PDF_CAPTURES, TRIAGE_OUTCOMES
 from infrastructure.api.services.crawlee_client import CrawleeClient, PageData
 from infrastructure.api.services.ollama_service import OllamaService
 from infrastructure.api.services.patterns_service import (
@@ -172,6 +173,7 @@ async def _handle_special_urls(
             output_path = output_dir / f"{filename_base}_gdrive.pdf"
 
             success, pdf_bytes, method = gdrive_handler.acquire_pdf(url, output_path)
+            PDF_CAPTURES.labels(method="google_drive", outcome="success" if success else "failure").inc()
 
             if success:
                 results.append({
@@ -201,6 +203,7 @@ async def _handle_special_urls(
             output_path = output_dir / f"{filename_base}_{safe_filename}.pdf"
 
             success, error = _download_direct_pdf(url, output_path)
+            PDF_CAPTURES.labels(method="direct", outcome="success" if success else "failure").inc()
 
             if success:
                 results.append({
@@ -243,6 +246,7 @@ async def _run_acquisition(request: AcquireRequest):
     crawlee = CrawleeClient()
     ollama_svc = OllamaService()
     output_dir = _get_output_dir(request.state, request.district_id, request.district_name)
+    ACQUISITIONS_IN_FLIGHT.inc()
 
     try:
         # Step 1: Check Crawlee health
@@ -326,8 +330,12 @@ async def _run_acquisition(request: AcquireRequest):
                 output_dir=str(output_dir),
             )
 
+            if capture_result.error:
+                PDF_CAPTURES.labels(method="crawlee", outcome="failure").inc(len(remaining_urls))
+
             # Convert Crawlee results to our format
             for result in capture_result.results:
+                PDF_CAPTURES.labels(method="crawlee", outcome="success" if result.success else "failure").inc()
                 all_capture_results.append({
                     "url": result.url,
                     "success": result.success,
@@ -365,11 +373,13 @@ async def _run_acquisition(request: AcquireRequest):
 
             # Move to appropriate directory
             if triage.score >= 0.7:
-                dest_dir = output_dir / "active"
+                triage_status = "active"
             elif triage.score >= 0.3:
-                dest_dir = output_dir / "quarantine"
+                triage_status = "quarantine"
             else:
-                dest_dir = output_dir / "rejected"
+                triage_status = "rejected"
+            TRIAGE_OUTCOMES.labels(outcome=triage_status, source="acquisition").inc()
+            dest_dir = output_dir / triage_status
 
             # Move PDF and text file
             new_pdf_path = dest_dir / pdf_path.name
@@ -383,7 +393,7 @@ async def _run_acquisition(request: AcquireRequest):
                 "method": result.get("method", "unknown"),
                 "score": triage.score,
                 "reason": triage.reason,
-                "status": "active" if triage.score >= 0.7 else "quarantine" if triage.score >= 0.3 else "rejected",
+                "status": triage_status,
             })
 
         # Step 6: Save metadata
@@ -450,6 +460,8 @@ async def _run_acquisition(request: AcquireRequest):
         }
 
     finally:
+        ACQUISITIONS_IN_FLIGHT.dec()
+        ACQUISITIONS.labels(status=_acquisition_status[district_id]["status"]).inc()
         await crawlee.close()
 
 
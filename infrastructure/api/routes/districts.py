@@ -0,0 +1,73 @@
+"""
+District Lookup Routes
+
+Long-lived lookups over the enrichment reference, so interactive enrichment
+sessions can query districts without reloading the CSV each time. The
+reference is loaded once per process and reloaded only when the CSV changes.
+"""
+
+import json
+import logging
+from typing import Any, Dict, List, Optional
+
+import pandas as pd
+from fastapi import APIRouter, HTTPException
+
+from infrastructure.utilities.district_reference import REFERENCE_CSV, get_reference
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+
+def _reference():
+    try:
+        return get_reference(REFERENCE_CSV)
+    except FileNotFoundError:
+        raise HTTPException(status_code=503, detail=f"Reference file not found: {REFERENCE_CSV}")
+
+
+def _records(df: pd.DataFrame) -> List[Dict[str, Any]]:
+    """JSON-safe records (numpy scalars and NaN converted)."""
+    return json.loads(df.to_json(orient="records"))
+
+
+@router.get("/stats")
+async def state_stats(state: Optional[str] = None):
+    """Enrichment statistics by state."""
+    stats = _reference().state_stats()
+    if state:
+        stats = stats[stats.index == state.upper()]
+    return _records(stats.reset_index())
+
+
+@router.get("")
+async def search(
+    name: Optional[str] = None,
+    state: Optional[str] = None,
+    limit: int = 10,
+):
+    """
+    Search districts by name (ranked trigram match) and/or state.
+
+    Without a name, returns the largest districts in the state.
+    """
+    ref = _reference()
+
+    if name:
+        candidates = ref.name_index.match(name, state, limit=limit)
+        result = ref.lookup(c.district_id for c in candidates)
+        return _records(result.assign(match_score=[c.score for c in candidates]))
+
+    if not state:
+        raise HTTPException(status_code=400, detail="Provide a name and/or state")
+    return _records(ref.for_state(state).nlargest(limit, "enrollment_total"))
+
+
+@router.get("/{district_id}")
+async def get_district(district_id: str):
+    """Look up one district by ID (leading zeros optional)."""
+    row = _reference().lookup([district_id])
+    if row.empty:
+        raise HTTPException(status_code=404, detail=f"District {district_id} not found")
+    return _records(row)[0]
@@ -11,6 +11,7 @@ from typing import Optional
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 
+from infrastructure.api.metrics import TRIAGE_OUTCOMES
 from infrastructure.api.services.ollama_service import OllamaService
 
 logger = logging.getLogger(__name__)
@@ -50,11 +51,12 @@ async def triage_pdf(request: TriageRequest):
 
     # Determine recommendation based on score
     if result.score >= 0.7:
-        recommendation = "active - likely contains bell schedule"
+        outcome, recommendation = "active", "active - likely contains bell schedule"
     elif result.score >= 0.3:
-        recommendation = "quarantine - review manually"
+        outcome, recommendation = "quarantine", "quarantine - review manually"
     else:
-        recommendation = "rejected - unlikely to contain bell schedule"
+        outcome, recommendation = "rejected", "rejected - unlikely to contain bell schedule"
+    TRIAGE_OUTCOMES.labels(outcome=outcome, source="triage_api").inc()
 
     return TriageResponse(
         score=result.score,
@@ -5,11 +5,14 @@ HTTP client for communicating with the Crawlee scraper service.
 """
 
 import logging
+import time
 from typing import Optional, List, Dict, Any
 from dataclasses import dataclass
 
 import httpx
 
+from infrastructure.api.metrics import CRAWLEE_MAP_SECONDS, CRAWLEE_PAGES_VISITED
+
 logger = logging.getLogger(__name__)
 
 # Default Crawlee service URL
@@ -132,6 +135,9 @@ class CrawleeClient:
         """
         Map a website using Crawlee.
 
+        Records the request's wall time and, on success, the pages visited
+        (infrastructure.api.metrics).
+
         Args:
             url: Website URL to map
             max_requests: Maximum pages to crawl
@@ -142,6 +148,24 @@ class CrawleeClient:
         Returns:
             MapResult with pages and statistics
         """
+        start = time.perf_counter()
+        result = await self._map_website(url, max_requests, max_depth, include_globs, exclude_globs)
+        CRAWLEE_MAP_SECONDS.labels(outcome="success" if result.success else "failure").observe(
+            time.perf_counter() - start
+        )
+        if result.success:
+            CRAWLEE_PAGES_VISITED.observe(result.pages_visited)
+        return result
+
+    async def _map_website(
+        self,
+        url: str,
+        max_requests: int,
+        max_depth: int,
+        include_globs: Optional[List[str]],
+        exclude_globs: Optional[List[str]],
+    ) -> MapResult:
+        """POST /map and convert the response (errors become a failed MapResult)."""
         client = await self._get_client()
 
         payload = {
@@ -15,6 +15,8 @@ from dataclasses import dataclass
 
 import yaml
 
+from infrastructure.api.metrics import HEURISTIC_FALLBACKS, OLLAMA_CALL_SECONDS
+
 try:
     import ollama
     OLLAMA_AVAILABLE = True
@@ -188,6 +190,7 @@ Return JSON: {{"score": 0.X, "reason": "...", "times_found": [...]}}"""
         """
         if not OLLAMA_AVAILABLE:
             logger.error("Ollama not available, returning heuristic scores")
+            HEURISTIC_FALLBACKS.labels(prompt="url_ranking", reason="unavailable").inc()
             return self._heuristic_url_ranking(pages)
 
         prompt_config = self._load_prompt("url_ranking")
@@ -200,24 +203,28 @@ Return JSON: {{"score": 0.X, "reason": "...", "times_found": [...]}}"""
 
         logger.info(f"Ranking {len(pages)} URLs for {district_name}")
 
+        model = prompt_config.get("model", self.url_ranking_model)
+
         try:
-            response = ollama.chat(
-                model=prompt_config.get("model", self.url_ranking_model),
-                messages=[
-                    {"role": "system", "content": prompt_config.get("system", "")},
-                    {"role": "user", "content": prompt},
-                ],
-                options={
-                    "temperature": prompt_config.get("temperature", 0.1),
-                    "num_predict": prompt_config.get("max_tokens", 500),
-                },
-            )
+            with OLLAMA_CALL_SECONDS.labels(model=model, prompt="url_ranking").time():
+                response = ollama.chat(
+                    model=model,
+                    messages=[
+                        {"role": "system", "content": prompt_config.get("system", "")},
+                        {"role": "user", "content": prompt},
+                    ],
+                    options={
+                        "temperature": prompt_config.get("temperature", 0.1),
+                        "num_predict": prompt_config.get("max_tokens", 500),
+                    },
+                )
 
             content = response.get("message", {}).get("content", "")
             scores_data = self._extract_json_from_response(content)
 
             if not scores_data or not isinstance(scores_data, list):
                 logger.warning("Invalid response format, using heuristic scores")
+                HEURISTIC_FALLBACKS.labels(prompt="url_ranking", reason="invalid_response").inc()
                 return self._heuristic_url_ranking(pages)
 
             scores = []
@@ -234,6 +241,7 @@ Return JSON: {{"score": 0.X, "reason": "...", "times_found": [...]}}"""
 
         except Exception as e:
             logger.error(f"Ollama URL ranking failed: {e}")
+            HEURISTIC_FALLBACKS.labels(prompt="url_ranking", reason="error").inc()
             return self._heuristic_url_ranking(pages)
 
     def _heuristic_url_ranking(self, pages: List[Dict[str, Any]]) -> List[URLScore]:
@@ -309,6 +317,7 @@ Return JSON: {{"score": 0.X, "reason": "...", "times_found": [...]}}"""
         """
         if not OLLAMA_AVAILABLE:
             logger.error("Ollama not available, returning heuristic triage")
+            HEURISTIC_FALLBACKS.labels(prompt="pdf_triage", reason="unavailable").inc()
             return self._heuristic_pdf_triage(pdf_text)
 
         prompt_config = self._load_prompt("pdf_triage")
@@ -322,24 +331,28 @@ Return JSON: {{"score": 0.X, "reason": "...", "times_found": [...]}}"""
 
         logger.info(f"Triaging PDF ({len(pdf_text)} chars)")
 
+        model = prompt_config.get("model", self.pdf_triage_model)
+
         try:
-            response = ollama.chat(
-                model=prompt_config.get("model", self.pdf_triage_model),
-                messages=[
-                    {"role": "system", "content": prompt_config.get("system", "")},
-                    {"role": "user", "content": prompt},
-                ],
-                options={
-                    "temperature": prompt_config.get("temperature", 0.1),
-                    "num_predict": prompt_config.get("max_tokens", 300),
-                },
-            )
+            with OLLAMA_CALL_SECONDS.labels(model=model, prompt="pdf_triage").time():
+                response = ollama.chat(
+                    model=model,
+                    messages=[
+                        {"role": "system", "content": prompt_config.get("system", "")},
+                        {"role": "user", "content": prompt},
+                    ],
+                    options={
+                        "temperature": prompt_config.get("temperature", 0.1),
+                        "num_predict": prompt_config.get("max_tokens", 300),
+                    },
+                )
 
             content = response.get("message", {}).get("content", "")
             result_data = self._extract_json_from_response(content)
 
             if not result_data or not isinstance(result_data, dict):
                 logger.warning("Invalid response format, using heuristic triage")
+                HEURISTIC_FALLBACKS.labels(prompt="pdf_triage", reason="invalid_response").inc()
                 return self._heuristic_pdf_triage(pdf_text)
 
             score = float(result_data.get("score", 0))
@@ -352,6 +365,7 @@ Return JSON: {{"score": 0.X, "reason": "...", "times_found": [...]}}"""
 
         except Exception as e:
             logger.error(f"Ollama PDF triage failed: {e}")
+            HEURISTIC_FALLBACKS.labels(prompt="pdf_triage", reason="error").inc()
             return self._heuristic_pdf_triage(pdf_text)
 
     def _heuristic_pdf_triage(self, pdf_text: str) -> PDFTriageResult:
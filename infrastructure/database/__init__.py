@@ -3,17 +3,25 @@
 Database module for Learning Connection Time project.
 
 Provides SQLAlchemy models, connection management, and database utilities.
+
+The names below are resolved on first access so that importing a submodule
+(e.g. infrastructure.database.connection) doesn't also build every ORM model.
 """
 
-from .connection import get_engine, get_session, init_db
-from .models import (
-    Base,
-    District,
-    StateRequirement,
-    BellSchedule,
-    LCTCalculation,
-    DataLineage,
-)
+import importlib
+
+_EXPORTS = {
+    "get_engine": ".connection",
+    "get_session": ".connection",
+    "init_db": ".connection",
+    "Base": ".models",
+    "District": ".models",
+    "StateRequirement": ".models",
+    "BellSchedule": ".models",
+    "LCTCalculation": ".models",
+    "DataLineage": ".models",
+    "LineageBatch": ".models",
+}
 
 __all__ = [
     "get_engine",
@@ -25,4 +33,13 @@ __all__ = [
     "BellSchedule",
     "LCTCalculation",
     "DataLineage",
+    "LineageBatch",
 ]
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,209 @@
+"""
+Columnar reads from PostgreSQL into pandas.
+
+read_frame() runs a SQLAlchemy Core select and returns only the selected
+columns as a DataFrame. On PostgreSQL (psycopg2) the query is streamed with
+`COPY (...) TO STDOUT` as CSV and parsed by pyarrow straight into typed
+columns. NUMERIC columns arrive as float64 arrays and integers as Int64,
+with no ORM objects and no per-value Decimal -> float conversion. Other
+databases (SQLite in tests) fall back to a regular execute.
+
+Column dtypes come from the statement's column types:
+    Numeric/Float -> float64    Integer -> Int64 (nullable)
+    Boolean       -> boolean    anything else -> str
+
+Raw text queries declare their columns with TextClause.columns():
+
+    stmt = text("SELECT nces_id, SUM(fte) FROM ny_staff_data GROUP BY nces_id").columns(
+        column("district_id", String), column("teachers", Float))
+
+Usage:
+    from infrastructure.database.columnar import read_frame, iter_records
+
+    staff = read_frame(session, select(
+        StaffCountsEffective.district_id,
+        StaffCountsEffective.scope_teachers_only,
+    ))
+
+    # Row-wise code: namedtuples with None for missing values
+    for row in iter_records(staff):
+        ...
+
+    # Most recent row per district
+    enrollment = read_latest(session, select(...), EnrollmentByGrade.district_id,
+                             EnrollmentByGrade.source_year.desc())
+
+COPY goes through a raw psycopg2 cursor, so these reads are not counted by
+query_tracking.
+"""
+
+import io
+from typing import Dict, Iterator, List, Tuple
+
+import pandas as pd
+from sqlalchemy import Boolean, Integer, Numeric, func, select
+from sqlalchemy.orm import Session
+
+# Optional: Arrow CSV parser (falls back to pandas' C parser)
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# NULL marker for COPY output, so NULL and '' stay distinct
+COPY_NULL = "\\N"
+
+
+def column_dtypes(statement) -> Tuple[List[str], Dict[str, str]]:
+    """
+    Output column names and pandas dtypes for a select.
+
+    Args:
+        statement: Select, or TextClause.columns(...)
+
+    Returns:
+        Tuple of (column names in select order, name -> dtype)
+    """
+    names, dtypes = [], {}
+    for name, col in statement.selected_columns.items():
+        sql_type = col.type
+        if isinstance(sql_type, Boolean):
+            dtype = "boolean"
+        elif isinstance(sql_type, Integer):
+            dtype = "Int64"
+        elif isinstance(sql_type, Numeric):
+            dtype = "float64"
+        else:
+            dtype = "str"
+        names.append(name)
+        dtypes[name] = dtype
+    return names, dtypes
+
+
+def parse_copy_csv(buffer, names: List[str], dtypes: Dict[str, str]) -> pd.DataFrame:
+    """
+    Parse `COPY ... TO STDOUT WITH (FORMAT csv, HEADER true, NULL '\\N')` output.
+
+    Args:
+        buffer: Binary file object positioned at the header row
+        names: Column names (replace the header, which may be unnamed)
+        dtypes: name -> pandas dtype from column_dtypes()
+
+    Returns:
+        DataFrame with the requested dtypes
+    """
+    if PYARROW_AVAILABLE:
+        arrow_types = {"boolean": pa.bool_(), "Int64": pa.int64(), "float64": pa.float64(), "str": pa.string()}
+        table = pa_csv.read_csv(
+            buffer,
+            read_options=pa_csv.ReadOptions(column_names=names, skip_rows=1),
+            convert_options=pa_csv.ConvertOptions(
+                column_types={name: arrow_types[dtype] for name, dtype in dtypes.items()},
+                null_values=[COPY_NULL],
+                strings_can_be_null=True,
+                true_values=["t"],
+                false_values=["f"],
+            ),
+        )
+        return table.to_pandas(types_mapper={
+            pa.int64(): pd.Int64Dtype(),
+            pa.bool_(): pd.BooleanDtype(),
+        }.get)
+
+    return pd.read_csv(
+        buffer,
+        header=0,
+        names=names,
+        dtype=dtypes,
+        na_values=[COPY_NULL],
+        keep_default_na=False,
+        true_values=["t"],
+        false_values=["f"],
+    )
+
+
+def read_frame(session, statement) -> pd.DataFrame:
+    """
+    Run a select and return its columns as a typed DataFrame.
+
+    Args:
+        session: Session or Connection
+        statement: Select, or TextClause.columns(...) with bound parameters
+
+    Returns:
+        DataFrame with one column per selected column (see module docstring
+        for dtypes), in result order
+    """
+    connection = session.connection() if isinstance(session, Session) else session
+    names, dtypes = column_dtypes(statement)
+
+    if connection.dialect.name == "postgresql" and connection.dialect.driver == "psycopg2":
+        # copy_expert() takes no parameters: let psycopg2 interpolate them
+        # (and undo the compiler's %% escaping) with mogrify()
+        compiled = statement.compile(dialect=connection.dialect, compile_kwargs={"render_postcompile": True})
+        buffer = io.BytesIO()
+        cursor = connection.connection.cursor()
+        try:
+            sql = cursor.mogrify(
+                f"COPY ({compiled}) TO STDOUT WITH (FORMAT csv, HEADER true, NULL '{COPY_NULL}')",
+                compiled.params,
+            )
+            cursor.copy_expert(sql, buffer)
+        finally:
+            cursor.close()
+        buffer.seek(0)
+        return parse_copy_csv(buffer, names, dtypes)
+
+    rows = connection.execute(statement).all()
+    frame = pd.DataFrame(rows, columns=names)
+    for name, dtype in dtypes.items():
+        values = frame[name]
+        if dtype == "str":
+            # astype(str) alone turns None into 'None' on pandas 2.x
+            frame[name] = values.where(values.isna(), values.astype(str))
+        else:
+            frame[name] = values.astype(dtype)
+    return frame
+
+
+def read_latest(session, statement, key, *order) -> pd.DataFrame:
+    """
+    Read one row per key: the first by `order` (e.g. most recent year).
+
+    On PostgreSQL this is `SELECT DISTINCT ON (key) ... ORDER BY key, <order>`,
+    which an index on (key, year DESC) answers in index order without a
+    GROUP BY/self-join. Other databases use ROW_NUMBER() over key.
+
+    Args:
+        session: Session or Connection
+        statement: Select of the columns to return
+        key: Column identifying the group (e.g. district_id); must be selected
+        *order: ORDER BY expressions within a group; the first row is kept
+
+    Returns:
+        DataFrame as from read_frame(), one row per key, ordered by key
+    """
+    connection = session.connection() if isinstance(session, Session) else session
+
+    if connection.dialect.name == "postgresql":
+        return read_frame(connection, statement.distinct(key).order_by(key, *order))
+
+    rank = func.row_number().over(partition_by=key, order_by=order).label("latest_rank")
+    ranked = statement.add_columns(rank).subquery()
+    names = list(statement.selected_columns.keys())
+    return read_frame(connection, select(*(ranked.c[name] for name in names))
+                      .where(ranked.c.latest_rank == 1)
+                      .order_by(ranked.c[key.key]))
+
+
+def iter_records(frame: pd.DataFrame, name: str = "Record") -> Iterator[tuple]:
+    """
+    Rows as namedtuples of plain Python values, with None for missing.
+
+    For row-wise code written against ORM objects: attribute access and
+    `value or 0` / `if value:` checks behave the same.
+    """
+    values = frame.astype(object).where(frame.notna(), None)
+    return values.itertuples(index=False, name=name)
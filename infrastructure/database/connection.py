@@ -6,6 +6,10 @@ Provides connection pooling, session management, and initialization utilities.
 Uses Docker PostgreSQL (not Homebrew) - see .env for credentials.
 
 IMPORTANT: Run `docker-compose up -d` before database operations.
+
+The Docker container check shells out to `docker ps`, so it only runs the
+first time a connection fails (to explain the failure). Set
+LCT_CHECK_DOCKER=1 to run it up front when the engine is created.
 """
 
 import os
@@ -14,7 +18,7 @@ import sys
 from contextlib import contextmanager
 from typing import Generator, Optional
 
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, event, text
 from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session, sessionmaker
 
@@ -79,9 +83,23 @@ def _check_docker_postgres() -> None:
         pass  # Don't fail on check errors
 
 
-# Run Docker check on module import (only once)
+# Docker check runs at most once per process
 _docker_check_done = False
 
+
+def _run_docker_check_once() -> None:
+    global _docker_check_done
+    if not _docker_check_done:
+        _docker_check_done = True
+        _check_docker_postgres()
+
+
+def _on_connection_error(context) -> None:
+    """Engine error hook: explain a failed connect with the Docker check."""
+    # context.connection is None when the DBAPI connect itself failed
+    if context.connection is None:
+        _run_docker_check_once()
+
 # Default connection parameters
 DEFAULT_HOST = "localhost"
 DEFAULT_PORT = "5432"
@@ -144,12 +162,11 @@ def get_engine(database_url: Optional[str] = None, echo: bool = False) -> Engine
     Returns:
         SQLAlchemy Engine instance
     """
-    global _engine, _docker_check_done
+    global _engine
 
-    # Check Docker on first connection attempt
-    if not _docker_check_done:
-        _docker_check_done = True
-        _check_docker_postgres()
+    # Docker check is deferred to the first failed connection unless requested
+    if os.getenv("LCT_CHECK_DOCKER") == "1":
+        _run_docker_check_once()
 
     if _engine is None or database_url is not None:
         url = database_url or get_database_url()
@@ -161,6 +178,7 @@ def get_engine(database_url: Optional[str] = None, echo: bool = False) -> Engine
             pool_timeout=30,  # Seconds to wait for available connection
             pool_recycle=1800,  # Recycle connections after 30 minutes
         )
+        event.listen(_engine, "handle_error", _on_connection_error)
 
     return _engine
 
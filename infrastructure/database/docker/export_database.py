@@ -1,118 +1,295 @@
 #!/usr/bin/env python3
 """
-Export current database to SQL dump for Docker migration.
+Export the database with COPY for Docker migration.
 
-This script exports the current Homebrew PostgreSQL database to a SQL file
-that can be imported into the Docker container.
+Every table defined in models.py is streamed out with
+COPY ... TO STDOUT (binary by default, or CSV for moving between PostgreSQL
+major versions), gzip-compressed into its own file. A manifest.json records
+each table's columns, row count, SHA-256 of the compressed file and the
+tables it references, which import_to_docker.py uses to verify the files and
+load them in foreign-key order.
+
+Tables are exported in parallel from one shared snapshot
+(pg_export_snapshot), so the export is consistent across tables like
+pg_dump -j.
+
+Usage:
+    # Export the configured database (DATABASE_URL / POSTGRES_* env vars)
+    python3 infrastructure/database/docker/export_database.py
+
+    # Export another host, CSV format, 8 workers
+    python3 infrastructure/database/docker/export_database.py \\
+        --source-url postgresql://user@oldhost:5432/learning_connection_time \\
+        --format csv --workers 8
 """
 
+import argparse
+import gzip
+import hashlib
+import json
+import logging
 import sys
-from pathlib import Path
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
 
 # Add project root to path
 PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
-from infrastructure.database.connection import get_engine
-from sqlalchemy import text, create_engine as create_engine_direct
+from sqlalchemy import create_engine
+
+logger = logging.getLogger(__name__)
+
+BACKUP_DIR = Path(__file__).parent / "backup"
+MANIFEST_NAME = "manifest.json"
+FORMATS = ("binary", "csv")
+
+
+class HashingWriter:
+    """File wrapper that hashes and counts bytes as they are written."""
+
+    def __init__(self, raw):
+        self.raw = raw
+        self.digest = hashlib.sha256()
+        self.bytes_written = 0
+
+    def write(self, data: bytes) -> int:
+        self.digest.update(data)
+        self.bytes_written += len(data)
+        return self.raw.write(data)
+
+    def flush(self):
+        self.raw.flush()
+
+
+def file_sha256(path: Path) -> str:
+    """SHA-256 hex digest of a file, read in 8 MB blocks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(8 * 1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def copy_options(fmt: str) -> str:
+    """WITH (...) options shared by COPY TO and COPY FROM."""
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown COPY format: {fmt}")
+    return "FORMAT binary" if fmt == "binary" else "FORMAT csv, HEADER false"
+
+
+def model_tables() -> List[Dict]:
+    """
+    Tables from models.py in foreign-key order.
+
+    Returns:
+        [{'name': ..., 'after': [referenced tables]}]
+    """
+    from infrastructure.database.models import Base
+
+    tables = []
+    for table in Base.metadata.sorted_tables:
+        after = sorted({
+            fk.column.table.name for fk in table.foreign_keys
+            if fk.column.table.name != table.name
+        })
+        tables.append({"name": table.name, "after": after})
+    return tables
+
+
+def load_waves(tables: List[Dict]) -> List[List[str]]:
+    """
+    Group tables into waves that can load concurrently.
+
+    A table lands in the wave after the last table it references, so
+    foreign keys are always satisfied. References to tables outside the
+    list are ignored.
+
+    Raises:
+        ValueError: On a reference cycle
+    """
+    names = {t["name"] for t in tables}
+    pending = {t["name"]: set(t.get("after", [])) & names for t in tables}
+    waves = []
+    done = set()
+    while pending:
+        ready = sorted(name for name, after in pending.items() if after <= done)
+        if not ready:
+            raise ValueError(f"Reference cycle among tables: {sorted(pending)}")
+        waves.append(ready)
+        done.update(ready)
+        for name in ready:
+            del pending[name]
+    return waves
+
 
+def read_manifest(export_dir: Path) -> Dict:
+    """Load an export's manifest.json."""
+    with open(export_dir / MANIFEST_NAME) as f:
+        return json.load(f)
 
-def export_database():
-    """Export database using Python instead of pg_dump."""
 
+def existing_columns(cursor, table: str) -> List[str]:
+    """Column names of a public table in ordinal order (empty if missing)."""
+    cursor.execute(
+        """
+        SELECT column_name FROM information_schema.columns
+        WHERE table_schema = 'public' AND table_name = %s
+        ORDER BY ordinal_position
+        """,
+        (table,),
+    )
+    return [row[0] for row in cursor.fetchall()]
+
+
+def export_table(engine, snapshot: str, table: Dict, export_dir: Path, fmt: str, compress_level: int) -> Dict:
+    """
+    COPY one table to a gzip file inside the shared snapshot.
+
+    Returns:
+        Manifest entry for the table, or None if it doesn't exist in the source
+    """
+    start = time.perf_counter()
+    name = table["name"]
+    conn = engine.raw_connection()
+    try:
+        conn.set_session(isolation_level="REPEATABLE READ", readonly=True)
+        cursor = conn.cursor()
+        cursor.execute("SET TRANSACTION SNAPSHOT %s", (snapshot,))
+
+        columns = existing_columns(cursor, name)
+        if not columns:
+            logger.warning(f"  {name}: not in source database, skipped")
+            return None
+
+        path = export_dir / f"{name}.copy.gz"
+        column_list = ", ".join(f'"{c}"' for c in columns)
+        with open(path, "wb") as raw:
+            hashed = HashingWriter(raw)
+            with gzip.GzipFile(fileobj=hashed, mode="wb", compresslevel=compress_level, mtime=0) as gz:
+                cursor.copy_expert(f"COPY {name} ({column_list}) TO STDOUT WITH ({copy_options(fmt)})", gz)
+        rows = cursor.rowcount
+        conn.rollback()
+    finally:
+        conn.close()
+
+    elapsed = time.perf_counter() - start
+    logger.info(f"  {name}: {rows:,} rows, {hashed.bytes_written / 1024:.1f} KB ({elapsed:.1f}s)")
+    return {
+        "name": name,
+        "file": path.name,
+        "columns": columns,
+        "rows": rows,
+        "bytes": hashed.bytes_written,
+        "sha256": hashed.digest.hexdigest(),
+        "after": table["after"],
+    }
+
+
+def export_database(
+    source_url: Optional[str] = None,
+    output_dir: Optional[Path] = None,
+    fmt: str = "binary",
+    workers: int = 4,
+    compress_level: int = 1,
+    tables: Optional[List[str]] = None,
+) -> Path:
+    """
+    Export every model table with COPY into a timestamped directory.
+
+    Args:
+        source_url: Database to export (default: configured database)
+        output_dir: Export directory (default: backup/learning_connection_time_<timestamp>)
+        fmt: 'binary' (fastest, same PostgreSQL major) or 'csv' (portable)
+        workers: Tables exported concurrently
+        compress_level: gzip level (1 = fastest)
+        tables: Restrict to these tables
+
+    Returns:
+        Export directory containing per-table files and manifest.json
+    """
+    from infrastructure.database.connection import get_database_url
+
+    copy_options(fmt)
+    source_url = source_url or get_database_url()
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    backup_file = Path(__file__).parent / "backup" / f"learning_connection_time_{timestamp}.sql"
-
-    print(f"Exporting database to: {backup_file}")
-
-    # Connect directly to Homebrew PostgreSQL (no password, system user)
-    import os
-    user = os.getenv("USER", "postgres")
-    homebrew_url = f"postgresql://{user}@localhost:5432/learning_connection_time"
-
-    print(f"Connecting to Homebrew PostgreSQL as user: {user}")
-
-    engine = create_engine_direct(homebrew_url)
-
-    with open(backup_file, 'w') as f:
-        # Export schema and data using Python
-        with engine.connect() as conn:
-            # Get all table data
-            tables = ['state_requirements', 'districts', 'bell_schedules', 'lct_calculations', 'data_lineage']
-
-            f.write("-- Database export for Docker migration\n")
-            f.write(f"-- Exported: {datetime.now().isoformat()}\n")
-            f.write("-- Source: Homebrew PostgreSQL\n\n")
-
-            for table in tables:
-                print(f"Exporting table: {table}")
-
-                # Get row count
-                count_result = conn.execute(text(f"SELECT COUNT(*) FROM {table}"))
-                count = count_result.scalar()
-
-                if count == 0:
-                    print(f"  Skipping empty table: {table}")
-                    continue
-
-                print(f"  Rows: {count}")
-
-                # Export table data
-                f.write(f"-- Table: {table} ({count} rows)\n")
-
-                # Get column names
-                col_result = conn.execute(text(f"""
-                    SELECT column_name
-                    FROM information_schema.columns
-                    WHERE table_name = '{table}'
-                    ORDER BY ordinal_position
-                """))
-                columns = [row[0] for row in col_result]
-
-                # Export rows
-                result = conn.execute(text(f"SELECT * FROM {table}"))
-                for row in result:
-                    # Build INSERT statement
-                    values = []
-                    for val in row:
-                        if val is None:
-                            values.append("NULL")
-                        elif isinstance(val, str):
-                            # Escape single quotes
-                            escaped = val.replace("'", "''")
-                            values.append(f"'{escaped}'")
-                        elif isinstance(val, (int, float)):
-                            values.append(str(val))
-                        elif isinstance(val, dict):
-                            # JSONB columns
-                            import json
-                            escaped = json.dumps(val).replace("'", "''")
-                            values.append(f"'{escaped}'::jsonb")
-                        elif isinstance(val, list):
-                            # Array columns
-                            import json
-                            escaped = json.dumps(val).replace("'", "''")
-                            values.append(f"'{escaped}'::jsonb")
-                        else:
-                            values.append(f"'{str(val)}'")
-
-                    insert = f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join(values)});\n"
-                    f.write(insert)
-
-                f.write("\n")
-
-    print(f"\nExport complete: {backup_file}")
-    print(f"File size: {backup_file.stat().st_size / 1024:.1f} KB")
-
-    return backup_file
+    export_dir = Path(output_dir or BACKUP_DIR / f"learning_connection_time_{timestamp}")
+    export_dir.mkdir(parents=True, exist_ok=True)
 
+    selected = [t for t in model_tables() if not tables or t["name"] in tables]
+    engine = create_engine(source_url, pool_size=workers + 1, max_overflow=0)
+
+    logger.info(f"Exporting {len(selected)} tables to {export_dir} ({fmt}, {workers} workers)")
+    start = time.perf_counter()
+
+    # Hold one transaction open so every worker reads the same snapshot
+    coordinator = engine.raw_connection()
+    try:
+        coordinator.set_session(isolation_level="REPEATABLE READ", readonly=True)
+        cursor = coordinator.cursor()
+        cursor.execute("SELECT pg_export_snapshot(), version()")
+        snapshot, server_version = cursor.fetchone()
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            entries = list(pool.map(
+                lambda t: export_table(engine, snapshot, t, export_dir, fmt, compress_level),
+                selected,
+            ))
+        coordinator.rollback()
+    finally:
+        coordinator.close()
+        engine.dispose()
+
+    manifest = {
+        "created": datetime.now().isoformat(),
+        "format": fmt,
+        "server_version": server_version,
+        "tables": [e for e in entries if e is not None],
+    }
+    with open(export_dir / MANIFEST_NAME, "w") as f:
+        json.dump(manifest, f, indent=2)
+
+    total_rows = sum(t["rows"] for t in manifest["tables"])
+    total_bytes = sum(t["bytes"] for t in manifest["tables"])
+    logger.info(
+        f"Export complete: {len(manifest['tables'])} tables, {total_rows:,} rows, "
+        f"{total_bytes / 1024 / 1024:.1f} MB in {time.perf_counter() - start:.1f}s"
+    )
+    return export_dir
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Export the database with COPY for Docker migration",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__,
+    )
+    parser.add_argument("--source-url", help="Database URL to export (default: configured database)")
+    parser.add_argument("--output", type=Path, help="Export directory")
+    parser.add_argument("--format", choices=FORMATS, default="binary", help="COPY format (default: binary)")
+    parser.add_argument("--workers", type=int, default=4, help="Tables exported in parallel (default: 4)")
+    parser.add_argument("--compress-level", type=int, default=1, help="gzip level 1-9 (default: 1)")
+    parser.add_argument("--tables", nargs="+", help="Only export these tables")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 
-if __name__ == "__main__":
     try:
-        export_database()
+        export_database(
+            source_url=args.source_url,
+            output_dir=args.output,
+            fmt=args.format,
+            workers=args.workers,
+            compress_level=args.compress_level,
+            tables=args.tables,
+        )
     except Exception as e:
-        print(f"Export failed: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.error(f"Export failed: {e}", exc_info=True)
         sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,24 +1,64 @@
 #!/usr/bin/env python3
 """
-Import database backup into Docker PostgreSQL container.
+Import a COPY export into the Docker PostgreSQL container.
 
-This script imports the SQL dump from Homebrew PostgreSQL into the Docker container.
-Run this after starting the Docker container with `docker-compose up -d`.
+Loads an export written by export_database.py. Run this after starting the
+Docker container with `docker-compose up -d` (the schema must already exist).
+
+Steps:
+1. Verify every table file against the manifest's SHA-256
+2. Drop secondary indexes on the target tables (constraint indexes are kept)
+3. COPY ... FROM STDIN each table, in parallel within foreign-key waves,
+   checking the loaded row count against the manifest
+4. Rebuild the dropped indexes in parallel, reset serial sequences, ANALYZE
+
+Legacy .sql dumps (INSERT statements) are still replayed through psql.
+
+Usage:
+    # Newest export in backup/ into the configured database
+    python3 infrastructure/database/docker/import_to_docker.py
+
+    # Specific export, replacing existing rows
+    python3 infrastructure/database/docker/import_to_docker.py \\
+        backup/learning_connection_time_20260118_101500 --truncate
 """
 
-import sys
+import argparse
+import gzip
+import logging
 import subprocess
-from pathlib import Path
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from sqlalchemy import create_engine
+
+from infrastructure.database.docker.export_database import (
+    BACKUP_DIR,
+    MANIFEST_NAME,
+    copy_options,
+    file_sha256,
+    load_waves,
+    read_manifest,
+)
+
+logger = logging.getLogger(__name__)
 
 
 def get_latest_backup() -> Path:
-    """Find the most recent backup file."""
-    backup_dir = Path(__file__).parent / "backup"
-    backups = list(backup_dir.glob("learning_connection_time_*.sql"))
+    """Find the most recent export directory (or legacy .sql dump)."""
+    backups = [p.parent for p in BACKUP_DIR.glob(f"learning_connection_time_*/{MANIFEST_NAME}")]
+    backups += list(BACKUP_DIR.glob("learning_connection_time_*.sql"))
 
     if not backups:
-        print("No backup files found in infrastructure/database/docker/backup/")
+        print("No backups found in infrastructure/database/docker/backup/")
         print("Run export_database.py first to create a backup.")
         sys.exit(1)
 
@@ -27,14 +67,8 @@ def get_latest_backup() -> Path:
     return backups[0]
 
 
-def import_to_docker(backup_file: Path):
-    """Import SQL dump into Docker container."""
-
-    print(f"Importing database from: {backup_file}")
-    print(f"File size: {backup_file.stat().st_size / 1024:.1f} KB")
-    print(f"Modified: {datetime.fromtimestamp(backup_file.stat().st_mtime)}")
-
-    # Check if Docker container is running
+def check_docker_running():
+    """Exit unless the docker-compose postgres service is up."""
     try:
         result = subprocess.run(
             ["docker-compose", "ps", "-q", "postgres"],
@@ -46,60 +80,261 @@ def import_to_docker(backup_file: Path):
             print("\nError: Docker container is not running")
             print("Start it with: docker-compose up -d")
             sys.exit(1)
-    except subprocess.CalledProcessError as e:
+    except (subprocess.CalledProcessError, FileNotFoundError) as e:
         print(f"\nError checking Docker status: {e}")
         print("Make sure Docker Desktop is running and docker-compose is available")
         sys.exit(1)
 
-    print("\n✓ Docker container is running")
+    print("✓ Docker container is running")
+
+
+def verify_export(export_dir: Path, manifest: Dict, workers: int = 4) -> List[str]:
+    """
+    Check each table file against the manifest.
+
+    Returns:
+        Problems found (empty when every file is intact)
+    """
+    def check(entry):
+        path = export_dir / entry["file"]
+        if not path.exists():
+            return f"{entry['name']}: missing {entry['file']}"
+        if file_sha256(path) != entry["sha256"]:
+            return f"{entry['name']}: checksum mismatch for {entry['file']}"
+        return None
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return [problem for problem in pool.map(check, manifest["tables"]) if problem]
 
-    # Import data using psql in the container
-    print("\nImporting data...")
+
+def external_references(cursor, tables: List[str]) -> List[Tuple[str, str]]:
+    """
+    Foreign keys from tables outside the export into exported tables.
+
+    Returns:
+        [(referencing table, referenced table)]
+    """
+    cursor.execute(
+        """
+        SELECT DISTINCT src.relname, dst.relname
+        FROM pg_constraint c
+        JOIN pg_class src ON src.oid = c.conrelid
+        JOIN pg_class dst ON dst.oid = c.confrelid
+        JOIN pg_namespace n ON n.oid = dst.relnamespace
+        WHERE c.contype = 'f'
+          AND n.nspname = 'public'
+          AND dst.relname = ANY(%s)
+          AND NOT src.relname = ANY(%s)
+        ORDER BY 1, 2
+        """,
+        (tables, tables),
+    )
+    return cursor.fetchall()
+
+
+def secondary_indexes(cursor, tables: List[str]) -> List[Tuple[str, str]]:
+    """
+    Indexes on tables that don't back a constraint (PK/UNIQUE/EXCLUDE).
+
+    Returns:
+        [(index name, CREATE INDEX statement)]
+    """
+    cursor.execute(
+        """
+        SELECT i.relname, pg_get_indexdef(ix.indexrelid)
+        FROM pg_index ix
+        JOIN pg_class i ON i.oid = ix.indexrelid
+        JOIN pg_class t ON t.oid = ix.indrelid
+        JOIN pg_namespace n ON n.oid = t.relnamespace
+        WHERE n.nspname = 'public'
+          AND t.relname = ANY(%s)
+          AND NOT EXISTS (SELECT 1 FROM pg_constraint c WHERE c.conindid = ix.indexrelid)
+        ORDER BY i.relname
+        """,
+        (tables,),
+    )
+    return cursor.fetchall()
+
+
+def load_table(engine, export_dir: Path, entry: Dict, fmt: str) -> int:
+    """COPY one table file into the target and return the rows loaded."""
+    start = time.perf_counter()
+    column_list = ", ".join(f'"{c}"' for c in entry["columns"])
+    sql = f"COPY {entry['name']} ({column_list}) FROM STDIN WITH ({copy_options(fmt)})"
+
+    conn = engine.raw_connection()
     try:
-        with open(backup_file, 'r') as f:
-            subprocess.run(
-                [
-                    "docker-compose", "exec", "-T", "postgres",
-                    "psql", "-U", "lct_user", "-d", "learning_connection_time"
-                ],
-                stdin=f,
-                check=True
-            )
-        print("\n✓ Import successful!")
-
-    except subprocess.CalledProcessError as e:
-        print(f"\nError during import: {e}")
-        sys.exit(1)
+        cursor = conn.cursor()
+        with gzip.open(export_dir / entry["file"], "rb") as f:
+            cursor.copy_expert(sql, f)
+        rows = cursor.rowcount
+        if rows != entry["rows"]:
+            conn.rollback()
+            raise RuntimeError(f"{entry['name']}: loaded {rows} rows, manifest has {entry['rows']}")
+        conn.commit()
+    finally:
+        conn.close()
+
+    logger.info(f"  {entry['name']}: {rows:,} rows ({time.perf_counter() - start:.1f}s)")
+    return rows
+
+
+def run_statements(engine, statements: List[str], workers: int):
+    """Run independent statements concurrently, one connection each."""
+    def run(statement):
+        conn = engine.raw_connection()
+        try:
+            conn.cursor().execute(statement)
+            conn.commit()
+        finally:
+            conn.close()
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        list(pool.map(run, statements))
+
+
+def reset_sequences(cursor, entries: List[Dict]):
+    """Move serial/identity sequences past the imported IDs."""
+    for entry in entries:
+        for column in entry["columns"]:
+            cursor.execute("SELECT pg_get_serial_sequence(%s, %s)", (entry["name"], column))
+            sequence = cursor.fetchone()[0]
+            if sequence:
+                cursor.execute(
+                    f'SELECT setval(%s, COALESCE(MAX("{column}"), 1), MAX("{column}") IS NOT NULL) '
+                    f"FROM {entry['name']}",
+                    (sequence,),
+                )
+
+
+def import_export(
+    export_dir: Path,
+    target_url: Optional[str] = None,
+    workers: int = 4,
+    truncate: bool = False,
+) -> Dict[str, int]:
+    """
+    Load a COPY export into the target database.
 
-    # Verify data was imported
-    print("\nVerifying import...")
+    Args:
+        export_dir: Directory written by export_database.py
+        target_url: Target database (default: configured database)
+        workers: Tables loaded / indexes built concurrently
+        truncate: TRUNCATE the target tables first (refused if a table
+            outside the export references one of them)
+
+    Returns:
+        Rows loaded per table
+    """
+    from infrastructure.database.connection import get_database_url
+
+    manifest = read_manifest(export_dir)
+    entries = {e["name"]: e for e in manifest["tables"]}
+    fmt = manifest["format"]
+    start = time.perf_counter()
+
+    problems = verify_export(export_dir, manifest, workers)
+    if problems:
+        raise RuntimeError("Export failed verification:\n  " + "\n  ".join(problems))
+    logger.info(f"✓ Verified {len(entries)} table files")
+
+    engine = create_engine(target_url or get_database_url(), pool_size=workers + 1, max_overflow=0)
     try:
-        result = subprocess.run(
-            [
-                "docker-compose", "exec", "-T", "postgres",
-                "psql", "-U", "lct_user", "-d", "learning_connection_time",
-                "-c", "SELECT COUNT(*) FROM districts;"
-            ],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        print(result.stdout)
+        conn = engine.raw_connection()
+        try:
+            cursor = conn.cursor()
+            if truncate:
+                # No CASCADE: it would also empty tables that aren't in the export
+                references = external_references(cursor, list(entries))
+                if references:
+                    raise RuntimeError(
+                        "Cannot truncate: tables outside the export reference exported tables:\n  "
+                        + "\n  ".join(f"{src} -> {dst}" for src, dst in references)
+                    )
+                cursor.execute(f"TRUNCATE {', '.join(entries)}")
+            indexes = secondary_indexes(cursor, list(entries))
+            for name, _ in indexes:
+                cursor.execute(f'DROP INDEX IF EXISTS "{name}"')
+            conn.commit()
+        finally:
+            conn.close()
+        logger.info(f"Deferred {len(indexes)} secondary indexes")
 
-        result = subprocess.run(
+        loaded = {}
+        try:
+            for wave in load_waves(manifest["tables"]):
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    counts = pool.map(lambda name: load_table(engine, export_dir, entries[name], fmt), wave)
+                    loaded.update(zip(wave, counts))
+        finally:
+            # Restore indexes even when a load fails
+            logger.info("Rebuilding indexes...")
+            run_statements(engine, [definition for _, definition in indexes], workers)
+
+        conn = engine.raw_connection()
+        try:
+            cursor = conn.cursor()
+            reset_sequences(cursor, list(entries.values()))
+            conn.commit()
+        finally:
+            conn.close()
+        run_statements(engine, [f"ANALYZE {name}" for name in entries], workers)
+    finally:
+        engine.dispose()
+
+    logger.info(
+        f"Import complete: {sum(loaded.values()):,} rows in {len(loaded)} tables "
+        f"({time.perf_counter() - start:.1f}s)"
+    )
+    return loaded
+
+
+def import_sql_dump(backup_file: Path):
+    """Replay a legacy INSERT-statement dump through psql in the container."""
+    print(f"Importing legacy SQL dump: {backup_file}")
+    with open(backup_file, 'r') as f:
+        subprocess.run(
             [
                 "docker-compose", "exec", "-T", "postgres",
-                "psql", "-U", "lct_user", "-d", "learning_connection_time",
-                "-c", "SELECT COUNT(*) FROM bell_schedules;"
+                "psql", "-U", "lct_user", "-d", "learning_connection_time"
             ],
-            capture_output=True,
-            text=True,
+            stdin=f,
             check=True
         )
-        print(result.stdout)
 
-    except subprocess.CalledProcessError as e:
-        print(f"Verification failed: {e}")
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Import a COPY export into Docker PostgreSQL",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__,
+    )
+    parser.add_argument("backup", nargs="?", type=Path, help="Export directory or legacy .sql file (default: newest)")
+    parser.add_argument("--target-url", help="Target database URL (default: configured database)")
+    parser.add_argument("--workers", type=int, default=4, help="Parallel table loads / index builds (default: 4)")
+    parser.add_argument("--truncate", action="store_true", help="TRUNCATE target tables before loading")
+    parser.add_argument("--skip-docker-check", action="store_true", help="Don't require the docker-compose service")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+    backup = args.backup or get_latest_backup()
+    print(f"Importing database from: {backup}")
+    print(f"Modified: {datetime.fromtimestamp(backup.stat().st_mtime)}")
+
+    if not (args.skip_docker_check or args.target_url):
+        check_docker_running()
+
+    try:
+        if backup.suffix == ".sql":
+            import_sql_dump(backup)
+        else:
+            import_export(backup, args.target_url, args.workers, args.truncate)
+    except KeyboardInterrupt:
+        print("\nImport cancelled")
+        sys.exit(1)
+    except Exception as e:
+        logger.error(f"Import failed: {e}", exc_info=True)
         sys.exit(1)
 
     print("\n✅ Database successfully imported to Docker!")
@@ -110,14 +345,4 @@ def import_to_docker(backup_file: Path):
 
 
 if __name__ == "__main__":
-    try:
-        backup_file = get_latest_backup()
-        import_to_docker(backup_file)
-    except KeyboardInterrupt:
-        print("\nImport cancelled")
-        sys.exit(1)
-    except Exception as e:
-        print(f"\nImport failed: {e}")
-        import traceback
-        traceback.print_exc()
-        sys.exit(1)
+    main()
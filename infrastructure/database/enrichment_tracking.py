@@ -10,16 +10,123 @@ Usage:
     # Log a scraper response
     log_attempt(session, district_id='0622710', url='https://lausd.org', response=scraper_response)
 
+    # Log many responses during a sweep (multi-row inserts, flushed on exit)
+    with AttemptLogger(session) as attempts:
+        for district_id, response in responses:
+            attempts.log_scraper_response(district_id, response)
+
     # Check before attempting
     if should_skip_district(session, district_id='0622710'):
         print("Skipping district - previously blocked")
 """
 
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, List, Any, Callable
 from datetime import datetime
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 import json
+import time
+
+ATTEMPT_COLUMNS = (
+    'district_id',
+    'url',
+    'status',
+    'block_type',
+    'http_status_code',
+    'error_message',
+    'timing_ms',
+    'scraper_version',
+    'enrichment_tier',
+    'notes',
+    'response_details',
+)
+
+INSERT_ATTEMPT_SQL = (
+    f"INSERT INTO enrichment_attempts ({', '.join(ATTEMPT_COLUMNS)}) "
+    f"VALUES ({', '.join(':' + c for c in ATTEMPT_COLUMNS)}) RETURNING id"
+)
+
+# Map scraper errorCode to database status
+STATUS_MAP = {
+    None: 'success',       # No error = success
+    'BLOCKED': 'blocked',
+    'NOT_FOUND': 'not_found',
+    'TIMEOUT': 'timeout',
+    'QUEUE_FULL': 'queue_full',
+    'NETWORK_ERROR': 'error',
+}
+
+
+def attempt_record(
+    district_id: str,
+    url: str,
+    response: Dict[str, Any],
+    enrichment_tier: Optional[str] = None,
+    scraper_version: str = "1.1.0",
+    notes: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Build the enrichment_attempts row for a scraper response
+
+    Returns:
+        Dict keyed by ATTEMPT_COLUMNS
+    """
+    error_code = response.get('errorCode')
+    status = STATUS_MAP.get(error_code, 'error')
+
+    # Determine block type if blocked
+    block_type = None
+    if response.get('blocked') or status == 'blocked':
+        # Try to infer from error message or response details
+        error_msg = (response.get('error') or '').lower()
+        if 'cloudflare' in error_msg or 'cf-browser-verification' in error_msg:
+            block_type = 'cloudflare'
+        elif 'captcha' in error_msg or 'recaptcha' in error_msg:
+            block_type = 'captcha'
+        elif 'waf' in error_msg or 'forbidden' in error_msg or response.get('statusCode') == 403:
+            block_type = 'waf'
+
+    return {
+        'district_id': district_id,
+        'url': url,
+        'status': status,
+        'block_type': block_type,
+        'http_status_code': response.get('statusCode'),
+        'error_message': response.get('error'),
+        'timing_ms': int(response.get('timing', 0)),
+        'scraper_version': scraper_version,
+        'enrichment_tier': enrichment_tier,
+        'notes': notes,
+        'response_details': json.dumps(response),
+    }
+
+
+def insert_attempts(session: Session, records: List[Dict[str, Any]], page_size: int = 500) -> List[int]:
+    """
+    Insert attempt rows with multi-row INSERTs (psycopg2 execute_values)
+
+    Runs inside the session's transaction; the caller commits.
+
+    Returns:
+        IDs of the inserted rows, in input order
+    """
+    from psycopg2.extras import execute_values
+
+    if not records:
+        return []
+
+    cursor = session.connection().connection.cursor()
+    try:
+        rows = execute_values(
+            cursor,
+            f"INSERT INTO enrichment_attempts ({', '.join(ATTEMPT_COLUMNS)}) VALUES %s RETURNING id",
+            [tuple(record[c] for c in ATTEMPT_COLUMNS) for record in records],
+            page_size=page_size,
+            fetch=True,
+        )
+    finally:
+        cursor.close()
+    return [row[0] for row in rows]
 
 
 def log_attempt(
@@ -51,74 +158,9 @@ def log_attempt(
         >>> log_attempt(session, '0622710', 'https://district.org', response)
         123
     """
-    # Map scraper errorCode to database status
-    status_map = {
-        None: 'success',       # No error = success
-        'BLOCKED': 'blocked',
-        'NOT_FOUND': 'not_found',
-        'TIMEOUT': 'timeout',
-        'QUEUE_FULL': 'queue_full',
-        'NETWORK_ERROR': 'error',
-    }
-
-    error_code = response.get('errorCode')
-    status = status_map.get(error_code, 'error')
-
-    # Determine block type if blocked
-    block_type = None
-    if response.get('blocked') or status == 'blocked':
-        # Try to infer from error message or response details
-        error_msg = (response.get('error') or '').lower()
-        if 'cloudflare' in error_msg or 'cf-browser-verification' in error_msg:
-            block_type = 'cloudflare'
-        elif 'captcha' in error_msg or 'recaptcha' in error_msg:
-            block_type = 'captcha'
-        elif 'waf' in error_msg or 'forbidden' in error_msg or response.get('statusCode') == 403:
-            block_type = 'waf'
-
-    # Insert record
     result = session.execute(
-        text("""
-            INSERT INTO enrichment_attempts (
-                district_id,
-                url,
-                status,
-                block_type,
-                http_status_code,
-                error_message,
-                timing_ms,
-                scraper_version,
-                enrichment_tier,
-                notes,
-                response_details
-            ) VALUES (
-                :district_id,
-                :url,
-                :status,
-                :block_type,
-                :http_status_code,
-                :error_message,
-                :timing_ms,
-                :scraper_version,
-                :enrichment_tier,
-                :notes,
-                :response_details
-            )
-            RETURNING id
-        """),
-        {
-            'district_id': district_id,
-            'url': url,
-            'status': status,
-            'block_type': block_type,
-            'http_status_code': response.get('statusCode'),
-            'error_message': response.get('error'),
-            'timing_ms': int(response.get('timing', 0)),
-            'scraper_version': scraper_version,
-            'enrichment_tier': enrichment_tier,
-            'notes': notes,
-            'response_details': json.dumps(response),
-        }
+        text(INSERT_ATTEMPT_SQL),
+        attempt_record(district_id, url, response, enrichment_tier, scraper_version, notes)
     )
 
     record_id = result.scalar()
@@ -127,6 +169,96 @@ def log_attempt(
     return record_id
 
 
+class AttemptLogger:
+    """
+    Buffered attempt logging for enrichment sweeps
+
+    Accumulates scraper responses and writes them with multi-row INSERTs
+    once batch_size attempts are pending or flush_seconds have passed since
+    the last flush (checked as attempts are logged). Use it as a context
+    manager so the final partial batch is always written.
+
+    Example:
+        >>> with AttemptLogger(session, batch_size=200) as attempts:
+        ...     for district_id, response in sweep():
+        ...         attempts.log_scraper_response(district_id, response, 'tier1')
+        >>> attempts.logged
+        1843
+    """
+
+    def __init__(
+        self,
+        session: Session,
+        batch_size: int = 200,
+        flush_seconds: float = 30.0,
+        scraper_version: str = "1.1.0",
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Args:
+            session: SQLAlchemy session (committed after each flush)
+            batch_size: Pending attempts that trigger a flush
+            flush_seconds: Maximum age of the oldest pending attempt
+            scraper_version: Default version recorded on each attempt
+            clock: Time source (monotonic seconds)
+        """
+        self.session = session
+        self.batch_size = batch_size
+        self.flush_seconds = flush_seconds
+        self.scraper_version = scraper_version
+        self.clock = clock
+        self.pending: List[Dict[str, Any]] = []
+        self.logged = 0
+        self._last_flush = clock()
+
+    def log(
+        self,
+        district_id: str,
+        url: str,
+        response: Dict[str, Any],
+        enrichment_tier: Optional[str] = None,
+        notes: Optional[str] = None
+    ) -> None:
+        """Queue an attempt (same arguments as log_attempt)"""
+        self.pending.append(attempt_record(
+            district_id, url, response, enrichment_tier, self.scraper_version, notes
+        ))
+        if len(self.pending) >= self.batch_size or self.clock() - self._last_flush >= self.flush_seconds:
+            self.flush()
+
+    def log_scraper_response(
+        self,
+        district_id: str,
+        scraper_response: Dict[str, Any],
+        enrichment_tier: Optional[str] = None
+    ) -> None:
+        """Queue a scraper service response (see log_scraper_response)"""
+        self.log(district_id, scraper_response.get('url', ''), scraper_response, enrichment_tier)
+
+    def flush(self) -> List[int]:
+        """
+        Write all pending attempts and commit
+
+        Returns:
+            IDs of the inserted records
+        """
+        self._last_flush = self.clock()
+        if not self.pending:
+            return []
+        records, self.pending = self.pending, []
+        ids = insert_attempts(self.session, records)
+        self.session.commit()
+        self.logged += len(ids)
+        return ids
+
+    def __enter__(self) -> 'AttemptLogger':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        # Attempts logged before an error are still real attempts
+        self.flush()
+
+
 def should_skip_district(session: Session, district_id: str) -> bool:
     """
     Check if a district should be skipped due to previous failures
@@ -325,45 +457,44 @@ def auto_flag_repeat_failures(
         >>> flagged = auto_flag_repeat_failures(session)
         >>> print(f"Auto-flagged {flagged} districts")
     """
-    # Find districts with repeated blocks
-    blocked_districts = session.execute(
-        text("""
-            SELECT district_id
-            FROM enrichment_attempts
-            WHERE status = 'blocked'
-            AND skip_future_attempts = FALSE
-            GROUP BY district_id
-            HAVING COUNT(*) >= :threshold
-        """),
-        {'threshold': block_threshold}
-    ).fetchall()
-
-    # Find districts with repeated 404s
-    not_found_districts = session.execute(
+    # One pass over the unflagged attempts; districts over both thresholds
+    # get the block reason
+    result = session.execute(
         text("""
-            SELECT district_id
-            FROM enrichment_attempts
-            WHERE status = 'not_found'
-            AND skip_future_attempts = FALSE
-            GROUP BY district_id
-            HAVING COUNT(*) >= :threshold
+            UPDATE enrichment_attempts ea
+            SET
+                skip_future_attempts = TRUE,
+                skip_reason = flagged.reason
+            FROM (
+                SELECT
+                    district_id,
+                    CASE
+                        WHEN COUNT(*) FILTER (WHERE status = 'blocked') >= :block_threshold
+                        THEN :block_reason
+                        ELSE :not_found_reason
+                    END AS reason
+                FROM enrichment_attempts
+                WHERE status IN ('blocked', 'not_found')
+                AND skip_future_attempts = FALSE
+                GROUP BY district_id
+                HAVING COUNT(*) FILTER (WHERE status = 'blocked') >= :block_threshold
+                    OR COUNT(*) FILTER (WHERE status = 'not_found') >= :not_found_threshold
+            ) flagged
+            WHERE ea.district_id = flagged.district_id
+            AND ea.skip_future_attempts = FALSE
+            RETURNING ea.district_id
         """),
-        {'threshold': not_found_threshold}
-    ).fetchall()
-
-    count = 0
-
-    # Flag blocked districts
-    for (district_id,) in blocked_districts:
-        mark_district_skip(session, district_id, f'auto_flag_{block_threshold}_blocks')
-        count += 1
-
-    # Flag not_found districts
-    for (district_id,) in not_found_districts:
-        mark_district_skip(session, district_id, f'auto_flag_{not_found_threshold}_not_found')
-        count += 1
+        {
+            'block_threshold': block_threshold,
+            'not_found_threshold': not_found_threshold,
+            'block_reason': f'auto_flag_{block_threshold}_blocks',
+            'not_found_reason': f'auto_flag_{not_found_threshold}_not_found',
+        }
+    )
+    flagged = {district_id for (district_id,) in result.fetchall()}
+    session.commit()
 
-    return count
+    return len(flagged)
 
 
 # Convenience function for direct use with scraper service
@@ -30,7 +30,7 @@ sys.path.insert(0, str(project_root))
 
 from mcp.server import Server
 from mcp.types import Tool, TextContent
-from infrastructure.database.connection import session_scope
+from infrastructure.database.query_cache import QueryLayer
 from infrastructure.database.queries import (
     get_state_campaign_progress,
     get_lct_summary_by_scope,
@@ -41,6 +41,11 @@ from infrastructure.database.queries import (
 # Initialize MCP server
 server = Server("postgres-lct")
 
+# Queries run on a thread pool (one session each) so tool calls don't block
+# the event loop; results are cached briefly and dropped when a calculation
+# run completes or bell schedules change.
+query_layer = QueryLayer(max_workers=8, ttl_seconds=60)
+
 
 @server.list_tools()
 async def handle_list_tools() -> list[Tool]:
@@ -152,6 +157,40 @@ async def handle_call_tool(name: str, arguments: dict) -> list[TextContent]:
         raise ValueError(f"Unknown tool: {name}")
 
 
+def _next_candidates(session, state: str, year: str, limit: int) -> list:
+    """Candidate districts as plain dicts (safe to use after the session closes)."""
+    candidates = get_next_enrichment_candidates(session, state, year, limit)
+    return [
+        {
+            "nces_id": c.nces_id,
+            "name": c.name,
+            "state": c.state,
+            "enrollment": c.enrollment
+        }
+        for c in candidates
+    ]
+
+
+def _table_status(session) -> dict:
+    """Row counts for the core tables."""
+    from infrastructure.database.models import (
+        District, BellSchedule, StateRequirement, LCTCalculation
+    )
+
+    return {
+        "connected": True,
+        "tables": {
+            "districts": session.query(District).count(),
+            "bell_schedules": session.query(BellSchedule).count(),
+            "state_requirements": session.query(StateRequirement).count(),
+            "lct_calculations": session.query(LCTCalculation).count(),
+        },
+        "enriched_districts": session.query(BellSchedule).distinct(
+            BellSchedule.district_id
+        ).count()
+    }
+
+
 async def _query_campaign_progress(year: str = "2025-26") -> TextContent:
     """
     Get state-by-state enrichment campaign progress.
@@ -163,12 +202,14 @@ async def _query_campaign_progress(year: str = "2025-26") -> TextContent:
         Campaign progress by state with enrichment counts
     """
     try:
-        with session_scope() as session:
-            progress = get_state_campaign_progress(session, year)
-            return TextContent(
-                type="text",
-                text=json.dumps(progress, indent=2)
-            )
+        progress = await query_layer.cached(
+            "query_campaign_progress", {"year": year},
+            get_state_campaign_progress, year,
+        )
+        return TextContent(
+            type="text",
+            text=json.dumps(progress, indent=2)
+        )
     except Exception as e:
         return TextContent(
             type="text",
@@ -189,12 +230,14 @@ async def _query_lct_summary(scope: str = "teachers_only", year: str = "2023-24"
         Summary statistics: mean, median, std, min, max LCT values
     """
     try:
-        with session_scope() as session:
-            summary = get_lct_summary_by_scope(session, scope, year)
-            return TextContent(
-                type="text",
-                text=json.dumps(summary, indent=2)
-            )
+        summary = await query_layer.cached(
+            "query_lct_summary", {"scope": scope, "year": year},
+            get_lct_summary_by_scope, scope, year,
+        )
+        return TextContent(
+            type="text",
+            text=json.dumps(summary, indent=2)
+        )
     except Exception as e:
         return TextContent(
             type="text",
@@ -213,12 +256,14 @@ async def _query_enrichment_summary(year: str = "2025-26") -> TextContent:
         Total enriched districts, enrichment rate, states represented
     """
     try:
-        with session_scope() as session:
-            summary = get_enrichment_summary(session, year)
-            return TextContent(
-                type="text",
-                text=json.dumps(summary, indent=2)
-            )
+        summary = await query_layer.cached(
+            "query_enrichment_summary", {"year": year},
+            get_enrichment_summary, year,
+        )
+        return TextContent(
+            type="text",
+            text=json.dumps(summary, indent=2)
+        )
     except Exception as e:
         return TextContent(
             type="text",
@@ -239,21 +284,14 @@ async def _query_next_candidates(state: str, year: str = "2025-26", limit: int =
         Top districts by enrollment needing enrichment
     """
     try:
-        with session_scope() as session:
-            candidates = get_next_enrichment_candidates(session, state, year, limit)
-            candidate_data = [
-                {
-                    "nces_id": c.nces_id,
-                    "name": c.name,
-                    "state": c.state,
-                    "enrollment": c.enrollment
-                }
-                for c in candidates
-            ]
-            return TextContent(
-                type="text",
-                text=json.dumps(candidate_data, indent=2)
-            )
+        candidate_data = await query_layer.cached(
+            "query_next_candidates", {"state": state, "year": year, "limit": limit},
+            _next_candidates, state, year, limit,
+        )
+        return TextContent(
+            type="text",
+            text=json.dumps(candidate_data, indent=2)
+        )
     except Exception as e:
         return TextContent(
             type="text",
@@ -266,30 +304,15 @@ async def _database_status() -> TextContent:
     Get database connection and table status.
 
     Returns:
-        Database health check and row counts
+        Database health check and row counts (never cached)
     """
     try:
-        with session_scope() as session:
-            from infrastructure.database.models import (
-                District, BellSchedule, StateRequirement, LCTCalculation
-            )
-
-            status = {
-                "connected": True,
-                "tables": {
-                    "districts": session.query(District).count(),
-                    "bell_schedules": session.query(BellSchedule).count(),
-                    "state_requirements": session.query(StateRequirement).count(),
-                    "lct_calculations": session.query(LCTCalculation).count(),
-                },
-                "enriched_districts": session.query(BellSchedule).distinct(
-                    BellSchedule.district_id
-                ).count()
-            }
-            return TextContent(
-                type="text",
-                text=json.dumps(status, indent=2)
-            )
+        status = await query_layer.run(_table_status)
+        status["cache"] = {"hits": query_layer.hits, "misses": query_layer.misses}
+        return TextContent(
+            type="text",
+            text=json.dumps(status, indent=2)
+        )
     except Exception as e:
         return TextContent(
             type="text",
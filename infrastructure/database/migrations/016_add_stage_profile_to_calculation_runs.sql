@@ -0,0 +1,10 @@
+-- Migration 016: Add stage_profile to calculation_runs
+-- Created: 2026-10-18
+-- Description: Stores per-stage wall time, CPU time and peak memory recorded by
+-- StageProfiler during calculate_lct_variants.py, so slow stages can be found
+-- and compared between runs (compare_calculation_runs.py)
+
+ALTER TABLE calculation_runs ADD COLUMN IF NOT EXISTS stage_profile JSONB;
+
+COMMENT ON COLUMN calculation_runs.stage_profile IS
+    'Per-stage profile: {"stages": {name: {wall_s, cpu_s, peak_rss_mb, rss_growth_mb}}, "total_wall_s", ...}';
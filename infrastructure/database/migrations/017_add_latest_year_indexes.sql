@@ -0,0 +1,23 @@
+-- Migration 017: Add covering "latest year per district" indexes
+-- Created: 2026-10-18
+-- Description: Serves the BLENDED-mode DISTINCT ON (district_id) ... ORDER BY
+-- district_id, year DESC queries in calculate_lct_variants.py (read_latest) in
+-- index order. INCLUDE lists the columns the calculator reads, so the scans
+-- can be index-only after VACUUM.
+
+CREATE INDEX IF NOT EXISTS ix_enrollment_by_grade_latest
+    ON enrollment_by_grade (district_id, source_year DESC, id DESC)
+    INCLUDE (enrollment_k12, enrollment_elementary, enrollment_secondary);
+
+CREATE INDEX IF NOT EXISTS ix_sped_estimates_latest
+    ON sped_estimates (district_id, estimate_year DESC)
+    INCLUDE (confidence, estimated_self_contained_sped, estimated_gened_enrollment,
+             estimated_sped_teachers, estimated_sped_instructional, estimated_gened_teachers);
+
+CREATE INDEX IF NOT EXISTS ix_ca_sped_latest
+    ON ca_sped_district_environments (nces_id, year DESC)
+    INCLUDE (confidence, sped_self_contained);
+
+ANALYZE enrollment_by_grade;
+ANALYZE sped_estimates;
+ANALYZE ca_sped_district_environments;
@@ -0,0 +1,22 @@
+-- Migration 018: Add rebuild_phase_runs
+-- Created: 2026-10-18
+-- Description: Per-phase wall time and row counts recorded by
+-- infrastructure/scripts/rebuild_database.py at the end of every rebuild, so
+-- slow phases can be compared between runs. One row per (run_id, phase); a
+-- resumed rebuild keeps its run_id. Not truncated by reset_database.py.
+
+CREATE TABLE IF NOT EXISTS rebuild_phase_runs (
+    run_id VARCHAR(50) NOT NULL,
+    phase INTEGER NOT NULL,
+    phase_name VARCHAR(50) NOT NULL,
+    status VARCHAR(20) NOT NULL,
+    tasks INTEGER,
+    seconds NUMERIC(10, 2),
+    row_counts JSONB,
+    options JSONB,
+    recorded_at TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (run_id, phase)
+);
+
+COMMENT ON COLUMN rebuild_phase_runs.row_counts IS
+    '{table: rows}, counted once every task writing the table has finished';
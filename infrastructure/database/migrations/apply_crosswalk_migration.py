@@ -19,6 +19,7 @@ project_root = Path(__file__).parent.parent.parent.parent
 sys.path.insert(0, str(project_root))
 
 from infrastructure.database.connection import get_engine, session_scope
+from infrastructure.database.migrations.sea_import_utils import clear_crosswalk_cache
 from sqlalchemy import text
 import logging
 
@@ -51,6 +52,7 @@ def apply_migration():
             # Execute migration
             conn.execute(text(migration_sql))
             conn.commit()
+        clear_crosswalk_cache()
 
         logger.info("Migration applied successfully!")
 
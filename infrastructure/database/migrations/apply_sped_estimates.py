@@ -4,12 +4,12 @@ Apply SPED baseline ratios to current year district data.
 
 This script:
 1. Loads 2017-18 baseline ratios (state and LEA level)
-2. For each current-year district, estimates:
+2. For every current-year district (column-wise, in one pass), estimates:
    - SPED enrollment (using LEA proportion or state average)
    - GenEd enrollment (total - SPED)
    - SPED teachers (SPED enrollment × state ratio)
    - GenEd teachers (total teachers - SPED teachers)
-3. Stores estimates in sped_estimates table
+3. Bulk upserts estimates into the sped_estimates table
 
 Usage:
     python apply_sped_estimates.py --year 2023-24
@@ -17,15 +17,19 @@ Usage:
 
 import argparse
 import sys
+from datetime import datetime, timezone
 from pathlib import Path
-from decimal import Decimal
+
+import numpy as np
+import pandas as pd
 
 # Add project root to path
 project_root = Path(__file__).parent.parent.parent.parent
 sys.path.insert(0, str(project_root))
 
-from sqlalchemy import func
+from sqlalchemy import func, select
 from infrastructure.database.connection import session_scope
+from infrastructure.database.migrations.sea_import_utils import bulk_upsert
 from infrastructure.database.models import (
     District, SpedStateBaseline, SpedLeaBaseline, SpedEstimate, DataLineage
 )
@@ -113,6 +117,130 @@ def get_lea_proportions(session) -> dict:
     return proportions
 
 
+def load_districts(session, year: str) -> pd.DataFrame:
+    """Districts for the year with usable enrollment and staffing, as a DataFrame."""
+    rows = session.execute(
+        select(District.nces_id, District.state, District.enrollment, District.instructional_staff)
+        .where(
+            District.year == year,
+            District.enrollment.isnot(None),
+            District.enrollment > 0,
+            District.instructional_staff.isnot(None),
+            District.instructional_staff > 0
+        )
+    ).all()
+    return pd.DataFrame(rows, columns=["district_id", "state", "enrollment", "instructional_staff"])
+
+
+def _truthy(values: pd.Series) -> pd.Series:
+    """Column-wise bool(x) for optional ratios (None/NaN and 0 are falsy)."""
+    return values.notna() & values.ne(0)
+
+
+def _round(values: pd.Series, ndigits: int) -> pd.Series:
+    """
+    Element-wise built-in round(), so estimates match the per-district rules
+
+    np.round scales by 10**ndigits before rounding and can land on the other
+    side of a tie: 178 self-contained students at a 0.0125 teacher ratio give
+    2.23 SPED teachers with round() but 2.22 with np.round.
+    """
+    return values.map(lambda v: round(float(v), ndigits))
+
+
+def compute_estimates(districts: pd.DataFrame, year: str, teacher_ratios: dict,
+                      instructional_ratios: dict, self_contained_ratios: dict,
+                      national_averages: dict, state_avgs: dict,
+                      lea_proportions: dict) -> tuple[pd.DataFrame, dict]:
+    """
+    Compute SPED estimates for every district at once.
+
+    Args:
+        districts: district_id, state, enrollment, instructional_staff
+        (remaining args as returned by the get_* loaders)
+
+    Returns:
+        Tuple of (one sped_estimates row per estimable district, fallback counters)
+    """
+    state = districts["state"]
+
+    # State ratios - fall back to national averages if either is missing
+    teacher_ratio = state.map(teacher_ratios).astype(float)
+    self_contained_ratio = state.map(self_contained_ratios).astype(float)
+    instructional_ratio = state.map(instructional_ratios).astype(float)
+    national = ~_truthy(teacher_ratio) | ~_truthy(self_contained_ratio)
+    teacher_ratio = teacher_ratio.mask(national, national_averages["teacher_ratio"])
+    self_contained_ratio = self_contained_ratio.mask(national, national_averages["self_contained_ratio"])
+    instructional_ratio = instructional_ratio.mask(national, national_averages["instructional_ratio"])
+
+    # SPED proportion - prefer LEA-specific, fall back to state average
+    lea_proportion = districts["district_id"].map(lea_proportions).astype(float)
+    state_proportion = state.map(state_avgs).astype(float)
+    has_lea = lea_proportion.notna()
+    has_state = ~has_lea & state_proportion.notna()
+    keep = has_lea | has_state
+
+    counts = {
+        "skipped_no_ratio": int((~keep).sum()),
+        "used_lea_ratio": int(has_lea.sum()),
+        "used_state_avg": int(has_state.sum()),
+        "used_national_avg": int(national.sum()),
+    }
+
+    d = districts[keep]
+    national = national[keep]
+    teacher_ratio = teacher_ratio[keep]
+    self_contained_ratio = self_contained_ratio[keep]
+    instructional_ratio = instructional_ratio[keep].where(_truthy(instructional_ratio[keep]))
+    sped_proportion = lea_proportion[keep].fillna(state_proportion[keep])
+
+    total_enrollment = d["enrollment"].astype("int64")
+    total_teachers = d["instructional_staff"].astype(float)
+
+    # Self-contained approach (see apply_estimates); np.round to whole numbers
+    # halves to even exactly like round(), hundredths go through _round
+    estimated_sped = np.round(total_enrollment * sped_proportion).astype("int64")
+    estimated_self_contained = np.round(estimated_sped * self_contained_ratio).astype("int64")
+    estimated_gened = total_enrollment - estimated_self_contained
+    estimated_sped_teachers = _round(estimated_self_contained * teacher_ratio, 2)
+    estimated_sped_instructional = _round(estimated_self_contained * instructional_ratio, 2)
+    estimated_sped_instructional = estimated_sped_instructional.where(_truthy(estimated_sped_instructional))
+    estimated_gened_teachers = _round(total_teachers - estimated_sped_teachers, 2)
+    negative = estimated_gened_teachers < 0
+    counts["negative_gened"] = int(negative.sum())
+
+    fallback_note = ("State " + d["state"] + " missing SPED ratios; used national averages").where(national)
+    negative_note = pd.Series("WARNING: Negative GenEd teachers (ratio mismatch)", index=d.index).where(negative)
+    notes = (
+        fallback_note.fillna("")
+        + np.where(fallback_note.notna() & negative_note.notna(), "; ", "")
+        + negative_note.fillna("")
+    )
+
+    estimates = pd.DataFrame({
+        "district_id": d["district_id"],
+        "estimate_year": year,
+        "baseline_year": "2017-18",
+        "current_total_enrollment": total_enrollment,
+        "current_total_teachers": total_teachers,
+        "ratio_state_sped_teachers_per_student": teacher_ratio,
+        "ratio_state_sped_instructional_per_student": instructional_ratio,
+        "ratio_state_self_contained_proportion": self_contained_ratio,
+        "ratio_lea_sped_proportion": sped_proportion,
+        "used_state_average_for_proportion": ~has_lea[keep],
+        "estimated_sped_enrollment": estimated_sped,
+        "estimated_self_contained_sped": estimated_self_contained,
+        "estimated_gened_enrollment": estimated_gened,
+        "estimated_sped_teachers": estimated_sped_teachers,
+        "estimated_sped_instructional": estimated_sped_instructional,
+        "estimated_gened_teachers": estimated_gened_teachers,
+        "estimation_method": np.where(national, "national_average_fallback", "self_contained_ratio"),
+        "confidence": np.where(negative, "low", "medium"),
+        "notes": notes.where(notes != ""),
+    })
+    return estimates.reset_index(drop=True), counts
+
+
 def apply_estimates(session, year: str, teacher_ratios: dict, instructional_ratios: dict,
                     self_contained_ratios: dict, national_averages: dict,
                     state_avgs: dict, lea_proportions: dict):
@@ -127,149 +255,31 @@ def apply_estimates(session, year: str, teacher_ratios: dict, instructional_rati
     5. GenEd Teachers = Total Teachers - SPED Teachers
 
     For states without 2017-18 SPED staffing data (ME, VT, WI), uses national
-    average ratios as fallback.
+    average ratios as fallback. Estimates are computed column-wise and
+    written with one bulk upsert on (district_id, estimate_year).
     """
     print(f"\n=== Applying Estimates to {year} Districts ===")
 
-    # Get all districts for the target year
-    districts = session.query(District).filter(
-        District.year == year,
-        District.enrollment.isnot(None),
-        District.enrollment > 0,
-        District.instructional_staff.isnot(None),
-        District.instructional_staff > 0
-    ).all()
-
+    districts = load_districts(session, year)
     print(f"  Found {len(districts):,} districts with valid data")
 
-    created = 0
-    updated = 0
-    skipped_no_ratio = 0
-    used_lea_ratio = 0
-    used_state_avg = 0
-    used_national_avg = 0
-    negative_gened = 0
-
-    for district in districts:
-        state = district.state
-        lea_id = district.nces_id
-
-        # Get state ratios - fall back to national average if not available
-        teacher_ratio = teacher_ratios.get(state)
-        self_contained_ratio = self_contained_ratios.get(state)
-        instructional_ratio = instructional_ratios.get(state)
-        used_national_fallback = False
-
-        if not teacher_ratio or not self_contained_ratio:
-            # Use national averages as fallback (for ME, VT, WI, etc.)
-            teacher_ratio = national_averages["teacher_ratio"]
-            self_contained_ratio = national_averages["self_contained_ratio"]
-            instructional_ratio = national_averages["instructional_ratio"]
-            used_national_fallback = True
-            used_national_avg += 1
-
-        # Get SPED proportion - prefer LEA-specific, fall back to state average
-        if lea_id in lea_proportions:
-            sped_proportion = lea_proportions[lea_id]
-            used_state_avg_flag = False
-            used_lea_ratio += 1
-        elif state in state_avgs:
-            sped_proportion = state_avgs[state]
-            used_state_avg_flag = True
-            used_state_avg += 1
-        else:
-            skipped_no_ratio += 1
-            continue
-
-        # Calculate estimates using self-contained approach
-        total_enrollment = int(district.enrollment)
-        total_teachers = float(district.instructional_staff)
-
-        # Step 1: All SPED enrollment
-        estimated_sped_enrollment = int(round(total_enrollment * sped_proportion))
-
-        # Step 2: Self-contained SPED (subset)
-        estimated_self_contained = int(round(estimated_sped_enrollment * self_contained_ratio))
-
-        # Step 3: GenEd = Total - Self-Contained (includes mainstreamed SPED)
-        estimated_gened_enrollment = total_enrollment - estimated_self_contained
-
-        # Step 4: SPED teachers (per self-contained student)
-        estimated_sped_teachers = round(estimated_self_contained * teacher_ratio, 2)
-
-        # Step 5: SPED instructional (teachers + paras, per self-contained student)
-        estimated_sped_instructional = round(estimated_self_contained * instructional_ratio, 2) if instructional_ratio else None
-
-        # Step 6: GenEd teachers
-        estimated_gened_teachers = round(total_teachers - estimated_sped_teachers, 2)
-
-        # Determine confidence and notes
-        notes_parts = []
-        confidence = "medium"
-
-        if used_national_fallback:
-            notes_parts.append(f"State {state} missing SPED ratios; used national averages")
-            # Keep confidence at "medium" - national average is calculated from 53 states
-            # and is statistically robust, just less precise than state-specific ratios
-
-        if estimated_gened_teachers < 0:
-            notes_parts.append("WARNING: Negative GenEd teachers (ratio mismatch)")
-            confidence = "low"
-            negative_gened += 1
-
-        notes = "; ".join(notes_parts) if notes_parts else None
-        estimation_method = "national_average_fallback" if used_national_fallback else "self_contained_ratio"
-
-        # Create or update estimate
-        existing = session.query(SpedEstimate).filter(
-            SpedEstimate.district_id == lea_id,
-            SpedEstimate.estimate_year == year
-        ).first()
+    estimates, counts = compute_estimates(
+        districts, year, teacher_ratios, instructional_ratios, self_contained_ratios,
+        national_averages, state_avgs, lea_proportions
+    )
 
-        if existing:
-            # Update existing
-            existing.current_total_enrollment = total_enrollment
-            existing.current_total_teachers = Decimal(str(total_teachers))
-            existing.ratio_state_sped_teachers_per_student = Decimal(str(teacher_ratio))
-            existing.ratio_state_sped_instructional_per_student = Decimal(str(instructional_ratio)) if instructional_ratio else None
-            existing.ratio_state_self_contained_proportion = Decimal(str(self_contained_ratio))
-            existing.ratio_lea_sped_proportion = Decimal(str(sped_proportion))
-            existing.used_state_average_for_proportion = used_state_avg_flag
-            existing.estimated_sped_enrollment = estimated_sped_enrollment
-            existing.estimated_self_contained_sped = estimated_self_contained
-            existing.estimated_gened_enrollment = estimated_gened_enrollment
-            existing.estimated_sped_teachers = Decimal(str(estimated_sped_teachers))
-            existing.estimated_sped_instructional = Decimal(str(estimated_sped_instructional)) if estimated_sped_instructional else None
-            existing.estimated_gened_teachers = Decimal(str(estimated_gened_teachers))
-            existing.estimation_method = estimation_method
-            existing.confidence = confidence
-            existing.notes = notes
-            updated += 1
-        else:
-            # Create new
-            estimate = SpedEstimate(
-                district_id=lea_id,
-                estimate_year=year,
-                baseline_year="2017-18",
-                current_total_enrollment=total_enrollment,
-                current_total_teachers=Decimal(str(total_teachers)),
-                ratio_state_sped_teachers_per_student=Decimal(str(teacher_ratio)),
-                ratio_state_sped_instructional_per_student=Decimal(str(instructional_ratio)) if instructional_ratio else None,
-                ratio_state_self_contained_proportion=Decimal(str(self_contained_ratio)),
-                ratio_lea_sped_proportion=Decimal(str(sped_proportion)),
-                used_state_average_for_proportion=used_state_avg_flag,
-                estimated_sped_enrollment=estimated_sped_enrollment,
-                estimated_self_contained_sped=estimated_self_contained,
-                estimated_gened_enrollment=estimated_gened_enrollment,
-                estimated_sped_teachers=Decimal(str(estimated_sped_teachers)),
-                estimated_sped_instructional=Decimal(str(estimated_sped_instructional)) if estimated_sped_instructional else None,
-                estimated_gened_teachers=Decimal(str(estimated_gened_teachers)),
-                estimation_method=estimation_method,
-                confidence=confidence,
-                notes=notes
-            )
-            session.add(estimate)
-            created += 1
+    # sped_estimates timestamps only have Python-side defaults
+    now = datetime.now(timezone.utc)
+    records = estimates.assign(created_at=now, updated_at=now)
+    update_columns = [
+        c for c in records.columns
+        if c not in ("district_id", "estimate_year", "created_at", "updated_at")
+    ]
+    result = bulk_upsert(
+        session, "sped_estimates", records, ["district_id", "estimate_year"],
+        update_columns=update_columns,
+    )
+    created, updated = result["inserted"], result["updated"]
 
     # Log lineage
     DataLineage.log(
@@ -281,11 +291,11 @@ def apply_estimates(session, year: str, teacher_ratios: dict, instructional_rati
             "year": year,
             "created": created,
             "updated": updated,
-            "skipped_no_ratio": skipped_no_ratio,
-            "used_lea_ratio": used_lea_ratio,
-            "used_state_avg": used_state_avg,
-            "used_national_avg": used_national_avg,
-            "negative_gened_warnings": negative_gened
+            "skipped_no_ratio": counts["skipped_no_ratio"],
+            "used_lea_ratio": counts["used_lea_ratio"],
+            "used_state_avg": counts["used_state_avg"],
+            "used_national_avg": counts["used_national_avg"],
+            "negative_gened_warnings": counts["negative_gened"]
         },
         created_by="apply_sped_estimates"
     )
@@ -295,11 +305,11 @@ def apply_estimates(session, year: str, teacher_ratios: dict, instructional_rati
     print(f"\n  Results:")
     print(f"    Created: {created:,}")
     print(f"    Updated: {updated:,}")
-    print(f"    Skipped (no ratio): {skipped_no_ratio:,}")
-    print(f"    Used LEA-specific ratio: {used_lea_ratio:,}")
-    print(f"    Used state average: {used_state_avg:,}")
-    print(f"    Used national average fallback: {used_national_avg:,}")
-    print(f"    Negative GenEd warnings: {negative_gened:,}")
+    print(f"    Skipped (no ratio): {counts['skipped_no_ratio']:,}")
+    print(f"    Used LEA-specific ratio: {counts['used_lea_ratio']:,}")
+    print(f"    Used state average: {counts['used_state_avg']:,}")
+    print(f"    Used national average fallback: {counts['used_national_avg']:,}")
+    print(f"    Negative GenEd warnings: {counts['negative_gened']:,}")
 
     return created + updated
 
@@ -37,12 +37,16 @@ PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
 from infrastructure.database.connection import get_engine, session_scope, get_table_counts
+from infrastructure.database.queries import add_bell_schedules_bulk
 from infrastructure.database.models import (
     District,
     StateRequirement,
     BellSchedule,
     DataLineage,
+    LineageBatch,
 )
+from infrastructure.database.migrations.sea_import_utils import clear_crosswalk_cache
+from infrastructure.utilities.ccd_parquet_cache import read_ccd
 from sqlalchemy import text
 
 # Configure logging
@@ -97,6 +101,7 @@ def import_state_requirements(session, dry_run: bool = False) -> int:
 
     states = data.get("states", {})
     count = 0
+    lineage = LineageBatch(session, created_by="migration")
 
     for state_key, state_data in states.items():
         state_code = state_data.get("code", state_key[:2].upper())
@@ -118,20 +123,19 @@ def import_state_requirements(session, dry_run: bool = False) -> int:
             # Use merge to handle existing records
             session.merge(requirement)
 
-            # Log lineage
-            DataLineage.log(
-                session,
+            # Log lineage (written in one INSERT below)
+            lineage.log(
                 entity_type="state_requirement",
                 entity_id=state_code,
                 operation="import",
                 source_file=str(STATE_REQUIREMENTS_FILE),
-                created_by="migration",
             )
 
         count += 1
         logger.debug(f"Imported state requirement: {state_code}")
 
     if not dry_run:
+        lineage.flush()
         session.flush()
 
     logger.info(f"Imported {count} state requirements")
@@ -261,8 +265,8 @@ def populate_st_leaid(session, dry_run: bool = False) -> int:
     directory_file = directory_files[0]
     logger.info(f"  Reading: {directory_file.name}")
 
-    # Read ST_LEAID from directory file
-    df = pd.read_csv(directory_file, usecols=['LEAID', 'ST_LEAID'], dtype=str)
+    # Read ST_LEAID from directory file (Parquet cache when available)
+    df = read_ccd(directory_file, columns=['LEAID', 'ST_LEAID'], dtype=str)
     logger.info(f"  Found {len(df)} records in NCES file")
 
     if dry_run:
@@ -329,6 +333,7 @@ def build_crosswalk(session, dry_run: bool = False) -> int:
     with engine.connect() as conn:
         conn.execute(text(migration_sql))
         conn.commit()
+    clear_crosswalk_cache()
 
     # Count entries created
     result = session.execute(text("SELECT COUNT(*) FROM state_district_crosswalk"))
@@ -378,7 +383,7 @@ def import_bell_schedules(session, dry_run: bool = False) -> int:
     )
     logger.info(f"Found {len(valid_district_ids)} valid districts in database")
 
-    count = 0
+    records = []
     skipped = 0
     grade_levels = ["elementary", "middle", "high"]
 
@@ -424,44 +429,41 @@ def import_bell_schedules(session, dry_run: bool = False) -> int:
             }
             normalized_method = method_mapping.get(raw_method, raw_method)
 
-            # Create bell schedule record
-            schedule = BellSchedule(
-                district_id=normalized_id,
-                year=year,
-                grade_level=grade_level,
-                instructional_minutes=instructional_minutes,
-                start_time=schedule_data.get("start_time"),
-                end_time=schedule_data.get("end_time"),
-                lunch_duration=schedule_data.get("lunch_duration"),
-                passing_periods=schedule_data.get("passing_periods"),
-                recess_duration=schedule_data.get("recess_duration"),
-                schools_sampled=schedule_data.get("schools_sampled", []),
-                source_urls=schedule_data.get("source_urls", []),
-                confidence=schedule_data.get("confidence", "high"),
-                method=normalized_method,
-                source_description=schedule_data.get("source"),
-                notes=schedule_data.get("notes"),
-                raw_import=schedule_data,  # Preserve original data
-            )
+            records.append({
+                "district_id": normalized_id,
+                "year": year,
+                "grade_level": grade_level,
+                "instructional_minutes": instructional_minutes,
+                "start_time": schedule_data.get("start_time"),
+                "end_time": schedule_data.get("end_time"),
+                "lunch_duration": schedule_data.get("lunch_duration"),
+                "passing_periods": schedule_data.get("passing_periods"),
+                "recess_duration": schedule_data.get("recess_duration"),
+                "schools_sampled": schedule_data.get("schools_sampled", []),
+                "source_urls": schedule_data.get("source_urls", []),
+                "confidence": schedule_data.get("confidence", "high"),
+                "method": normalized_method,
+                "source_description": schedule_data.get("source"),
+                "notes": schedule_data.get("notes"),
+                "raw_import": schedule_data,  # Preserve original data
+            })
 
-            if not dry_run:
-                session.merge(schedule)
-
-                # Log lineage
-                DataLineage.log(
-                    session,
-                    entity_type="bell_schedule",
-                    entity_id=f"{normalized_id}/{year}/{grade_level}",
-                    operation="import",
-                    source_file=str(BELL_SCHEDULES_FILE),
-                    details={"instructional_minutes": instructional_minutes},
-                    created_by="migration",
+    if dry_run:
+        count = len(records)
+    else:
+        # One upsert for the whole file (re-imports update in place). The
+        # curated collection is restored as-is, without plausibility checks
+        outcomes = add_bell_schedules_bulk(
+            session, records, created_by="migration",
+            source_file=str(BELL_SCHEDULES_FILE), validate=False,
+        )
+        for outcome in outcomes:
+            if outcome["status"] == "rejected":
+                logger.warning(
+                    f"Bell schedule {outcome['district_id']}/{outcome['grade_level']} rejected: "
+                    f"{'; '.join(outcome['errors'])}"
                 )
-
-            count += 1
-            logger.debug(f"Imported bell schedule: {district_id}/{grade_level}")
-
-    if not dry_run:
+        count = sum(1 for o in outcomes if o["status"] in ("create", "update"))
         session.flush()
 
     logger.info(f"Imported {count} bell schedule records ({skipped} districts skipped - not in database)")
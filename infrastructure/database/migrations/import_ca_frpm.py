@@ -26,7 +26,7 @@ sys.path.insert(0, str(project_root))
 
 from infrastructure.database.connection import session_scope
 from infrastructure.database.models import DistrictSocioeconomic
-from infrastructure.utilities.nces_cds_crosswalk import cds_to_nces, normalize_cds_code
+from infrastructure.database.migrations.sea_import_utils import resolve_cds_nces_ids
 
 
 def load_frpm_data(file_path: Path) -> pd.DataFrame:
@@ -76,25 +76,15 @@ def filter_district_level(df: pd.DataFrame) -> pd.DataFrame:
     return district_df
 
 
-def build_cds_code(row: pd.Series) -> str:
-    """Build 7-digit CDS code from County Code and District Code."""
-    county = str(row['County Code']).strip().zfill(2)
-    district = str(row['District Code']).strip().zfill(5)
-    return county + district
-
-
-def import_frpm_record(row: pd.Series, session, year: str = "2023-24") -> Optional[DistrictSocioeconomic]:
+def import_frpm_record(row: pd.Series, year: str = "2023-24") -> Optional[DistrictSocioeconomic]:
     """
     Import a single FRPM record.
 
     Returns:
         DistrictSocioeconomic object if successful, None if crosswalk failed
     """
-    # Build CDS code
-    cds_code = build_cds_code(row)
-
-    # Get NCES ID via crosswalk
-    nces_id = cds_to_nces(cds_code, session)
+    # NCES ID resolved for the whole frame by resolve_cds_nces_ids()
+    nces_id = row['nces_id']
 
     if not nces_id:
         return None
@@ -171,8 +161,10 @@ def import_ca_frpm(file_path: Path, year: str = "2023-24"):
         ).delete()
         print(f"  Deleted {deleted} existing FRPM records for {year}")
 
+        district_df = resolve_cds_nces_ids(district_df, session)
+
         for idx, row in district_df.iterrows():
-            frpm_record = import_frpm_record(row, session, year)
+            frpm_record = import_frpm_record(row, year)
 
             if frpm_record:
                 session.add(frpm_record)
@@ -181,11 +173,11 @@ def import_ca_frpm(file_path: Path, year: str = "2023-24"):
                 if imported_count % 100 == 0:
                     print(f"  Imported {imported_count} districts...")
                     session.flush()
-            elif build_cds_code(row):
+            elif row['cds_code']:
                 # Check if it was skipped (no enrollment) or failed (no NCES match)
                 if pd.notna(row['Enrollment \n(K-12)']) and row['Enrollment \n(K-12)'] > 0:
                     failed_count += 1
-                    cds_code = build_cds_code(row)
+                    cds_code = row['cds_code']
                     district_name = row.get('District Name', 'Unknown')
                     failed_districts.append((cds_code, district_name))
                 else:
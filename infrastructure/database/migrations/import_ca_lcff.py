@@ -22,7 +22,7 @@ sys.path.insert(0, str(project_root))
 
 from infrastructure.database.connection import session_scope
 from infrastructure.database.models import DistrictFunding, CALCFFFunding
-from infrastructure.utilities.nces_cds_crosswalk import cds_to_nces
+from infrastructure.database.migrations.sea_import_utils import resolve_cds_nces_ids
 
 
 def load_lcff_data(file_path: Path) -> pd.DataFrame:
@@ -60,25 +60,15 @@ def filter_district_level(df: pd.DataFrame) -> pd.DataFrame:
     return district_df
 
 
-def build_cds_code(row: pd.Series) -> str:
-    """Build 7-digit CDS code from County Code and District Code."""
-    county = str(row['County Code']).strip().zfill(2)
-    district = str(row['District Code']).strip().zfill(5)
-    return county + district
-
-
-def import_lcff_record(row: pd.Series, session, year: str = "2023-24") -> Tuple[Optional[DistrictFunding], Optional[CALCFFFunding]]:
+def import_lcff_record(row: pd.Series, year: str = "2023-24") -> Tuple[Optional[DistrictFunding], Optional[CALCFFFunding]]:
     """
     Import a single LCFF record.
 
     Returns:
         Tuple of (DistrictFunding, CALCFFFunding) if successful, (None, None) if crosswalk failed
     """
-    # Build CDS code
-    cds_code = build_cds_code(row)
-
-    # Get NCES ID via crosswalk
-    nces_id = cds_to_nces(cds_code, session)
+    # NCES ID resolved for the whole frame by resolve_cds_nces_ids()
+    nces_id = row['nces_id']
 
     if not nces_id:
         return None, None
@@ -193,8 +183,10 @@ def import_ca_lcff(file_path: Path, year: str = "2023-24"):
         print(f"  Deleted {deleted_funding} existing DistrictFunding records")
         print(f"  Deleted {deleted_lcff} existing CALCFFFunding records")
 
+        district_df = resolve_cds_nces_ids(district_df, session)
+
         for idx, row in district_df.iterrows():
-            funding_record, lcff_record = import_lcff_record(row, session, year)
+            funding_record, lcff_record = import_lcff_record(row, year)
 
             if funding_record and lcff_record:
                 session.add(funding_record)
@@ -204,11 +196,11 @@ def import_ca_lcff(file_path: Path, year: str = "2023-24"):
                 if imported_count % 100 == 0:
                     print(f"  Imported {imported_count} districts...")
                     session.flush()
-            elif build_cds_code(row):
+            elif row['cds_code']:
                 # Check if it was skipped (no funding) or failed (no NCES match)
                 if pd.notna(row.get('Total LCFF Entitlement')) and row.get('Total LCFF Entitlement') > 0:
                     failed_count += 1
-                    cds_code = build_cds_code(row)
+                    cds_code = row['cds_code']
                     lea_name = row.get('Local Educational Agency ', 'Unknown')
                     failed_districts.append((cds_code, lea_name))
                 else:
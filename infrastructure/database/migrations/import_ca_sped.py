@@ -29,7 +29,7 @@ sys.path.insert(0, str(project_root))
 
 from infrastructure.database.connection import session_scope
 from infrastructure.database.models import CASpedDistrictEnvironments
-from infrastructure.utilities.nces_cds_crosswalk import cds_to_nces, normalize_cds_code
+from infrastructure.database.migrations.sea_import_utils import resolve_cds_nces_ids
 
 
 def load_sped_data(file_path: Path) -> pd.DataFrame:
@@ -81,25 +81,15 @@ def filter_district_level(df: pd.DataFrame) -> pd.DataFrame:
     return aggregated_df
 
 
-def build_cds_code(row: pd.Series) -> str:
-    """Build 7-digit CDS code from County Code and District Code."""
-    county = str(row['County Code']).strip().zfill(2)
-    district = str(row['District Code']).strip().zfill(5)
-    return county + district
-
-
-def import_sped_record(row: pd.Series, session, year: str = "2023-24") -> Optional[CASpedDistrictEnvironments]:
+def import_sped_record(row: pd.Series, year: str = "2023-24") -> Optional[CASpedDistrictEnvironments]:
     """
     Import a single SPED record.
 
     Returns:
         CASpedDistrictEnvironments object if successful, None if crosswalk failed
     """
-    # Build CDS code
-    cds_code = build_cds_code(row)
-
-    # Get NCES ID via crosswalk
-    nces_id = cds_to_nces(cds_code, session)
+    # NCES ID resolved for the whole frame by resolve_cds_nces_ids()
+    nces_id = row['nces_id']
 
     if not nces_id:
         return None
@@ -194,8 +184,10 @@ def import_ca_sped(file_path: Path, year: str = "2023-24"):
         ).delete()
         print(f"  Deleted {deleted} existing records for {year}")
 
+        district_df = resolve_cds_nces_ids(district_df, session)
+
         for idx, row in district_df.iterrows():
-            sped_record = import_sped_record(row, session, year)
+            sped_record = import_sped_record(row, year)
 
             if sped_record:
                 session.add(sped_record)
@@ -206,7 +198,7 @@ def import_ca_sped(file_path: Path, year: str = "2023-24"):
                     session.flush()
             else:
                 failed_count += 1
-                cds_code = build_cds_code(row)
+                cds_code = row['cds_code']
                 district_name = row.get('District Name', 'Unknown')
                 failed_districts.append((cds_code, district_name))
 
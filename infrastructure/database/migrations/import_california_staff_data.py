@@ -30,13 +30,14 @@ project_root = Path(__file__).parent.parent.parent.parent
 sys.path.insert(0, str(project_root))
 
 from infrastructure.database.connection import session_scope
-from sqlalchemy import text
 import pandas as pd
 import logging
 
 # Import shared SEA utilities
 from infrastructure.database.migrations.sea_import_utils import (
-    safe_float, safe_int,
+    safe_numeric,
+    get_state_crosswalk, StateCrosswalk,
+    match_to_crosswalk, bulk_upsert,
 )
 
 # Configure logging
@@ -61,22 +62,17 @@ def log_stats(stats: dict) -> None:
     logger.info(f"  Total records: {stats['total']}")
     logger.info(f"  Matched with NCES: {stats['matched']}")
     logger.info(f"  Skipped (no match): {stats['skipped']}")
-    logger.info(f"  Inserted/Updated: {stats['inserted']}")
+    logger.info(f"  Inserted: {stats['inserted']}")
+    logger.info(f"  Updated: {stats['updated']}")
 
 
-def load_ca_crosswalk(session) -> dict:
+def load_ca_crosswalk(session) -> StateCrosswalk:
     """Load California crosswalk from database.
 
     Returns:
-        Dict mapping CDS Code (7-digit) -> NCES ID
+        Cached StateCrosswalk mapping CDS Code (7-digit) -> NCES ID
     """
-    result = session.execute(text("""
-        SELECT state_district_id, nces_id
-        FROM state_district_crosswalk
-        WHERE state = 'CA'
-          AND id_system = 'st_leaid'
-    """))
-    return {row[0]: row[1] for row in result.fetchall()}
+    return get_state_crosswalk(session, 'CA')
 
 
 def load_staff_ratio_data() -> pd.DataFrame:
@@ -114,101 +110,36 @@ def load_staff_ratio_data() -> pd.DataFrame:
     return district_df
 
 
-def import_staff_to_database(session, staff_df: pd.DataFrame, crosswalk: dict, dry_run: bool = False):
+def import_staff_to_database(session, staff_df: pd.DataFrame, crosswalk: StateCrosswalk, dry_run: bool = False):
     """Import staff data to ca_staff_data table."""
     logger.info("Importing staff data to database...")
 
-    stats = {'total': 0, 'matched': 0, 'skipped': 0, 'inserted': 0}
-
-    for _, row in staff_df.iterrows():
-        stats['total'] += 1
-
-        cds_code = row['cds_code']
-        district_name = row['District Name']
-
-        # Get NCES ID from crosswalk
-        nces_id = crosswalk.get(cds_code)
-        if not nces_id:
-            if stats['skipped'] < 5:
-                logger.warning(f"  No NCES match for CDS {cds_code} ({district_name})")
-            stats['skipped'] += 1
-            continue
-
-        stats['matched'] += 1
-
-        # Extract staff fields
-        total_enrollment = safe_int(row['TOTAL_ENR_N'])
-        teachers_fte = safe_float(row['TCH_FTE_N'])
-        admin_fte = safe_float(row['ADM_FTE_N'])
-        pupil_services_fte = safe_float(row['PSV_FTE_N'])
-        other_staff_fte = safe_float(row['OTH_FTE_N'])
-
-        # Calculate K-12 enrollment (exclude PK if needed)
-        # For now, use TOTAL_ENR_N as is since it's district-level
-
-        if not dry_run:
-            # Check if record exists
-            existing = session.execute(text("""
-                SELECT nces_id FROM ca_staff_data
-                WHERE nces_id = :nces_id AND year = :year
-            """), {"nces_id": nces_id, "year": DATA_YEAR}).fetchone()
-
-            if existing:
-                # Update existing record
-                session.execute(text("""
-                    UPDATE ca_staff_data
-                    SET teachers_fte = :teachers_fte,
-                        admin_fte = :admin_fte,
-                        pupil_services_fte = :pupil_services_fte,
-                        other_staff_fte = :other_staff_fte,
-                        data_source = 'cde_staff_ratios',
-                        updated_at = NOW()
-                    WHERE nces_id = :nces_id AND year = :year
-                """), {
-                    "nces_id": nces_id,
-                    "year": DATA_YEAR,
-                    "teachers_fte": teachers_fte,
-                    "admin_fte": admin_fte,
-                    "pupil_services_fte": pupil_services_fte,
-                    "other_staff_fte": other_staff_fte
-                })
-            else:
-                # Insert new record
-                session.execute(text("""
-                    INSERT INTO ca_staff_data (
-                        nces_id, cds_code, year,
-                        teachers_fte,
-                        admin_fte,
-                        pupil_services_fte,
-                        other_staff_fte,
-                        data_source
-                    ) VALUES (
-                        :nces_id, :cds_code, :year,
-                        :teachers_fte, :admin_fte, :pupil_services_fte, :other_staff_fte,
-                        'cde_staff_ratios'
-                    )
-                """), {
-                    "nces_id": nces_id,
-                    "cds_code": cds_code,
-                    "year": DATA_YEAR,
-                    "teachers_fte": teachers_fte,
-                    "admin_fte": admin_fte,
-                    "pupil_services_fte": pupil_services_fte,
-                    "other_staff_fte": other_staff_fte
-                })
-
-            stats['inserted'] += 1
-
-        if stats['matched'] % 100 == 0:
-            logger.info(f"  Processed {stats['matched']} districts...")
+    matched_df, stats = match_to_crosswalk(staff_df, staff_df['cds_code'], crosswalk)
+
+    unmatched = ~staff_df.index.isin(matched_df.index)
+    for cds_code, district_name in zip(staff_df.loc[unmatched, 'cds_code'][:5], staff_df.loc[unmatched, 'District Name'][:5]):
+        logger.warning(f"  No NCES match for CDS {cds_code} ({district_name})")
+
+    # Extract staff fields
+    records = pd.DataFrame({
+        'nces_id': matched_df['nces_id'],
+        'cds_code': matched_df['state_id'],
+        'year': DATA_YEAR,
+        'teachers_fte': safe_numeric(matched_df['TCH_FTE_N']),
+        'admin_fte': safe_numeric(matched_df['ADM_FTE_N']),
+        'pupil_services_fte': safe_numeric(matched_df['PSV_FTE_N']),
+        'other_staff_fte': safe_numeric(matched_df['OTH_FTE_N']),
+        'data_source': 'cde_staff_ratios',
+    })
 
     if not dry_run:
+        stats.update(bulk_upsert(session, 'ca_staff_data', records, ['nces_id', 'year']))
         session.commit()
 
     return stats
 
 
-def import_enrollment_to_database(session, staff_df: pd.DataFrame, crosswalk: dict, dry_run: bool = False):
+def import_enrollment_to_database(session, staff_df: pd.DataFrame, crosswalk: StateCrosswalk, dry_run: bool = False):
     """Import enrollment data to ca_enrollment_data table.
 
     Note: Using enrollment from staff ratio file. Could also load from cdenroll2425.txt
@@ -216,69 +147,19 @@ def import_enrollment_to_database(session, staff_df: pd.DataFrame, crosswalk: di
     """
     logger.info("Importing enrollment data to database...")
 
-    stats = {'total': 0, 'matched': 0, 'skipped': 0, 'inserted': 0}
-
-    for _, row in staff_df.iterrows():
-        stats['total'] += 1
-
-        cds_code = row['cds_code']
-
-        # Get NCES ID from crosswalk
-        nces_id = crosswalk.get(cds_code)
-        if not nces_id:
-            stats['skipped'] += 1
-            continue
-
-        stats['matched'] += 1
-
-        # Extract enrollment
-        total_enrollment = safe_int(row['TOTAL_ENR_N'])
-
-        if not dry_run:
-            # Check if record exists
-            existing = session.execute(text("""
-                SELECT nces_id FROM ca_enrollment_data
-                WHERE nces_id = :nces_id AND year = :year
-            """), {"nces_id": nces_id, "year": DATA_YEAR}).fetchone()
-
-            if existing:
-                # Update
-                session.execute(text("""
-                    UPDATE ca_enrollment_data
-                    SET total_k12 = :total_k12,
-                        data_source = 'cde_staff_ratios',
-                        updated_at = NOW()
-                    WHERE nces_id = :nces_id AND year = :year
-                """), {
-                    "nces_id": nces_id,
-                    "year": DATA_YEAR,
-                    "total_k12": total_enrollment
-                })
-            else:
-                # Insert
-                session.execute(text("""
-                    INSERT INTO ca_enrollment_data (
-                        nces_id, cds_code, year,
-                        total_k12,
-                        data_source
-                    ) VALUES (
-                        :nces_id, :cds_code, :year,
-                        :total_k12,
-                        'cde_staff_ratios'
-                    )
-                """), {
-                    "nces_id": nces_id,
-                    "cds_code": cds_code,
-                    "year": DATA_YEAR,
-                    "total_k12": total_enrollment
-                })
-
-            stats['inserted'] += 1
-
-        if stats['matched'] % 100 == 0:
-            logger.info(f"  Processed {stats['matched']} districts...")
+    matched_df, stats = match_to_crosswalk(staff_df, staff_df['cds_code'], crosswalk)
+
+    # TOTAL_ENR_N is district-level, used as K-12 total
+    records = pd.DataFrame({
+        'nces_id': matched_df['nces_id'],
+        'cds_code': matched_df['state_id'],
+        'year': DATA_YEAR,
+        'total_k12': safe_numeric(matched_df['TOTAL_ENR_N'], integer=True),
+        'data_source': 'cde_staff_ratios',
+    })
 
     if not dry_run:
+        stats.update(bulk_upsert(session, 'ca_enrollment_data', records, ['nces_id', 'year']))
         session.commit()
 
     return stats
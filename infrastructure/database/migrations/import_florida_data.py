@@ -27,9 +27,7 @@ import logging
 
 # Import shared SEA utilities
 from infrastructure.database.migrations.sea_import_utils import (
-    safe_float, safe_int,
-    load_state_crosswalk, get_district_name,
-    format_state_id, log_import_summary,
+    get_state_crosswalk, StateCrosswalk, bulk_upsert, numeric_column, upsert_mapped,
 )
 
 # Configure logging
@@ -48,7 +46,7 @@ ENROLLMENT_FILE = FLORIDA_DATA_DIR / "2425MembInFLPublicSchools.xlsx"
 STATE_CODE = 'FL'
 
 
-def load_florida_crosswalk(session, county_districts_only: bool = True) -> dict:
+def load_florida_crosswalk(session, county_districts_only: bool = True) -> StateCrosswalk:
     """Load Florida crosswalk from database.
 
     Args:
@@ -57,26 +55,13 @@ def load_florida_crosswalk(session, county_districts_only: bool = True) -> dict:
                               If False, include charter districts (e.g., 53D).
 
     Returns:
-        Dict mapping FLDOE district code -> NCES ID
+        Cached StateCrosswalk mapping FLDOE district code -> NCES ID
     """
+    crosswalk = get_state_crosswalk(session, 'FL')
     if county_districts_only:
         # Only return 2-digit numeric county district codes
-        result = session.execute(text("""
-            SELECT state_district_id, nces_id
-            FROM state_district_crosswalk
-            WHERE state = 'FL'
-              AND id_system = 'st_leaid'
-              AND LENGTH(state_district_id) = 2
-              AND state_district_id ~ '^[0-9]+$'
-        """))
-    else:
-        result = session.execute(text("""
-            SELECT state_district_id, nces_id
-            FROM state_district_crosswalk
-            WHERE state = 'FL'
-              AND id_system = 'st_leaid'
-        """))
-    return {row[0]: row[1] for row in result.fetchall()}
+        return crosswalk.where_keys(lambda code: len(code) == 2 and code.isdigit())
+    return crosswalk
 
 
 def load_staff_data():
@@ -133,42 +118,24 @@ def import_district_identifiers():
         florida_crosswalk = load_florida_crosswalk(session)
         logger.info(f"Loaded {len(florida_crosswalk)} Florida districts from crosswalk table")
 
-        count = 0
-        for fldoe_no, nces_id in florida_crosswalk.items():
-            try:
-                # Get district name from districts table
-                result = session.execute(text("""
-                    SELECT name FROM districts WHERE nces_id = :nces_id
-                """), {"nces_id": nces_id})
-                row = result.fetchone()
-
-                if not row:
-                    logger.debug(f"District {nces_id} not found in districts table")
-                    continue
-
-                district_name = row[0]
-
-                # Insert into fl_district_identifiers
-                session.execute(text("""
-                    INSERT INTO fl_district_identifiers
-                    (nces_id, fldoe_district_no, district_name_fldoe, source_year)
-                    VALUES (:nces_id, :fldoe_no, :name, '2024-25')
-                    ON CONFLICT (nces_id) DO UPDATE SET
-                        fldoe_district_no = EXCLUDED.fldoe_district_no,
-                        district_name_fldoe = EXCLUDED.district_name_fldoe,
-                        updated_at = CURRENT_TIMESTAMP
-                """), {
-                    "nces_id": nces_id,
-                    "fldoe_no": fldoe_no,
-                    "name": district_name
-                })
-                count += 1
-
-            except Exception as e:
-                logger.error(f"Failed to import {fldoe_no}: {e}")
+        # District names for every crosswalk entry in one query; entries
+        # missing from the districts table are skipped
+        names = dict(session.execute(text("""
+            SELECT nces_id, name FROM districts WHERE nces_id = ANY(:nces_ids)
+        """), {"nces_ids": list(florida_crosswalk.values())}).fetchall())
+
+        records = pd.DataFrame(
+            [(nces_id, fldoe_no, names[nces_id]) for fldoe_no, nces_id in florida_crosswalk.items()
+             if nces_id in names],
+            columns=['nces_id', 'fldoe_district_no', 'district_name_fldoe'],
+        ).assign(source_year='2024-25')
 
+        counts = bulk_upsert(session, 'fl_district_identifiers', records, ['nces_id'])
         session.commit()
-        logger.info(f"✅ Imported {count} district identifiers")
+
+        count = counts['inserted'] + counts['updated']
+        logger.info(f"✅ Imported {count} district identifiers "
+                    f"(skipped {len(florida_crosswalk) - len(records)} not in districts table)")
         return count
 
 
@@ -183,51 +150,18 @@ def import_staff_data(df):
 
     logger.info("Importing Florida staff data...")
 
-    # Load crosswalk once for efficiency
     with session_scope() as session:
-        florida_crosswalk = load_florida_crosswalk(session)
-
-    count = 0
-    for _, row in df.iterrows():
-        try:
-            # Extract district code from 'Dist #'
-            district_code = str(int(row.get('Dist #', 0))).strip().zfill(2)
-
-            # Look up NCES ID from crosswalk
-            nces_id = florida_crosswalk.get(district_code)
-            if not nces_id:
-                continue
-
-            # Extract staff counts using safe conversion
-            total_staff = safe_float(row.get('Total Instructional Staff')) or 0
-            total_teachers = safe_float(row.get('Total Teachers')) or 0
-            ese_teachers = safe_float(row.get('Exceptional Education Teachers')) or 0
-
-            # Use individual transaction for each row
-            with session_scope() as session:
-                session.execute(text("""
-                    INSERT INTO fl_staff_data
-                    (nces_id, year, total_instructional_staff, classroom_teachers, ese_teachers)
-                    VALUES (:nces_id, '2024-25', :total, :teachers, :ese)
-                    ON CONFLICT (nces_id, year, data_source) DO UPDATE SET
-                        total_instructional_staff = EXCLUDED.total_instructional_staff,
-                        classroom_teachers = EXCLUDED.classroom_teachers,
-                        ese_teachers = EXCLUDED.ese_teachers,
-                        updated_at = CURRENT_TIMESTAMP
-                """), {
-                    "nces_id": nces_id,
-                    "total": total_staff,
-                    "teachers": total_teachers,
-                    "ese": ese_teachers
-                })
-                session.commit()
-                count += 1
-
-        except Exception as e:
-            logger.debug(f"Skipping district {district_code}: {str(e)[:100]}")
-            continue
-
-    logger.info(f"✅ Imported {count} staff records")
+        count, _ = upsert_mapped(
+            session, 'fl_staff_data', df, df['Dist #'], load_florida_crosswalk(session),
+            {
+                'year': '2024-25',
+                'total_instructional_staff': numeric_column('Total Instructional Staff', default=0),
+                'classroom_teachers': numeric_column('Total Teachers', default=0),
+                'ese_teachers': numeric_column('Exceptional Education Teachers', default=0),
+            },
+            ['nces_id', 'year', 'data_source'],
+            label='staff records',
+        )
     return count
 
 
@@ -242,46 +176,16 @@ def import_enrollment_data(df):
 
     logger.info("Importing Florida enrollment data...")
 
-    # Load crosswalk once for efficiency
     with session_scope() as session:
-        florida_crosswalk = load_florida_crosswalk(session)
-
-    count = 0
-    for idx, row in df.iterrows():
-        district_code = "unknown"
-        try:
-            # Extract district code from 'District #'
-            district_code = str(int(row.get('District #', 0))).strip().zfill(2)
-
-            # Look up NCES ID from crosswalk
-            nces_id = florida_crosswalk.get(district_code)
-            if not nces_id:
-                continue
-
-            # Extract enrollment using safe conversion
-            total_enrollment = safe_int(row.get('Total Enrollment')) or 0
-
-            # Use individual transaction for each row
-            with session_scope() as session:
-                session.execute(text("""
-                    INSERT INTO fl_enrollment_data
-                    (nces_id, year, total_enrollment)
-                    VALUES (:nces_id, '2024-25', :enrollment)
-                    ON CONFLICT (nces_id, year, data_source) DO UPDATE SET
-                        total_enrollment = EXCLUDED.total_enrollment,
-                        updated_at = CURRENT_TIMESTAMP
-                """), {
-                    "nces_id": nces_id,
-                    "enrollment": total_enrollment
-                })
-                session.commit()
-                count += 1
-
-        except Exception as e:
-            logger.debug(f"Skipping district {district_code} (row {idx}): {str(e)[:100]}")
-            continue
-
-    logger.info(f"✅ Imported {count} enrollment records")
+        count, _ = upsert_mapped(
+            session, 'fl_enrollment_data', df, df['District #'], load_florida_crosswalk(session),
+            {
+                'year': '2024-25',
+                'total_enrollment': numeric_column('Total Enrollment', integer=True, default=0),
+            },
+            ['nces_id', 'year', 'data_source'],
+            label='enrollment records',
+        )
     return count
 
 
@@ -39,9 +39,7 @@ import logging
 
 # Import shared SEA utilities
 from infrastructure.database.migrations.sea_import_utils import (
-    safe_float, safe_int,
-    load_state_crosswalk, get_district_name,
-    log_import_summary,
+    safe_numeric, get_state_crosswalk, StateCrosswalk, numeric_column, text_column, upsert_mapped,
 )
 
 # Configure logging
@@ -72,19 +70,13 @@ def rcdts_to_state_id(rcdts):
     return f'{s[0:2]}-{s[2:5]}-{s[5:9]}-{s[9:11]}'
 
 
-def load_il_crosswalk(session) -> dict:
+def load_il_crosswalk(session) -> StateCrosswalk:
     """Load Illinois crosswalk from database.
 
     Returns:
-        Dict mapping ISBE state district ID -> NCES ID
+        Cached StateCrosswalk mapping ISBE state district ID -> NCES ID
     """
-    result = session.execute(text("""
-        SELECT state_district_id, nces_id
-        FROM state_district_crosswalk
-        WHERE state = 'IL'
-          AND id_system = 'st_leaid'
-    """))
-    return {row[0]: row[1] for row in result.fetchall()}
+    return get_state_crosswalk(session, 'IL')
 
 
 def load_report_card_data():
@@ -173,9 +165,6 @@ def create_il_tables():
         logger.info("✅ Tables created/verified")
 
 
-# Note: safe_float and safe_int are now imported from sea_import_utils
-
-
 def import_district_identifiers(df):
     """Import Illinois district identifiers from Report Card data."""
     if df is None:
@@ -185,46 +174,17 @@ def import_district_identifiers(df):
     logger.info("Importing Illinois district identifiers...")
 
     with session_scope() as session:
-        # Load crosswalk from database
-        il_crosswalk = load_il_crosswalk(session)
-        logger.info(f"Loaded {len(il_crosswalk)} Illinois districts from crosswalk table")
-
-        count = 0
-        for _, row in df.iterrows():
-            try:
-                # Convert RCDTS to state ID format
-                rcdts = str(row['RCDTS'])
-                state_id = rcdts_to_state_id(rcdts)
-
-                # Look up NCES ID
-                nces_id = il_crosswalk.get(state_id)
-                if not nces_id:
-                    continue
-
-                district_name = str(row.get('District', '')).strip()
-
-                # Insert into il_district_identifiers
-                session.execute(text("""
-                    INSERT INTO il_district_identifiers
-                    (nces_id, isbe_rcdts, district_name_isbe, source_year)
-                    VALUES (:nces_id, :rcdts, :name, '2023-24')
-                    ON CONFLICT (nces_id) DO UPDATE SET
-                        isbe_rcdts = EXCLUDED.isbe_rcdts,
-                        district_name_isbe = EXCLUDED.district_name_isbe,
-                        updated_at = CURRENT_TIMESTAMP
-                """), {
-                    "nces_id": nces_id,
-                    "rcdts": rcdts,
-                    "name": district_name
-                })
-                count += 1
-
-            except Exception as e:
-                logger.debug(f"Failed to import {rcdts}: {e}")
-
-        session.commit()
-        logger.info(f"✅ Imported {count} district identifiers")
-        return count
+        count, _ = upsert_mapped(
+            session, 'il_district_identifiers', df, df['RCDTS'], load_il_crosswalk(session),
+            {
+                'isbe_rcdts': lambda d: d['RCDTS'].astype(str),
+                'district_name_isbe': text_column('District'),
+                'source_year': '2023-24',
+            },
+            ['nces_id'],
+            label='district identifiers',
+        )
+    return count
 
 
 def import_staff_data(df):
@@ -235,80 +195,27 @@ def import_staff_data(df):
 
     logger.info("Importing Illinois staff data...")
 
-    # Load crosswalk once for efficiency
+    # Skip if no teacher FTE
+    df = df[safe_numeric(df['Total Teacher FTE']).fillna(0) != 0]
+
     with session_scope() as session:
-        il_crosswalk = load_il_crosswalk(session)
-
-    count = 0
-    skipped = 0
-    for _, row in df.iterrows():
-        try:
-            # Convert RCDTS to state ID format
-            rcdts = str(row['RCDTS'])
-            state_id = rcdts_to_state_id(rcdts)
-
-            # Look up NCES ID from crosswalk
-            nces_id = il_crosswalk.get(state_id)
-            if not nces_id:
-                skipped += 1
-                continue
-
-            # Extract staff data
-            total_teacher_fte = safe_float(row.get('Total Teacher FTE'))
-            counselor_fte = safe_float(row.get('School Counselor FTE'))
-            nurse_fte = safe_float(row.get('School Nurse FTE'))
-            psychologist_fte = safe_float(row.get('School Psychologist FTE'))
-            social_worker_fte = safe_float(row.get('School Social Worker FTE'))
-            ptr_elementary = safe_float(row.get('Pupil Teacher Ratio - Elementary'))
-            ptr_high_school = safe_float(row.get('Pupil Teacher Ratio - High School'))
-            teacher_retention = safe_float(row.get('Teacher Retention Rate'))
-            teacher_salary = safe_float(row.get('Teacher Avg Salary'))
-
-            # Skip if no teacher FTE
-            if total_teacher_fte is None or total_teacher_fte == 0:
-                continue
-
-            # Use individual transaction for each row
-            with session_scope() as session:
-                session.execute(text("""
-                    INSERT INTO il_staff_data
-                    (nces_id, year, total_teacher_fte, counselor_fte, nurse_fte,
-                     psychologist_fte, social_worker_fte, ptr_elementary,
-                     ptr_high_school, teacher_retention_rate, teacher_avg_salary)
-                    VALUES (:nces_id, '2023-24', :teacher_fte, :counselor, :nurse,
-                            :psychologist, :social_worker, :ptr_elem,
-                            :ptr_hs, :retention, :salary)
-                    ON CONFLICT (nces_id, year, data_source) DO UPDATE SET
-                        total_teacher_fte = EXCLUDED.total_teacher_fte,
-                        counselor_fte = EXCLUDED.counselor_fte,
-                        nurse_fte = EXCLUDED.nurse_fte,
-                        psychologist_fte = EXCLUDED.psychologist_fte,
-                        social_worker_fte = EXCLUDED.social_worker_fte,
-                        ptr_elementary = EXCLUDED.ptr_elementary,
-                        ptr_high_school = EXCLUDED.ptr_high_school,
-                        teacher_retention_rate = EXCLUDED.teacher_retention_rate,
-                        teacher_avg_salary = EXCLUDED.teacher_avg_salary,
-                        updated_at = CURRENT_TIMESTAMP
-                """), {
-                    "nces_id": nces_id,
-                    "teacher_fte": total_teacher_fte,
-                    "counselor": counselor_fte,
-                    "nurse": nurse_fte,
-                    "psychologist": psychologist_fte,
-                    "social_worker": social_worker_fte,
-                    "ptr_elem": ptr_elementary,
-                    "ptr_hs": ptr_high_school,
-                    "retention": teacher_retention,
-                    "salary": teacher_salary
-                })
-                session.commit()
-                count += 1
-
-        except Exception as e:
-            logger.debug(f"Skipping row: {str(e)[:100]}")
-            continue
-
-    logger.info(f"✅ Imported {count} staff records ({skipped} skipped - no NCES match)")
+        count, _ = upsert_mapped(
+            session, 'il_staff_data', df, df['RCDTS'], load_il_crosswalk(session),
+            {
+                'year': '2023-24',
+                'total_teacher_fte': numeric_column('Total Teacher FTE'),
+                'counselor_fte': numeric_column('School Counselor FTE'),
+                'nurse_fte': numeric_column('School Nurse FTE'),
+                'psychologist_fte': numeric_column('School Psychologist FTE'),
+                'social_worker_fte': numeric_column('School Social Worker FTE'),
+                'ptr_elementary': numeric_column('Pupil Teacher Ratio - Elementary'),
+                'ptr_high_school': numeric_column('Pupil Teacher Ratio - High School'),
+                'teacher_retention_rate': numeric_column('Teacher Retention Rate'),
+                'teacher_avg_salary': numeric_column('Teacher Avg Salary'),
+            },
+            ['nces_id', 'year', 'data_source'],
+            label='staff records',
+        )
     return count
 
 
@@ -320,83 +227,29 @@ def import_enrollment_data(df):
 
     logger.info("Importing Illinois enrollment data...")
 
-    # Load crosswalk once for efficiency
+    # Skip if no enrollment
+    df = df[safe_numeric(df['# Student Enrollment'], integer=True).fillna(0) != 0]
+
     with session_scope() as session:
-        il_crosswalk = load_il_crosswalk(session)
-
-    count = 0
-    skipped = 0
-    for _, row in df.iterrows():
-        try:
-            # Convert RCDTS to state ID format
-            rcdts = str(row['RCDTS'])
-            state_id = rcdts_to_state_id(rcdts)
-
-            # Look up NCES ID from crosswalk
-            nces_id = il_crosswalk.get(state_id)
-            if not nces_id:
-                skipped += 1
-                continue
-
-            # Extract enrollment data
-            total_enrollment = safe_int(row.get('# Student Enrollment'))
-            pct_white = safe_float(row.get('% Student Enrollment - White'))
-            pct_black = safe_float(row.get('% Student Enrollment - Black or African American'))
-            pct_hispanic = safe_float(row.get('% Student Enrollment - Hispanic or Latino'))
-            pct_asian = safe_float(row.get('% Student Enrollment - Asian'))
-            pct_low_income = safe_float(row.get('% Student Enrollment - Low Income'))
-            pct_iep = safe_float(row.get('% Student Enrollment - IEP'))
-            pct_el = safe_float(row.get('% Student Enrollment - EL'))
-            students_with_disabilities = safe_int(row.get('# Student Enrollment - Children with Disabilities'))
-            iep_students = safe_int(row.get('# Student Enrollment - IEP'))
-
-            # Skip if no enrollment
-            if total_enrollment is None or total_enrollment == 0:
-                continue
-
-            # Use individual transaction for each row
-            with session_scope() as session:
-                session.execute(text("""
-                    INSERT INTO il_enrollment_data
-                    (nces_id, year, total_enrollment, pct_white, pct_black,
-                     pct_hispanic, pct_asian, pct_low_income, pct_iep, pct_el,
-                     students_with_disabilities, iep_students)
-                    VALUES (:nces_id, '2023-24', :enrollment, :white, :black,
-                            :hispanic, :asian, :low_income, :iep, :el,
-                            :swd, :iep_students)
-                    ON CONFLICT (nces_id, year, data_source) DO UPDATE SET
-                        total_enrollment = EXCLUDED.total_enrollment,
-                        pct_white = EXCLUDED.pct_white,
-                        pct_black = EXCLUDED.pct_black,
-                        pct_hispanic = EXCLUDED.pct_hispanic,
-                        pct_asian = EXCLUDED.pct_asian,
-                        pct_low_income = EXCLUDED.pct_low_income,
-                        pct_iep = EXCLUDED.pct_iep,
-                        pct_el = EXCLUDED.pct_el,
-                        students_with_disabilities = EXCLUDED.students_with_disabilities,
-                        iep_students = EXCLUDED.iep_students,
-                        updated_at = CURRENT_TIMESTAMP
-                """), {
-                    "nces_id": nces_id,
-                    "enrollment": total_enrollment,
-                    "white": pct_white,
-                    "black": pct_black,
-                    "hispanic": pct_hispanic,
-                    "asian": pct_asian,
-                    "low_income": pct_low_income,
-                    "iep": pct_iep,
-                    "el": pct_el,
-                    "swd": students_with_disabilities,
-                    "iep_students": iep_students
-                })
-                session.commit()
-                count += 1
-
-        except Exception as e:
-            logger.debug(f"Skipping row: {str(e)[:100]}")
-            continue
-
-    logger.info(f"✅ Imported {count} enrollment records ({skipped} skipped - no NCES match)")
+        count, _ = upsert_mapped(
+            session, 'il_enrollment_data', df, df['RCDTS'], load_il_crosswalk(session),
+            {
+                'year': '2023-24',
+                'total_enrollment': numeric_column('# Student Enrollment', integer=True),
+                'pct_white': numeric_column('% Student Enrollment - White'),
+                'pct_black': numeric_column('% Student Enrollment - Black or African American'),
+                'pct_hispanic': numeric_column('% Student Enrollment - Hispanic or Latino'),
+                'pct_asian': numeric_column('% Student Enrollment - Asian'),
+                'pct_low_income': numeric_column('% Student Enrollment - Low Income'),
+                'pct_iep': numeric_column('% Student Enrollment - IEP'),
+                'pct_el': numeric_column('% Student Enrollment - EL'),
+                'students_with_disabilities': numeric_column(
+                    '# Student Enrollment - Children with Disabilities', integer=True),
+                'iep_students': numeric_column('# Student Enrollment - IEP', integer=True),
+            },
+            ['nces_id', 'year', 'data_source'],
+            label='enrollment records',
+        )
     return count
 
 
@@ -36,9 +36,7 @@ import logging
 
 # Import shared SEA utilities
 from infrastructure.database.migrations.sea_import_utils import (
-    safe_float, safe_int,
-    load_state_crosswalk, get_district_name,
-    log_import_summary,
+    safe_numeric, get_state_crosswalk, StateCrosswalk, numeric_column, text_column, upsert_mapped,
 )
 
 # Configure logging
@@ -80,19 +78,13 @@ def format_ma_district_code(dist_code) -> str:
     return code_str[:4]
 
 
-def load_ma_crosswalk(session) -> dict:
+def load_ma_crosswalk(session) -> StateCrosswalk:
     """Load Massachusetts crosswalk from database.
 
     Returns:
-        Dict mapping DESE District Code (4-digit zero-padded) -> NCES ID
+        Cached StateCrosswalk mapping DESE District Code (4-digit zero-padded) -> NCES ID
     """
-    result = session.execute(text("""
-        SELECT state_district_id, nces_id
-        FROM state_district_crosswalk
-        WHERE state = 'MA'
-          AND id_system = 'st_leaid'
-    """))
-    return {row[0]: row[1] for row in result.fetchall()}
+    return get_state_crosswalk(session, 'MA')
 
 
 def load_teacher_data():
@@ -207,170 +199,68 @@ def create_ma_tables():
         logger.info("Massachusetts-specific tables created successfully")
 
 
+def student_teacher_ratio(df):
+    """Parse student/teacher ratios (format: "11.3 to 1", or a bare number)."""
+    return safe_numeric(df['student_teacher_ratio'].astype('string').str.split('to').str[0].str.strip())
+
+
 def import_district_identifiers(session, crosswalk, teacher_df, enrollment_df):
     """Import district identifiers to ma_district_identifiers table."""
     logger.info("Importing district identifiers...")
 
-    imported = 0
-    skipped = 0
-
     # Use teacher data for names (more complete district names)
-    for _, row in teacher_df.iterrows():
-        try:
-            dist_code_4 = format_ma_district_code(row['district_code'])
-        except (ValueError, TypeError):
-            skipped += 1
-            continue
-
-        if dist_code_4 not in crosswalk:
-            skipped += 1
-            continue
-
-        nces_id = crosswalk[dist_code_4]
-        district_name = str(row.get('district_name', '')).strip()
-
-        try:
-            session.execute(text("""
-                INSERT INTO ma_district_identifiers
-                (nces_id, dese_district_code, district_name_dese, source_year)
-                VALUES (:nces_id, :dist_code, :name, :year)
-                ON CONFLICT (nces_id) DO UPDATE SET
-                    district_name_dese = EXCLUDED.district_name_dese,
-                    updated_at = CURRENT_TIMESTAMP
-            """), {
-                "nces_id": nces_id,
-                "dist_code": dist_code_4,
-                "name": district_name,
-                "year": DATA_YEAR
-            })
-            imported += 1
-        except Exception as e:
-            logger.error(f"Failed to import identifier for District {dist_code_4}: {e}")
-            skipped += 1
-
-    session.commit()
-    logger.info(f"Imported {imported} district identifiers, skipped {skipped}")
-    return imported, skipped
+    return upsert_mapped(
+        session, 'ma_district_identifiers', teacher_df, teacher_df['district_code'], crosswalk,
+        {
+            'dese_district_code': lambda df: df['state_id'],
+            'district_name_dese': text_column('district_name'),
+            'source_year': DATA_YEAR,
+        },
+        ['nces_id'],
+        update_columns=['district_name_dese'],
+        label='district identifiers',
+    )
 
 
 def import_staff_data(session, crosswalk, teacher_df):
     """Import staff data to ma_staff_data table."""
     logger.info("Importing staff data...")
 
-    imported = 0
-    skipped = 0
-
-    for _, row in teacher_df.iterrows():
-        try:
-            dist_code_4 = format_ma_district_code(row['district_code'])
-        except (ValueError, TypeError):
-            skipped += 1
-            continue
-
-        if dist_code_4 not in crosswalk:
-            skipped += 1
-            continue
-
-        nces_id = crosswalk[dist_code_4]
-
-        # Parse student/teacher ratio (format: "11.3 to 1")
-        ratio_raw = row.get('student_teacher_ratio', '')
-        ratio_val = None
-        if isinstance(ratio_raw, str) and 'to' in ratio_raw:
-            try:
-                ratio_val = float(ratio_raw.split('to')[0].strip())
-            except ValueError:
-                pass
-        elif isinstance(ratio_raw, (int, float)):
-            ratio_val = float(ratio_raw)
-
-        try:
-            session.execute(text("""
-                INSERT INTO ma_staff_data
-                (nces_id, year, teachers_fte, pct_licensed, student_teacher_ratio, pct_experienced)
-                VALUES (:nces_id, :year, :teachers, :pct_lic, :ratio, :pct_exp)
-                ON CONFLICT (nces_id, year, data_source) DO UPDATE SET
-                    teachers_fte = EXCLUDED.teachers_fte,
-                    pct_licensed = EXCLUDED.pct_licensed,
-                    student_teacher_ratio = EXCLUDED.student_teacher_ratio,
-                    pct_experienced = EXCLUDED.pct_experienced,
-                    updated_at = CURRENT_TIMESTAMP
-            """), {
-                "nces_id": nces_id,
-                "year": DATA_YEAR,
-                "teachers": safe_float(row.get('teachers_fte')),
-                "pct_lic": safe_float(row.get('pct_licensed')),
-                "ratio": ratio_val,
-                "pct_exp": safe_float(row.get('pct_experienced'))
-            })
-            imported += 1
-        except Exception as e:
-            logger.error(f"Failed to import staff data for District {dist_code_4}: {e}")
-            skipped += 1
-
-    session.commit()
-    logger.info(f"Imported {imported} staff records, skipped {skipped}")
-    return imported, skipped
+    return upsert_mapped(
+        session, 'ma_staff_data', teacher_df, teacher_df['district_code'], crosswalk,
+        {
+            'year': DATA_YEAR,
+            'teachers_fte': numeric_column('teachers_fte'),
+            'pct_licensed': numeric_column('pct_licensed'),
+            'student_teacher_ratio': student_teacher_ratio,
+            'pct_experienced': numeric_column('pct_experienced'),
+        },
+        ['nces_id', 'year', 'data_source'],
+        label='staff records',
+    )
 
 
 def import_enrollment_data(session, crosswalk, enrollment_df):
     """Import enrollment data to ma_enrollment_data table."""
     logger.info("Importing enrollment data...")
 
-    imported = 0
-    skipped = 0
-
-    for _, row in enrollment_df.iterrows():
-        try:
-            dist_code_4 = format_ma_district_code(row['DIST_CODE'])
-        except (ValueError, TypeError):
-            skipped += 1
-            continue
-
-        if dist_code_4 not in crosswalk:
-            skipped += 1
-            continue
-
-        nces_id = crosswalk[dist_code_4]
-
-        try:
-            session.execute(text("""
-                INSERT INTO ma_enrollment_data
-                (nces_id, year, total_enrollment, pk_enrollment, k_enrollment,
-                 sped_count, sped_pct, el_count, el_pct, low_income_count, low_income_pct)
-                VALUES (:nces_id, :year, :total, :pk, :k, :sped, :sped_pct, :el, :el_pct, :li, :li_pct)
-                ON CONFLICT (nces_id, year, data_source) DO UPDATE SET
-                    total_enrollment = EXCLUDED.total_enrollment,
-                    pk_enrollment = EXCLUDED.pk_enrollment,
-                    k_enrollment = EXCLUDED.k_enrollment,
-                    sped_count = EXCLUDED.sped_count,
-                    sped_pct = EXCLUDED.sped_pct,
-                    el_count = EXCLUDED.el_count,
-                    el_pct = EXCLUDED.el_pct,
-                    low_income_count = EXCLUDED.low_income_count,
-                    low_income_pct = EXCLUDED.low_income_pct,
-                    updated_at = CURRENT_TIMESTAMP
-            """), {
-                "nces_id": nces_id,
-                "year": DATA_YEAR,
-                "total": safe_int(row.get('TOTAL_CNT')),
-                "pk": safe_int(row.get('PK_CNT')),
-                "k": safe_int(row.get('K_CNT')),
-                "sped": safe_int(row.get('SWD_CNT')),
-                "sped_pct": safe_float(row.get('SWD_PCT')),
-                "el": safe_int(row.get('EL_CNT')),
-                "el_pct": safe_float(row.get('EL_PCT')),
-                "li": safe_int(row.get('LI_CNT')),
-                "li_pct": safe_float(row.get('LI_PCT'))
-            })
-            imported += 1
-        except Exception as e:
-            logger.error(f"Failed to import enrollment data for District {dist_code_4}: {e}")
-            skipped += 1
-
-    session.commit()
-    logger.info(f"Imported {imported} enrollment records, skipped {skipped}")
-    return imported, skipped
+    return upsert_mapped(
+        session, 'ma_enrollment_data', enrollment_df, enrollment_df['DIST_CODE'], crosswalk,
+        {
+            'year': DATA_YEAR,
+            'total_enrollment': numeric_column('TOTAL_CNT', integer=True),
+            'pk_enrollment': numeric_column('PK_CNT', integer=True),
+            'k_enrollment': numeric_column('K_CNT', integer=True),
+            'sped_count': numeric_column('SWD_CNT', integer=True),
+            'sped_pct': numeric_column('SWD_PCT'),
+            'el_count': numeric_column('EL_CNT', integer=True),
+            'el_pct': numeric_column('EL_PCT'),
+            'low_income_count': numeric_column('LI_CNT', integer=True),
+            'low_income_pct': numeric_column('LI_PCT'),
+        },
+        ['nces_id', 'year', 'data_source'],
+        label='enrollment records',
+    )
 
 
 def main():
@@ -36,8 +36,8 @@ import logging
 
 # Import shared SEA utilities
 from infrastructure.database.migrations.sea_import_utils import (
-    safe_float, safe_int,
-    load_state_crosswalk, get_district_name,
+    load_state_crosswalk, get_state_crosswalk, StateCrosswalk, get_district_name,
+    numeric_column, text_column, upsert_mapped,
     log_import_summary,
 )
 
@@ -58,19 +58,13 @@ ENROLLMENT_FILE = MI_DATA_DIR / "Spring_2024_Headcount.xlsx"
 SPECIAL_ED_FILE = MI_DATA_DIR / "mi_special_ed_2023_24.xlsx"
 
 
-def load_mi_crosswalk(session) -> dict:
+def load_mi_crosswalk(session) -> StateCrosswalk:
     """Load Michigan crosswalk from database.
 
     Returns:
-        Dict mapping MDE state district ID -> NCES ID
+        Cached StateCrosswalk mapping MDE state district ID -> NCES ID
     """
-    result = session.execute(text("""
-        SELECT state_district_id, nces_id
-        FROM state_district_crosswalk
-        WHERE state = 'MI'
-          AND id_system = 'st_leaid'
-    """))
-    return {row[0]: row[1] for row in result.fetchall()}
+    return get_state_crosswalk(session, 'MI')
 
 
 def load_staffing_data():
@@ -219,202 +213,73 @@ def import_district_identifiers(session, crosswalk, staffing_df):
     """Import district identifiers to mi_district_identifiers table."""
     logger.info("Importing district identifiers...")
 
-    imported = 0
-    skipped = 0
-
-    for _, row in staffing_df.iterrows():
-        district_code = str(safe_int(row.get('DCODE')))
-
-        if district_code not in crosswalk:
-            skipped += 1
-            continue
-
-        nces_id = crosswalk[district_code]
-        district_name = row.get('DNAME', '').strip()
-
-        try:
-            session.execute(text("""
-                INSERT INTO mi_district_identifiers
-                (nces_id, mde_district_code, district_name_mde, source_year)
-                VALUES (:nces_id, :code, :name, :year)
-                ON CONFLICT (nces_id) DO UPDATE SET
-                    district_name_mde = EXCLUDED.district_name_mde,
-                    updated_at = CURRENT_TIMESTAMP
-            """), {
-                "nces_id": nces_id,
-                "code": district_code,
-                "name": district_name,
-                "year": "2023-24"
-            })
-            imported += 1
-        except Exception as e:
-            logger.error(f"Failed to import identifier for {district_code}: {e}")
-            skipped += 1
-
-    session.commit()
-    logger.info(f"Imported {imported} district identifiers, skipped {skipped}")
-    return imported, skipped
+    return upsert_mapped(
+        session, 'mi_district_identifiers', staffing_df, staffing_df['DCODE'], crosswalk,
+        {
+            'mde_district_code': lambda df: df['state_id'],
+            'district_name_mde': text_column('DNAME'),
+            'source_year': '2023-24',
+        },
+        ['nces_id'],
+        label='district identifiers',
+    )
 
 
 def import_staff_data(session, crosswalk, staffing_df):
     """Import staff data to mi_staff_data table."""
     logger.info("Importing staff data...")
 
-    imported = 0
-    skipped = 0
-
-    for _, row in staffing_df.iterrows():
-        district_code = str(safe_int(row.get('DCODE')))
-
-        if district_code not in crosswalk:
-            skipped += 1
-            continue
-
-        nces_id = crosswalk[district_code]
-
-        try:
-            session.execute(text("""
-                INSERT INTO mi_staff_data
-                (nces_id, year, total_teacher_fte, sped_instructional_fte,
-                 instructional_aide_fte, instructional_support_fte)
-                VALUES (:nces_id, :year, :teachers, :se_instr, :inst_aide, :inst_sup)
-                ON CONFLICT (nces_id, year, data_source) DO UPDATE SET
-                    total_teacher_fte = EXCLUDED.total_teacher_fte,
-                    sped_instructional_fte = EXCLUDED.sped_instructional_fte,
-                    instructional_aide_fte = EXCLUDED.instructional_aide_fte,
-                    instructional_support_fte = EXCLUDED.instructional_support_fte,
-                    updated_at = CURRENT_TIMESTAMP
-            """), {
-                "nces_id": nces_id,
-                "year": "2023-24",
-                "teachers": safe_float(row.get('TEACHER')),
-                "se_instr": safe_float(row.get('SE_INSTR')),
-                "inst_aide": safe_float(row.get('INST_AID')),
-                "inst_sup": safe_float(row.get('INST_SUP'))
-            })
-            imported += 1
-        except Exception as e:
-            logger.error(f"Failed to import staff data for {district_code}: {e}")
-            skipped += 1
-
-    session.commit()
-    logger.info(f"Imported {imported} staff records, skipped {skipped}")
-    return imported, skipped
+    return upsert_mapped(
+        session, 'mi_staff_data', staffing_df, staffing_df['DCODE'], crosswalk,
+        {
+            'year': '2023-24',
+            'total_teacher_fte': numeric_column('TEACHER'),
+            'sped_instructional_fte': numeric_column('SE_INSTR'),
+            'instructional_aide_fte': numeric_column('INST_AID'),
+            'instructional_support_fte': numeric_column('INST_SUP'),
+        },
+        ['nces_id', 'year', 'data_source'],
+        label='staff records',
+    )
 
 
 def import_enrollment_data(session, crosswalk, enrollment_df):
     """Import enrollment data to mi_enrollment_data table."""
     logger.info("Importing enrollment data...")
 
-    imported = 0
-    skipped = 0
-
-    for _, row in enrollment_df.iterrows():
-        district_code = str(safe_int(row.get('District Code')))
-
-        if district_code not in crosswalk:
-            skipped += 1
-            continue
-
-        nces_id = crosswalk[district_code]
-
-        try:
-            session.execute(text("""
-                INSERT INTO mi_enrollment_data
-                (nces_id, year, total_k12, k_enrollment, g1_enrollment, g2_enrollment,
-                 g3_enrollment, g4_enrollment, g5_enrollment, g6_enrollment,
-                 g7_enrollment, g8_enrollment, g9_enrollment, g10_enrollment,
-                 g11_enrollment, g12_enrollment, male_count, female_count)
-                VALUES (:nces_id, :year, :total, :k, :g1, :g2, :g3, :g4, :g5,
-                        :g6, :g7, :g8, :g9, :g10, :g11, :g12, :male, :female)
-                ON CONFLICT (nces_id, year, data_source) DO UPDATE SET
-                    total_k12 = EXCLUDED.total_k12,
-                    k_enrollment = EXCLUDED.k_enrollment,
-                    g1_enrollment = EXCLUDED.g1_enrollment,
-                    g2_enrollment = EXCLUDED.g2_enrollment,
-                    g3_enrollment = EXCLUDED.g3_enrollment,
-                    g4_enrollment = EXCLUDED.g4_enrollment,
-                    g5_enrollment = EXCLUDED.g5_enrollment,
-                    g6_enrollment = EXCLUDED.g6_enrollment,
-                    g7_enrollment = EXCLUDED.g7_enrollment,
-                    g8_enrollment = EXCLUDED.g8_enrollment,
-                    g9_enrollment = EXCLUDED.g9_enrollment,
-                    g10_enrollment = EXCLUDED.g10_enrollment,
-                    g11_enrollment = EXCLUDED.g11_enrollment,
-                    g12_enrollment = EXCLUDED.g12_enrollment,
-                    male_count = EXCLUDED.male_count,
-                    female_count = EXCLUDED.female_count,
-                    updated_at = CURRENT_TIMESTAMP
-            """), {
-                "nces_id": nces_id,
-                "year": "2023-24",
-                "total": safe_float(row.get('tot_all')),
-                "k": safe_float(row.get('k_totl')),
-                "g1": safe_float(row.get('g1_totl')),
-                "g2": safe_float(row.get('g2_totl')),
-                "g3": safe_float(row.get('g3_totl')),
-                "g4": safe_float(row.get('g4_totl')),
-                "g5": safe_float(row.get('g5_totl')),
-                "g6": safe_float(row.get('g6_totl')),
-                "g7": safe_float(row.get('g7_totl')),
-                "g8": safe_float(row.get('g8_totl')),
-                "g9": safe_float(row.get('g9_totl')),
-                "g10": safe_float(row.get('g10_totl')),
-                "g11": safe_float(row.get('g11_totl')),
-                "g12": safe_float(row.get('g12_totl')),
-                "male": safe_float(row.get('tot_male')),
-                "female": safe_float(row.get('tot_fem'))
-            })
-            imported += 1
-        except Exception as e:
-            logger.error(f"Failed to import enrollment data for {district_code}: {e}")
-            skipped += 1
-
-    session.commit()
-    logger.info(f"Imported {imported} enrollment records, skipped {skipped}")
-    return imported, skipped
+    grade_columns = {
+        f'{grade}_enrollment': numeric_column(f'{grade}_totl')
+        for grade in ['k'] + [f'g{n}' for n in range(1, 13)]
+    }
+    return upsert_mapped(
+        session, 'mi_enrollment_data', enrollment_df, enrollment_df['District Code'], crosswalk,
+        {
+            'year': '2023-24',
+            'total_k12': numeric_column('tot_all'),
+            **grade_columns,
+            'male_count': numeric_column('tot_male'),
+            'female_count': numeric_column('tot_fem'),
+        },
+        ['nces_id', 'year', 'data_source'],
+        label='enrollment records',
+    )
 
 
 def import_special_ed_data(session, crosswalk, sped_df):
     """Import special education data to mi_special_ed_data table."""
     logger.info("Importing special education data...")
 
-    imported = 0
-    skipped = 0
-
-    for _, row in sped_df.iterrows():
-        # SPED file uses DCODE.1 for district code
-        district_code = str(safe_int(row.get('DCODE.1')))
-
-        if district_code not in crosswalk:
-            skipped += 1
-            continue
-
-        nces_id = crosswalk[district_code]
-
-        try:
-            session.execute(text("""
-                INSERT INTO mi_special_ed_data
-                (nces_id, year, students_with_iep, sped_percentage)
-                VALUES (:nces_id, :year, :iep_count, :sped_pct)
-                ON CONFLICT (nces_id, year, data_source) DO UPDATE SET
-                    students_with_iep = EXCLUDED.students_with_iep,
-                    sped_percentage = EXCLUDED.sped_percentage,
-                    updated_at = CURRENT_TIMESTAMP
-            """), {
-                "nces_id": nces_id,
-                "year": "2023-24",
-                "iep_count": safe_int(row.get('StudwI E P')),
-                "sped_pct": safe_float(row.get('SpEd%'))
-            })
-            imported += 1
-        except Exception as e:
-            logger.error(f"Failed to import SPED data for {district_code}: {e}")
-            skipped += 1
-
-    session.commit()
-    logger.info(f"Imported {imported} special ed records, skipped {skipped}")
-    return imported, skipped
+    # SPED file uses DCODE.1 for district code
+    return upsert_mapped(
+        session, 'mi_special_ed_data', sped_df, sped_df['DCODE.1'], crosswalk,
+        {
+            'year': '2023-24',
+            'students_with_iep': numeric_column('StudwI E P', integer=True),
+            'sped_percentage': numeric_column('SpEd%'),
+        },
+        ['nces_id', 'year', 'data_source'],
+        label='special ed records',
+    )
 
 
 def main():
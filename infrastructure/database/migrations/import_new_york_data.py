@@ -28,9 +28,8 @@ import logging
 
 # Import shared SEA utilities
 from infrastructure.database.migrations.sea_import_utils import (
-    safe_float, safe_int,
-    load_state_crosswalk, get_district_name,
-    format_state_id, log_import_summary,
+    safe_numeric, get_state_crosswalk, StateCrosswalk, bulk_upsert,
+    numeric_column, text_column, upsert_mapped,
 )
 
 # Configure logging
@@ -49,20 +48,25 @@ STAFF_FILE = NY_DATA_DIR / "ny_staffing_2023_24.xlsx"
 ENROLLMENT_FILE = NY_DATA_DIR / "ny_enrollment_district_2023_24.xlsx"
 SPED_ENROLLMENT_FILE = NY_DATA_DIR / "ny_enrollment_sped_2023_24.xlsx"
 
+# Enrollment file columns stored in enrollment_by_grade
+GRADE_COLUMNS = [
+    'PreK (Half Day)', 'PreK (Full Day)',
+    'Kindergarten (Half Day)', 'Kindergarten (Full Day)',
+    'Grade 1', 'Grade 2', 'Grade 3', 'Grade 4', 'Grade 5', 'Grade 6',
+    'Ungraded (Elementary)',
+    'Grade 7', 'Grade 8',
+    'Grade 9', 'Grade 10', 'Grade 11', 'Grade 12',
+    'Ungraded (Secondary)'
+]
 
-def load_ny_crosswalk(session) -> dict:
+
+def load_ny_crosswalk(session) -> StateCrosswalk:
     """Load New York crosswalk from database.
 
     Returns:
-        Dict mapping NYSED state district ID -> NCES ID
+        Cached StateCrosswalk mapping NYSED state district ID -> NCES ID
     """
-    result = session.execute(text("""
-        SELECT state_district_id, nces_id
-        FROM state_district_crosswalk
-        WHERE state = 'NY'
-          AND id_system = 'st_leaid'
-    """))
-    return {row[0]: row[1] for row in result.fetchall()}
+    return get_state_crosswalk(session, 'NY')
 
 
 def load_staff_data():
@@ -186,45 +190,39 @@ def import_district_identifiers():
         ny_crosswalk = load_ny_crosswalk(session)
         logger.info(f"Loaded {len(ny_crosswalk)} New York districts from crosswalk table")
 
-        count = 0
-        for nysed_id, nces_id in ny_crosswalk.items():
-            try:
-                # Get district name from districts table
-                result = session.execute(text("""
-                    SELECT name FROM districts WHERE nces_id = :nces_id
-                """), {"nces_id": nces_id})
-                row = result.fetchone()
-
-                if not row:
-                    logger.debug(f"District {nces_id} not found in districts table")
-                    continue
-
-                district_name = row[0]
-
-                # Insert into ny_district_identifiers
-                session.execute(text("""
-                    INSERT INTO ny_district_identifiers
-                    (nces_id, nysed_district_id, district_name_nysed, source_year)
-                    VALUES (:nces_id, :nysed_id, :name, '2023-24')
-                    ON CONFLICT (nces_id) DO UPDATE SET
-                        nysed_district_id = EXCLUDED.nysed_district_id,
-                        district_name_nysed = EXCLUDED.district_name_nysed,
-                        updated_at = CURRENT_TIMESTAMP
-                """), {
-                    "nces_id": nces_id,
-                    "nysed_id": nysed_id,
-                    "name": district_name
-                })
-                count += 1
-
-            except Exception as e:
-                logger.error(f"Failed to import {nysed_id}: {e}")
+        # District names for every crosswalk entry in one query; entries
+        # missing from the districts table are skipped
+        names = dict(session.execute(text("""
+            SELECT nces_id, name FROM districts WHERE nces_id = ANY(:nces_ids)
+        """), {"nces_ids": list(ny_crosswalk.values())}).fetchall())
+
+        records = pd.DataFrame(
+            [(nces_id, nysed_id, names[nces_id]) for nysed_id, nces_id in ny_crosswalk.items()
+             if nces_id in names],
+            columns=['nces_id', 'nysed_district_id', 'district_name_nysed'],
+        ).assign(source_year='2023-24')
 
+        counts = bulk_upsert(session, 'ny_district_identifiers', records, ['nces_id'])
         session.commit()
-        logger.info(f"✅ Imported {count} district identifiers")
+
+        count = counts['inserted'] + counts['updated']
+        logger.info(f"✅ Imported {count} district identifiers "
+                    f"(skipped {len(ny_crosswalk) - len(records)} not in districts table)")
         return count
 
 
+def grade_breakdown(df):
+    """JSON object of positive per-grade counts for each row of df."""
+    grades = pd.DataFrame({
+        column: safe_numeric(df[column], integer=True)
+        for column in GRADE_COLUMNS if column in df.columns
+    }, index=df.index)
+    return pd.Series([
+        json.dumps({grade: int(value) for grade, value in row.items() if pd.notna(value) and value > 0})
+        for row in grades.to_dict('records')
+    ], index=df.index, dtype=object)
+
+
 def import_staff_data(df):
     """Import staff data into database.
 
@@ -236,63 +234,22 @@ def import_staff_data(df):
 
     logger.info("Importing New York staff data...")
 
-    # Load crosswalk once for efficiency
-    with session_scope() as session:
-        ny_crosswalk = load_ny_crosswalk(session)
+    # Skip categories with no FTE
+    df = df[safe_numeric(df['FTE']).fillna(0) != 0]
 
-    count = 0
-    skipped = 0
-    for _, row in df.iterrows():
-        try:
-            # Extract state district ID using safe conversion
-            raw_id = safe_int(row.get('STATE_DISTRICT_ID'))
-            if raw_id is None:
-                skipped += 1
-                continue
-            state_district_id = str(raw_id).strip()
-
-            # Look up NCES ID from crosswalk
-            nces_id = ny_crosswalk.get(state_district_id)
-            if not nces_id:
-                skipped += 1
-                continue
-
-            # Extract staff data using safe conversion
-            staff_category = str(row.get('STAFF_IND_DESC', '')).strip()
-            fte = safe_float(row.get('FTE')) or 0
-            enrollment = safe_int(row.get('K-12_ENROLL')) or 0
-            ratio = safe_float(row.get('DISTRICT_RATIO')) or 0
-
-            # Skip if no FTE
-            if fte == 0:
-                continue
-
-            # Use individual transaction for each row
-            with session_scope() as session:
-                session.execute(text("""
-                    INSERT INTO ny_staff_data
-                    (nces_id, year, staff_category, fte, enrollment_k12, district_ratio)
-                    VALUES (:nces_id, '2023-24', :category, :fte, :enroll, :ratio)
-                    ON CONFLICT (nces_id, year, staff_category, data_source) DO UPDATE SET
-                        fte = EXCLUDED.fte,
-                        enrollment_k12 = EXCLUDED.enrollment_k12,
-                        district_ratio = EXCLUDED.district_ratio,
-                        updated_at = CURRENT_TIMESTAMP
-                """), {
-                    "nces_id": nces_id,
-                    "category": staff_category,
-                    "fte": fte,
-                    "enroll": enrollment,
-                    "ratio": ratio
-                })
-                session.commit()
-                count += 1
-
-        except Exception as e:
-            logger.debug(f"Skipping row: {str(e)[:100]}")
-            continue
-
-    logger.info(f"✅ Imported {count} staff records ({skipped} skipped - no NCES match)")
+    with session_scope() as session:
+        count, _ = upsert_mapped(
+            session, 'ny_staff_data', df, df['STATE_DISTRICT_ID'], load_ny_crosswalk(session),
+            {
+                'year': '2023-24',
+                'staff_category': text_column('STAFF_IND_DESC'),
+                'fte': numeric_column('FTE', default=0),
+                'enrollment_k12': numeric_column('K-12_ENROLL', integer=True, default=0),
+                'district_ratio': numeric_column('DISTRICT_RATIO', default=0),
+            },
+            ['nces_id', 'year', 'staff_category', 'data_source'],
+            label='staff records',
+        )
     return count
 
 
@@ -309,143 +266,29 @@ def import_enrollment_data(df, sped_df=None):
 
     logger.info("Importing New York enrollment data...")
 
-    # Load crosswalk once for efficiency
-    with session_scope() as session:
-        ny_crosswalk = load_ny_crosswalk(session)
-
-    count = 0
-    skipped = 0
-
     # Process SPED enrollment if available (more detailed)
     if sped_df is not None:
         logger.info("Processing SPED-disaggregated enrollment data...")
-        for _, row in sped_df.iterrows():
-            try:
-                # Extract state district ID using safe conversion
-                raw_id = safe_int(row.get('State District Identifier'))
-                if raw_id is None:
-                    skipped += 1
-                    continue
-                state_district_id = str(raw_id).strip()
-
-                # Look up NCES ID
-                nces_id = ny_crosswalk.get(state_district_id)
-                if not nces_id:
-                    skipped += 1
-                    continue
-
-                # Extract enrollment data using safe conversion
-                subgroup = str(row.get('Subgroup Name', '')).strip()
-                enrollment = safe_int(row.get('PreK-12 Total')) or 0
-
-                # Build grade-level JSON
-                grade_data = {}
-                grade_columns = [
-                    'PreK (Half Day)', 'PreK (Full Day)',
-                    'Kindergarten (Half Day)', 'Kindergarten (Full Day)',
-                    'Grade 1', 'Grade 2', 'Grade 3', 'Grade 4', 'Grade 5', 'Grade 6',
-                    'Ungraded (Elementary)',
-                    'Grade 7', 'Grade 8',
-                    'Grade 9', 'Grade 10', 'Grade 11', 'Grade 12',
-                    'Ungraded (Secondary)'
-                ]
-
-                for grade_col in grade_columns:
-                    if grade_col in row:
-                        try:
-                            value = int(row[grade_col])
-                            if value > 0:
-                                grade_data[grade_col] = value
-                        except (ValueError, TypeError):
-                            continue
-
-                # Use individual transaction
-                with session_scope() as session:
-                    session.execute(text("""
-                        INSERT INTO ny_enrollment_data
-                        (nces_id, year, subgroup, enrollment_prek12, enrollment_by_grade)
-                        VALUES (:nces_id, '2023-24', :subgroup, :enrollment, CAST(:grades_json AS jsonb))
-                        ON CONFLICT (nces_id, year, subgroup, data_source) DO UPDATE SET
-                            enrollment_prek12 = EXCLUDED.enrollment_prek12,
-                            enrollment_by_grade = EXCLUDED.enrollment_by_grade,
-                            updated_at = CURRENT_TIMESTAMP
-                    """), {
-                        "nces_id": nces_id,
-                        "subgroup": subgroup,
-                        "enrollment": enrollment,
-                        "grades_json": json.dumps(grade_data)
-                    })
-                    session.commit()
-                    count += 1
-
-            except Exception as e:
-                logger.error(f"Failed to import enrollment row: {str(e)}")
-                continue
-
+        source_df = sped_df
     else:
         # Process regular enrollment (All Students only)
         logger.info("Processing regular enrollment data...")
-        for _, row in df.iterrows():
-            try:
-                # Extract state district ID using safe conversion
-                raw_id = safe_int(row.get('State District Identifier'))
-                if raw_id is None:
-                    skipped += 1
-                    continue
-                state_district_id = str(raw_id).strip()
-                nces_id = ny_crosswalk.get(state_district_id)
-
-                if not nces_id:
-                    skipped += 1
-                    continue
-
-                subgroup = str(row.get('Subgroup Name', 'All Students')).strip()
-                enrollment = safe_int(row.get('PreK-12 Total')) or 0
-
-                # Build grade-level JSON (same as above)
-                grade_data = {}
-                grade_columns = [
-                    'PreK (Half Day)', 'PreK (Full Day)',
-                    'Kindergarten (Half Day)', 'Kindergarten (Full Day)',
-                    'Grade 1', 'Grade 2', 'Grade 3', 'Grade 4', 'Grade 5', 'Grade 6',
-                    'Ungraded (Elementary)',
-                    'Grade 7', 'Grade 8',
-                    'Grade 9', 'Grade 10', 'Grade 11', 'Grade 12',
-                    'Ungraded (Secondary)'
-                ]
-
-                for grade_col in grade_columns:
-                    if grade_col in row:
-                        try:
-                            value = int(row[grade_col])
-                            if value > 0:
-                                grade_data[grade_col] = value
-                        except (ValueError, TypeError):
-                            continue
-
-                with session_scope() as session:
-                    session.execute(text("""
-                        INSERT INTO ny_enrollment_data
-                        (nces_id, year, subgroup, enrollment_prek12, enrollment_by_grade)
-                        VALUES (:nces_id, '2023-24', :subgroup, :enrollment, CAST(:grades_json AS jsonb))
-                        ON CONFLICT (nces_id, year, subgroup, data_source) DO UPDATE SET
-                            enrollment_prek12 = EXCLUDED.enrollment_prek12,
-                            enrollment_by_grade = EXCLUDED.enrollment_by_grade,
-                            updated_at = CURRENT_TIMESTAMP
-                    """), {
-                        "nces_id": nces_id,
-                        "subgroup": subgroup,
-                        "enrollment": enrollment,
-                        "grades_json": json.dumps(grade_data)
-                    })
-                    session.commit()
-                    count += 1
-
-            except Exception as e:
-                logger.error(f"Failed to import enrollment row: {str(e)}")
-                continue
-
-    logger.info(f"✅ Imported {count} enrollment records ({skipped} skipped - no NCES match)")
+        source_df = df
+
+    with session_scope() as session:
+        count, _ = upsert_mapped(
+            session, 'ny_enrollment_data', source_df, source_df['State District Identifier'],
+            load_ny_crosswalk(session),
+            {
+                'year': '2023-24',
+                'subgroup': (text_column('Subgroup Name') if 'Subgroup Name' in source_df.columns
+                             else 'All Students'),
+                'enrollment_prek12': numeric_column('PreK-12 Total', integer=True, default=0),
+                'enrollment_by_grade': grade_breakdown,
+            },
+            ['nces_id', 'year', 'subgroup', 'data_source'],
+            label='enrollment records',
+        )
     return count
 
 
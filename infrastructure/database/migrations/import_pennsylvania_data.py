@@ -34,9 +34,7 @@ import logging
 
 # Import shared SEA utilities
 from infrastructure.database.migrations.sea_import_utils import (
-    safe_float, safe_int,
-    load_state_crosswalk, get_district_name,
-    log_import_summary,
+    get_state_crosswalk, StateCrosswalk, numeric_column, text_column, upsert_mapped,
 )
 
 # Configure logging
@@ -55,19 +53,13 @@ STAFFING_FILE = PA_DATA_DIR / "pa_staffing_2024_25.xlsx"
 ENROLLMENT_FILE = PA_DATA_DIR / "pa_enrollment_2024_25.xlsx"
 
 
-def load_pa_crosswalk(session) -> dict:
+def load_pa_crosswalk(session) -> StateCrosswalk:
     """Load Pennsylvania crosswalk from database.
 
     Returns:
-        Dict mapping PDE AUN -> NCES ID
+        Cached StateCrosswalk mapping PDE AUN -> NCES ID
     """
-    result = session.execute(text("""
-        SELECT state_district_id, nces_id
-        FROM state_district_crosswalk
-        WHERE state = 'PA'
-          AND id_system = 'st_leaid'
-    """))
-    return {row[0]: row[1] for row in result.fetchall()}
+    return get_state_crosswalk(session, 'PA')
 
 
 def load_staffing_data():
@@ -183,168 +175,58 @@ def import_district_identifiers(session, crosswalk, staffing_df, enrollment_df):
     """Import district identifiers to pa_district_identifiers table."""
     logger.info("Importing district identifiers...")
 
-    imported = 0
-    skipped = 0
-
     # Use enrollment file for primary district info
-    for _, row in enrollment_df.iterrows():
-        aun = str(safe_int(row.get('AUN')))
-
-        if aun not in crosswalk:
-            skipped += 1
-            continue
-
-        nces_id = crosswalk[aun]
-        district_name = row.get('LEA Name', '').strip()
-        lea_type = row.get('LEA Type', '').strip()
-        county = row.get('County', '').strip()
-
-        try:
-            session.execute(text("""
-                INSERT INTO pa_district_identifiers
-                (nces_id, pde_aun, district_name_pde, lea_type, county, source_year)
-                VALUES (:nces_id, :aun, :name, :type, :county, :year)
-                ON CONFLICT (nces_id) DO UPDATE SET
-                    district_name_pde = EXCLUDED.district_name_pde,
-                    lea_type = EXCLUDED.lea_type,
-                    county = EXCLUDED.county,
-                    updated_at = CURRENT_TIMESTAMP
-            """), {
-                "nces_id": nces_id,
-                "aun": aun,
-                "name": district_name,
-                "type": lea_type,
-                "county": county,
-                "year": "2024-25"
-            })
-            imported += 1
-        except Exception as e:
-            logger.error(f"Failed to import identifier for AUN {aun}: {e}")
-            skipped += 1
-
-    session.commit()
-    logger.info(f"Imported {imported} district identifiers, skipped {skipped}")
-    return imported, skipped
+    return upsert_mapped(
+        session, 'pa_district_identifiers', enrollment_df, enrollment_df['AUN'], crosswalk,
+        {
+            'pde_aun': lambda df: df['state_id'],
+            'district_name_pde': text_column('LEA Name'),
+            'lea_type': text_column('LEA Type'),
+            'county': text_column('County'),
+            'source_year': '2024-25',
+        },
+        ['nces_id'],
+        update_columns=['district_name_pde', 'lea_type', 'county'],
+        label='district identifiers',
+    )
 
 
 def import_staff_data(session, crosswalk, staffing_df):
     """Import staff data to pa_staff_data table."""
     logger.info("Importing staff data...")
 
-    imported = 0
-    skipped = 0
-
-    for _, row in staffing_df.iterrows():
-        aun = str(safe_int(row.get('AUN')))
-
-        if aun not in crosswalk:
-            skipped += 1
-            continue
-
-        nces_id = crosswalk[aun]
-
-        try:
-            session.execute(text("""
-                INSERT INTO pa_staff_data
-                (nces_id, year, classroom_teachers_fte, professional_personnel_fte,
-                 administrators_fte, coordinate_services_fte, other_professional_fte)
-                VALUES (:nces_id, :year, :ct, :pp, :ad, :co, :ot)
-                ON CONFLICT (nces_id, year, data_source) DO UPDATE SET
-                    classroom_teachers_fte = EXCLUDED.classroom_teachers_fte,
-                    professional_personnel_fte = EXCLUDED.professional_personnel_fte,
-                    administrators_fte = EXCLUDED.administrators_fte,
-                    coordinate_services_fte = EXCLUDED.coordinate_services_fte,
-                    other_professional_fte = EXCLUDED.other_professional_fte,
-                    updated_at = CURRENT_TIMESTAMP
-            """), {
-                "nces_id": nces_id,
-                "year": "2024-25",
-                "ct": safe_float(row.get('CT')),    # Classroom Teachers
-                "pp": safe_float(row.get('PP')),    # Professional Personnel
-                "ad": safe_float(row.get('Ad')),    # Administrators
-                "co": safe_float(row.get('Co')),    # Coordinate Services
-                "ot": safe_float(row.get('Ot'))     # Other
-            })
-            imported += 1
-        except Exception as e:
-            logger.error(f"Failed to import staff data for AUN {aun}: {e}")
-            skipped += 1
-
-    session.commit()
-    logger.info(f"Imported {imported} staff records, skipped {skipped}")
-    return imported, skipped
+    return upsert_mapped(
+        session, 'pa_staff_data', staffing_df, staffing_df['AUN'], crosswalk,
+        {
+            'year': '2024-25',
+            'classroom_teachers_fte': numeric_column('CT'),        # Classroom Teachers
+            'professional_personnel_fte': numeric_column('PP'),    # Professional Personnel
+            'administrators_fte': numeric_column('Ad'),            # Administrators
+            'coordinate_services_fte': numeric_column('Co'),       # Coordinate Services
+            'other_professional_fte': numeric_column('Ot'),        # Other
+        },
+        ['nces_id', 'year', 'data_source'],
+        label='staff records',
+    )
 
 
 def import_enrollment_data(session, crosswalk, enrollment_df):
     """Import enrollment data to pa_enrollment_data table."""
     logger.info("Importing enrollment data...")
 
-    imported = 0
-    skipped = 0
-
-    for _, row in enrollment_df.iterrows():
-        aun = str(safe_int(row.get('AUN')))
-
-        if aun not in crosswalk:
-            skipped += 1
-            continue
-
-        nces_id = crosswalk[aun]
-
-        try:
-            # Column names are numbers (1.0, 2.0, etc.)
-            session.execute(text("""
-                INSERT INTO pa_enrollment_data
-                (nces_id, year, total_k12, prekf_enrollment, k5f_enrollment,
-                 g1_enrollment, g2_enrollment, g3_enrollment, g4_enrollment,
-                 g5_enrollment, g6_enrollment, g7_enrollment, g8_enrollment,
-                 g9_enrollment, g10_enrollment, g11_enrollment, g12_enrollment)
-                VALUES (:nces_id, :year, :total, :prekf, :k5f, :g1, :g2, :g3, :g4,
-                        :g5, :g6, :g7, :g8, :g9, :g10, :g11, :g12)
-                ON CONFLICT (nces_id, year, data_source) DO UPDATE SET
-                    total_k12 = EXCLUDED.total_k12,
-                    prekf_enrollment = EXCLUDED.prekf_enrollment,
-                    k5f_enrollment = EXCLUDED.k5f_enrollment,
-                    g1_enrollment = EXCLUDED.g1_enrollment,
-                    g2_enrollment = EXCLUDED.g2_enrollment,
-                    g3_enrollment = EXCLUDED.g3_enrollment,
-                    g4_enrollment = EXCLUDED.g4_enrollment,
-                    g5_enrollment = EXCLUDED.g5_enrollment,
-                    g6_enrollment = EXCLUDED.g6_enrollment,
-                    g7_enrollment = EXCLUDED.g7_enrollment,
-                    g8_enrollment = EXCLUDED.g8_enrollment,
-                    g9_enrollment = EXCLUDED.g9_enrollment,
-                    g10_enrollment = EXCLUDED.g10_enrollment,
-                    g11_enrollment = EXCLUDED.g11_enrollment,
-                    g12_enrollment = EXCLUDED.g12_enrollment,
-                    updated_at = CURRENT_TIMESTAMP
-            """), {
-                "nces_id": nces_id,
-                "year": "2024-25",
-                "total": safe_float(row.get('Total')),
-                "prekf": safe_float(row.get('PKF')),
-                "k5f": safe_float(row.get('K5F')),
-                "g1": safe_float(row.get(1.0)),    # Grades are numeric columns
-                "g2": safe_float(row.get(2.0)),
-                "g3": safe_float(row.get(3.0)),
-                "g4": safe_float(row.get(4.0)),
-                "g5": safe_float(row.get(5.0)),
-                "g6": safe_float(row.get(6.0)),
-                "g7": safe_float(row.get(7.0)),
-                "g8": safe_float(row.get(8.0)),
-                "g9": safe_float(row.get(9.0)),
-                "g10": safe_float(row.get(10.0)),
-                "g11": safe_float(row.get(11.0)),
-                "g12": safe_float(row.get(12.0))
-            })
-            imported += 1
-        except Exception as e:
-            logger.error(f"Failed to import enrollment data for AUN {aun}: {e}")
-            skipped += 1
-
-    session.commit()
-    logger.info(f"Imported {imported} enrollment records, skipped {skipped}")
-    return imported, skipped
+    return upsert_mapped(
+        session, 'pa_enrollment_data', enrollment_df, enrollment_df['AUN'], crosswalk,
+        {
+            'year': '2024-25',
+            'total_k12': numeric_column('Total'),
+            'prekf_enrollment': numeric_column('PKF'),
+            'k5f_enrollment': numeric_column('K5F'),
+            # Grade columns are numbers (1.0, 2.0, etc.)
+            **{f'g{grade}_enrollment': numeric_column(float(grade)) for grade in range(1, 13)},
+        },
+        ['nces_id', 'year', 'data_source'],
+        label='enrollment records',
+    )
 
 
 def main():
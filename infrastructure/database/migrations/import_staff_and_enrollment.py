@@ -27,6 +27,7 @@ project_root = Path(__file__).parent.parent.parent.parent
 sys.path.insert(0, str(project_root))
 
 from infrastructure.database.connection import session_scope, get_engine
+from infrastructure.utilities.ccd_parquet_cache import read_ccd
 from infrastructure.database.models import (
     District,
     StaffCounts,
@@ -107,8 +108,8 @@ def load_staff_data(staff_file: Path, year: str) -> pd.DataFrame:
     """
     print(f"Loading staff data from {staff_file}...")
 
-    # Read the file
-    df = pd.read_csv(staff_file, dtype={"LEAID": str})
+    # Read the file (Parquet cache when available)
+    df = read_ccd(staff_file, dtype={"LEAID": str})
 
     print(f"  Loaded {len(df):,} rows")
 
@@ -156,8 +157,8 @@ def load_enrollment_data(membership_file: Path, year: str) -> pd.DataFrame:
     """
     print(f"Loading enrollment data from {membership_file}...")
 
-    # Read the file
-    df = pd.read_csv(membership_file, dtype={"LEAID": str})
+    # Read the file (Parquet cache when available)
+    df = read_ccd(membership_file, dtype={"LEAID": str})
 
     print(f"  Loaded {len(df):,} rows")
 
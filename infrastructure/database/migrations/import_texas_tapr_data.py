@@ -29,13 +29,14 @@ project_root = Path(__file__).parent.parent.parent.parent
 sys.path.insert(0, str(project_root))
 
 from infrastructure.database.connection import session_scope
-from sqlalchemy import text
 import pandas as pd
 import logging
 
 # Import shared SEA utilities
 from infrastructure.database.migrations.sea_import_utils import (
-    safe_float, safe_int,
+    safe_numeric,
+    get_state_crosswalk, StateCrosswalk,
+    match_to_crosswalk, bulk_upsert,
 )
 
 # Configure logging
@@ -61,20 +62,17 @@ def log_stats(stats: dict) -> None:
     logger.info(f"  Total records: {stats['total']}")
     logger.info(f"  Matched with NCES: {stats['matched']}")
     logger.info(f"  Skipped (no match): {stats['skipped']}")
-    logger.info(f"  Inserted/Updated: {stats['inserted']}")
+    logger.info(f"  Inserted: {stats['inserted']}")
+    logger.info(f"  Updated: {stats['updated']}")
 
 
-def load_tx_crosswalk(session) -> dict:
+def load_tx_crosswalk(session) -> StateCrosswalk:
     """Load Texas crosswalk from database.
 
     Returns:
-        Dict mapping TEA District Number (6-digit) -> NCES ID
+        Cached StateCrosswalk mapping TEA District Number (6-digit) -> NCES ID
     """
-    result = session.execute(text("""
-        SELECT tea_district_no, nces_id
-        FROM tx_district_identifiers
-    """))
-    return {row[0]: row[1] for row in result.fetchall()}
+    return get_state_crosswalk(session, 'TX')
 
 
 def load_staff_data() -> pd.DataFrame:
@@ -105,220 +103,78 @@ def load_student_data() -> pd.DataFrame:
     return df
 
 
-def import_staff_to_database(session, staff_df: pd.DataFrame, crosswalk: dict, dry_run: bool = False):
+def import_staff_to_database(session, staff_df: pd.DataFrame, crosswalk: StateCrosswalk, dry_run: bool = False):
     """Import staff data to tx_staff_data table."""
     logger.info("Importing staff data to database...")
 
-    stats = {'total': 0, 'matched': 0, 'skipped': 0, 'inserted': 0}
-
-    for _, row in staff_df.iterrows():
-        stats['total'] += 1
-
-        tea_code = str(row['6 Digit County District Number']).strip()
-        district_name = row['District Name']
-
-        # Get NCES ID from crosswalk
-        nces_id = crosswalk.get(tea_code)
-        if not nces_id:
-            if stats['skipped'] < 5:
-                logger.warning(f"  No NCES match for TEA {tea_code} ({district_name})")
-            stats['skipped'] += 1
-            continue
-
-        stats['matched'] += 1
-
-        # Extract key staff fields
-        # Use internal column names (second header row)
-        teacher_total = safe_float(row.iloc[2])  # DPSTTOFC
-        teacher_special_ed = safe_float(row.iloc[39])  # DPSTSPFC
-        teacher_regular = safe_float(row.iloc[34])  # DPSTREFC
-        teacher_bilingual = safe_float(row.iloc[36])  # DPSTBIFC
-        teacher_gifted = safe_float(row.iloc[38])  # DPSTGIFC
-
-        if not dry_run:
-            # Check if record exists
-            existing = session.execute(text("""
-                SELECT nces_id FROM tx_staff_data
-                WHERE nces_id = :nces_id AND year = :year
-            """), {"nces_id": nces_id, "year": DATA_YEAR}).fetchone()
-
-            if existing:
-                # Update existing record
-                session.execute(text("""
-                    UPDATE tx_staff_data
-                    SET teachers_total_fte = :teachers_total,
-                        teachers_special_ed_fte = :teachers_sped,
-                        teachers_regular_fte = :teachers_regular,
-                        teachers_bilingual_fte = :teachers_bilingual,
-                        teachers_gifted_fte = :teachers_gifted,
-                        data_source = 'tea_tapr',
-                        updated_at = NOW()
-                    WHERE nces_id = :nces_id AND year = :year
-                """), {
-                    "nces_id": nces_id,
-                    "year": DATA_YEAR,
-                    "teachers_total": teacher_total,
-                    "teachers_sped": teacher_special_ed,
-                    "teachers_regular": teacher_regular,
-                    "teachers_bilingual": teacher_bilingual,
-                    "teachers_gifted": teacher_gifted
-                })
-            else:
-                # Insert new record
-                session.execute(text("""
-                    INSERT INTO tx_staff_data (
-                        nces_id, tea_district_no, year,
-                        teachers_total_fte,
-                        teachers_special_ed_fte,
-                        teachers_regular_fte,
-                        teachers_bilingual_fte,
-                        teachers_gifted_fte,
-                        data_source
-                    ) VALUES (
-                        :nces_id, :tea_code, :year,
-                        :teachers_total, :teachers_sped, :teachers_regular,
-                        :teachers_bilingual, :teachers_gifted,
-                        'tea_tapr'
-                    )
-                """), {
-                    "nces_id": nces_id,
-                    "tea_code": tea_code,
-                    "year": DATA_YEAR,
-                    "teachers_total": teacher_total,
-                    "teachers_sped": teacher_special_ed,
-                    "teachers_regular": teacher_regular,
-                    "teachers_bilingual": teacher_bilingual,
-                    "teachers_gifted": teacher_gifted
-                })
-
-            stats['inserted'] += 1
-
-        if stats['matched'] % 100 == 0:
-            logger.info(f"  Processed {stats['matched']} districts...")
+    tea_codes = staff_df['6 Digit County District Number'].astype(str).str.strip()
+    matched_df, stats = match_to_crosswalk(staff_df, tea_codes, crosswalk, normalize=False)
+
+    unmatched = ~staff_df.index.isin(matched_df.index)
+    for tea_code, district_name in zip(tea_codes[unmatched][:5], staff_df.loc[unmatched, 'District Name'][:5]):
+        logger.warning(f"  No NCES match for TEA {tea_code} ({district_name})")
+
+    # Extract key staff fields
+    # Use internal column names (second header row)
+    records = pd.DataFrame({
+        'nces_id': matched_df['nces_id'],
+        'tea_district_no': matched_df['state_id'],
+        'year': DATA_YEAR,
+        'teachers_total_fte': safe_numeric(matched_df.iloc[:, 2]),  # DPSTTOFC
+        'teachers_special_ed_fte': safe_numeric(matched_df.iloc[:, 39]),  # DPSTSPFC
+        'teachers_regular_fte': safe_numeric(matched_df.iloc[:, 34]),  # DPSTREFC
+        'teachers_bilingual_fte': safe_numeric(matched_df.iloc[:, 36]),  # DPSTBIFC
+        'teachers_gifted_fte': safe_numeric(matched_df.iloc[:, 38]),  # DPSTGIFC
+        'data_source': 'tea_tapr',
+    })
 
     if not dry_run:
+        stats.update(bulk_upsert(session, 'tx_staff_data', records, ['nces_id', 'year']))
         session.commit()
 
     return stats
 
 
-def import_enrollment_to_database(session, student_df: pd.DataFrame, crosswalk: dict, dry_run: bool = False):
+def import_enrollment_to_database(session, student_df: pd.DataFrame, crosswalk: StateCrosswalk, dry_run: bool = False):
     """Import enrollment data to tx_enrollment_data table."""
     logger.info("Importing enrollment data to database...")
 
-    stats = {'total': 0, 'matched': 0, 'skipped': 0, 'inserted': 0}
+    tea_codes = student_df['6 Digit County District Number'].astype(str).str.strip()
+    matched_df, stats = match_to_crosswalk(student_df, tea_codes, crosswalk, normalize=False)
 
-    for _, row in student_df.iterrows():
-        stats['total'] += 1
+    def column(position):
+        return safe_numeric(matched_df.iloc[:, position], integer=True)
 
-        tea_code = str(row['6 Digit County District Number']).strip()
-
-        # Get NCES ID from crosswalk
-        nces_id = crosswalk.get(tea_code)
-        if not nces_id:
-            stats['skipped'] += 1
-            continue
-
-        stats['matched'] += 1
-
-        # Extract enrollment fields
+    records = pd.DataFrame({
+        'nces_id': matched_df['nces_id'],
+        'tea_district_no': matched_df['state_id'],
+        'year': DATA_YEAR,
         # Total enrollment
-        total_enrollment = safe_int(row.iloc[27])  # DPETALLC
-
+        'total_enrollment': column(27),  # DPETALLC
         # By grade
-        enrollment_pk = safe_int(row.iloc[14])  # DPETGPKC
-        enrollment_k = safe_int(row.iloc[15])  # DPETGKNC
-        enrollment_g1 = safe_int(row.iloc[16])  # DPETG01C
-        enrollment_g2 = safe_int(row.iloc[17])  # DPETG02C
-        enrollment_g3 = safe_int(row.iloc[18])  # DPETG03C
-        enrollment_g4 = safe_int(row.iloc[19])  # DPETG04C
-        enrollment_g5 = safe_int(row.iloc[20])  # DPETG05C
-        enrollment_g6 = safe_int(row.iloc[21])  # DPETG06C
-        enrollment_g7 = safe_int(row.iloc[22])  # DPETG07C
-        enrollment_g8 = safe_int(row.iloc[23])  # DPETG08C
-        enrollment_g9 = safe_int(row.iloc[24])  # DPETG09C
-        enrollment_g10 = safe_int(row.iloc[25])  # DPETG10C
-        enrollment_g11 = safe_int(row.iloc[26])  # DPETG11C
-        enrollment_g12 = safe_int(row.iloc[27])  # DPETG12C
-
+        'enrollment_pk': column(14),  # DPETGPKC
+        'enrollment_k': column(15),  # DPETGKNC
+        'enrollment_g1': column(16),  # DPETG01C
+        'enrollment_g2': column(17),  # DPETG02C
+        'enrollment_g3': column(18),  # DPETG03C
+        'enrollment_g4': column(19),  # DPETG04C
+        'enrollment_g5': column(20),  # DPETG05C
+        'enrollment_g6': column(21),  # DPETG06C
+        'enrollment_g7': column(22),  # DPETG07C
+        'enrollment_g8': column(23),  # DPETG08C
+        'enrollment_g9': column(24),  # DPETG09C
+        'enrollment_g10': column(25),  # DPETG10C
+        'enrollment_g11': column(26),  # DPETG11C
+        'enrollment_g12': column(27),  # DPETG12C
         # Special populations
-        enrollment_sped = safe_int(row.iloc[28])  # DPETSPEC
-        enrollment_ell = safe_int(row.iloc[31])  # DPETLEPC
-        enrollment_econ_disadv = safe_int(row.iloc[32])  # DPETECOC
-
-        if not dry_run:
-            # Check if record exists
-            existing = session.execute(text("""
-                SELECT nces_id FROM tx_enrollment_data
-                WHERE nces_id = :nces_id AND year = :year
-            """), {"nces_id": nces_id, "year": DATA_YEAR}).fetchone()
-
-            if existing:
-                # Update
-                session.execute(text("""
-                    UPDATE tx_enrollment_data
-                    SET total_enrollment = :total,
-                        enrollment_pk = :pk, enrollment_k = :k,
-                        enrollment_g1 = :g1, enrollment_g2 = :g2,
-                        enrollment_g3 = :g3, enrollment_g4 = :g4,
-                        enrollment_g5 = :g5, enrollment_g6 = :g6,
-                        enrollment_g7 = :g7, enrollment_g8 = :g8,
-                        enrollment_g9 = :g9, enrollment_g10 = :g10,
-                        enrollment_g11 = :g11, enrollment_g12 = :g12,
-                        enrollment_sped = :sped,
-                        enrollment_ell = :ell,
-                        enrollment_econ_disadvantaged = :econ,
-                        data_source = 'tea_tapr',
-                        updated_at = NOW()
-                    WHERE nces_id = :nces_id AND year = :year
-                """), {
-                    "nces_id": nces_id, "year": DATA_YEAR,
-                    "total": total_enrollment,
-                    "pk": enrollment_pk, "k": enrollment_k,
-                    "g1": enrollment_g1, "g2": enrollment_g2, "g3": enrollment_g3,
-                    "g4": enrollment_g4, "g5": enrollment_g5, "g6": enrollment_g6,
-                    "g7": enrollment_g7, "g8": enrollment_g8, "g9": enrollment_g9,
-                    "g10": enrollment_g10, "g11": enrollment_g11, "g12": enrollment_g12,
-                    "sped": enrollment_sped, "ell": enrollment_ell, "econ": enrollment_econ_disadv
-                })
-            else:
-                # Insert
-                session.execute(text("""
-                    INSERT INTO tx_enrollment_data (
-                        nces_id, tea_district_no, year,
-                        total_enrollment,
-                        enrollment_pk, enrollment_k,
-                        enrollment_g1, enrollment_g2, enrollment_g3,
-                        enrollment_g4, enrollment_g5, enrollment_g6,
-                        enrollment_g7, enrollment_g8, enrollment_g9,
-                        enrollment_g10, enrollment_g11, enrollment_g12,
-                        enrollment_sped, enrollment_ell, enrollment_econ_disadvantaged,
-                        data_source
-                    ) VALUES (
-                        :nces_id, :tea_code, :year,
-                        :total,
-                        :pk, :k, :g1, :g2, :g3, :g4, :g5, :g6,
-                        :g7, :g8, :g9, :g10, :g11, :g12,
-                        :sped, :ell, :econ,
-                        'tea_tapr'
-                    )
-                """), {
-                    "nces_id": nces_id, "tea_code": tea_code, "year": DATA_YEAR,
-                    "total": total_enrollment,
-                    "pk": enrollment_pk, "k": enrollment_k,
-                    "g1": enrollment_g1, "g2": enrollment_g2, "g3": enrollment_g3,
-                    "g4": enrollment_g4, "g5": enrollment_g5, "g6": enrollment_g6,
-                    "g7": enrollment_g7, "g8": enrollment_g8, "g9": enrollment_g9,
-                    "g10": enrollment_g10, "g11": enrollment_g11, "g12": enrollment_g12,
-                    "sped": enrollment_sped, "ell": enrollment_ell, "econ": enrollment_econ_disadv
-                })
-
-            stats['inserted'] += 1
-
-        if stats['matched'] % 100 == 0:
-            logger.info(f"  Processed {stats['matched']} districts...")
+        'enrollment_sped': column(28),  # DPETSPEC
+        'enrollment_ell': column(31),  # DPETLEPC
+        'enrollment_econ_disadvantaged': column(32),  # DPETECOC
+        'data_source': 'tea_tapr',
+    })
 
     if not dry_run:
+        stats.update(bulk_upsert(session, 'tx_enrollment_data', records, ['nces_id', 'year']))
         session.commit()
 
     return stats
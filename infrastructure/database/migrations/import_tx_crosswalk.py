@@ -23,6 +23,7 @@ project_root = Path(__file__).parent.parent.parent.parent
 sys.path.insert(0, str(project_root))
 
 from infrastructure.database.connection import session_scope
+from infrastructure.database.migrations.sea_import_utils import clear_crosswalk_cache
 from infrastructure.database.models import District
 from sqlalchemy import text
 import logging
@@ -205,6 +206,7 @@ def import_crosswalk(df):
                 logger.info(f"Processed {idx + 1}/{len(df)} districts...")
 
         session.commit()
+        clear_crosswalk_cache('TX')
 
         logger.info(f"\n✅ Import complete!")
         logger.info(f"   - Imported to tx_district_identifiers: {imported_count}")
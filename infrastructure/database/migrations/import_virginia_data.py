@@ -36,9 +36,7 @@ import logging
 
 # Import shared SEA utilities
 from infrastructure.database.migrations.sea_import_utils import (
-    safe_float, safe_int,
-    load_state_crosswalk, get_district_name,
-    log_import_summary,
+    get_state_crosswalk, StateCrosswalk, numeric_column, text_column, upsert_mapped,
 )
 
 # Configure logging
@@ -58,19 +56,13 @@ STAFFING_FILE = VA_DATA_DIR / "staffing_and_vacancy_report_statistics.csv"
 SPECIAL_ED_FILE = VA_DATA_DIR / "dec_1_statistics (Special Education Enrollment).csv"
 
 
-def load_va_crosswalk(session) -> dict:
+def load_va_crosswalk(session) -> StateCrosswalk:
     """Load Virginia crosswalk from database.
 
     Returns:
-        Dict mapping VDOE Division Number (zero-padded) -> NCES ID
+        Cached StateCrosswalk mapping VDOE Division Number (zero-padded) -> NCES ID
     """
-    result = session.execute(text("""
-        SELECT state_district_id, nces_id
-        FROM state_district_crosswalk
-        WHERE state = 'VA'
-          AND id_system = 'st_leaid'
-    """))
-    return {row[0]: row[1] for row in result.fetchall()}
+    return get_state_crosswalk(session, 'VA')
 
 
 def load_enrollment_data():
@@ -208,187 +200,67 @@ def import_district_identifiers(session, crosswalk, enrollment_df):
     """Import district identifiers to va_district_identifiers table."""
     logger.info("Importing district identifiers...")
 
-    imported = 0
-    skipped = 0
-
-    for _, row in enrollment_df.iterrows():
-        div_num = format_division_number(row.get('Division Number'))
-
-        if div_num not in crosswalk:
-            skipped += 1
-            continue
-
-        nces_id = crosswalk[div_num]
-        division_name = row.get('Division Name', '').strip()
-
-        try:
-            session.execute(text("""
-                INSERT INTO va_district_identifiers
-                (nces_id, vdoe_division_number, division_name_vdoe, source_year)
-                VALUES (:nces_id, :div_num, :name, :year)
-                ON CONFLICT (nces_id) DO UPDATE SET
-                    division_name_vdoe = EXCLUDED.division_name_vdoe,
-                    updated_at = CURRENT_TIMESTAMP
-            """), {
-                "nces_id": nces_id,
-                "div_num": div_num,
-                "name": division_name,
-                "year": "2025-26"
-            })
-            imported += 1
-        except Exception as e:
-            logger.error(f"Failed to import identifier for Division {div_num}: {e}")
-            skipped += 1
-
-    session.commit()
-    logger.info(f"Imported {imported} district identifiers, skipped {skipped}")
-    return imported, skipped
+    return upsert_mapped(
+        session, 'va_district_identifiers', enrollment_df, enrollment_df['Division Number'], crosswalk,
+        {
+            'vdoe_division_number': lambda df: df['state_id'],
+            'division_name_vdoe': text_column('Division Name'),
+            'source_year': '2025-26',
+        },
+        ['nces_id'],
+        update_columns=['division_name_vdoe'],
+        label='district identifiers',
+    )
 
 
 def import_staff_data(session, crosswalk, staffing_df):
     """Import staff data to va_staff_data table."""
     logger.info("Importing staff data...")
 
-    imported = 0
-    skipped = 0
-
-    for _, row in staffing_df.iterrows():
-        div_num = format_division_number(row.get('Division Number'))
-
-        if div_num not in crosswalk:
-            skipped += 1
-            continue
-
-        nces_id = crosswalk[div_num]
-
-        # Clean FTE values (remove commas, handle spaces)
-        def clean_fte(val):
-            if pd.isna(val):
-                return None
-            return safe_float(str(val).replace(',', '').strip())
-
-        try:
-            session.execute(text("""
-                INSERT INTO va_staff_data
-                (nces_id, year, teachers_fte, administration_fte,
-                 aides_paraprofessionals_fte, non_instructional_fte)
-                VALUES (:nces_id, :year, :teachers, :admin, :aides, :non_instr)
-                ON CONFLICT (nces_id, year, data_source) DO UPDATE SET
-                    teachers_fte = EXCLUDED.teachers_fte,
-                    administration_fte = EXCLUDED.administration_fte,
-                    aides_paraprofessionals_fte = EXCLUDED.aides_paraprofessionals_fte,
-                    non_instructional_fte = EXCLUDED.non_instructional_fte,
-                    updated_at = CURRENT_TIMESTAMP
-            """), {
-                "nces_id": nces_id,
-                "year": "2025-26",
-                "teachers": clean_fte(row.get('Teachers')),
-                "admin": clean_fte(row.get('Administration')),
-                "aides": clean_fte(row.get('Aides and Paraprofessionals')),
-                "non_instr": clean_fte(row.get('Non-Instructional Personnel'))
-            })
-            imported += 1
-        except Exception as e:
-            logger.error(f"Failed to import staff data for Division {div_num}: {e}")
-            skipped += 1
-
-    session.commit()
-    logger.info(f"Imported {imported} staff records, skipped {skipped}")
-    return imported, skipped
+    return upsert_mapped(
+        session, 'va_staff_data', staffing_df, staffing_df['Division Number'], crosswalk,
+        {
+            'year': '2025-26',
+            'teachers_fte': numeric_column('Teachers', thousands=True),
+            'administration_fte': numeric_column('Administration', thousands=True),
+            'aides_paraprofessionals_fte': numeric_column('Aides and Paraprofessionals', thousands=True),
+            'non_instructional_fte': numeric_column('Non-Instructional Personnel', thousands=True),
+        },
+        ['nces_id', 'year', 'data_source'],
+        label='staff records',
+    )
 
 
 def import_enrollment_data(session, crosswalk, enrollment_df):
     """Import enrollment data to va_enrollment_data table."""
     logger.info("Importing enrollment data...")
 
-    imported = 0
-    skipped = 0
-
-    for _, row in enrollment_df.iterrows():
-        div_num = format_division_number(row.get('Division Number'))
-
-        if div_num not in crosswalk:
-            skipped += 1
-            continue
-
-        nces_id = crosswalk[div_num]
-
-        # Clean enrollment values (remove commas, handle spaces)
-        def clean_count(val):
-            if pd.isna(val):
-                return None
-            return safe_float(str(val).replace(',', '').strip())
-
-        try:
-            session.execute(text("""
-                INSERT INTO va_enrollment_data
-                (nces_id, year, total_enrollment, full_time_count, part_time_count)
-                VALUES (:nces_id, :year, :total, :ft, :pt)
-                ON CONFLICT (nces_id, year, data_source) DO UPDATE SET
-                    total_enrollment = EXCLUDED.total_enrollment,
-                    full_time_count = EXCLUDED.full_time_count,
-                    part_time_count = EXCLUDED.part_time_count,
-                    updated_at = CURRENT_TIMESTAMP
-            """), {
-                "nces_id": nces_id,
-                "year": "2025-26",
-                "total": clean_count(row.get('Total Count')),
-                "ft": clean_count(row.get('FT Count')),
-                "pt": clean_count(row.get('PT Count'))
-            })
-            imported += 1
-        except Exception as e:
-            logger.error(f"Failed to import enrollment data for Division {div_num}: {e}")
-            skipped += 1
-
-    session.commit()
-    logger.info(f"Imported {imported} enrollment records, skipped {skipped}")
-    return imported, skipped
+    return upsert_mapped(
+        session, 'va_enrollment_data', enrollment_df, enrollment_df['Division Number'], crosswalk,
+        {
+            'year': '2025-26',
+            'total_enrollment': numeric_column('Total Count', thousands=True),
+            'full_time_count': numeric_column('FT Count', thousands=True),
+            'part_time_count': numeric_column('PT Count', thousands=True),
+        },
+        ['nces_id', 'year', 'data_source'],
+        label='enrollment records',
+    )
 
 
 def import_special_ed_data(session, crosswalk, sped_df):
     """Import special education data to va_special_ed_data table."""
     logger.info("Importing special education data...")
 
-    imported = 0
-    skipped = 0
-
-    for _, row in sped_df.iterrows():
-        div_num = format_division_number(row.get('Division Number'))
-
-        if div_num not in crosswalk:
-            skipped += 1
-            continue
-
-        nces_id = crosswalk[div_num]
-
-        # Clean SPED count
-        def clean_count(val):
-            if pd.isna(val):
-                return None
-            return safe_int(str(val).replace(',', '').strip())
-
-        try:
-            session.execute(text("""
-                INSERT INTO va_special_ed_data
-                (nces_id, year, sped_enrollment)
-                VALUES (:nces_id, :year, :sped_count)
-                ON CONFLICT (nces_id, year, data_source) DO UPDATE SET
-                    sped_enrollment = EXCLUDED.sped_enrollment,
-                    updated_at = CURRENT_TIMESTAMP
-            """), {
-                "nces_id": nces_id,
-                "year": "2024-25",  # SPED data is from 2024-25
-                "sped_count": clean_count(row.get('Total Count'))
-            })
-            imported += 1
-        except Exception as e:
-            logger.error(f"Failed to import SPED data for Division {div_num}: {e}")
-            skipped += 1
-
-    session.commit()
-    logger.info(f"Imported {imported} special ed records, skipped {skipped}")
-    return imported, skipped
+    return upsert_mapped(
+        session, 'va_special_ed_data', sped_df, sped_df['Division Number'], crosswalk,
+        {
+            'year': '2024-25',  # SPED data is from 2024-25
+            'sped_enrollment': numeric_column('Total Count', integer=True, thousands=True),
+        },
+        ['nces_id', 'year', 'data_source'],
+        label='special ed records',
+    )
 
 
 def main():
@@ -4,17 +4,30 @@ Shared Utilities for State Education Agency (SEA) Data Imports
 
 Consolidates common patterns discovered during FL, NY, IL integrations:
 - Safe value conversion (handling suppressed data: '*', '-', '')
-- Crosswalk loading and lookup
+- Crosswalk loading and lookup (cached, with bulk Series resolution)
 - State ID format conversion
 - Common import workflow helpers
 
 Usage:
     from sea_import_utils import (
         safe_float, safe_int, safe_pct,
-        load_state_crosswalk, get_nces_id,
-        format_state_id, SEA_ID_FORMATS
+        load_state_crosswalk, get_state_crosswalk, get_nces_id,
+        format_state_id, format_state_ids, SEA_ID_FORMATS
     )
 
+    # Resolve a whole column of state IDs with one query and one join
+    crosswalk = get_state_crosswalk(session, 'MI')
+    df['nces_id'] = crosswalk.resolve(df['District Code'])
+
+    # Write a mapped frame with one INSERT ... ON CONFLICT per 1,000 rows
+    counts = bulk_upsert(session, 'mi_staff_data', records, ['nces_id', 'year'])
+
+    # Or match, map and upsert a whole state file in one call
+    imported, skipped = upsert_mapped(
+        session, 'mi_staff_data', df, df['DCODE'], crosswalk,
+        {'year': '2023-24', 'total_teacher_fte': numeric_column('TEACHER')},
+        ['nces_id', 'year', 'data_source'], label='staff records')
+
 Lessons Learned (January 2026):
 - SQLAlchemy JSONB: Use CAST(:param AS jsonb), not :param::jsonb
 - Suppressed values: State data uses '*', '-', '', NaN for suppressed data
@@ -22,8 +35,12 @@ Lessons Learned (January 2026):
 - Mixin naming: Don't prefix with 'Test' or pytest collects them
 """
 
+import numpy as np
 import pandas as pd
-from typing import Optional, Dict, Any, Callable
+import re
+import threading
+from collections.abc import Mapping
+from typing import Optional, Dict, Any, Callable, Iterator, List, Tuple
 from sqlalchemy import text
 import logging
 
@@ -116,6 +133,32 @@ def safe_pct(val, as_decimal: bool = False) -> Optional[float]:
     return f / 100.0 if as_decimal else f
 
 
+def safe_numeric(values: pd.Series, integer: bool = False) -> pd.Series:
+    """
+    Column-wise safe_float()/safe_int().
+
+    Suppressed markers and anything non-numeric become NA; integers are
+    truncated like int() and returned as nullable Int64.
+
+    Args:
+        values: Raw column from a state data file
+        integer: Truncate to nullable integers
+
+    Returns:
+        Float (or Int64) Series, same index
+
+    Examples:
+        >>> safe_numeric(pd.Series(['42.5', '*', None])).tolist()
+        [42.5, nan, nan]
+        >>> safe_numeric(pd.Series([42.7, '-']), integer=True).tolist()
+        [42, <NA>]
+    """
+    numbers = pd.to_numeric(pd.Series(values), errors='coerce')
+    if integer:
+        return np.trunc(numbers).astype('Int64')
+    return numbers.astype(float)
+
+
 # =============================================================================
 # CROSSWALK UTILITIES
 # =============================================================================
@@ -151,7 +194,7 @@ def get_nces_id(session, state: str, state_district_id: str) -> Optional[str]:
     """
     Look up NCES LEAID for a single state district ID.
 
-    For bulk lookups, use load_state_crosswalk() instead.
+    For bulk lookups, use get_state_crosswalk() instead.
 
     Args:
         session: SQLAlchemy session
@@ -305,6 +348,482 @@ def get_state_id_info(state: str) -> Dict[str, str]:
     }
 
 
+def format_state_ids(state: str, raw_ids: pd.Series) -> pd.Series:
+    """
+    Format a column of state district IDs (column-wise format_state_id).
+
+    The state converter runs once per distinct value and the results are
+    mapped back onto the column, so a 10,000-row file with 900 districts
+    costs 900 conversions. Values the converter rejects become None.
+
+    Args:
+        state: Two-letter state code
+        raw_ids: Series of raw district IDs from a state data file
+
+    Returns:
+        Series of formatted IDs (None where missing/invalid), same index
+
+    Examples:
+        >>> format_state_ids('VA', pd.Series([29, '29', None])).tolist()
+        ['029', '029', None]
+    """
+    ids = pd.Series(raw_ids)
+    formatted = {}
+    for raw in ids.dropna().unique():
+        try:
+            formatted[raw] = format_state_id(state, raw)
+        except (ValueError, TypeError):
+            formatted[raw] = None
+    result = ids.map(formatted).astype(object)
+    return result.where(result.notna(), None)
+
+
+# =============================================================================
+# BULK CROSSWALK RESOLUTION
+# =============================================================================
+
+def _normalize_ca_ids(raw_ids: pd.Series) -> pd.Series:
+    # CA crosswalk keys are 7-digit CDS codes, not SEA_ID_FORMATS['CA']
+    from infrastructure.utilities.nces_cds_crosswalk import normalize_cds_codes
+    return normalize_cds_codes(raw_ids)
+
+
+# States whose crosswalk comes from somewhere other than state_district_crosswalk
+CROSSWALK_QUERIES: Dict[str, str] = {
+    'TX': "SELECT tea_district_no, nces_id FROM tx_district_identifiers",
+}
+
+# States whose IDs need more than format_state_id() before lookup
+CROSSWALK_NORMALIZERS: Dict[str, Callable[[pd.Series], pd.Series]] = {
+    'CA': _normalize_ca_ids,
+}
+
+
+class StateCrosswalk(Mapping):
+    """
+    In-memory state district ID -> NCES ID map for one state.
+
+    Behaves like the dict returned by load_state_crosswalk() (so existing
+    ``crosswalk.get(id)`` / ``id in crosswalk`` code keeps working) and adds
+    vectorized resolution of whole pandas Series with a single hash join.
+
+    Example:
+        >>> crosswalk = get_state_crosswalk(session, 'CA')
+        >>> df['nces_id'] = crosswalk.resolve(df['cds_code'])
+        >>> unmatched = df[df['nces_id'].isna()]
+    """
+
+    def __init__(
+        self,
+        state: str,
+        mapping: Dict[str, str],
+        normalizer: Optional[Callable[[pd.Series], pd.Series]] = None,
+    ):
+        self.state = state
+        self._mapping = dict(mapping)
+        self._normalizer = normalizer or CROSSWALK_NORMALIZERS.get(state)
+
+    def __getitem__(self, state_id: str) -> str:
+        return self._mapping[state_id]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._mapping)
+
+    def __len__(self) -> int:
+        return len(self._mapping)
+
+    def __repr__(self) -> str:
+        return f"StateCrosswalk({self.state!r}, {len(self)} districts)"
+
+    def normalize(self, raw_ids: pd.Series) -> pd.Series:
+        """Convert raw IDs from a state file to crosswalk keys, column-wise."""
+        if self._normalizer is not None:
+            return self._normalizer(pd.Series(raw_ids))
+        return format_state_ids(self.state, raw_ids)
+
+    def resolve(self, raw_ids: pd.Series, normalize: bool = True) -> pd.Series:
+        """
+        Map a Series of state district IDs to NCES IDs.
+
+        Args:
+            raw_ids: State IDs as they appear in the source file
+            normalize: Apply state formatting first (False if already keys)
+
+        Returns:
+            Series of NCES IDs (None where unmatched), same index as raw_ids
+        """
+        keys = self.normalize(raw_ids) if normalize else pd.Series(raw_ids)
+        nces = keys.map(self._mapping)
+        return nces.astype(object).where(nces.notna(), None)
+
+    def attach(
+        self,
+        df: pd.DataFrame,
+        id_column: str,
+        nces_column: str = 'nces_id',
+        key_column: Optional[str] = None,
+    ) -> pd.DataFrame:
+        """
+        Return a copy of df with an NCES ID column resolved from id_column.
+
+        Args:
+            df: Source data
+            id_column: Column holding raw state district IDs
+            nces_column: Name of the NCES ID column to add
+            key_column: Also keep the normalized crosswalk key under this name
+
+        Returns:
+            New DataFrame; rows without a match have None in nces_column
+        """
+        keys = self.normalize(df[id_column])
+        out = df.copy()
+        if key_column:
+            out[key_column] = keys
+        out[nces_column] = self.resolve(keys, normalize=False)
+        return out
+
+    def where_keys(self, predicate: Callable[[str], bool]) -> 'StateCrosswalk':
+        """Return a crosswalk restricted to keys matching predicate."""
+        return StateCrosswalk(
+            self.state,
+            {k: v for k, v in self._mapping.items() if predicate(k)},
+            self._normalizer,
+        )
+
+    def coverage(self, raw_ids) -> Dict[str, Any]:
+        """Match statistics for a list/Series of raw state IDs."""
+        keys = self.normalize(pd.Series(list(raw_ids), dtype=object))
+        matched = keys.isin(self._mapping.keys())
+        total = len(keys)
+        matched_count = int(matched.sum())
+        return {
+            'total': total,
+            'matched': matched_count,
+            'unmatched': total - matched_count,
+            'coverage_pct': (matched_count / total * 100) if total > 0 else 0,
+            'unmatched_ids': keys[~matched].tolist()[:20],  # First 20 for debugging
+        }
+
+
+# Keyed by (database URL, state) so sessions on different databases never
+# share a crosswalk
+_crosswalk_cache: Dict[Tuple[Optional[str], str], StateCrosswalk] = {}
+_crosswalk_lock = threading.Lock()
+
+
+def _bind_key(session) -> Optional[str]:
+    """URL (password masked) of the database a session or connection uses."""
+    get_bind = getattr(session, 'get_bind', None)
+    bind = get_bind() if get_bind is not None else getattr(session, 'engine', None)
+    url = getattr(bind, 'url', None)
+    return str(url) if url is not None else None
+
+
+def get_state_crosswalk(session, state: str, refresh: bool = False) -> StateCrosswalk:
+    """
+    Get the cached crosswalk for a state, loading it with one query if needed.
+
+    Every importer (and every function within an importer) on the same
+    database shares the same in-memory crosswalk, so resolving IDs never
+    costs a per-row round-trip. Scripts that rewrite a crosswalk call
+    clear_crosswalk_cache() afterwards.
+
+    Args:
+        session: SQLAlchemy session
+        state: Two-letter state code
+        refresh: Reload from the database (e.g. after importing identifiers)
+
+    Returns:
+        StateCrosswalk for the state
+    """
+    key = (_bind_key(session), state)
+    with _crosswalk_lock:
+        if refresh or key not in _crosswalk_cache:
+            if state in CROSSWALK_QUERIES:
+                result = session.execute(text(CROSSWALK_QUERIES[state]))
+                mapping = {row[0]: row[1] for row in result.fetchall()}
+            else:
+                mapping = load_state_crosswalk(session, state)
+            _crosswalk_cache[key] = StateCrosswalk(state, mapping)
+            logger.debug(f"Loaded {len(mapping)} {state} crosswalk entries")
+        return _crosswalk_cache[key]
+
+
+def clear_crosswalk_cache(state: Optional[str] = None) -> None:
+    """Drop cached crosswalks (one state on every database, or all if state is None)."""
+    with _crosswalk_lock:
+        if state is None:
+            _crosswalk_cache.clear()
+        else:
+            for key in [key for key in _crosswalk_cache if key[1] == state]:
+                del _crosswalk_cache[key]
+
+
+# =============================================================================
+# CALIFORNIA CDS CODES
+# =============================================================================
+
+def build_cds_codes(df: pd.DataFrame) -> pd.Series:
+    """Build 7-digit CDS codes from County Code and District Code columns."""
+    county = df['County Code'].astype(str).str.strip().str.zfill(2)
+    district = df['District Code'].astype(str).str.strip().str.zfill(5)
+    return county + district
+
+
+def resolve_cds_nces_ids(district_df: pd.DataFrame, session) -> pd.DataFrame:
+    """Add cds_code and nces_id columns to a CDE file using the cached CA crosswalk."""
+    district_df = district_df.assign(cds_code=build_cds_codes(district_df))
+    return get_state_crosswalk(session, 'CA').attach(district_df, 'cds_code')
+
+
+# =============================================================================
+# BULK WRITES
+# =============================================================================
+
+_IDENTIFIER = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*$')
+
+
+def _check_identifiers(*names: str) -> None:
+    for name in names:
+        if not _IDENTIFIER.match(name):
+            raise ValueError(f"Invalid SQL identifier: {name!r}")
+
+
+def build_upsert_sql(
+    table: str,
+    columns: List[str],
+    conflict_columns: List[str],
+    update_columns: Optional[List[str]] = None,
+    touch_column: Optional[str] = 'updated_at',
+) -> str:
+    """
+    Build an INSERT ... ON CONFLICT statement for execute_values().
+
+    RETURNING (xmax = 0) is true for freshly inserted rows and false for
+    rows that took the DO UPDATE path, which is how inserted/updated are
+    counted without a separate existence check.
+
+    Args:
+        table: Target table
+        columns: Columns supplied for each row
+        conflict_columns: Unique key columns (must match a constraint)
+        update_columns: Columns overwritten on conflict (default: all non-key)
+        touch_column: Timestamp column set to NOW() on update (None to skip)
+
+    Returns:
+        SQL with a single %s placeholder for the VALUES list
+    """
+    if update_columns is None:
+        update_columns = [c for c in columns if c not in conflict_columns]
+    _check_identifiers(table, *columns, *conflict_columns, *update_columns)
+
+    sql = (
+        f"INSERT INTO {table} ({', '.join(columns)}) VALUES %s "
+        f"ON CONFLICT ({', '.join(conflict_columns)}) "
+    )
+    assignments = [f"{c} = EXCLUDED.{c}" for c in update_columns]
+    if assignments and touch_column:
+        _check_identifiers(touch_column)
+        assignments.append(f"{touch_column} = NOW()")
+
+    if assignments:
+        sql += "DO UPDATE SET " + ", ".join(assignments)
+    else:
+        sql += "DO NOTHING"
+    return sql + " RETURNING (xmax = 0) AS inserted"
+
+
+def dataframe_rows(df: pd.DataFrame) -> List[tuple]:
+    """Convert a DataFrame to row tuples of plain Python values (NA -> None)."""
+    columns = []
+    for name in df.columns:
+        series = df[name]
+        missing = series.isna().tolist()
+        columns.append([None if m else v for v, m in zip(series.tolist(), missing)])
+    return list(zip(*columns))
+
+
+def bulk_upsert(
+    session,
+    table: str,
+    df: pd.DataFrame,
+    conflict_columns: List[str],
+    update_columns: Optional[List[str]] = None,
+    touch_column: Optional[str] = 'updated_at',
+    page_size: int = 1000,
+) -> Dict[str, int]:
+    """
+    Insert or update every row of a mapped DataFrame in a few round-trips.
+
+    Rows are sent with psycopg2's execute_values, page_size rows per
+    INSERT ... ON CONFLICT DO UPDATE statement, inside the session's
+    transaction (the caller commits). Duplicate keys within df keep the
+    last row, since one statement cannot update the same row twice.
+
+    Args:
+        session: SQLAlchemy session (PostgreSQL/psycopg2)
+        table: Target table
+        df: One row per record, columns named after table columns
+        conflict_columns: Unique key columns, e.g. ['nces_id', 'year']
+        update_columns: Columns overwritten on conflict (default: all non-key)
+        touch_column: Timestamp column set to NOW() on update (None to skip)
+        page_size: Rows per statement
+
+    Returns:
+        Dict with 'inserted' and 'updated' counts
+
+    Example:
+        >>> counts = bulk_upsert(session, 'tx_staff_data', records, ['nces_id', 'year'])
+        >>> stats.update(counts)
+    """
+    from psycopg2.extras import execute_values
+
+    if df.empty:
+        return {'inserted': 0, 'updated': 0}
+
+    # Key columns filled by table defaults (e.g. data_source) can't be deduped here
+    key_columns = [c for c in conflict_columns if c in df.columns]
+    deduped = df.drop_duplicates(subset=key_columns, keep='last')
+    if len(deduped) < len(df):
+        logger.warning(f"  {len(df) - len(deduped)} duplicate {table} keys in input; keeping last")
+
+    sql = build_upsert_sql(table, list(deduped.columns), conflict_columns, update_columns, touch_column)
+
+    cursor = session.connection().connection.cursor()
+    try:
+        results = execute_values(cursor, sql, dataframe_rows(deduped), page_size=page_size, fetch=True)
+    finally:
+        cursor.close()
+
+    inserted = sum(1 for (was_inserted,) in results if was_inserted)
+    return {'inserted': inserted, 'updated': len(results) - inserted}
+
+
+def match_to_crosswalk(
+    df: pd.DataFrame,
+    state_ids: pd.Series,
+    crosswalk: 'StateCrosswalk',
+    normalize: bool = True,
+) -> Tuple[pd.DataFrame, Dict[str, int]]:
+    """
+    Keep the rows of df whose state IDs resolve to an NCES ID.
+
+    Args:
+        df: Source rows
+        state_ids: State district ID for each row (aligned with df)
+        crosswalk: StateCrosswalk for the state
+        normalize: Format state_ids before lookup
+
+    Returns:
+        (matched rows with 'nces_id' and 'state_id' columns, stats dict
+        with total/matched/skipped and zeroed inserted/updated for log_stats)
+    """
+    keys = crosswalk.normalize(state_ids) if normalize else pd.Series(state_ids)
+    nces_ids = crosswalk.resolve(keys, normalize=False)
+    matched = nces_ids.notna()
+
+    stats = {
+        'total': len(df),
+        'matched': int(matched.sum()),
+        'skipped': int((~matched).sum()),
+        'inserted': 0,
+        'updated': 0,
+    }
+    out = df[matched].assign(nces_id=nces_ids[matched], state_id=keys[matched])
+    return out, stats
+
+
+def numeric_column(
+    column: Any,
+    integer: bool = False,
+    thousands: bool = False,
+    default: Optional[float] = None,
+) -> Callable[[pd.DataFrame], pd.Series]:
+    """
+    Column mapper for upsert_mapped(): safe_numeric() of a source column.
+
+    Args:
+        column: Source column name
+        integer: Truncate to nullable integers
+        thousands: Strip ',' thousands separators first (e.g. "1,234")
+        default: Value for suppressed/missing entries (None keeps NA)
+
+    Returns:
+        Function of the matched rows returning the converted Series
+
+    Examples:
+        >>> numeric_column('FTE')(pd.DataFrame({'FTE': ['12.5', '*']})).tolist()
+        [12.5, nan]
+    """
+    def convert(df: pd.DataFrame) -> pd.Series:
+        values = df[column]
+        if thousands:
+            values = values.astype('string').str.replace(',', '', regex=False).str.strip()
+        numbers = safe_numeric(values, integer=integer)
+        return numbers if default is None else numbers.fillna(default)
+    return convert
+
+
+def text_column(column: Any) -> Callable[[pd.DataFrame], pd.Series]:
+    """Column mapper for upsert_mapped(): stripped text of a source column ('' if missing)."""
+    return lambda df: df[column].fillna('').astype(str).str.strip()
+
+
+def upsert_mapped(
+    session,
+    table: str,
+    df: pd.DataFrame,
+    state_ids: pd.Series,
+    crosswalk: 'StateCrosswalk',
+    columns: Dict[str, Any],
+    conflict_columns: List[str],
+    update_columns: Optional[List[str]] = None,
+    label: str = 'records',
+) -> Tuple[int, int]:
+    """
+    Match rows to NCES IDs, bulk upsert a mapped frame, and commit.
+
+    The shared workflow of the SEA importers: match_to_crosswalk() on the
+    raw state IDs (formatted by the crosswalk's normalizer), build one
+    record per matched row from a {table column: value} mapping, then
+    bulk_upsert() the records.
+
+    Args:
+        session: SQLAlchemy session (committed after the upsert)
+        table: Target table
+        df: Rows from a state data file
+        state_ids: Raw state district ID for each row (aligned with df)
+        crosswalk: StateCrosswalk for the state
+        columns: {table column: constant, or function of the matched rows
+            (which carry 'nces_id' and the normalized 'state_id')}
+        conflict_columns: Unique key columns, e.g. ['nces_id', 'year', 'data_source']
+        update_columns: Columns overwritten on conflict (default: all non-key)
+        label: Record description for logging
+
+    Returns:
+        (rows inserted or updated, rows skipped without an NCES match)
+
+    Example:
+        >>> imported, skipped = upsert_mapped(
+        ...     session, 'mi_staff_data', df, df['DCODE'], crosswalk,
+        ...     {'year': '2023-24', 'total_teacher_fte': numeric_column('TEACHER')},
+        ...     ['nces_id', 'year', 'data_source'], label='staff records')
+    """
+    matched_df, stats = match_to_crosswalk(df, state_ids, crosswalk)
+
+    records = pd.DataFrame({'nces_id': matched_df['nces_id'], **{
+        name: column(matched_df) if callable(column) else column
+        for name, column in columns.items()
+    }})
+    counts = bulk_upsert(session, table, records, conflict_columns, update_columns=update_columns)
+    session.commit()
+
+    imported = counts['inserted'] + counts['updated']
+    logger.info(f"Imported {imported} {label} ({counts['inserted']} new, {counts['updated']} updated), "
+                f"skipped {stats['skipped']} without an NCES match")
+    return imported, stats['skipped']
+
+
 # =============================================================================
 # IMPORT WORKFLOW HELPERS
 # =============================================================================
@@ -323,26 +842,8 @@ def check_crosswalk_coverage(session, state: str, state_ids: list) -> Dict[str,
     Returns:
         Dict with 'total', 'matched', 'unmatched', 'coverage_pct', 'unmatched_ids'
     """
-    crosswalk = load_state_crosswalk(session, state)
-
-    matched = []
-    unmatched = []
-
-    for sid in state_ids:
-        formatted = format_state_id(state, sid)
-        if formatted in crosswalk:
-            matched.append(formatted)
-        else:
-            unmatched.append(formatted)
-
-    total = len(state_ids)
-    return {
-        'total': total,
-        'matched': len(matched),
-        'unmatched': len(unmatched),
-        'coverage_pct': (len(matched) / total * 100) if total > 0 else 0,
-        'unmatched_ids': unmatched[:20],  # First 20 for debugging
-    }
+    # Diagnostics read the crosswalk as it is now, not as first cached
+    return get_state_crosswalk(session, state, refresh=True).coverage(state_ids)
 
 
 def log_import_summary(
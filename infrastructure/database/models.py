@@ -19,9 +19,11 @@ from sqlalchemy import (
     ForeignKey,
     Index,
     Integer,
+    insert,
     Numeric,
     String,
     Text,
+    text,
     UniqueConstraint,
 )
 from sqlalchemy.dialects.postgresql import JSONB
@@ -472,6 +474,9 @@ class CalculationRun(Base):
     # QA summary
     qa_summary = Column(JSONB)  # QA report embedded
 
+    # Performance: per-stage wall/CPU seconds and peak memory (StageProfiler)
+    stage_profile = Column(JSONB)
+
     def __repr__(self) -> str:
         mode_str = f"mode={self.calculation_mode.value}"
         year_str = f", target={self.target_year}" if self.target_year else ""
@@ -496,6 +501,7 @@ class CalculationRun(Base):
         target_year: Optional[str] = None,
         run_type: str = "full",
         previous_run_id: Optional[str] = None,
+        run_id: Optional[str] = None,
     ) -> "CalculationRun":
         """
         Start a new calculation run.
@@ -506,6 +512,8 @@ class CalculationRun(Base):
             target_year: Required for TARGET_YEAR mode, optional for BLENDED
             run_type: 'full' or 'incremental'
             previous_run_id: ID of previous run for incremental processing
+            run_id: Explicit run ID (default: current UTC timestamp); used
+                when several runs start in the same second
 
         Raises:
             ValueError: If TARGET_YEAR mode specified without target_year
@@ -516,7 +524,7 @@ class CalculationRun(Base):
         if calculation_mode == CalculationMode.TARGET_YEAR and not target_year:
             raise ValueError("target_year is required when calculation_mode is TARGET_YEAR")
 
-        run_id = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+        run_id = run_id or datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
 
         run = cls(
             run_id=run_id,
@@ -538,8 +546,9 @@ class CalculationRun(Base):
         qa_summary: Optional[dict] = None,
         data_year_min: Optional[str] = None,
         data_year_max: Optional[str] = None,
+        stage_profile: Optional[dict] = None,
     ) -> None:
-        """Mark run as completed with data range information."""
+        """Mark run as completed with data range and stage profile information."""
         self.status = "completed"
         self.completed_at = datetime.utcnow()
         self.districts_processed = districts_processed
@@ -548,6 +557,7 @@ class CalculationRun(Base):
         self.qa_summary = qa_summary
         self.data_year_min = data_year_min
         self.data_year_max = data_year_max
+        self.stage_profile = stage_profile
 
     def fail(self, error_message: str) -> None:
         """Mark run as failed."""
@@ -556,6 +566,37 @@ class CalculationRun(Base):
         self.error_message = error_message
 
 
+class RebuildPhaseRun(Base):
+    """
+    Per-phase duration and row counts of one rebuild_database.py run.
+
+    One row per (run, phase); a resumed rebuild keeps its run_id and
+    overwrites the phases it reran. Not truncated by reset_database.py, so
+    runs can be compared over time.
+    """
+    __tablename__ = "rebuild_phase_runs"
+
+    run_id: Mapped[str] = mapped_column(String(50), primary_key=True)
+    phase: Mapped[int] = mapped_column(Integer, primary_key=True)
+
+    phase_name: Mapped[str] = mapped_column(String(50), nullable=False)
+    status: Mapped[str] = mapped_column(String(20), nullable=False)  # completed, partial, failed, pending
+    tasks: Mapped[Optional[int]] = mapped_column(Integer)
+    seconds: Mapped[Optional[float]] = mapped_column(Numeric(10, 2))
+
+    # {table: row count} once every task writing the table has finished
+    row_counts = Column(JSONB)
+    # Options the rebuild ran with (year, sample, sea)
+    options = Column(JSONB)
+
+    recorded_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=datetime.utcnow
+    )
+
+    def __repr__(self) -> str:
+        return f"<RebuildPhaseRun {self.run_id} phase {self.phase}: {self.status}>"
+
+
 class DataLineage(Base):
     """
     Audit trail for data changes and imports.
@@ -623,6 +664,114 @@ class DataLineage(Base):
         return lineage
 
 
+class LineageBatch:
+    """
+    Collects DataLineage records and writes them in one multi-row INSERT.
+
+    Use instead of DataLineage.log inside per-entity import loops. Records
+    are written when the block exits normally (or on flush()); if the block
+    raises, they are discarded along with the import they describe.
+
+    With collapse=True, records sharing entity_type, operation, source_file
+    and created_by are written as one summary row (entity_id '*') whose
+    details hold the count, the entity IDs and any per-entity details.
+    Keep collapse off where per-entity lineage is checked, e.g. bell
+    schedules (see verification.verify_audit_completeness).
+
+    Example:
+        with LineageBatch(session, created_by="migration") as lineage:
+            for schedule in schedules:
+                session.merge(schedule)
+                lineage.log("bell_schedule", schedule_key, "import", source_file=path)
+    """
+
+    def __init__(self, session, created_by: str = "system", collapse: bool = False):
+        """
+        Args:
+            session: SQLAlchemy session (the caller commits)
+            created_by: Default created_by for logged records
+            collapse: Write one summary row per group instead of one row per entity
+        """
+        self.session = session
+        self.created_by = created_by
+        self.collapse = collapse
+        self.records: List[dict] = []
+        self.written = 0
+
+    def log(
+        self,
+        entity_type: str,
+        entity_id: str,
+        operation: str,
+        source_file: Optional[str] = None,
+        details: Optional[dict] = None,
+        created_by: Optional[str] = None,
+    ) -> None:
+        """Queue a lineage record (same arguments as DataLineage.log)."""
+        self.records.append({
+            "entity_type": entity_type,
+            "entity_id": entity_id,
+            "operation": operation,
+            "source_file": source_file,
+            "details": details,
+            "created_by": created_by or self.created_by,
+            "created_at": datetime.utcnow(),
+        })
+
+    def rows(self) -> List[dict]:
+        """Rows to insert, collapsed into summary rows if requested."""
+        if not self.collapse:
+            return list(self.records)
+
+        groups = {}
+        for record in self.records:
+            key = (record["entity_type"], record["operation"], record["source_file"], record["created_by"])
+            groups.setdefault(key, []).append(record)
+
+        rows = []
+        for (entity_type, operation, source_file, created_by), records in groups.items():
+            details = {
+                "count": len(records),
+                "entity_ids": [r["entity_id"] for r in records],
+            }
+            entity_details = {r["entity_id"]: r["details"] for r in records if r["details"]}
+            if entity_details:
+                details["entity_details"] = entity_details
+            rows.append({
+                "entity_type": entity_type,
+                "entity_id": "*",
+                "operation": operation,
+                "source_file": source_file,
+                "details": details,
+                "created_by": created_by,
+                "created_at": records[-1]["created_at"],
+            })
+        return rows
+
+    def flush(self) -> int:
+        """
+        Insert the queued records in a single statement.
+
+        Returns:
+            Number of data_lineage rows written
+        """
+        rows = self.rows()
+        self.records = []
+        if rows:
+            self.session.execute(insert(DataLineage), rows)
+        self.written += len(rows)
+        return len(rows)
+
+    def __enter__(self) -> "LineageBatch":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.flush()
+        else:
+            self.records = []
+
+
 class DataSourceRegistry(Base):
     """
     Registry of available data sources with metadata.
@@ -979,6 +1128,11 @@ class EnrollmentByGrade(Base):
     # Constraints
     __table_args__ = (
         UniqueConstraint("district_id", "source_year", "data_source", name="uq_enrollment_by_grade"),
+        # Most recent year per district (migration 017)
+        Index(
+            "ix_enrollment_by_grade_latest", "district_id", text("source_year DESC"), text("id DESC"),
+            postgresql_include=["enrollment_k12", "enrollment_elementary", "enrollment_secondary"],
+        ),
     )
 
     def __repr__(self) -> str:
@@ -1237,6 +1391,14 @@ class SpedEstimate(Base):
     __table_args__ = (
         UniqueConstraint("district_id", "estimate_year", name="uq_sped_estimate"),
         CheckConstraint("confidence IN ('high', 'medium', 'low')", name="chk_sped_confidence"),
+        # Most recent year per district (migration 017)
+        Index(
+            "ix_sped_estimates_latest", "district_id", text("estimate_year DESC"),
+            postgresql_include=[
+                "confidence", "estimated_self_contained_sped", "estimated_gened_enrollment",
+                "estimated_sped_teachers", "estimated_sped_instructional", "estimated_gened_teachers",
+            ],
+        ),
     )
 
     def __repr__(self) -> str:
@@ -1371,6 +1533,11 @@ class CASpedDistrictEnvironments(Base):
         Index("ix_ca_sped_nces_id", "nces_id"),
         Index("ix_ca_sped_year", "year"),
         Index("ix_ca_sped_cds_code", "cds_code"),
+        # Most recent year per district (migration 017)
+        Index(
+            "ix_ca_sped_latest", "nces_id", text("year DESC"),
+            postgresql_include=["confidence", "sped_self_contained"],
+        ),
     )
 
     def __repr__(self) -> str:
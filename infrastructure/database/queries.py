@@ -10,11 +10,12 @@ import json
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 
-from sqlalchemy import and_, desc, func, or_, select
+from sqlalchemy import and_, desc, func, literal_column, null, or_, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 
-from .models import BellSchedule, DataLineage, District, LCTCalculation, StateRequirement
-from .verification import validate_schedule_plausibility
+from .models import BellSchedule, DataLineage, District, LCTCalculation, LineageBatch, StateRequirement
+from .verification import validate_schedule_plausibility, validate_schedules_batch
 
 
 # =============================================================================
@@ -309,7 +310,7 @@ def add_district_bell_schedules(
     Returns:
         List of created/updated BellSchedule instances
     """
-    results = []
+    records = []
 
     for grade_level in ["elementary", "middle", "high"]:
         if grade_level not in schedules or schedules[grade_level] is None:
@@ -319,28 +320,233 @@ def add_district_bell_schedules(
         if not data.get("instructional_minutes"):
             continue
 
-        schedule = add_bell_schedule(
-            session=session,
-            district_id=district_id,
-            year=year,
-            grade_level=grade_level,
-            instructional_minutes=data["instructional_minutes"],
-            start_time=data.get("start_time"),
-            end_time=data.get("end_time"),
-            lunch_duration=data.get("lunch_duration"),
-            passing_periods=data.get("passing_periods"),
-            recess_duration=data.get("recess_duration"),
-            schools_sampled=data.get("schools_sampled"),
-            source_urls=data.get("source_urls"),
-            confidence=data.get("confidence", "high"),
-            method=method,
-            source_description=data.get("source"),
-            notes=data.get("notes"),
-            created_by=created_by,
+        records.append({
+            "district_id": district_id,
+            "year": year,
+            "grade_level": grade_level,
+            "instructional_minutes": data["instructional_minutes"],
+            "start_time": data.get("start_time"),
+            "end_time": data.get("end_time"),
+            "lunch_duration": data.get("lunch_duration"),
+            "passing_periods": data.get("passing_periods"),
+            "recess_duration": data.get("recess_duration"),
+            "schools_sampled": data.get("schools_sampled"),
+            "source_urls": data.get("source_urls"),
+            "confidence": data.get("confidence", "high"),
+            "method": method,
+            "source_description": data.get("source"),
+            "notes": data.get("notes"),
+        })
+
+    outcomes = add_bell_schedules_bulk(session, records, created_by=created_by)
+    rejected = [o for o in outcomes if o["status"] == "rejected"]
+    if rejected:
+        raise ValueError(
+            f"Schedule validation failed for {district_id}/{rejected[0]['grade_level']}: "
+            f"{'; '.join(rejected[0]['errors'])}"
         )
-        results.append(schedule)
 
-    return results
+    ids = [o["id"] for o in outcomes]
+    by_id = {
+        schedule.id: schedule
+        for schedule in session.query(BellSchedule)
+        .filter(BellSchedule.id.in_(ids))
+        .populate_existing()
+    }
+    return [by_id[i] for i in ids]
+
+
+# Values accepted by the bell_schedules CHECK constraints; rows outside them
+# would abort a whole bulk statement, so they are rejected up front
+BELL_SCHEDULE_GRADE_LEVELS = ("elementary", "middle", "high")
+BELL_SCHEDULE_CONFIDENCE = ("high", "medium", "low")
+BELL_SCHEDULE_METHODS = ("automated_enrichment", "human_provided", "statutory_fallback")
+BELL_SCHEDULE_MINUTES_RANGE = (100, 600)
+
+BELL_SCHEDULE_FIELDS = (
+    "instructional_minutes",
+    "start_time",
+    "end_time",
+    "lunch_duration",
+    "passing_periods",
+    "recess_duration",
+    "schools_sampled",
+    "source_urls",
+    "confidence",
+    "method",
+    "source_description",
+    "notes",
+)
+
+
+def _bell_schedule_constraint_errors(record: Dict) -> List[str]:
+    """Problems that would violate the bell_schedules table constraints."""
+    errors = []
+    if not record.get("year"):
+        errors.append("year is required")
+    if record.get("grade_level") not in BELL_SCHEDULE_GRADE_LEVELS:
+        errors.append(f"Invalid grade_level: '{record.get('grade_level')}'")
+    if record.get("confidence", "high") not in BELL_SCHEDULE_CONFIDENCE:
+        errors.append(f"Invalid confidence: '{record.get('confidence')}'")
+    if record.get("method", "human_provided") not in BELL_SCHEDULE_METHODS:
+        errors.append(f"Invalid method: '{record.get('method')}'")
+    minutes = record.get("instructional_minutes")
+    low, high = BELL_SCHEDULE_MINUTES_RANGE
+    if not isinstance(minutes, (int, float)) or isinstance(minutes, bool) or not low <= minutes <= high:
+        errors.append(f"instructional_minutes must be between {low} and {high}, got {minutes!r}")
+    return errors
+
+
+def add_bell_schedules_bulk(
+    session: Session,
+    records: List[Dict],
+    created_by: str = "claude",
+    source_file: Optional[str] = None,
+    validate: bool = True,
+    page_size: int = 500,
+) -> List[Dict]:
+    """
+    Add or update many bell schedules in a few statements.
+
+    Bulk counterpart of add_bell_schedule: district IDs are verified with
+    one query, schedules with start/end times are checked with
+    validate_schedules_batch, and every accepted row is written with
+    INSERT ... ON CONFLICT (district_id, year, grade_level) DO UPDATE,
+    page_size rows per statement. Lineage is written in one batch. Invalid
+    records are reported rather than raised, so one bad schedule doesn't
+    block the rest. Runs in the session's transaction (the caller commits).
+
+    Args:
+        session: Database session
+        records: Dicts with district_id, year, grade_level,
+            instructional_minutes and optionally the other
+            add_bell_schedule fields plus raw_import
+        created_by: Attribution for lineage
+        source_file: Source file recorded in lineage
+        validate: Run the plausibility checks (table constraints are
+            always enforced)
+        page_size: Rows per INSERT statement
+
+    Returns:
+        One outcome per record, in input order, with district_id, year,
+        grade_level, status ('create', 'update', 'rejected' or
+        'superseded' by a later record for the same key), id, errors
+        and warnings
+    """
+    outcomes = [
+        {
+            "district_id": r.get("district_id"),
+            "year": r.get("year"),
+            "grade_level": r.get("grade_level"),
+            "status": None,
+            "id": None,
+            "errors": _bell_schedule_constraint_errors(r),
+            "warnings": [],
+        }
+        for r in records
+    ]
+
+    # Verify districts with one query (same ID forms as import_all_data)
+    candidates = set()
+    for r in records:
+        raw_id = str(r.get("district_id") or "")
+        candidates.update({raw_id, raw_id.lstrip("0") or raw_id})
+    known = set(session.execute(
+        select(District.nces_id).where(District.nces_id.in_(candidates))
+    ).scalars()) if candidates else set()
+
+    for r, outcome in zip(records, outcomes):
+        raw_id = str(r.get("district_id") or "")
+        normalized_id = raw_id.lstrip("0") or raw_id
+        if normalized_id in known:
+            outcome["district_id"] = normalized_id
+        elif raw_id in known:
+            outcome["district_id"] = raw_id
+        else:
+            outcome["errors"].append(f"District {raw_id} not found in database")
+
+    # REQ-038: plausibility checks for schedules with start and end times
+    timed = [i for i, r in enumerate(records) if validate and r.get("start_time") and r.get("end_time")]
+    validation = validate_schedules_batch([
+        {
+            "start_time": records[i]["start_time"],
+            "end_time": records[i]["end_time"],
+            "grade_level": records[i].get("grade_level") or "",
+            "instructional_minutes": records[i].get("instructional_minutes"),
+        }
+        for i in timed
+    ])
+    for i, result in zip(timed, validation["results"]):
+        outcomes[i]["errors"].extend(result["errors"])
+        outcomes[i]["warnings"].extend(result["warnings"])
+
+    # One row per key; a later record for the same schedule wins
+    rows = {}
+    now = datetime.utcnow()
+    for i, (r, outcome) in enumerate(zip(records, outcomes)):
+        if outcome["errors"]:
+            outcome["status"] = "rejected"
+            continue
+        key = (outcome["district_id"], r["year"], r["grade_level"])
+        if key in rows:
+            outcomes[rows[key][0]]["status"] = "superseded"
+        row = {field: r.get(field) for field in BELL_SCHEDULE_FIELDS}
+        row.update(
+            district_id=key[0],
+            year=key[1],
+            grade_level=key[2],
+            schools_sampled=r.get("schools_sampled") or [],
+            source_urls=r.get("source_urls") or [],
+            confidence=r.get("confidence") or "high",
+            method=r.get("method") or "human_provided",
+            # SQL NULL (not JSON null) so the COALESCE below keeps existing data
+            raw_import=r["raw_import"] if r.get("raw_import") is not None else null(),
+            created_at=now,
+            updated_at=now,
+        )
+        rows[key] = (i, row)
+
+    written = {}
+    pending = list(rows.values())
+    for start in range(0, len(pending), page_size):
+        stmt = pg_insert(BellSchedule.__table__).values([row for _, row in pending[start:start + page_size]])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["district_id", "year", "grade_level"],
+            set_={
+                **{field: stmt.excluded[field] for field in BELL_SCHEDULE_FIELDS},
+                # add_bell_schedule never touches the preserved original import
+                "raw_import": func.coalesce(stmt.excluded.raw_import, BellSchedule.__table__.c.raw_import),
+                "updated_at": func.now(),
+            },
+        ).returning(
+            BellSchedule.__table__.c.id,
+            BellSchedule.__table__.c.district_id,
+            BellSchedule.__table__.c.year,
+            BellSchedule.__table__.c.grade_level,
+            literal_column("xmax = 0").label("inserted"),
+        )
+        for row in session.execute(stmt):
+            written[(row.district_id, row.year, row.grade_level)] = (row.id, row.inserted)
+
+    with LineageBatch(session, created_by=created_by) as lineage:
+        for key, (i, row) in rows.items():
+            record_id, inserted = written[key]
+            outcome = outcomes[i]
+            outcome["id"] = record_id
+            outcome["status"] = "create" if inserted else "update"
+            lineage.log(
+                entity_type="bell_schedule",
+                entity_id="/".join(key),
+                operation=outcome["status"],
+                source_file=source_file,
+                details={
+                    "instructional_minutes": row["instructional_minutes"],
+                    "method": row["method"],
+                    "confidence": row["confidence"],
+                },
+            )
+
+    return outcomes
 
 
 # =============================================================================
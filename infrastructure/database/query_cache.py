@@ -0,0 +1,163 @@
+"""
+Async query layer with a data-versioned TTL cache.
+
+Runs synchronous query functions (infrastructure.database.queries) on a
+dedicated thread pool, each call with its own session from the engine's
+connection pool, so async servers (the MCP server) don't block their event
+loop and concurrent tool calls run side by side.
+
+Results are cached per tool + arguments for a short TTL. Every cached entry
+is tagged with the database's data version: the latest completed
+calculation run and the bell schedule count/last update. When either
+changes, older entries are treated as stale even if their TTL hasn't
+expired. Identical calls that arrive while one is already running share its
+result instead of querying again.
+
+Usage:
+    layer = QueryLayer(ttl_seconds=60)
+
+    progress = await layer.cached(
+        "query_campaign_progress", {"year": year},
+        get_state_campaign_progress, year,
+    )
+"""
+
+import asyncio
+import json
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from sqlalchemy import text
+
+logger = logging.getLogger(__name__)
+
+DATA_VERSION_SQL = text("""
+    SELECT
+        (SELECT MAX(completed_at) FROM calculation_runs WHERE status = 'completed'),
+        (SELECT COUNT(*) FROM bell_schedules),
+        (SELECT MAX(updated_at) FROM bell_schedules)
+""")
+
+
+def data_version(session) -> Tuple:
+    """
+    Fingerprint of the data the MCP tools report on.
+
+    Changes when a calculation run completes or bell schedules are added,
+    removed or updated.
+    """
+    return tuple(session.execute(DATA_VERSION_SQL).one())
+
+
+def cache_key(tool: str, arguments: Optional[Dict[str, Any]]) -> Hashable:
+    """Stable key for a tool call (argument order doesn't matter)."""
+    return tool, json.dumps(arguments or {}, sort_keys=True, default=str)
+
+
+class QueryLayer:
+    """
+    Thread-pooled, cached execution of session-based query functions.
+
+    Args:
+        max_workers: Queries allowed to run at once
+        ttl_seconds: Maximum age of a cached result
+        version_interval: Seconds between data version checks
+        session_factory: Context manager yielding a session (default: session_scope)
+        version_fn: Callable(session) -> hashable data version
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 8,
+        ttl_seconds: float = 60.0,
+        version_interval: float = 5.0,
+        session_factory: Optional[Callable] = None,
+        version_fn: Callable = data_version,
+    ):
+        if session_factory is None:
+            from infrastructure.database.connection import session_scope
+            session_factory = session_scope
+
+        self.ttl_seconds = ttl_seconds
+        self.version_interval = version_interval
+        self.session_factory = session_factory
+        self.version_fn = version_fn
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="lct-query")
+
+        self._entries: Dict[Hashable, Tuple[float, Any, Any]] = {}  # key -> (stored_at, version, result)
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        self._version: Any = None
+        self._version_checked = float("-inf")
+        self._version_task: Optional[asyncio.Future] = None
+        self.hits = 0
+        self.misses = 0
+
+    def _call(self, fn: Callable, args: tuple) -> Any:
+        with self.session_factory() as session:
+            return fn(session, *args)
+
+    async def run(self, fn: Callable, *args) -> Any:
+        """Run fn(session, *args) on the thread pool with its own session."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._call, fn, args)
+
+    async def current_version(self) -> Any:
+        """Data version, re-queried at most every version_interval seconds."""
+        if time.monotonic() - self._version_checked < self.version_interval:
+            return self._version
+        if self._version_task is None:
+            self._version_task = asyncio.ensure_future(self.run(self.version_fn))
+        task = self._version_task
+        try:
+            version = await task
+        finally:
+            if self._version_task is task:
+                self._version_task = None
+        if version != self._version:
+            if self._version is not None:
+                logger.info("Data version changed; invalidating cached tool results")
+            self._entries.clear()
+            self._version = version
+        self._version_checked = time.monotonic()
+        return version
+
+    def invalidate(self) -> None:
+        """Drop every cached result and force a version re-check."""
+        self._entries.clear()
+        self._version_checked = float("-inf")
+
+    async def cached(self, tool: str, arguments: Optional[Dict[str, Any]], fn: Callable, *args) -> Any:
+        """
+        Cached run(fn, *args), keyed by tool name and arguments.
+
+        Args:
+            tool: Tool name (part of the cache key)
+            arguments: Tool arguments (part of the cache key)
+            fn: Query function taking (session, *args)
+        """
+        key = cache_key(tool, arguments)
+        version = await self.current_version()
+
+        entry = self._entries.get(key)
+        if entry and entry[1] == version and time.monotonic() - entry[0] < self.ttl_seconds:
+            self.hits += 1
+            return entry[2]
+
+        if key in self._inflight:
+            self.hits += 1
+            return await asyncio.shield(self._inflight[key])
+
+        self.misses += 1
+        future = asyncio.ensure_future(self.run(fn, *args))
+        self._inflight[key] = future
+        try:
+            result = await future
+        finally:
+            self._inflight.pop(key, None)
+        self._entries[key] = (time.monotonic(), version, result)
+        return result
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False)
@@ -0,0 +1,242 @@
+"""
+Opt-in SQL statement counts and latency per pipeline stage.
+
+Listens to SQLAlchemy's before_cursor_execute/after_cursor_execute events
+on an engine and, while a named stage is active, records every statement
+against it: how many ran, how long they took and which normalized
+statements dominate. A statement repeated at least n_plus_one_threshold
+times within one stage is reported as a probable N+1 pattern (e.g. one
+bell schedule lookup per district instead of one query for all).
+
+Nothing is recorded until tracking is enabled, and statements issued
+outside a stage are ignored. Raw psycopg2 cursors (execute_values in the
+bulk importers) bypass SQLAlchemy events and are not counted.
+
+Usage:
+    from infrastructure.database.query_tracking import track_queries, query_summary
+
+    with track_queries("calculate_all_variants"):
+        df, _, _ = calculate_all_variants(session)
+
+    run.complete(..., qa_summary={**qa_report, "query_stats": query_summary()})
+"""
+
+import logging
+import re
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TOP_N = 10
+DEFAULT_N_PLUS_ONE_THRESHOLD = 50
+MAX_STATEMENT_LENGTH = 500
+
+_WHITESPACE = re.compile(r"\s+")
+_PARAMETER = re.compile(r"%\(\w+\)s|%s|(?<!:):\w+|\?")
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"\b\d+(?:\.\d+)?\b")
+_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+
+
+def normalize_statement(statement: str) -> str:
+    """
+    Reduce a statement to its shape for grouping.
+
+    Bound parameters and literals become '?', expanded IN lists collapse
+    to '(?, ...)' and whitespace is squeezed, so the same query with
+    different values (or list lengths) groups together.
+    """
+    sql = _WHITESPACE.sub(" ", statement).strip()
+    sql = _STRING.sub("?", sql)
+    sql = _PARAMETER.sub("?", sql)
+    sql = _NUMBER.sub("?", sql)
+    sql = _LIST.sub("(?, ...)", sql)
+    return sql[:MAX_STATEMENT_LENGTH]
+
+
+class StageStats:
+    """Statement counts and timings for one named stage."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.count = 0
+        self.seconds = 0.0
+        self.statements: Dict[str, List] = {}  # normalized -> [count, seconds]
+
+    def record(self, statement: str, seconds: float) -> None:
+        self.count += 1
+        self.seconds += seconds
+        entry = self.statements.setdefault(normalize_statement(statement), [0, 0.0])
+        entry[0] += 1
+        entry[1] += seconds
+
+    def summary(self, top_n: int = DEFAULT_TOP_N,
+                n_plus_one_threshold: int = DEFAULT_N_PLUS_ONE_THRESHOLD) -> Dict:
+        """
+        JSON-ready summary of the stage.
+
+        Returns:
+            Dict with statements, total_ms, top (most time-consuming
+            normalized statements) and probable_n_plus_one (statements
+            repeated at least n_plus_one_threshold times)
+        """
+        def entries(items):
+            return [
+                {"sql": sql, "count": count, "total_ms": round(seconds * 1000, 1)}
+                for sql, (count, seconds) in items
+            ]
+
+        by_time = sorted(self.statements.items(), key=lambda item: item[1][1], reverse=True)
+        repeated = sorted(
+            ((sql, stats) for sql, stats in self.statements.items() if stats[0] >= n_plus_one_threshold),
+            key=lambda item: item[1][0], reverse=True,
+        )
+        return {
+            "statements": self.count,
+            "total_ms": round(self.seconds * 1000, 1),
+            "top": entries(by_time[:top_n]),
+            "probable_n_plus_one": entries(repeated),
+        }
+
+
+class QueryTracker:
+    """
+    Engine event listener that attributes statements to named stages.
+
+    Stages nest: a statement counts towards every stage active in the
+    executing thread. Re-entering a stage name adds to its totals.
+
+    Args:
+        top_n: Normalized statements listed per stage in summary()
+        n_plus_one_threshold: Repeats of one statement within a stage
+            that flag it as a probable N+1 pattern
+    """
+
+    def __init__(self, top_n: int = DEFAULT_TOP_N,
+                 n_plus_one_threshold: int = DEFAULT_N_PLUS_ONE_THRESHOLD):
+        self.top_n = top_n
+        self.n_plus_one_threshold = n_plus_one_threshold
+        self.stages: Dict[str, StageStats] = {}
+        self._engines: List[Engine] = []
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def _active(self) -> List[StageStats]:
+        if not hasattr(self._local, "stack"):
+            self._local.stack = []
+        return self._local.stack
+
+    def attach(self, engine: Engine) -> None:
+        """Start listening to an engine's statements."""
+        if engine in self._engines:
+            return
+        event.listen(engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", self._after_cursor_execute)
+        self._engines.append(engine)
+
+    def detach(self) -> None:
+        """Stop listening to every attached engine."""
+        for engine in self._engines:
+            event.remove(engine, "before_cursor_execute", self._before_cursor_execute)
+            event.remove(engine, "after_cursor_execute", self._after_cursor_execute)
+        self._engines = []
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        # Kept on the execution context, which is discarded with the
+        # statement even when it raises (after_cursor_execute never fires)
+        if self._active():
+            context._query_start = time.perf_counter()
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        stages = self._active()
+        start = getattr(context, "_query_start", None)
+        if not stages or start is None:
+            return
+        elapsed = time.perf_counter() - start
+        with self._lock:
+            for stage in stages:
+                stage.record(statement, elapsed)
+
+    @contextmanager
+    def track(self, name: str):
+        """
+        Attribute statements executed in this block to stage `name`.
+
+        Yields:
+            The stage's StageStats
+        """
+        with self._lock:
+            stage = self.stages.setdefault(name, StageStats(name))
+        stack = self._active()
+        stack.append(stage)
+        try:
+            yield stage
+        finally:
+            stack.pop()
+            self._warn_n_plus_one(stage)
+
+    def _warn_n_plus_one(self, stage: StageStats) -> None:
+        for entry in stage.summary(0, self.n_plus_one_threshold)["probable_n_plus_one"]:
+            logger.warning(
+                f"Probable N+1 in {stage.name}: {entry['count']:,} executions of {entry['sql'][:120]}"
+            )
+
+    def summary(self) -> Dict[str, Dict]:
+        """Per-stage summaries keyed by stage name, in first-use order."""
+        return {
+            name: stage.summary(self.top_n, self.n_plus_one_threshold)
+            for name, stage in self.stages.items()
+        }
+
+    def reset(self) -> None:
+        """Forget all recorded stages."""
+        self.stages = {}
+
+
+# Process-wide tracker used by track_queries()
+_tracker: Optional[QueryTracker] = None
+
+
+def enable_query_tracking(engine: Optional[Engine] = None, **kwargs) -> QueryTracker:
+    """
+    Attach the process-wide tracker to an engine (default: get_engine()).
+
+    Args:
+        engine: Engine to instrument
+        **kwargs: QueryTracker options, used when the tracker is created
+
+    Returns:
+        The process-wide QueryTracker
+    """
+    global _tracker
+    if _tracker is None:
+        _tracker = QueryTracker(**kwargs)
+    if engine is None:
+        from .connection import get_engine
+        engine = get_engine()
+    _tracker.attach(engine)
+    return _tracker
+
+
+def track_queries(name: str, engine: Optional[Engine] = None):
+    """
+    Context manager recording statements under stage `name`.
+
+    Enables tracking on first use.
+
+    Example:
+        >>> with track_queries("write_calculations_to_db"):
+        ...     write_calculations_to_db(session, results, run_id, year)
+    """
+    return enable_query_tracking(engine).track(name)
+
+
+def query_summary() -> Dict[str, Dict]:
+    """Summaries from the process-wide tracker ({} if tracking never ran)."""
+    return _tracker.summary() if _tracker else {}
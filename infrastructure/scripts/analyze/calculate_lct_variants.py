@@ -42,26 +42,32 @@ Usage:
 Reference: docs/STAFFING_DATA_ENHANCEMENT_PLAN.md
 """
 
+from __future__ import annotations
+
 import argparse
-import hashlib
+import importlib.util
 import json
+import re
 import sys
+from contextlib import nullcontext
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional, List, Dict, Any
-
-import pandas as pd
+from typing import TYPE_CHECKING, Optional, List, Dict, Any
 
 # Add project root to path
 project_root = Path(__file__).parent.parent.parent.parent
 sys.path.insert(0, str(project_root))
 
-# Optional: Parquet support
-try:
-    import pyarrow
-    PARQUET_AVAILABLE = True
-except ImportError:
-    PARQUET_AVAILABLE = False
+# pandas, SQLAlchemy and the ORM models are imported inside the functions
+# that use them so that --help and argument errors return immediately.
+if TYPE_CHECKING:
+    import pandas as pd
+
+    from infrastructure.database.models import CalculationMode
+    from infrastructure.utilities.stage_profiler import StageProfiler
+
+# Optional: Parquet support (checked without importing pyarrow)
+PARQUET_AVAILABLE = importlib.util.find_spec("pyarrow") is not None
 
 
 def get_utc_timestamp() -> str:
@@ -80,6 +86,8 @@ def compute_input_hash(session) -> str:
 
     Used to determine if incremental calculation is needed.
     """
+    import hashlib
+
     from infrastructure.database.models import StaffCountsEffective, EnrollmentByGrade
 
     # Get counts and max update times as proxy for data state
@@ -90,21 +98,6 @@ def compute_input_hash(session) -> str:
     return hashlib.md5(hash_input.encode()).hexdigest()[:16]
 
 
-from infrastructure.database.connection import session_scope, get_engine
-from infrastructure.database.models import (
-    District,
-    BellSchedule,
-    StateRequirement,
-    StaffCountsEffective,
-    EnrollmentByGrade,
-    CalculationRun,
-    CalculationMode,
-    SpedEstimate,
-    CASpedDistrictEnvironments,
-    LCTCalculation,
-)
-
-
 # LCT scope definitions - base scopes
 BASE_SCOPES = [
     "teachers_only",
@@ -149,6 +142,8 @@ def get_instructional_minutes(
     Returns:
         Tuple of (minutes, source, year)
     """
+    from infrastructure.database.models import BellSchedule, StateRequirement
+
     # Try bell schedule for requested grade level first
     bell = session.query(BellSchedule).filter(
         BellSchedule.district_id == district_id,
@@ -268,31 +263,36 @@ def get_most_recent_enrollment(session, target_year: Optional[str] = None) -> Di
         target_year: If specified, filter to this year (TARGET_YEAR mode)
 
     Returns:
-        Dict mapping district_id to (enrollment_record, source_year)
+        Dict mapping district_id to (enrollment_record, source_year); records
+        are namedtuples of the columns the calculator reads
     """
-    from sqlalchemy import func
+    from sqlalchemy import select
+
+    from infrastructure.database.columnar import iter_records, read_frame, read_latest
+    from infrastructure.database.models import EnrollmentByGrade
+
+    query = select(
+        EnrollmentByGrade.district_id,
+        EnrollmentByGrade.source_year,
+        EnrollmentByGrade.enrollment_k12,
+        EnrollmentByGrade.enrollment_elementary,
+        EnrollmentByGrade.enrollment_secondary,
+    )
 
     if target_year:
         # TARGET_YEAR mode: enrollment anchored to specific year
-        enrollments = session.query(EnrollmentByGrade).filter(
-            EnrollmentByGrade.source_year == target_year
-        ).all()
-        return {e.district_id: (e, target_year) for e in enrollments}
+        enrollments = read_frame(session, query.where(EnrollmentByGrade.source_year == target_year))
+        return {e.district_id: (e, target_year) for e in iter_records(enrollments)}
 
     # BLENDED mode: get most recent enrollment per district
-    # Subquery to find max year per district
-    subq = session.query(
-        EnrollmentByGrade.district_id,
-        func.max(EnrollmentByGrade.source_year).label('max_year')
-    ).group_by(EnrollmentByGrade.district_id).subquery()
-
-    enrollments = session.query(EnrollmentByGrade).join(
-        subq,
-        (EnrollmentByGrade.district_id == subq.c.district_id) &
-        (EnrollmentByGrade.source_year == subq.c.max_year)
-    ).all()
+    # (school years are 'YYYY-YY', so string order is chronological; ties
+    # between data sources go to the most recently loaded row)
+    enrollments = read_latest(
+        session, query, EnrollmentByGrade.district_id,
+        EnrollmentByGrade.source_year.desc(), EnrollmentByGrade.id.desc(),
+    )
 
-    return {e.district_id: (e, e.source_year) for e in enrollments}
+    return {e.district_id: (e, e.source_year) for e in iter_records(enrollments)}
 
 
 def get_most_recent_sped(session, target_year: Optional[str] = None) -> Dict[str, Any]:
@@ -304,31 +304,35 @@ def get_most_recent_sped(session, target_year: Optional[str] = None) -> Dict[str
         target_year: If specified, prefer this year but allow blending
 
     Returns:
-        Dict mapping district_id to (sped_record, source_year)
+        Dict mapping district_id to (sped_record, source_year); records are
+        namedtuples of the columns the calculator reads
     """
-    from sqlalchemy import func
+    from sqlalchemy import select
+
+    from infrastructure.database.columnar import iter_records, read_frame, read_latest
+    from infrastructure.database.models import SpedEstimate
+
+    query = select(
+        SpedEstimate.district_id,
+        SpedEstimate.estimate_year,
+        SpedEstimate.confidence,
+        SpedEstimate.estimated_self_contained_sped,
+        SpedEstimate.estimated_gened_enrollment,
+        SpedEstimate.estimated_sped_teachers,
+        SpedEstimate.estimated_sped_instructional,
+        SpedEstimate.estimated_gened_teachers,
+    )
 
     if target_year:
         # First try target year
-        sped_estimates = session.query(SpedEstimate).filter(
-            SpedEstimate.estimate_year == target_year
-        ).all()
-        if sped_estimates:
-            return {s.district_id: (s, target_year) for s in sped_estimates}
+        sped_estimates = read_frame(session, query.where(SpedEstimate.estimate_year == target_year))
+        if not sped_estimates.empty:
+            return {s.district_id: (s, target_year) for s in iter_records(sped_estimates)}
 
     # Get most recent SPED per district
-    subq = session.query(
-        SpedEstimate.district_id,
-        func.max(SpedEstimate.estimate_year).label('max_year')
-    ).group_by(SpedEstimate.district_id).subquery()
+    sped_estimates = read_latest(session, query, SpedEstimate.district_id, SpedEstimate.estimate_year.desc())
 
-    sped_estimates = session.query(SpedEstimate).join(
-        subq,
-        (SpedEstimate.district_id == subq.c.district_id) &
-        (SpedEstimate.estimate_year == subq.c.max_year)
-    ).all()
-
-    return {s.district_id: (s, s.estimate_year) for s in sped_estimates}
+    return {s.district_id: (s, s.estimate_year) for s in iter_records(sped_estimates)}
 
 
 def get_most_recent_ca_sped(session, target_year: Optional[str] = None) -> Dict[str, Any]:
@@ -340,30 +344,32 @@ def get_most_recent_ca_sped(session, target_year: Optional[str] = None) -> Dict[
         target_year: If specified, prefer this year but allow blending
 
     Returns:
-        Dict mapping nces_id to (ca_sped_record, source_year)
+        Dict mapping nces_id to (ca_sped_record, source_year); records are
+        namedtuples of the columns the calculator reads
     """
-    from sqlalchemy import func
+    from sqlalchemy import select
 
-    if target_year:
-        ca_sped = session.query(CASpedDistrictEnvironments).filter(
-            CASpedDistrictEnvironments.year == target_year
-        ).all()
-        if ca_sped:
-            return {ca.nces_id: (ca, target_year) for ca in ca_sped}
+    from infrastructure.database.columnar import iter_records, read_frame, read_latest
+    from infrastructure.database.models import CASpedDistrictEnvironments
 
-    # Get most recent CA SPED per district
-    subq = session.query(
+    query = select(
         CASpedDistrictEnvironments.nces_id,
-        func.max(CASpedDistrictEnvironments.year).label('max_year')
-    ).group_by(CASpedDistrictEnvironments.nces_id).subquery()
+        CASpedDistrictEnvironments.year,
+        CASpedDistrictEnvironments.confidence,
+        CASpedDistrictEnvironments.sped_self_contained,
+    )
 
-    ca_sped = session.query(CASpedDistrictEnvironments).join(
-        subq,
-        (CASpedDistrictEnvironments.nces_id == subq.c.nces_id) &
-        (CASpedDistrictEnvironments.year == subq.c.max_year)
-    ).all()
+    if target_year:
+        ca_sped = read_frame(session, query.where(CASpedDistrictEnvironments.year == target_year))
+        if not ca_sped.empty:
+            return {ca.nces_id: (ca, target_year) for ca in iter_records(ca_sped)}
+
+    # Get most recent CA SPED per district
+    ca_sped = read_latest(
+        session, query, CASpedDistrictEnvironments.nces_id, CASpedDistrictEnvironments.year.desc()
+    )
 
-    return {ca.nces_id: (ca, ca.year) for ca in ca_sped}
+    return {ca.nces_id: (ca, ca.year) for ca in iter_records(ca_sped)}
 
 
 def calculate_year_span(years: List[str]) -> int:
@@ -389,22 +395,123 @@ def calculate_year_span(years: List[str]) -> int:
     return max(numeric_years) - min(numeric_years)
 
 
+class SharedInputs:
+    """
+    Calculation inputs that don't depend on the calculation mode.
+
+    Loaded once and reused when several modes are calculated in one process
+    (--modes): staff counts, districts and each district's instructional
+    minutes. SPED and CA SPED maps are cached per target year, so modes that
+    resolve to the same data share one load.
+
+    Args:
+        session: Database session
+    """
+
+    def __init__(self, session):
+        self.session = session
+        self.staff_records: Optional[List[tuple]] = None
+        self.district_map: Dict[str, tuple] = {}
+        self._minutes: Dict[str, tuple] = {}
+        self._sped: Dict[Optional[str], Dict[str, Any]] = {}
+        self._ca_sped: Dict[Optional[str], Dict[str, Any]] = {}
+
+    def load(self, profiler: Optional[StageProfiler] = None) -> SharedInputs:
+        """
+        Load staff counts and districts (no-op once loaded).
+
+        Args:
+            profiler: Records load_staff and load_districts stages (optional)
+
+        Returns:
+            self
+        """
+        from sqlalchemy import select
+
+        from infrastructure.database.columnar import iter_records, read_frame
+        from infrastructure.database.models import District, StaffCountsEffective
+        from infrastructure.utilities.stage_profiler import StageProfiler
+
+        if self.staff_records is not None:
+            return self
+        session = self.session
+        profiler = profiler or StageProfiler()
+
+        # Get all effective staff counts (excluding shared service entities)
+        # Shared service entities (CTCs, BOCES, cooperatives, etc.) serve students part-time
+        # from multiple districts, causing artificially inflated teacher-to-student ratios
+        # Inputs are read column-wise (only the fields used) rather than as ORM objects
+        with profiler.stage("load_staff"):
+            self.staff_records = list(iter_records(read_frame(session, select(
+                StaffCountsEffective.district_id,
+                StaffCountsEffective.effective_year,
+                StaffCountsEffective.primary_source,
+                StaffCountsEffective.teachers_k12,
+                StaffCountsEffective.teachers_elementary_k5,
+                StaffCountsEffective.teachers_secondary_6_12,
+                StaffCountsEffective.scope_teachers_only,
+                StaffCountsEffective.scope_teachers_core,
+                StaffCountsEffective.scope_instructional,
+                StaffCountsEffective.scope_instructional_plus_support,
+                StaffCountsEffective.scope_all,
+            ).join(
+                District,
+                StaffCountsEffective.district_id == District.nces_id
+            ).where(
+                District.is_shared_service_entity == False
+            ))))
+
+        # Get districts for state info
+        with profiler.stage("load_districts"):
+            districts = read_frame(session, select(District.nces_id, District.name, District.state))
+        self.district_map = {d.nces_id: d for d in iter_records(districts)}
+        return self
+
+    def instructional_minutes(self, district_id: str, state: str) -> tuple[int, str, str]:
+        """get_instructional_minutes() for the high school level, resolved once per district."""
+        if district_id not in self._minutes:
+            self._minutes[district_id] = get_instructional_minutes(self.session, district_id, state, "high")
+        return self._minutes[district_id]
+
+    def sped(self, target_year: Optional[str]) -> Dict[str, Any]:
+        """get_most_recent_sped(), cached per target year."""
+        if target_year not in self._sped:
+            self._sped[target_year] = get_most_recent_sped(self.session, target_year)
+        return self._sped[target_year]
+
+    def ca_sped(self, target_year: Optional[str]) -> Dict[str, Any]:
+        """get_most_recent_ca_sped(), cached per target year."""
+        if target_year not in self._ca_sped:
+            self._ca_sped[target_year] = get_most_recent_ca_sped(self.session, target_year)
+        return self._ca_sped[target_year]
+
+
 def calculate_all_variants(
     session,
-    calculation_mode: CalculationMode = CalculationMode.BLENDED,
-    target_year: Optional[str] = None
+    calculation_mode: Optional[CalculationMode] = None,
+    target_year: Optional[str] = None,
+    profiler: Optional[StageProfiler] = None,
+    inputs: Optional[SharedInputs] = None,
 ) -> tuple[pd.DataFrame, str, str]:
     """
     Calculate all LCT variants for all districts with staff data.
 
     Args:
         session: Database session
-        calculation_mode: BLENDED or TARGET_YEAR
+        calculation_mode: BLENDED (default) or TARGET_YEAR
         target_year: Required for TARGET_YEAR mode, optional for BLENDED
+        profiler: Records load_* and compute_variants stages (optional)
+        inputs: Mode-independent inputs from an earlier mode (loaded if omitted)
 
     Returns:
         Tuple of (DataFrame with LCT calculations, data_year_min, data_year_max)
     """
+    import pandas as pd
+
+    from infrastructure.database.models import CalculationMode
+    from infrastructure.utilities.stage_profiler import StageProfiler
+
+    calculation_mode = calculation_mode or CalculationMode.BLENDED
     print("Calculating LCT variants...")
     mode_str = f"{calculation_mode.value}"
     if target_year:
@@ -413,45 +520,39 @@ def calculate_all_variants(
 
     # Track all years used for data range reporting
     all_years_used = set()
+    profiler = profiler or StageProfiler()
 
-    # Get all effective staff counts (excluding shared service entities)
-    # Shared service entities (CTCs, BOCES, cooperatives, etc.) serve students part-time
-    # from multiple districts, causing artificially inflated teacher-to-student ratios
-    staff_records = session.query(StaffCountsEffective).join(
-        District,
-        StaffCountsEffective.district_id == District.nces_id
-    ).filter(
-        District.is_shared_service_entity == False
-    ).all()
+    # Staff counts, districts and minutes are shared by every mode
+    inputs = (inputs or SharedInputs(session)).load(profiler)
+    staff_records = inputs.staff_records
+    district_map = inputs.district_map
     print(f"  Found {len(staff_records):,} districts with staff data (excluding shared service entities)")
 
     # Get enrollment (mode-aware)
-    enrollment_with_years = get_most_recent_enrollment(
-        session,
-        target_year if calculation_mode == CalculationMode.TARGET_YEAR else None
-    )
+    with profiler.stage("load_enrollment"):
+        enrollment_with_years = get_most_recent_enrollment(
+            session,
+            target_year if calculation_mode == CalculationMode.TARGET_YEAR else None
+        )
     enrollment_map = {k: v[0] for k, v in enrollment_with_years.items()}
     enrollment_years = {k: v[1] for k, v in enrollment_with_years.items()}
     print(f"  Found {len(enrollment_map):,} districts with grade-level enrollment")
 
     # Get SPED estimates (mode-aware - can blend in both modes)
-    sped_with_years = get_most_recent_sped(session, target_year)
+    with profiler.stage("load_sped"):
+        sped_with_years = inputs.sped(target_year)
     sped_map = {k: v[0] for k, v in sped_with_years.items()}
     sped_years = {k: v[1] for k, v in sped_with_years.items()}
     print(f"  Found {len(sped_map):,} districts with SPED estimates")
 
     # Get CA actual SPED data (mode-aware - can blend in both modes)
-    ca_sped_with_years = get_most_recent_ca_sped(session, target_year)
+    with profiler.stage("load_ca_sped"):
+        ca_sped_with_years = inputs.ca_sped(target_year)
     ca_sped_map = {k: v[0] for k, v in ca_sped_with_years.items()}
     ca_sped_years = {k: v[1] for k, v in ca_sped_with_years.items()}
     print(f"  Found {len(ca_sped_map):,} CA districts with actual SPED data")
 
-    # Get districts for state info
-    district_map = {}
-    districts = session.query(District).all()
-    for d in districts:
-        district_map[d.nces_id] = d
-
+    profiler.start("compute_variants")
     results = []
     processed = 0
     qa_issues = 0
@@ -461,9 +562,9 @@ def calculate_all_variants(
         if not district:
             continue
 
-        # Get instructional minutes
-        minutes, minutes_source, minutes_year = get_instructional_minutes(
-            session, staff.district_id, district.state, "high"
+        # Get instructional minutes (same for every mode)
+        minutes, minutes_source, minutes_year = inputs.instructional_minutes(
+            staff.district_id, district.state
         )
 
         # Get enrollments from enrollment_by_grade table
@@ -721,6 +822,8 @@ def calculate_all_variants(
     print(f"  Calculated {len(results):,} LCT values")
     print(f"  Districts with QA notes: {qa_issues:,}")
 
+    profiler.stop()
+
     # Compute data year range
     def extract_start_year(year_str: str) -> int:
         """Extract numeric start year from school year string."""
@@ -1062,6 +1165,8 @@ def clear_lct_calculations(session, run_id: Optional[str] = None) -> int:
     Returns:
         Number of records deleted
     """
+    from infrastructure.database.models import LCTCalculation
+
     if run_id:
         deleted = session.query(LCTCalculation).filter(
             LCTCalculation.run_id == run_id
@@ -1090,6 +1195,8 @@ def write_calculations_to_db(
     Returns:
         Number of records inserted
     """
+    from infrastructure.database.models import LCTCalculation
+
     print(f"\nWriting {len(results):,} calculations to database...")
 
     # Determine data tier based on minutes source
@@ -1158,6 +1265,10 @@ def export_lct_from_db(
     Returns:
         Tuple of (DataFrame with all calculations, list of output file paths)
     """
+    import pandas as pd
+
+    from infrastructure.database.models import District, LCTCalculation
+
     print(f"\nExporting LCT calculations from database (run_id: {run_id})...")
 
     # Query all calculations for this run, joining with districts for names
@@ -1217,6 +1328,354 @@ def export_lct_from_db(
     return df, output_files
 
 
+def parse_modes(value: str) -> List[Optional[str]]:
+    """
+    Parse --modes: comma-separated "blended" and/or school years.
+
+    Args:
+        value: e.g. "blended,2023-24,2022-23"
+
+    Returns:
+        Target years in the given order, None for BLENDED, without duplicates
+    """
+    modes: List[Optional[str]] = []
+    for item in (part.strip() for part in value.split(",")):
+        if not item:
+            continue
+        if item.lower() == "blended":
+            mode = None
+        elif re.fullmatch(r"\d{4}-\d{2}", item):
+            mode = item
+        else:
+            raise argparse.ArgumentTypeError(
+                f"invalid mode {item!r} (use 'blended' or a school year like 2023-24)"
+            )
+        if mode not in modes:
+            modes.append(mode)
+    if not modes:
+        raise argparse.ArgumentTypeError("no modes given")
+    return modes
+
+
+def describe_mode(target_year: Optional[str]) -> str:
+    """Display name for a calculation mode (None = BLENDED)."""
+    if target_year:
+        return f"TARGET_YEAR (enrollment anchored to {target_year})"
+    return "BLENDED (most recent data within REQ-026 window)"
+
+
+def run_calculation(
+    session,
+    args: argparse.Namespace,
+    target_year: Optional[str],
+    inputs: SharedInputs,
+    output_dir: Path,
+    timestamp: str,
+    run_id: Optional[str] = None,
+) -> bool:
+    """
+    Calculate, store and export LCT variants for one mode.
+
+    Args:
+        session: Database session
+        args: Parsed command-line arguments
+        target_year: Enrollment anchor year (None = BLENDED mode)
+        inputs: Mode-independent inputs, shared across the modes of a batch
+        output_dir: Directory for output files
+        timestamp: Timestamp string for filenames
+        run_id: Explicit calculation run ID (default: current UTC timestamp)
+
+    Returns:
+        False if no LCT values could be calculated
+    """
+    from infrastructure.database.models import CalculationMode, CalculationRun
+    from infrastructure.database.query_tracking import enable_query_tracking, query_summary, track_queries
+    from infrastructure.utilities.stage_profiler import StageProfiler
+
+    calculation_mode = CalculationMode.TARGET_YEAR if target_year else CalculationMode.BLENDED
+    mode_display = describe_mode(target_year)
+    # File naming: include year only for TARGET_YEAR mode
+    year_str = target_year.replace('-', '_') + "_" if target_year else ""
+
+    # Optional per-stage SQL statement counts (track_queries), reset per mode
+    if args.track_queries:
+        enable_query_tracking().reset()
+    stage = track_queries if args.track_queries else (lambda name: nullcontext())
+    # Per-stage wall/CPU time and memory, saved to calculation_runs.stage_profile
+    profiler = StageProfiler(trace_memory=args.trace_memory)
+
+    # Start calculation run tracking (do this early to get run_id)
+    run = None
+    if not args.no_track:
+        try:
+            run = CalculationRun.start_run(
+                session,
+                calculation_mode=calculation_mode,
+                target_year=target_year,
+                run_type="full",
+                run_id=run_id,
+            )
+            session.flush()
+            print(f"Started calculation run: {run.run_id}")
+        except Exception as e:
+            print(f"Warning: Could not start run tracking: {e}")
+            run = None
+
+    run_id = run.run_id if run else (run_id or timestamp)
+
+    # Calculate all variants
+    with stage("calculate_all_variants"):
+        df, data_year_min, data_year_max = calculate_all_variants(
+            session,
+            calculation_mode=calculation_mode,
+            target_year=target_year,
+            profiler=profiler,
+            inputs=inputs,
+        )
+
+    if len(df) == 0:
+        print("No LCT values calculated. Check data availability.")
+        if run:
+            run.fail("No LCT values calculated")
+            session.commit()
+        return False
+
+    # Apply data safeguards (January 2026)
+    with profiler.stage("safeguards"):
+        df, safeguard_counts = apply_data_safeguards(df)
+
+    # === DB-FIRST APPROACH (January 2026) ===
+    # Write calculations to database first, then export CSVs from DB
+
+    # Convert DataFrame to list of dicts for database insertion
+    results_list = df.to_dict('records')
+
+    # Write to database
+    year_for_db = target_year if target_year else 'blended'
+    with stage("write_calculations_to_db"), profiler.stage("db_write"):
+        inserted_count = write_calculations_to_db(
+            session, results_list, run_id, year_for_db
+        )
+
+    # Export CSVs from database
+    with stage("export_lct_from_db"), profiler.stage("export"):
+        df_from_db, output_files = export_lct_from_db(
+            session, run_id, output_dir, timestamp, year_str
+        )
+
+    # Use the database export as our source of truth
+    df = df_from_db
+
+    # Filter for valid LCT (0 < LCT <= 360 for all scopes)
+    # SPED scopes that would exceed 360 are capped with WARN_SPED_RATIO_CAP flag
+    valid_df = df[(df['lct_value'] > 0) & (df['lct_value'] <= 360)]
+    valid_file = output_dir / f"lct_all_variants_{year_str}valid_{timestamp}.csv"
+    # Note: valid_file is already created by export_lct_from_db
+
+    # Generate and save summary statistics
+    summary = generate_summary_statistics(valid_df)
+    summary_file = output_dir / f"lct_variants_summary_{year_str}{timestamp}.csv"
+    summary.to_csv(summary_file, index=False)
+    print(f"Saved summary to {summary_file}")
+
+    # Generate state-level summary
+    state_summary = generate_state_summary(valid_df)
+    state_file = output_dir / f"lct_variants_by_state_{year_str}{timestamp}.csv"
+    state_summary.to_csv(state_file, index=False)
+    print(f"Saved state summary to {state_file}")
+
+    # Print summary report
+    print("\n" + "=" * 60)
+    print("LCT VARIANTS SUMMARY (Valid: 0 < LCT <= 360)")
+    print("=" * 60)
+    print()
+
+    # Order scopes for display
+    scope_order = ["teachers_only", "teachers_elementary", "teachers_secondary",
+                   "core_sped", "teachers_gened", "instructional_sped",
+                   "teachers_core", "instructional", "instructional_plus_support", "all"]
+
+    for scope in scope_order:
+        row = summary[summary['staff_scope'] == scope]
+        if len(row) == 0:
+            continue
+        row = row.iloc[0]
+        print(f"{scope.upper()}:")
+        print(f"  Districts: {int(row['districts']):,}")
+        print(f"  Mean LCT:  {row['mean']:.1f} minutes")
+        print(f"  Median:   {row['median']:.1f} minutes")
+        print(f"  Std Dev:   {row['std']:.1f} minutes")
+        print(f"  Range:    {row['min']:.1f} - {row['max']:.1f} minutes")
+        print()
+
+    # Generate comparison text report
+    report_file = output_dir / f"lct_variants_report_{year_str}{timestamp}.txt"
+    utc_now = datetime.now(timezone.utc)
+    with open(report_file, "w") as f:
+        f.write("=" * 60 + "\n")
+        f.write("LCT VARIANT COMPARISON REPORT\n")
+        f.write("=" * 60 + "\n\n")
+        f.write(f"Generated: {utc_now.strftime('%Y-%m-%dT%H:%M:%SZ')} (UTC)\n")
+        f.write(f"Mode: {mode_display}\n")
+        if data_year_min and data_year_max:
+            f.write(f"Data Range: {data_year_min} to {data_year_max}\n")
+        if target_year:
+            f.write(f"Target Year: {target_year}\n")
+        f.write("\n")
+
+        f.write("KEY METHODOLOGY DECISIONS (December 2025):\n")
+        f.write("-" * 40 + "\n")
+        f.write("- ALL scopes use K-12 enrollment (Pre-K excluded)\n")
+        f.write("- ALL scopes exclude Pre-K teachers\n")
+        f.write("- Ungraded teachers EXCLUDED from teachers_only variants\n")
+        f.write("- Ungraded teachers INCLUDED in other scopes\n\n")
+
+        f.write("SCOPE DEFINITIONS:\n")
+        f.write("-" * 40 + "\n")
+        f.write("teachers_only:           K-12 teachers (elem+sec+kinder, NO ungraded)\n")
+        f.write("teachers_elementary:     Elementary+Kinder teachers / K-5 enrollment\n")
+        f.write("teachers_secondary:      Secondary teachers / 6-12 enrollment\n")
+        f.write("core_sped:               SPED teachers / SPED enrollment (for audit)\n")
+        f.write("teachers_gened:          GenEd teachers / GenEd enrollment\n")
+        f.write("instructional_sped:      (SPED teachers+paras) / SPED enrollment\n")
+        f.write("teachers_core:           K-12 teachers + ungraded\n")
+        f.write("instructional:           core + coordinators + paraprofessionals\n")
+        f.write("instructional_plus_support: above + counselors + psychologists + support\n")
+        f.write("all:                     All staff except Pre-K teachers\n\n")
+
+        f.write("SUMMARY STATISTICS:\n")
+        f.write("-" * 40 + "\n")
+
+        for scope in scope_order:
+            row = summary[summary['staff_scope'] == scope]
+            if len(row) == 0:
+                continue
+            row = row.iloc[0]
+            f.write(f"\n{scope.upper()}:\n")
+            f.write(f"  Districts with valid LCT: {int(row['districts']):,}\n")
+            f.write(f"  Mean LCT:   {row['mean']:.1f} minutes\n")
+            f.write(f"  Median:    {row['median']:.1f} minutes\n")
+            f.write(f"  Std Dev:   {row['std']:.1f} minutes\n")
+            f.write(f"  Range:     {row['min']:.1f} - {row['max']:.1f} minutes\n")
+
+        f.write("\n" + "=" * 60 + "\n")
+        f.write("INTERPRETATION NOTES:\n")
+        f.write("=" * 60 + "\n\n")
+        f.write("- Higher LCT values indicate more theoretical one-on-one time\n")
+        f.write("- 'teachers_only' is the most conservative K-12 measure\n")
+        f.write("- 'teachers_elementary' vs 'teachers_secondary' shows level differences\n")
+        f.write("- 'instructional' is recommended for policy discussions\n")
+        f.write("- 'all' shows maximum resource investment\n")
+        f.write("- Compare across scopes to understand staffing mix impact\n")
+
+    print(f"Saved report to {report_file}")
+
+    # Summary of QA issues
+    qa_df = df[df['level_lct_notes'] != '']
+    if len(qa_df) > 0:
+        print(f"\nDistricts with level LCT QA notes: {qa_df['district_id'].nunique()}")
+
+    # Add summary files to output_files (detail and valid already added by export_lct_from_db)
+    output_files.extend([
+        str(summary_file),
+        str(state_file),
+        str(report_file),
+    ])
+
+    # Generate and save QA report (JSON)
+    # Pass data range info instead of single year
+    data_range_str = f"{data_year_min} to {data_year_max}" if data_year_min and data_year_max else "unknown"
+    with profiler.stage("qa_report"):
+        qa_report = generate_qa_report(df, valid_df, summary, timestamp, data_range_str, safeguard_counts)
+    qa_report['calculation_mode'] = calculation_mode.value
+    qa_report['target_year'] = target_year
+    qa_report['data_year_min'] = data_year_min
+    qa_report['data_year_max'] = data_year_max
+    if args.track_queries:
+        qa_report['query_stats'] = query_summary()
+    qa_file = output_dir / f"lct_qa_report_{year_str}{timestamp}.json"
+    with open(qa_file, 'w') as f:
+        json.dump(qa_report, f, indent=2)
+    print(f"Saved QA report to {qa_file}")
+    output_files.append(str(qa_file))
+
+    # Print QA summary
+    print("\n" + "=" * 60)
+    print("QA DASHBOARD")
+    print("=" * 60)
+    print(f"Status: {qa_report['overall_status']}")
+    print(f"Pass Rate: {qa_report['data_quality']['pass_rate']}%")
+    print(f"Hierarchy Checks:")
+    for check, result in qa_report['hierarchy_validation'].items():
+        status = "✓" if result['passed'] else "✗"
+        print(f"  {status} {check}")
+    if qa_report['outliers']:
+        print(f"Outliers Detected: {len(qa_report['outliers'])}")
+
+    # Print safeguard summary (January 2026)
+    print("\nData Safeguards (flagged records):")
+    safeguards = qa_report.get('safeguards', {})
+    for flag, count in sorted(safeguards.items()):
+        if count > 0:
+            flag_type = "ERR" if flag.startswith("ERR") else "WARN"
+            print(f"  [{flag_type}] {flag}: {count:,}")
+    total_safeguard_flags = sum(safeguards.values())
+    if total_safeguard_flags == 0:
+        print("  No safeguard flags triggered")
+
+    if args.track_queries:
+        print("\nSQL Statements by Stage:")
+        for name, stats in qa_report['query_stats'].items():
+            print(f"  {name}: {stats['statements']:,} statements, {stats['total_ms'] / 1000:.1f}s")
+            for entry in stats['probable_n_plus_one']:
+                print(f"    [N+1?] {entry['count']:,}x {entry['sql'][:100]}")
+
+    # Parquet export (optional)
+    if args.parquet:
+        print("\nSaving Parquet files...")
+        if PARQUET_AVAILABLE:
+            # Get file paths from output_files list
+            detail_file_path = Path(output_files[0]) if output_files else None
+            valid_file_path = Path(output_files[1]) if len(output_files) > 1 else None
+            if detail_file_path and save_parquet(df, detail_file_path):
+                parquet_file = detail_file_path.with_suffix('.parquet')
+                print(f"  Saved {parquet_file}")
+                output_files.append(str(parquet_file))
+            if valid_file_path and save_parquet(valid_df, valid_file_path):
+                parquet_file = valid_file_path.with_suffix('.parquet')
+                print(f"  Saved {parquet_file}")
+                output_files.append(str(parquet_file))
+        else:
+            print("  Parquet not available. Install pyarrow: pip install pyarrow")
+
+    # Stage profile (wall/CPU seconds, peak memory)
+    stage_profile = profiler.to_dict()
+    print("\nStage Profile:")
+    for name, stats in stage_profile['stages'].items():
+        memory = f", peak RSS {stats['peak_rss_mb']:,.0f} MB" if 'peak_rss_mb' in stats else ""
+        print(f"  {name:<18} {stats['wall_s']:>9.2f}s wall {stats['cpu_s']:>9.2f}s CPU{memory}")
+
+    # Complete calculation run tracking
+    if run:
+        try:
+            run.complete(
+                districts_processed=df['district_id'].nunique(),
+                calculations_created=len(df),
+                output_files=output_files,
+                qa_summary=qa_report,
+                data_year_min=data_year_min,
+                data_year_max=data_year_max,
+                stage_profile=stage_profile,
+            )
+            session.commit()
+            print(f"\nCalculation run completed: {run.run_id}")
+            print(f"  Calculations in database: {inserted_count:,}")
+        except Exception as e:
+            print(f"\nWarning: Could not complete run tracking: {e}")
+
+    return True
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Calculate LCT variants",
@@ -1227,26 +1686,38 @@ Examples:
 
   # Target year mode: Enrollment anchored to target year, staff/bell blended
   python calculate_lct_variants.py --target-year 2023-24
+
+  # Batch: several modes in one pass (staff, districts, bell schedules and
+  # SPED data loaded once; one calculation run and output set per mode)
+  python calculate_lct_variants.py --modes blended,2023-24,2022-23
         """
     )
-    parser.add_argument(
+    mode_group = parser.add_mutually_exclusive_group()
+    mode_group.add_argument(
         "--target-year",
         default=None,
         help="Anchor enrollment to specific year (TARGET_YEAR mode). Without this flag, uses most recent data (BLENDED mode)."
     )
+    mode_group.add_argument(
+        "--modes",
+        type=parse_modes,
+        default=None,
+        help="Comma-separated modes to calculate in one pass: 'blended' and/or school years (e.g. blended,2023-24)"
+    )
     parser.add_argument("--output-dir", type=Path, default=None, help="Output directory")
     parser.add_argument("--parquet", action="store_true", help="Also save Parquet files")
     parser.add_argument("--incremental", action="store_true", help="Only recalculate changed districts")
     parser.add_argument("--no-track", action="store_true", help="Don't track run in database")
+    parser.add_argument("--track-queries", action="store_true",
+                        help="Count SQL statements per stage and flag probable N+1 patterns (saved in the QA report)")
+    parser.add_argument("--trace-memory", action="store_true",
+                        help="Add tracemalloc peaks to the stage profile (slower)")
     args = parser.parse_args()
 
-    # Determine calculation mode
-    if args.target_year:
-        calculation_mode = CalculationMode.TARGET_YEAR
-        mode_display = f"TARGET_YEAR (enrollment anchored to {args.target_year})"
-    else:
-        calculation_mode = CalculationMode.BLENDED
-        mode_display = "BLENDED (most recent data within REQ-026 window)"
+    from infrastructure.database.connection import session_scope
+
+    # Modes to calculate (None = BLENDED)
+    modes = args.modes or [args.target_year]
 
     # Default output directory
     output_dir = args.output_dir or project_root / "data" / "enriched" / "lct-calculations"
@@ -1255,7 +1726,8 @@ Examples:
     print("=" * 60)
     print("LCT VARIANT CALCULATIONS")
     print("=" * 60)
-    print(f"Mode: {mode_display}")
+    for target_year in modes:
+        print(f"Mode: {describe_mode(target_year)}")
     print(f"Output: {output_dir}")
     print()
     print("SCOPE DEFINITIONS (December 2025):")
@@ -1282,263 +1754,33 @@ Examples:
 
     # Generate timestamp for all output files
     timestamp = get_utc_timestamp()
-    # File naming: include year only for TARGET_YEAR mode
-    if args.target_year:
-        year_str = args.target_year.replace('-', '_') + "_"
-    else:
-        year_str = ""  # No year in filename for BLENDED mode
     print(f"Timestamp: {timestamp}")
     print()
 
+    failed = []
     with session_scope() as session:
-        # Start calculation run tracking (do this early to get run_id)
-        run = None
-        if not args.no_track:
-            try:
-                run = CalculationRun.start_run(
-                    session,
-                    calculation_mode=calculation_mode,
-                    target_year=args.target_year,
-                    run_type="full",
-                )
-                session.flush()
-                print(f"Started calculation run: {run.run_id}")
-            except Exception as e:
-                print(f"Warning: Could not start run tracking: {e}")
-                run = None
-
-        run_id = run.run_id if run else timestamp
-
-        # Calculate all variants
-        df, data_year_min, data_year_max = calculate_all_variants(
-            session,
-            calculation_mode=calculation_mode,
-            target_year=args.target_year
-        )
-
-        if len(df) == 0:
-            print("No LCT values calculated. Check data availability.")
-            if run:
-                run.fail("No LCT values calculated")
-                session.commit()
-            sys.exit(1)
-
-        # Apply data safeguards (January 2026)
-        df, safeguard_counts = apply_data_safeguards(df)
-
-        # === DB-FIRST APPROACH (January 2026) ===
-        # Write calculations to database first, then export CSVs from DB
-
-        # Convert DataFrame to list of dicts for database insertion
-        results_list = df.to_dict('records')
-
-        # Write to database
-        year_for_db = args.target_year if args.target_year else 'blended'
-        inserted_count = write_calculations_to_db(
-            session, results_list, run_id, year_for_db
-        )
-
-        # Export CSVs from database
-        df_from_db, output_files = export_lct_from_db(
-            session, run_id, output_dir, timestamp, year_str
-        )
-
-        # Use the database export as our source of truth
-        df = df_from_db
-
-        # Filter for valid LCT (0 < LCT <= 360 for all scopes)
-        # SPED scopes that would exceed 360 are capped with WARN_SPED_RATIO_CAP flag
-        valid_df = df[(df['lct_value'] > 0) & (df['lct_value'] <= 360)]
-        valid_file = output_dir / f"lct_all_variants_{year_str}valid_{timestamp}.csv"
-        # Note: valid_file is already created by export_lct_from_db
-
-        # Generate and save summary statistics
-        summary = generate_summary_statistics(valid_df)
-        summary_file = output_dir / f"lct_variants_summary_{year_str}{timestamp}.csv"
-        summary.to_csv(summary_file, index=False)
-        print(f"Saved summary to {summary_file}")
-
-        # Generate state-level summary
-        state_summary = generate_state_summary(valid_df)
-        state_file = output_dir / f"lct_variants_by_state_{year_str}{timestamp}.csv"
-        state_summary.to_csv(state_file, index=False)
-        print(f"Saved state summary to {state_file}")
-
-        # Print summary report
-        print("\n" + "=" * 60)
-        print("LCT VARIANTS SUMMARY (Valid: 0 < LCT <= 360)")
-        print("=" * 60)
-        print()
-
-        # Order scopes for display
-        scope_order = ["teachers_only", "teachers_elementary", "teachers_secondary",
-                       "core_sped", "teachers_gened", "instructional_sped",
-                       "teachers_core", "instructional", "instructional_plus_support", "all"]
-
-        for scope in scope_order:
-            row = summary[summary['staff_scope'] == scope]
-            if len(row) == 0:
-                continue
-            row = row.iloc[0]
-            print(f"{scope.upper()}:")
-            print(f"  Districts: {int(row['districts']):,}")
-            print(f"  Mean LCT:  {row['mean']:.1f} minutes")
-            print(f"  Median:   {row['median']:.1f} minutes")
-            print(f"  Std Dev:   {row['std']:.1f} minutes")
-            print(f"  Range:    {row['min']:.1f} - {row['max']:.1f} minutes")
-            print()
-
-        # Generate comparison text report
-        report_file = output_dir / f"lct_variants_report_{year_str}{timestamp}.txt"
-        utc_now = datetime.now(timezone.utc)
-        with open(report_file, "w") as f:
-            f.write("=" * 60 + "\n")
-            f.write("LCT VARIANT COMPARISON REPORT\n")
-            f.write("=" * 60 + "\n\n")
-            f.write(f"Generated: {utc_now.strftime('%Y-%m-%dT%H:%M:%SZ')} (UTC)\n")
-            f.write(f"Mode: {mode_display}\n")
-            if data_year_min and data_year_max:
-                f.write(f"Data Range: {data_year_min} to {data_year_max}\n")
-            if args.target_year:
-                f.write(f"Target Year: {args.target_year}\n")
-            f.write("\n")
-
-            f.write("KEY METHODOLOGY DECISIONS (December 2025):\n")
-            f.write("-" * 40 + "\n")
-            f.write("- ALL scopes use K-12 enrollment (Pre-K excluded)\n")
-            f.write("- ALL scopes exclude Pre-K teachers\n")
-            f.write("- Ungraded teachers EXCLUDED from teachers_only variants\n")
-            f.write("- Ungraded teachers INCLUDED in other scopes\n\n")
-
-            f.write("SCOPE DEFINITIONS:\n")
-            f.write("-" * 40 + "\n")
-            f.write("teachers_only:           K-12 teachers (elem+sec+kinder, NO ungraded)\n")
-            f.write("teachers_elementary:     Elementary+Kinder teachers / K-5 enrollment\n")
-            f.write("teachers_secondary:      Secondary teachers / 6-12 enrollment\n")
-            f.write("core_sped:               SPED teachers / SPED enrollment (for audit)\n")
-            f.write("teachers_gened:          GenEd teachers / GenEd enrollment\n")
-            f.write("instructional_sped:      (SPED teachers+paras) / SPED enrollment\n")
-            f.write("teachers_core:           K-12 teachers + ungraded\n")
-            f.write("instructional:           core + coordinators + paraprofessionals\n")
-            f.write("instructional_plus_support: above + counselors + psychologists + support\n")
-            f.write("all:                     All staff except Pre-K teachers\n\n")
-
-            f.write("SUMMARY STATISTICS:\n")
-            f.write("-" * 40 + "\n")
-
-            for scope in scope_order:
-                row = summary[summary['staff_scope'] == scope]
-                if len(row) == 0:
-                    continue
-                row = row.iloc[0]
-                f.write(f"\n{scope.upper()}:\n")
-                f.write(f"  Districts with valid LCT: {int(row['districts']):,}\n")
-                f.write(f"  Mean LCT:   {row['mean']:.1f} minutes\n")
-                f.write(f"  Median:    {row['median']:.1f} minutes\n")
-                f.write(f"  Std Dev:   {row['std']:.1f} minutes\n")
-                f.write(f"  Range:     {row['min']:.1f} - {row['max']:.1f} minutes\n")
-
-            f.write("\n" + "=" * 60 + "\n")
-            f.write("INTERPRETATION NOTES:\n")
-            f.write("=" * 60 + "\n\n")
-            f.write("- Higher LCT values indicate more theoretical one-on-one time\n")
-            f.write("- 'teachers_only' is the most conservative K-12 measure\n")
-            f.write("- 'teachers_elementary' vs 'teachers_secondary' shows level differences\n")
-            f.write("- 'instructional' is recommended for policy discussions\n")
-            f.write("- 'all' shows maximum resource investment\n")
-            f.write("- Compare across scopes to understand staffing mix impact\n")
-
-        print(f"Saved report to {report_file}")
-
-        # Summary of QA issues
-        qa_df = df[df['level_lct_notes'] != '']
-        if len(qa_df) > 0:
-            print(f"\nDistricts with level LCT QA notes: {qa_df['district_id'].nunique()}")
-
-        # Add summary files to output_files (detail and valid already added by export_lct_from_db)
-        output_files.extend([
-            str(summary_file),
-            str(state_file),
-            str(report_file),
-        ])
-
-        # Generate and save QA report (JSON)
-        # Pass data range info instead of single year
-        data_range_str = f"{data_year_min} to {data_year_max}" if data_year_min and data_year_max else "unknown"
-        qa_report = generate_qa_report(df, valid_df, summary, timestamp, data_range_str, safeguard_counts)
-        qa_report['calculation_mode'] = calculation_mode.value
-        qa_report['target_year'] = args.target_year
-        qa_report['data_year_min'] = data_year_min
-        qa_report['data_year_max'] = data_year_max
-        qa_file = output_dir / f"lct_qa_report_{year_str}{timestamp}.json"
-        with open(qa_file, 'w') as f:
-            json.dump(qa_report, f, indent=2)
-        print(f"Saved QA report to {qa_file}")
-        output_files.append(str(qa_file))
-
-        # Print QA summary
-        print("\n" + "=" * 60)
-        print("QA DASHBOARD")
-        print("=" * 60)
-        print(f"Status: {qa_report['overall_status']}")
-        print(f"Pass Rate: {qa_report['data_quality']['pass_rate']}%")
-        print(f"Hierarchy Checks:")
-        for check, result in qa_report['hierarchy_validation'].items():
-            status = "✓" if result['passed'] else "✗"
-            print(f"  {status} {check}")
-        if qa_report['outliers']:
-            print(f"Outliers Detected: {len(qa_report['outliers'])}")
-
-        # Print safeguard summary (January 2026)
-        print("\nData Safeguards (flagged records):")
-        safeguards = qa_report.get('safeguards', {})
-        for flag, count in sorted(safeguards.items()):
-            if count > 0:
-                flag_type = "ERR" if flag.startswith("ERR") else "WARN"
-                print(f"  [{flag_type}] {flag}: {count:,}")
-        total_safeguard_flags = sum(safeguards.values())
-        if total_safeguard_flags == 0:
-            print("  No safeguard flags triggered")
-
-        # Parquet export (optional)
-        if args.parquet:
-            print("\nSaving Parquet files...")
-            if PARQUET_AVAILABLE:
-                # Get file paths from output_files list
-                detail_file_path = Path(output_files[0]) if output_files else None
-                valid_file_path = Path(output_files[1]) if len(output_files) > 1 else None
-                if detail_file_path and save_parquet(df, detail_file_path):
-                    parquet_file = detail_file_path.with_suffix('.parquet')
-                    print(f"  Saved {parquet_file}")
-                    output_files.append(str(parquet_file))
-                if valid_file_path and save_parquet(valid_df, valid_file_path):
-                    parquet_file = valid_file_path.with_suffix('.parquet')
-                    print(f"  Saved {parquet_file}")
-                    output_files.append(str(parquet_file))
-            else:
-                print("  Parquet not available. Install pyarrow: pip install pyarrow")
-
-        # Complete calculation run tracking
-        if run:
-            try:
-                run.complete(
-                    districts_processed=df['district_id'].nunique(),
-                    calculations_created=len(df),
-                    output_files=output_files,
-                    qa_summary=qa_report,
-                    data_year_min=data_year_min,
-                    data_year_max=data_year_max,
-                )
-                session.commit()
-                print(f"\nCalculation run completed: {run.run_id}")
-                print(f"  Calculations in database: {inserted_count:,}")
-            except Exception as e:
-                print(f"\nWarning: Could not complete run tracking: {e}")
+        # Staff, districts, bell schedules and SPED data are loaded once
+        inputs = SharedInputs(session)
+        for target_year in modes:
+            run_id = None
+            if len(modes) > 1:
+                print("\n" + "#" * 60)
+                print(f"MODE: {describe_mode(target_year)}")
+                print("#" * 60)
+                run_id = f"{timestamp}_{target_year or 'blended'}"
+            if not run_calculation(session, args, target_year, inputs, output_dir, timestamp, run_id):
+                if len(modes) == 1:
+                    sys.exit(1)
+                failed.append(target_year or "blended")
 
         print("\n" + "=" * 60)
         print("CALCULATION COMPLETE")
         print("=" * 60)
 
+    if failed:
+        print(f"No LCT values calculated for: {', '.join(failed)}")
+        sys.exit(1)
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Compare the stage profiles of two calculation runs.
+
+calculate_lct_variants.py records wall time, CPU time and peak memory per
+stage (loading, variant computation, safeguards, QA report, DB write,
+export) in calculation_runs.stage_profile. This prints two runs side by
+side so a slowdown can be traced to a stage.
+
+Usage:
+    # Two most recent completed runs that have a profile
+    python compare_calculation_runs.py
+
+    # Specific runs (baseline first)
+    python compare_calculation_runs.py 20260115T020000Z 20260116T020000Z
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from typing import List
+
+import pandas as pd
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from infrastructure.database.connection import session_scope
+from infrastructure.database.models import CalculationRun
+from infrastructure.utilities.stage_profiler import compare_profiles
+
+
+def load_runs(session, run_ids: List[str]) -> List[CalculationRun]:
+    """
+    Fetch the runs to compare, baseline first.
+
+    Args:
+        session: Database session
+        run_ids: Two run IDs, or empty for the two latest profiled runs
+
+    Returns:
+        [baseline, current]
+
+    Raises:
+        ValueError: If a run is missing or has no stage profile
+    """
+    if run_ids:
+        found = {r.run_id: r for r in session.query(CalculationRun).filter(CalculationRun.run_id.in_(run_ids))}
+        missing = [run_id for run_id in run_ids if run_id not in found]
+        if missing:
+            raise ValueError(f"Calculation run(s) not found: {', '.join(missing)}")
+        runs = [found[run_id] for run_id in run_ids]
+    else:
+        runs = session.query(CalculationRun).filter(
+            CalculationRun.status == "completed",
+            CalculationRun.stage_profile.isnot(None),
+        ).order_by(CalculationRun.started_at.desc()).limit(2).all()[::-1]
+        if len(runs) < 2:
+            raise ValueError("Need two completed runs with a stage profile")
+
+    unprofiled = [r.run_id for r in runs if not r.stage_profile]
+    if unprofiled:
+        raise ValueError(f"No stage profile recorded for: {', '.join(unprofiled)}")
+    return runs
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare stage profiles of two calculation runs")
+    parser.add_argument("run_ids", nargs="*", help="Baseline and current run IDs (default: latest two)")
+    args = parser.parse_args()
+
+    if len(args.run_ids) not in (0, 2):
+        parser.error("give two run IDs, or none for the latest two profiled runs")
+
+    with session_scope() as session:
+        try:
+            baseline, current = load_runs(session, args.run_ids)
+        except ValueError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+
+        print("=" * 60)
+        print("CALCULATION RUN STAGE PROFILES")
+        print("=" * 60)
+        for label, run in (("Baseline", baseline), ("Current", current)):
+            profile = run.stage_profile
+            print(f"{label + ':':<10} {run.run_id}  {run.calculations_created or 0:,} calculations, "
+                  f"{profile.get('total_wall_s', 0):.1f}s wall, peak RSS {profile.get('peak_rss_mb') or 0:,.0f} MB")
+        print()
+
+        comparison = compare_profiles(baseline.stage_profile, current.stage_profile)
+        with pd.option_context("display.float_format", "{:,.2f}".format, "display.width", 160):
+            print(comparison.to_string())
+
+
+if __name__ == "__main__":
+    main()
@@ -36,8 +36,9 @@ import pandas as pd
 project_root = Path(__file__).parent.parent.parent.parent
 sys.path.insert(0, str(project_root))
 
+from infrastructure.database.columnar import read_frame
 from infrastructure.database.connection import session_scope
-from sqlalchemy import text
+from sqlalchemy import Float, String, column, text
 
 # Default instructional minutes
 DEFAULT_MINUTES = 360
@@ -81,19 +82,14 @@ def get_federal_data(session, state: str, nces_year: str) -> pd.DataFrame:
         WHERE d.state = :state
           AND sc.source_year = :year
           AND eg.source_year = :year
-    """)
+    """).bindparams(state=state, year=nces_year).columns(
+        column('district_id', String),
+        column('teachers', Float),
+        column('enrollment_k12', Float),
+        column('enrollment_k5', Float),
+    )
 
-    result = session.execute(query, {"state": state, "year": nces_year})
-    rows = []
-    for row in result:
-        rows.append({
-            'district_id': row[0],
-            'teachers': row[1],
-            'enrollment_k12': row[2],
-            'enrollment_k5': row[3],
-        })
-
-    return pd.DataFrame(rows)
+    return read_frame(session, query)
 
 
 def get_sea_data(session, state: str, config: dict) -> pd.DataFrame:
@@ -129,24 +125,15 @@ def get_sea_data(session, state: str, config: dict) -> pd.DataFrame:
     else:
         return pd.DataFrame()
 
-    # Get staff
-    staff_result = session.execute(text(staff_query))
-    staff_data = {row[0]: row[1] for row in staff_result}
-
-    # Get enrollment
-    enroll_result = session.execute(text(enroll_query))
-    enroll_data = {row[0]: row[1] for row in enroll_result}
-
-    # Merge
-    rows = []
-    for nces_id in set(staff_data.keys()) & set(enroll_data.keys()):
-        rows.append({
-            'district_id': nces_id,
-            'teachers': staff_data[nces_id],
-            'enrollment_k12': enroll_data[nces_id],
-        })
+    # Get staff and enrollment (columns declared positionally; names vary by state)
+    staff_data = read_frame(session, text(staff_query).columns(
+        column('district_id', String), column('teachers', Float)))
+    enroll_data = read_frame(session, text(enroll_query).columns(
+        column('district_id', String), column('enrollment_k12', Float)))
 
-    return pd.DataFrame(rows)
+    # Merge (one row per district, like the per-id dicts this replaced)
+    return staff_data.drop_duplicates('district_id', keep='last').merge(
+        enroll_data.drop_duplicates('district_id', keep='last'), on='district_id')
 
 
 def compare_sources(federal_df: pd.DataFrame, sea_df: pd.DataFrame, state: str) -> Dict:
@@ -0,0 +1,429 @@
+#!/usr/bin/env python3
+"""
+Raw source files for the benchmark importers, written from synthetic tables.
+
+run_benchmarks.py times the real importer entry points (import_all_data,
+import_staff_and_enrollment and the SEA importers). They read the files
+the rebuild downloads: the state requirements YAML, the normalized
+districts CSV, CCD directory/staff/membership files, the bell schedule
+collection and each state's SEA spreadsheets. This module writes those
+files from generate()'s frames, in the layouts the importers parse (sheet
+names, header rows, column names and state ID formats), so the same seed
+and scale always give the same inputs.
+
+State district IDs are derived from the within-state sequence in the
+synthetic NCES ID and written to the CCD directory file as ST_LEAID, so
+the crosswalk import_all_data builds resolves every SEA fixture row.
+
+Usage:
+    from infrastructure.scripts.benchmark.fixture_files import write_fixture_files
+    paths = write_fixture_files(generate(scale=1), Path("/tmp/fixtures"))
+    paths["sea_va"]["ENROLLMENT_FILE"]
+"""
+
+import json
+from pathlib import Path
+from typing import Dict
+
+import numpy as np
+import pandas as pd
+import yaml
+
+from infrastructure.database.migrations.import_staff_and_enrollment import (
+    GRADE_MAPPING,
+    STAFF_CATEGORY_MAPPING,
+)
+
+# CCD file names the importers look for (import_all_data globs ccd_lea_029_*)
+DIRECTORY_FILE = "ccd_lea_029_2324_w_1a_073124.csv"
+STAFF_FILE = "ccd_lea_059_2324_l_1a_073124.csv"
+MEMBERSHIP_FILE = "ccd_lea_052_2324_l_1a_073124.csv"
+
+# State district ID (as stored in the crosswalk) from the within-state sequence
+STATE_ID_FORMATS = {
+    "FL": lambda seq: f"{seq:02d}",
+    "IL": lambda seq: "{0}-{1}-{2}-{3}".format(*_split(f"1{seq:010d}0000", 2, 5, 9, 11)),
+    "MA": lambda seq: f"{seq:04d}",
+    "MI": lambda seq: str(10000 + seq),
+    "NY": lambda seq: f"3{seq:011d}",
+    "PA": lambda seq: str(100000000 + seq),
+    "VA": lambda seq: f"{seq:03d}",
+}
+
+# Importer -> {module constant: file name}; patched in by run_benchmarks
+SEA_FILES = {
+    "sea_fl": {"STAFF_FILE": "fl_staff.xlsx", "ENROLLMENT_FILE": "fl_enrollment.xlsx"},
+    "sea_il": {"REPORT_CARD_FILE": "il_report_card.xlsx"},
+    "sea_ma": {"TEACHER_FILE": "ma_teachers.xlsx", "ENROLLMENT_FILE": "ma_enrollment.xlsx"},
+    "sea_mi": {"STAFFING_FILE": "mi_staffing.xlsx", "ENROLLMENT_FILE": "mi_enrollment.xlsx",
+               "SPECIAL_ED_FILE": "mi_special_ed.xlsx"},
+    "sea_ny": {"STAFF_FILE": "ny_staffing.xlsx", "ENROLLMENT_FILE": "ny_enrollment.xlsx",
+               "SPED_ENROLLMENT_FILE": "ny_enrollment_sped.xlsx"},
+    "sea_pa": {"STAFFING_FILE": "pa_staffing.xlsx", "ENROLLMENT_FILE": "pa_enrollment.xlsx"},
+    "sea_va": {"ENROLLMENT_FILE": "va_fall_membership.csv", "STAFFING_FILE": "va_staffing.csv",
+               "SPECIAL_ED_FILE": "va_special_ed.csv"},
+}
+
+
+def _split(value: str, *bounds: int):
+    starts = (0,) + bounds[:-1]
+    return [value[a:b] for a, b in zip(starts, bounds)]
+
+
+def ccd_district_ids(nces_ids: pd.Series) -> pd.Series:
+    """NCES IDs as the normalized districts file stores them (no leading zeros)."""
+    return nces_ids.str.lstrip("0")
+
+
+def state_district_ids(districts: pd.DataFrame) -> pd.Series:
+    """State-assigned district ID for each district (crosswalk format)."""
+    sequence = districts["nces_id"].str[2:].astype(int)
+    ids = sequence.astype(str).str.zfill(5)
+    for state, fmt in STATE_ID_FORMATS.items():
+        in_state = districts["state"] == state
+        ids[in_state] = sequence[in_state].map(fmt)
+    return ids
+
+
+def _write_excel(df: pd.DataFrame, path: Path, sheet_name: str, header_row: int = 0) -> None:
+    # Title rows above the header, as in the published spreadsheets
+    with pd.ExcelWriter(path) as writer:
+        if header_row:
+            pd.DataFrame([["Synthetic benchmark data"]]).to_excel(
+                writer, sheet_name=sheet_name, header=False, index=False)
+        df.to_excel(writer, sheet_name=sheet_name, startrow=header_row, index=False)
+
+
+# =============================================================================
+# CORE FILES (import_all_data, import_staff_and_enrollment)
+# =============================================================================
+
+def _state_requirements_yaml(state_requirements: pd.DataFrame, path: Path) -> None:
+    states = {
+        row.state_name.lower().replace(" ", "_"): {
+            "code": row.state,
+            "source_url": row.source,
+            "elementary": int(row.elementary_minutes),
+            "middle_school": int(row.middle_minutes),
+            "high_school": int(row.high_minutes),
+        }
+        for row in state_requirements.itertuples()
+    }
+    path.write_text(yaml.safe_dump({"states": states}, sort_keys=False))
+
+
+def _districts_csv(districts: pd.DataFrame, path: Path) -> None:
+    pd.DataFrame({
+        "district_id": ccd_district_ids(districts["nces_id"]),
+        "district_name": districts["name"],
+        "state": districts["state"],
+        "enrollment": districts["enrollment"],
+        "instructional_staff": districts["instructional_staff"],
+        "year": districts["year"],
+        "data_source": "nces_ccd",
+    }).to_csv(path, index=False)
+
+
+def _directory_csv(districts: pd.DataFrame, path: Path) -> None:
+    pd.DataFrame({
+        "LEAID": districts["nces_id"],
+        "ST": districts["state"],
+        "ST_LEAID": districts["state"] + "-" + state_district_ids(districts),
+        "LEA_NAME": districts["name"],
+    }).to_csv(path, index=False)
+
+
+def _staff_csv(staff: pd.DataFrame, path: Path) -> None:
+    categories = {column: name for name, column in STAFF_CATEGORY_MAPPING.items()
+                  if column in staff.columns}
+    long = staff[["district_id", *categories]].melt(
+        id_vars="district_id", var_name="category", value_name="STAFF_COUNT")
+    pd.DataFrame({
+        "LEAID": long["district_id"],
+        "STAFF": long["category"].map(categories),
+        "STAFF_COUNT": long["STAFF_COUNT"],
+    }).to_csv(path, index=False)
+
+
+def _membership_csv(enrollment: pd.DataFrame, path: Path) -> None:
+    grades = {column: name for name, column in GRADE_MAPPING.items() if column in enrollment.columns}
+    long = enrollment[["district_id", *grades]].melt(
+        id_vars="district_id", var_name="grade", value_name="count")
+    # Detail rows split by sex, plus the subtotal rows the importer must skip
+    female = long["count"] // 2
+    frames = [
+        pd.DataFrame({"RACE_ETHNICITY": "White", "SEX": "Female", "STUDENT_COUNT": female}),
+        pd.DataFrame({"RACE_ETHNICITY": "White", "SEX": "Male", "STUDENT_COUNT": long["count"] - female}),
+        pd.DataFrame({"RACE_ETHNICITY": "No Category Codes", "SEX": "No Category Codes",
+                      "STUDENT_COUNT": long["count"]}),
+    ]
+    pd.concat([
+        frame.assign(LEAID=long["district_id"].to_numpy(), GRADE=long["grade"].map(grades).to_numpy())
+        for frame in frames
+    ])[["LEAID", "GRADE", "RACE_ETHNICITY", "SEX", "STUDENT_COUNT"]].to_csv(path, index=False)
+
+
+def _bell_schedules_json(bell_schedules: pd.DataFrame, path: Path) -> None:
+    collection: Dict[str, Dict] = {}
+    for row in bell_schedules.itertuples():
+        district = collection.setdefault(row.district_id, {"year": row.year})
+        district[row.grade_level] = {
+            "instructional_minutes": int(row.instructional_minutes),
+            "confidence": row.confidence,
+            "method": row.method,
+            "source": row.source_description,
+        }
+    path.write_text(json.dumps(collection))
+
+
+# =============================================================================
+# SEA FILES
+# =============================================================================
+
+def _state_frame(tables: Dict[str, pd.DataFrame], state: str) -> pd.DataFrame:
+    """One row per district in state with staff, enrollment and SPED columns."""
+    districts = tables["districts"]
+    df = districts[districts["state"] == state].reset_index(drop=True)
+    df["state_id"] = state_district_ids(df).to_numpy()
+    staff = tables["staff_counts_effective"].set_index("district_id")
+    sped = tables["sped_estimates"].set_index("district_id")
+    df["teachers"] = staff.loc[df["nces_id"], "teachers_k12"].to_numpy()
+    df["paraprofessionals"] = staff.loc[df["nces_id"], "paraprofessionals"].to_numpy()
+    df["administrators"] = staff.loc[df["nces_id"], "lea_administrators"].to_numpy()
+    df["other_staff"] = staff.loc[df["nces_id"], "other_staff"].to_numpy()
+    df["sped"] = sped.loc[df["nces_id"], "estimated_sped_enrollment"].to_numpy()
+    df["sped_teachers"] = sped.loc[df["nces_id"], "estimated_sped_teachers"].to_numpy()
+    df["grade"] = np.floor(df["enrollment"] / 13).astype(int)
+    return df
+
+
+def _florida(df: pd.DataFrame, paths: Dict[str, Path]) -> None:
+    _write_excel(pd.DataFrame({
+        "Dist #": df["state_id"],
+        "District": df["name"],
+        "Total Instructional Staff": (df["teachers"] + df["paraprofessionals"]).round(2),
+        "Total Teachers": df["teachers"],
+        "Exceptional Education Teachers": df["sped_teachers"],
+    }), paths["STAFF_FILE"], "Instr_Staff_by_Assignment", header_row=2)
+    _write_excel(pd.DataFrame({
+        "District #": df["state_id"],
+        "District": df["name"],
+        "Total Enrollment": df["enrollment"],
+    }), paths["ENROLLMENT_FILE"], "District", header_row=2)
+
+
+def _illinois(df: pd.DataFrame, paths: Dict[str, Path]) -> None:
+    enrollment = df["enrollment"].clip(lower=1)
+    _write_excel(pd.DataFrame({
+        "Type": "District",
+        "RCDTS": df["state_id"].str.replace("-", "") + "0000",
+        "District": df["name"],
+        "Total Teacher FTE": df["teachers"],
+        "School Counselor FTE": (df["teachers"] * 0.04).round(2),
+        "School Nurse FTE": (df["teachers"] * 0.01).round(2),
+        "School Psychologist FTE": (df["teachers"] * 0.01).round(2),
+        "School Social Worker FTE": (df["teachers"] * 0.02).round(2),
+        "Pupil Teacher Ratio - Elementary": (enrollment / df["teachers"]).round(1),
+        "Pupil Teacher Ratio - High School": (enrollment / df["teachers"]).round(1),
+        "Teacher Retention Rate": 85.0,
+        "Teacher Avg Salary": 70000,
+        "# Student Enrollment": df["enrollment"],
+        "% Student Enrollment - White": 50.0,
+        "% Student Enrollment - Black or African American": 15.0,
+        "% Student Enrollment - Hispanic or Latino": 25.0,
+        "% Student Enrollment - Asian": 5.0,
+        "% Student Enrollment - Low Income": 45.0,
+        "% Student Enrollment - IEP": (df["sped"] / enrollment * 100).round(1),
+        "% Student Enrollment - EL": 10.0,
+        "# Student Enrollment - Children with Disabilities": df["sped"],
+        "# Student Enrollment - IEP": df["sped"],
+    }), paths["REPORT_CARD_FILE"], "General")
+
+
+def _massachusetts(df: pd.DataFrame, paths: Dict[str, Path]) -> None:
+    enrollment = df["enrollment"].clip(lower=1)
+    dist_code = (df["state_id"] + "0000").astype(int)
+    _write_excel(pd.DataFrame({
+        "District Name": df["name"],
+        "District Code": dist_code,
+        "Teachers (FTE)": df["teachers"],
+        "% Licensed": 97.0,
+        "Student / Teacher Ratio": (enrollment / df["teachers"]).round(1).astype(str) + " to 1",
+        "% Experienced": 80.0,
+        "% Without Waiver": 99.0,
+        "% Teaching In-Field": 95.0,
+    }), paths["TEACHER_FILE"], "Sheet1", header_row=1)
+    _write_excel(pd.DataFrame({
+        "SY": 2026,
+        "ORG_TYPE": "District",
+        "DIST_CODE": dist_code,
+        "TOTAL_CNT": df["enrollment"],
+        "PK_CNT": df["grade"] // 2,
+        "K_CNT": df["grade"],
+        "SWD_CNT": df["sped"],
+        "SWD_PCT": (df["sped"] / enrollment * 100).round(1),
+        "EL_CNT": df["enrollment"] // 10,
+        "EL_PCT": 10.0,
+        "LI_CNT": df["enrollment"] * 2 // 5,
+        "LI_PCT": 40.0,
+    }), paths["ENROLLMENT_FILE"], "Sheet1")
+
+
+def _michigan(df: pd.DataFrame, paths: Dict[str, Path]) -> None:
+    _write_excel(pd.DataFrame({
+        "DCODE": df["state_id"].astype(int),
+        "DNAME": df["name"],
+        "TEACHER": df["teachers"],
+        "SE_INSTR": df["sped_teachers"],
+        "INST_AID": df["paraprofessionals"],
+        "INST_SUP": (df["teachers"] * 0.02).round(2),
+    }), paths["STAFFING_FILE"], "District", header_row=4)
+    grades = {f"{g}_totl": df["grade"] for g in ["k"] + [f"g{n}" for n in range(1, 13)]}
+    _write_excel(pd.DataFrame({
+        "District Code": df["state_id"].astype(int),
+        "tot_all": df["grade"] * 13,
+        **grades,
+        "tot_male": df["grade"] * 13 // 2,
+        "tot_fem": df["grade"] * 13 - df["grade"] * 13 // 2,
+    }), paths["ENROLLMENT_FILE"], "Fall Dist K-12 Total Data", header_row=4)
+    # Intermediate district code then district code; pandas reads the second as DCODE.1
+    _write_excel(pd.DataFrame(
+        list(zip(df["state_id"].astype(int) // 1000, df["state_id"].astype(int), df["sped"],
+                 (df["sped"] / df["enrollment"].clip(lower=1) * 100).round(1))),
+        columns=["DCODE", "DCODE", "StudwI E P", "SpEd%"],
+    ), paths["SPECIAL_ED_FILE"], "Fall 2023 Data", header_row=4)
+
+
+def _new_york(df: pd.DataFrame, paths: Dict[str, Path]) -> None:
+    beds = df["state_id"].astype(int)
+    categories = {"Teachers": df["teachers"], "Paraprofessionals": df["paraprofessionals"],
+                  "Administrators": df["administrators"]}
+    _write_excel(pd.concat([
+        pd.DataFrame({
+            "STATE_DISTRICT_ID": beds,
+            "STAFF_IND_DESC": category,
+            "FTE": fte,
+            "K-12_ENROLL": df["grade"] * 13,
+            "DISTRICT_RATIO": (df["grade"] * 13 / fte.clip(lower=0.01)).round(1),
+        })
+        for category, fte in categories.items()
+    ]), paths["STAFF_FILE"], "STAFF_RATIOS")
+
+    grades = {"Kindergarten (Full Day)": df["grade"],
+              **{f"Grade {n}": df["grade"] for n in range(1, 13)}}
+    enrollment = pd.DataFrame({
+        "State District Identifier": beds,
+        "PreK-12 Total": df["grade"] * 13,
+        **grades,
+    })
+    _write_excel(enrollment, paths["ENROLLMENT_FILE"], "public-district-2023-24")
+    sped_grades = {name: np.round(count * df["sped"] / df["enrollment"].clip(lower=1)).astype(int)
+                   for name, count in grades.items()}
+    _write_excel(pd.concat([
+        enrollment.assign(**{"Subgroup Name": "General Education Students"}),
+        enrollment.assign(**{"Subgroup Name": "Students with Disabilities"},
+                          **{"PreK-12 Total": df["sped"]}, **sped_grades),
+    ]), paths["SPED_ENROLLMENT_FILE"], "public-district-2023-24")
+
+
+def _pennsylvania(df: pd.DataFrame, paths: Dict[str, Path]) -> None:
+    aun = df["state_id"].astype(int)
+    _write_excel(pd.DataFrame({
+        "AUN": aun,
+        "LEA Name": df["name"],
+        "CT": df["teachers"],
+        "PP": (df["teachers"] * 0.1).round(2),
+        "Ad": df["administrators"],
+        "Co": (df["teachers"] * 0.03).round(2),
+        "Ot": df["other_staff"],
+    }), paths["STAFFING_FILE"], "LEA_FT+PT", header_row=4)
+    _write_excel(pd.DataFrame({
+        "AUN": aun,
+        "LEA Name": df["name"],
+        "LEA Type": "SD",
+        "County": "Synthetic",
+        "PKF": df["grade"] // 2,
+        "K5F": df["grade"],
+        **{float(n): df["grade"] for n in range(1, 13)},
+        "Total": df["grade"] * 13,
+    }), paths["ENROLLMENT_FILE"], "LEA", header_row=4)
+
+
+def _virginia(df: pd.DataFrame, paths: Dict[str, Path]) -> None:
+    division = df["state_id"].astype(int)
+    part_time = df["enrollment"] // 50
+    pd.DataFrame({
+        "Division Number": division,
+        "Division Name": df["name"],
+        "Total Count": df["enrollment"].map("{:,}".format),
+        "FT Count": (df["enrollment"] - part_time).map("{:,}".format),
+        "PT Count": part_time,
+    }).to_csv(paths["ENROLLMENT_FILE"], index=False)
+    positions = {"Teachers": df["teachers"], "Administration": df["administrators"],
+                 "Aides and Paraprofessionals": df["paraprofessionals"],
+                 "Non-Instructional Personnel": df["other_staff"]}
+    pd.concat([
+        pd.DataFrame({"Division Number": division, "Division Name": df["name"],
+                      "Position Type": position, "Number of Positions by FTE": fte})
+        for position, fte in positions.items()
+    ]).to_csv(paths["STAFFING_FILE"], index=False)
+    pd.DataFrame({
+        "Division Number": division,
+        "Division Name": df["name"],
+        "Total Count": df["sped"],
+    }).to_csv(paths["SPECIAL_ED_FILE"], index=False)
+
+
+SEA_WRITERS = {
+    "sea_fl": ("FL", _florida),
+    "sea_il": ("IL", _illinois),
+    "sea_ma": ("MA", _massachusetts),
+    "sea_mi": ("MI", _michigan),
+    "sea_ny": ("NY", _new_york),
+    "sea_pa": ("PA", _pennsylvania),
+    "sea_va": ("VA", _virginia),
+}
+
+
+def write_fixture_files(tables: Dict[str, pd.DataFrame], directory: Path) -> Dict[str, Dict[str, Path]]:
+    """
+    Write every importer's source files for one generated dataset.
+
+    Args:
+        tables: Frames from synthetic_data.generate()
+        directory: Empty directory to write into
+
+    Returns:
+        Dict of importer -> {module constant or argument: path}; keys are
+        import_all_data, import_staff_and_enrollment and the SEA_FILES keys
+    """
+    directory = Path(directory)
+    ccd_dir = directory / "nces-ccd"
+    ccd_dir.mkdir(parents=True, exist_ok=True)
+
+    paths = {
+        "import_all_data": {
+            "STATE_REQUIREMENTS_FILE": directory / "state-requirements.yaml",
+            "DISTRICTS_FILE": directory / "districts_nces.csv",
+            "BELL_SCHEDULES_FILE": directory / "bell_schedules.json",
+            "NCES_RAW_DIR": ccd_dir,
+        },
+        "import_staff_and_enrollment": {
+            "staff_file": ccd_dir / STAFF_FILE,
+            "enrollment_file": ccd_dir / MEMBERSHIP_FILE,
+        },
+    }
+    core = paths["import_all_data"]
+    _state_requirements_yaml(tables["state_requirements"], core["STATE_REQUIREMENTS_FILE"])
+    _districts_csv(tables["districts"], core["DISTRICTS_FILE"])
+    _directory_csv(tables["districts"], ccd_dir / DIRECTORY_FILE)
+    _bell_schedules_json(tables["bell_schedules"], core["BELL_SCHEDULES_FILE"])
+    _staff_csv(tables["staff_counts_effective"], paths["import_staff_and_enrollment"]["staff_file"])
+    _membership_csv(tables["enrollment_by_grade"], paths["import_staff_and_enrollment"]["enrollment_file"])
+
+    for importer, (state, writer) in SEA_WRITERS.items():
+        sea_paths = {constant: directory / name for constant, name in SEA_FILES[importer].items()}
+        writer(_state_frame(tables, state), sea_paths)
+        paths[importer] = sea_paths
+
+    return paths
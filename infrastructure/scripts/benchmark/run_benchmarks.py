@@ -0,0 +1,407 @@
+#!/usr/bin/env python3
+"""
+Benchmark the LCT pipeline on synthetic data at 1x, 5x and 20x national scale.
+
+For each scale this script:
+1. Truncates the benchmark database and generates a seeded dataset
+   (see synthetic_data.py)
+2. Writes the dataset as the source files the importers read (see
+   fixture_files.py) and times each importer's main() on them:
+   import_all_data, import_staff_and_enrollment and the FL, IL, MA, MI,
+   NY, PA and VA SEA importers, then update_districts for district URLs.
+   sped_estimates and ca_sped_district_environments, which no file
+   importer produces from these inputs, are loaded with bulk_upsert
+3. Times calculate_all_variants, apply_data_safeguards,
+   write_calculations_to_db and export_lct_from_db as main() runs them
+4. Writes one JSON file with the git commit, generated and imported row
+   counts, timings and SQL
+   statement counts per scenario (query_tracking), so runs from different
+   commits can be compared with --compare
+
+The benchmark database is truncated on every run, so it must not be the
+main database. Point BENCHMARK_DATABASE_URL (or --database-url) at a
+scratch database; the schema is created if missing.
+
+Usage:
+    createdb lct_benchmark
+    python infrastructure/scripts/benchmark/run_benchmarks.py --scales 1 5 20
+
+    # Compare this run with an earlier one
+    python infrastructure/scripts/benchmark/run_benchmarks.py --compare outputs/benchmarks/<file>.json
+
+    # Compare two saved runs without running anything
+    python infrastructure/scripts/benchmark/run_benchmarks.py --compare old.json new.json
+"""
+
+import argparse
+import importlib
+import io
+import json
+import logging
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import contextmanager, nullcontext, redirect_stdout
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+# Add project root to path
+project_root = Path(__file__).resolve().parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from sqlalchemy import text
+from sqlalchemy.engine import make_url
+from infrastructure.database.connection import get_database_url, get_engine, get_session_factory, init_db
+from infrastructure.database.migrations.sea_import_utils import bulk_upsert
+from infrastructure.database.query_tracking import QueryTracker
+from infrastructure.scripts.analyze.calculate_lct_variants import (
+    apply_data_safeguards,
+    calculate_all_variants,
+    export_lct_from_db,
+    get_utc_timestamp,
+    write_calculations_to_db,
+)
+from infrastructure.scripts.benchmark.fixture_files import ccd_district_ids, write_fixture_files
+from infrastructure.scripts.benchmark.synthetic_data import SCALES, TABLES, district_count, generate
+from infrastructure.scripts.import_district_urls import update_districts
+
+DEFAULT_BENCHMARK_URL = "postgresql://localhost:5432/lct_benchmark"
+DEFAULT_OUTPUT_DIR = project_root / "outputs" / "benchmarks"
+
+MIGRATIONS = "infrastructure.database.migrations"
+
+# Importer entry points timed on the fixture files, in rebuild order
+IMPORTERS = {
+    "import_all_data": f"{MIGRATIONS}.import_all_data",
+    "import_staff_and_enrollment": f"{MIGRATIONS}.import_staff_and_enrollment",
+    "sea_fl": f"{MIGRATIONS}.import_florida_data",
+    "sea_il": f"{MIGRATIONS}.import_illinois_data",
+    "sea_ma": f"{MIGRATIONS}.import_massachusetts_data",
+    "sea_mi": f"{MIGRATIONS}.import_michigan_data",
+    "sea_ny": f"{MIGRATIONS}.import_new_york_data",
+    "sea_pa": f"{MIGRATIONS}.import_pennsylvania_data",
+    "sea_va": f"{MIGRATIONS}.import_virginia_data",
+}
+
+# The Florida importer expects its tables from this migration
+FLORIDA_MIGRATION_FILE = project_root / "infrastructure" / "database" / "migrations" / "006_add_florida_integration.sql"
+
+# Tables the importers write, counted after loading
+IMPORTED_TABLES = [
+    "state_requirements", "districts", "state_district_crosswalk", "bell_schedules",
+    "staff_counts", "staff_counts_effective", "enrollment_by_grade",
+    "fl_staff_data", "il_staff_data", "ma_staff_data", "mi_staff_data",
+    "ny_staff_data", "pa_staff_data", "va_staff_data",
+]
+
+# Unique keys used by bulk_upsert for the tables loaded without an importer
+CONFLICT_COLUMNS = {
+    "sped_estimates": ["district_id", "estimate_year"],
+    "ca_sped_district_environments": ["nces_id", "year"],
+}
+
+# Tables emptied before each scale (lct_calculations and lineage depend on the rest)
+RESET_TABLES = ["lct_calculations", "calculation_runs", "data_lineage"] + TABLES[::-1]
+
+
+def benchmark_database_url(database_url: Optional[str] = None) -> str:
+    """
+    Resolve the benchmark database URL.
+
+    Args:
+        database_url: Explicit URL (default: BENCHMARK_DATABASE_URL or
+            DEFAULT_BENCHMARK_URL)
+
+    Returns:
+        Database URL
+
+    Raises:
+        ValueError: If the URL is the main database, which the benchmark
+            would truncate
+    """
+    url = database_url or os.getenv("BENCHMARK_DATABASE_URL", DEFAULT_BENCHMARK_URL)
+    if make_url(url) == make_url(get_database_url()):
+        raise ValueError(
+            "Benchmark database is the main database; set BENCHMARK_DATABASE_URL "
+            "to a scratch database (benchmarks truncate every table they load)"
+        )
+    return url
+
+
+def git_revision() -> Dict[str, Optional[object]]:
+    """Current commit and whether the working tree has uncommitted changes."""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=project_root,
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+        status = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"], cwd=project_root,
+            capture_output=True, text=True, check=True,
+        ).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return {"commit": None, "dirty": None}
+    return {"commit": commit, "dirty": bool(status.strip())}
+
+
+class Timer:
+    """
+    Collect wall-clock seconds per scenario, optionally hiding their output.
+
+    With a QueryTracker, each scenario is also a query-tracking stage.
+    """
+
+    def __init__(self, verbose: bool = False, tracker: Optional[QueryTracker] = None):
+        self.verbose = verbose
+        self.tracker = tracker
+        self.timings: Dict[str, float] = {}
+
+    @contextmanager
+    def measure(self, name: str):
+        output = io.StringIO()
+        stage = self.tracker.track(name) if self.tracker else nullcontext()
+        start = time.perf_counter()
+        try:
+            with stage:
+                if self.verbose:
+                    yield
+                else:
+                    # Importers log progress at INFO as well as printing it
+                    logging.disable(logging.INFO)
+                    try:
+                        with redirect_stdout(output):
+                            yield
+                    finally:
+                        logging.disable(logging.NOTSET)
+        finally:
+            self.timings[name] = round(time.perf_counter() - start, 4)
+        print(f"  {name:<40} {self.timings[name]:>10.3f}s")
+
+
+def reset_tables(session) -> None:
+    """Empty every benchmark table."""
+    session.execute(text(f"TRUNCATE TABLE {', '.join(RESET_TABLES)} RESTART IDENTITY CASCADE"))
+    session.commit()
+
+
+@contextmanager
+def entry_point(module, argv: List[str], **constants):
+    """
+    Run a script's main() with its arguments and file path constants swapped in.
+
+    Args:
+        module: Importer module
+        argv: Command-line arguments after the script name
+        **constants: Module-level names (e.g. STAFF_FILE) to point at fixtures
+    """
+    saved_argv = sys.argv
+    saved = {name: getattr(module, name) for name in constants}
+    sys.argv = [module.__file__, *argv]
+    for name, value in constants.items():
+        setattr(module, name, value)
+    try:
+        yield
+    finally:
+        sys.argv = saved_argv
+        for name, value in saved.items():
+            setattr(module, name, value)
+
+
+def run_importers(session, tables: Dict[str, pd.DataFrame], timer: Timer, fixture_dir: Path) -> None:
+    """Write the fixture files and run each importer's main() on them, one timing each."""
+    with timer.measure("write_fixture_files"):
+        paths = write_fixture_files(tables, fixture_dir)
+
+    # import_all_data logs to logs/migration.log; fl_* tables come from a migration
+    (project_root / "logs").mkdir(exist_ok=True)
+    session.execute(text(FLORIDA_MIGRATION_FILE.read_text()))
+    session.commit()
+
+    year = tables["districts"]["year"].iloc[0]
+    ccd = paths["import_staff_and_enrollment"]
+    for name, module_name in IMPORTERS.items():
+        module = importlib.import_module(module_name)
+        if name == "import_staff_and_enrollment":
+            run = entry_point(module, ["--year", year, "--staff-file", str(ccd["staff_file"]),
+                                       "--enrollment-file", str(ccd["enrollment_file"])])
+        else:
+            run = entry_point(module, [], **paths[name])
+        with timer.measure(f"import:{name}"), run:
+            module.main()
+
+
+def load_tables(session, tables: Dict[str, pd.DataFrame], timer: Timer, fixture_dir: Path) -> None:
+    """Load generated tables through the importers, one timing each."""
+    run_importers(session, tables, timer, fixture_dir)
+
+    # Derived tables, keyed like the imported districts
+    for table, conflict_columns in CONFLICT_COLUMNS.items():
+        df = tables[table]
+        key = "nces_id" if "nces_id" in df.columns else "district_id"
+        df = df.assign(**{key: ccd_district_ids(df[key])})
+        touch_column = "updated_at" if "updated_at" in df.columns else None
+        with timer.measure(f"import:{table}"):
+            bulk_upsert(session, table, df, conflict_columns, touch_column=touch_column)
+            session.commit()
+
+    nces_ids = ccd_district_ids(tables["districts"]["nces_id"])
+    rows = list(zip(nces_ids, "https://" + nces_ids + ".k12.example.org"))
+    with timer.measure("import:district_urls"):
+        update_districts(session, ["website_url"], rows)
+        session.commit()
+
+
+def imported_row_counts(session) -> Dict[str, int]:
+    """Rows in each table the importers write."""
+    return {
+        table: session.execute(text(f"SELECT COUNT(*) FROM {table}")).scalar()
+        for table in IMPORTED_TABLES
+    }
+
+
+def run_scale(engine, scale: float, seed: int, verbose: bool = False) -> Dict:
+    """
+    Generate, load and run the pipeline at one scale.
+
+    Args:
+        engine: Engine for the benchmark database
+        scale: Multiple of national scale
+        seed: Generator seed
+        verbose: Show pipeline output instead of hiding it
+
+    Returns:
+        Dict with scale, generated and imported row counts, per-scenario
+        timings in seconds and per-scenario SQL statement summaries
+    """
+    print(f"\n=== Scale {scale:g}x ({district_count(scale):,} districts) ===")
+    tracker = QueryTracker()
+    tracker.attach(engine)
+    timer = Timer(verbose, tracker)
+
+    with timer.measure("generate"):
+        tables = generate(scale=scale, seed=seed)
+
+    session = get_session_factory(engine)()
+    try:
+        reset_tables(session)
+        with tempfile.TemporaryDirectory() as fixture_dir:
+            load_tables(session, tables, timer, Path(fixture_dir))
+        imported = imported_row_counts(session)
+
+        with timer.measure("calculate_all_variants"):
+            df, _, _ = calculate_all_variants(session)
+        with timer.measure("apply_data_safeguards"):
+            df, _ = apply_data_safeguards(df)
+
+        timestamp = get_utc_timestamp()
+        run_id = f"benchmark_{scale:g}x_{timestamp}"
+        with timer.measure("write_calculations_to_db"):
+            write_calculations_to_db(session, df.to_dict("records"), run_id, "blended")
+            session.commit()
+
+        with tempfile.TemporaryDirectory() as output_dir:
+            with timer.measure("export_lct_from_db"):
+                export_lct_from_db(session, run_id, Path(output_dir), timestamp)
+    finally:
+        session.close()
+        tracker.detach()
+
+    return {
+        "scale": scale,
+        "rows": {table: len(frame) for table, frame in tables.items()},
+        "imported": imported,
+        "lct_calculations": len(df),
+        "timings": timer.timings,
+        "queries": tracker.summary(),
+    }
+
+
+def compare_results(baseline: Dict, current: Dict) -> pd.DataFrame:
+    """
+    Scenario timings of two benchmark runs side by side.
+
+    Args:
+        baseline: Earlier results JSON
+        current: Later results JSON
+
+    Returns:
+        DataFrame with scale, scenario, baseline_s, current_s and change_pct
+        (negative is faster) for scenarios present in both runs
+    """
+    def flatten(results: Dict) -> pd.DataFrame:
+        return pd.DataFrame([
+            {"scale": r["scale"], "scenario": name, "seconds": seconds}
+            for r in results["results"]
+            for name, seconds in r["timings"].items()
+        ], columns=["scale", "scenario", "seconds"])
+
+    merged = flatten(baseline).merge(
+        flatten(current), on=["scale", "scenario"], suffixes=("_baseline", "_current")
+    ).rename(columns={"seconds_baseline": "baseline_s", "seconds_current": "current_s"})
+    merged["change_pct"] = ((merged["current_s"] / merged["baseline_s"] - 1) * 100).round(1)
+    return merged
+
+
+def print_comparison(baseline: Dict, current: Dict) -> None:
+    """Print compare_results with the commits being compared."""
+    print(f"\nBaseline: {baseline.get('commit')}  ({baseline.get('timestamp')})")
+    print(f"Current:  {current.get('commit')}  ({current.get('timestamp')})")
+    print(compare_results(baseline, current).to_string(index=False))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the LCT pipeline on synthetic data")
+    parser.add_argument("--scales", type=float, nargs="+", default=[1],
+                        help=f"Multiples of national scale (standard: {' '.join(map(str, SCALES))})")
+    parser.add_argument("--seed", type=int, default=42, help="Synthetic data seed")
+    parser.add_argument("--database-url", default=None,
+                        help="Benchmark database (default: BENCHMARK_DATABASE_URL or %(default)s)")
+    parser.add_argument("--output-dir", type=Path, default=DEFAULT_OUTPUT_DIR, help="Results directory")
+    parser.add_argument("--compare", type=Path, nargs="+", metavar="RESULTS",
+                        help="Compare with a saved run; with two files, compare them and exit")
+    parser.add_argument("--verbose", action="store_true", help="Show pipeline output")
+    args = parser.parse_args()
+
+    if args.compare and len(args.compare) > 2:
+        parser.error("--compare takes one or two results files")
+    if args.compare and len(args.compare) == 2:
+        baseline, current = (json.loads(p.read_text()) for p in args.compare)
+        print_comparison(baseline, current)
+        return
+
+    try:
+        url = benchmark_database_url(args.database_url)
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    engine = get_engine(url)
+    init_db(engine)
+
+    revision = git_revision()
+    results = {
+        "timestamp": get_utc_timestamp(),
+        **revision,
+        "seed": args.seed,
+        "python": platform.python_version(),
+        "database": make_url(url).render_as_string(hide_password=True),
+        "results": [run_scale(engine, scale, args.seed, args.verbose) for scale in args.scales],
+    }
+
+    args.output_dir.mkdir(parents=True, exist_ok=True)
+    commit = (revision["commit"] or "unknown")[:8]
+    output_file = args.output_dir / f"benchmark_{results['timestamp']}_{commit}.json"
+    output_file.write_text(json.dumps(results, indent=2))
+    print(f"\nSaved results to {output_file}")
+
+    if args.compare:
+        print_comparison(json.loads(args.compare[0].read_text()), results)
+
+
+if __name__ == "__main__":
+    main()
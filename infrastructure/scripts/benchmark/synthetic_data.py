@@ -0,0 +1,321 @@
+#!/usr/bin/env python3
+"""
+Seeded synthetic dataset for benchmarking the LCT pipeline.
+
+Generates the tables calculate_all_variants reads (districts,
+staff_counts_effective, enrollment_by_grade, sped_estimates,
+ca_sped_district_environments, bell_schedules, plus state_requirements
+for the minutes fallback) at a multiple of national scale. The same seed
+and scale always produce the same frames, so timings from different
+commits are measured against identical data.
+
+Distributions are shaped like CCD, not copied from it: lognormal district
+enrollment, grade shares drawn around an even split, student-teacher
+ratios around 15.5, and bell schedules for roughly one district in ten.
+
+Usage:
+    from infrastructure.scripts.benchmark.synthetic_data import generate
+    tables = generate(scale=5, seed=42)
+    tables["districts"].head()
+"""
+
+from datetime import datetime, timezone
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+# Roughly the number of LEAs in the CCD directory, i.e. "1x"
+NATIONAL_DISTRICTS = 19_600
+
+SCALES = (1, 5, 20)
+
+# Tables in load order (parents before children)
+TABLES = [
+    "state_requirements",
+    "districts",
+    "staff_counts_effective",
+    "enrollment_by_grade",
+    "sped_estimates",
+    "ca_sped_district_environments",
+    "bell_schedules",
+]
+
+# (state, FIPS code, name)
+STATES = [
+    ("AL", "01", "Alabama"), ("AK", "02", "Alaska"), ("AZ", "04", "Arizona"),
+    ("AR", "05", "Arkansas"), ("CA", "06", "California"), ("CO", "08", "Colorado"),
+    ("CT", "09", "Connecticut"), ("DE", "10", "Delaware"), ("DC", "11", "District of Columbia"),
+    ("FL", "12", "Florida"), ("GA", "13", "Georgia"), ("HI", "15", "Hawaii"),
+    ("ID", "16", "Idaho"), ("IL", "17", "Illinois"), ("IN", "18", "Indiana"),
+    ("IA", "19", "Iowa"), ("KS", "20", "Kansas"), ("KY", "21", "Kentucky"),
+    ("LA", "22", "Louisiana"), ("ME", "23", "Maine"), ("MD", "24", "Maryland"),
+    ("MA", "25", "Massachusetts"), ("MI", "26", "Michigan"), ("MN", "27", "Minnesota"),
+    ("MS", "28", "Mississippi"), ("MO", "29", "Missouri"), ("MT", "30", "Montana"),
+    ("NE", "31", "Nebraska"), ("NV", "32", "Nevada"), ("NH", "33", "New Hampshire"),
+    ("NJ", "34", "New Jersey"), ("NM", "35", "New Mexico"), ("NY", "36", "New York"),
+    ("NC", "37", "North Carolina"), ("ND", "38", "North Dakota"), ("OH", "39", "Ohio"),
+    ("OK", "40", "Oklahoma"), ("OR", "41", "Oregon"), ("PA", "42", "Pennsylvania"),
+    ("RI", "44", "Rhode Island"), ("SC", "45", "South Carolina"), ("SD", "46", "South Dakota"),
+    ("TN", "47", "Tennessee"), ("TX", "48", "Texas"), ("UT", "49", "Utah"),
+    ("VT", "50", "Vermont"), ("VA", "51", "Virginia"), ("WA", "53", "Washington"),
+    ("WV", "54", "West Virginia"), ("WI", "55", "Wisconsin"), ("WY", "56", "Wyoming"),
+]
+
+GRADES = ["kindergarten"] + [f"grade_{g}" for g in range(1, 13)]
+BELL_GRADE_LEVELS = ["elementary", "middle", "high"]
+CONFIDENCE_LEVELS = ["high", "medium", "low"]
+
+
+def district_count(scale: float) -> int:
+    """Number of synthetic districts at a multiple of national scale."""
+    return int(round(NATIONAL_DISTRICTS * scale))
+
+
+def _state_requirements(rng: np.random.Generator, now: datetime) -> pd.DataFrame:
+    n = len(STATES)
+    elementary = rng.integers(24, 73, n) * 5  # 120-360 minutes
+    return pd.DataFrame({
+        "state": [s for s, _, _ in STATES],
+        "state_name": [name for _, _, name in STATES],
+        "elementary_minutes": elementary,
+        "middle_minutes": elementary + 15,
+        "high_minutes": elementary + 30,
+        "default_minutes": elementary + 15,
+        "annual_days": 180,
+        "source": "synthetic",
+        "updated_at": now,
+    })
+
+
+def _districts(rng: np.random.Generator, n: int, year: str, now: datetime) -> pd.DataFrame:
+    states = rng.integers(0, len(STATES), n)
+    codes = np.array([s for s, _, _ in STATES])[states]
+    fips = np.array([f for _, f, _ in STATES])[states]
+
+    # Sequence within state keeps IDs unique and 7 characters like CCD LEAIDs
+    order = np.argsort(states, kind="stable")
+    sequence = np.empty(n, dtype=int)
+    sorted_states = states[order]
+    starts = np.searchsorted(sorted_states, sorted_states, side="left")
+    sequence[order] = np.arange(n) - starts + 1
+    nces_ids = pd.Series(fips).str.cat(pd.Series(sequence).astype(str).str.zfill(5))
+
+    enrollment = np.clip(rng.lognormal(mean=7.0, sigma=1.4, size=n), 10, 700_000).astype(int)
+    return pd.DataFrame({
+        "nces_id": nces_ids,
+        "name": "Synthetic District " + nces_ids,
+        "state": codes,
+        "enrollment": enrollment,
+        "schools_count": np.maximum(1, enrollment // 500),
+        "year": year,
+        "data_source": "synthetic",
+        "is_career_technical_center": False,
+        "is_shared_service_entity": rng.random(n) < 0.02,
+        "created_at": now,
+        "updated_at": now,
+    })
+
+
+def _enrollment(rng: np.random.Generator, districts: pd.DataFrame, year: str,
+                now: datetime) -> pd.DataFrame:
+    n = len(districts)
+    enrollment = districts["enrollment"].to_numpy()
+    shares = rng.dirichlet(np.full(len(GRADES), 20.0), size=n)
+    grades = np.floor(shares * enrollment[:, None]).astype(int)
+
+    df = pd.DataFrame(grades, columns=[f"enrollment_{g}" for g in GRADES])
+    df.insert(0, "district_id", districts["nces_id"].to_numpy())
+    df.insert(1, "source_year", year)
+    df.insert(2, "data_source", "synthetic")
+    df["enrollment_prek"] = (enrollment * rng.uniform(0, 0.06, n)).astype(int)
+    df["enrollment_k12"] = grades.sum(axis=1)
+    df["enrollment_elementary"] = grades[:, :6].sum(axis=1)
+    df["enrollment_secondary"] = grades[:, 6:].sum(axis=1)
+    df["enrollment_total"] = df["enrollment_k12"] + df["enrollment_prek"]
+    df["created_at"] = now
+    df["updated_at"] = now
+
+    # A few districts report staff but no grade-level enrollment
+    return df[rng.random(n) >= 0.02].reset_index(drop=True)
+
+
+def _staff(rng: np.random.Generator, districts: pd.DataFrame, year: str,
+           now: datetime) -> pd.DataFrame:
+    n = len(districts)
+    enrollment = districts["enrollment"].to_numpy()
+    ratio = np.clip(rng.normal(15.5, 3.0, n), 6, 35)
+    teachers_k12 = np.maximum(1.0, np.round(enrollment / ratio, 2))
+    elementary_share = np.clip(rng.normal(6 / 13, 0.05, n), 0.2, 0.8)
+
+    teachers_elementary_k5 = np.round(teachers_k12 * elementary_share, 2)
+    teachers_secondary_6_12 = np.round(teachers_k12 - teachers_elementary_k5, 2)
+    teachers_kindergarten = np.round(teachers_elementary_k5 / 6, 2)
+    teachers_ungraded = np.round(teachers_k12 * rng.uniform(0, 0.03, n), 2)
+    coordinators = np.round(teachers_k12 * rng.uniform(0, 0.02, n), 2)
+    paraprofessionals = np.round(teachers_k12 * rng.uniform(0.1, 0.5, n), 2)
+    counselors = np.round(teachers_k12 * rng.uniform(0.02, 0.06, n), 2)
+    psychologists = np.round(teachers_k12 * rng.uniform(0, 0.02, n), 2)
+    student_support = np.round(teachers_k12 * rng.uniform(0, 0.05, n), 2)
+    administrators = np.round(teachers_k12 * rng.uniform(0.03, 0.08, n), 2)
+    other_staff = np.round(teachers_k12 * rng.uniform(0.2, 0.6, n), 2)
+
+    scope_teachers_core = teachers_k12 + teachers_ungraded
+    scope_instructional = scope_teachers_core + coordinators + paraprofessionals
+    scope_plus_support = scope_instructional + counselors + psychologists + student_support
+    scope_all = scope_plus_support + administrators + other_staff
+
+    return pd.DataFrame({
+        "district_id": districts["nces_id"].to_numpy(),
+        "effective_year": year,
+        "primary_source": "nces_ccd",
+        "sources_used": '{"nces_ccd": "synthetic"}',
+        "teachers_total": teachers_k12 + teachers_ungraded,
+        "teachers_elementary": teachers_elementary_k5 - teachers_kindergarten,
+        "teachers_kindergarten": teachers_kindergarten,
+        "teachers_secondary": teachers_secondary_6_12,
+        "teachers_ungraded": teachers_ungraded,
+        "instructional_coordinators": coordinators,
+        "paraprofessionals": paraprofessionals,
+        "counselors_total": counselors,
+        "psychologists": psychologists,
+        "student_support_services": student_support,
+        "lea_administrators": administrators,
+        "other_staff": other_staff,
+        "teachers_k12": teachers_k12,
+        "teachers_elementary_k5": teachers_elementary_k5,
+        "teachers_secondary_6_12": teachers_secondary_6_12,
+        "scope_teachers_only": teachers_k12,
+        "scope_teachers_core": np.round(scope_teachers_core, 2),
+        "scope_instructional": np.round(scope_instructional, 2),
+        "scope_instructional_plus_support": np.round(scope_plus_support, 2),
+        "scope_all": np.round(scope_all, 2),
+        "last_resolved_at": now,
+    })
+
+
+def _sped_estimates(rng: np.random.Generator, districts: pd.DataFrame,
+                    staff: pd.DataFrame, year: str, now: datetime) -> pd.DataFrame:
+    n = len(districts)
+    enrollment = districts["enrollment"].to_numpy()
+    teachers = staff["teachers_k12"].to_numpy()
+
+    lea_proportion = np.clip(rng.normal(0.14, 0.03, n), 0.02, 0.4)
+    self_contained_proportion = np.clip(rng.normal(0.13, 0.04, n), 0.02, 0.4)
+    teacher_ratio = np.clip(rng.normal(0.06, 0.015, n), 0.01, 0.15)
+
+    sped = np.round(enrollment * lea_proportion).astype(int)
+    self_contained = np.round(sped * self_contained_proportion).astype(int)
+    sped_teachers = np.round(self_contained * teacher_ratio, 2)
+
+    return pd.DataFrame({
+        "district_id": districts["nces_id"].to_numpy(),
+        "estimate_year": year,
+        "baseline_year": "2017-18",
+        "current_total_enrollment": enrollment,
+        "current_total_teachers": teachers,
+        "ratio_state_sped_teachers_per_student": np.round(teacher_ratio, 6),
+        "ratio_state_sped_instructional_per_student": np.round(teacher_ratio * 2.5, 6),
+        "ratio_state_self_contained_proportion": np.round(self_contained_proportion, 6),
+        "ratio_lea_sped_proportion": np.round(lea_proportion, 6),
+        "used_state_average_for_proportion": rng.random(n) < 0.1,
+        "estimated_sped_enrollment": sped,
+        "estimated_self_contained_sped": self_contained,
+        "estimated_gened_enrollment": enrollment - self_contained,
+        "estimated_sped_teachers": sped_teachers,
+        "estimated_sped_instructional": np.round(sped_teachers * 2.5, 2),
+        "estimated_gened_teachers": np.round(np.maximum(0, teachers - sped_teachers), 2),
+        "estimation_method": "self_contained_ratio",
+        "confidence": rng.choice(CONFIDENCE_LEVELS, n, p=[0.6, 0.3, 0.1]),
+        "created_at": now,
+        "updated_at": now,
+    })
+
+
+def _ca_sped(rng: np.random.Generator, districts: pd.DataFrame, year: str,
+             now: datetime) -> pd.DataFrame:
+    ca = districts[districts["state"] == "CA"]
+    n = len(ca)
+    enrollment = ca["enrollment"].to_numpy()
+
+    total = np.round(enrollment * np.clip(rng.normal(0.13, 0.03, n), 0.02, 0.4)).astype(int)
+    self_contained = np.round(total * np.clip(rng.normal(0.2, 0.05, n), 0.02, 0.5)).astype(int)
+    separate_school = np.round(total * rng.uniform(0, 0.03, n)).astype(int)
+    mainstreamed = total - self_contained - separate_school
+
+    return pd.DataFrame({
+        "nces_id": ca["nces_id"].to_numpy(),
+        "cds_code": (ca["nces_id"].str[2:] + "00").to_numpy(),
+        "year": year,
+        "data_source": "synthetic",
+        "sped_enrollment_total": total,
+        "sped_mainstreamed": mainstreamed,
+        "sped_self_contained": self_contained,
+        "sped_separate_school": separate_school,
+        "self_contained_proportion": np.round(np.divide(
+            self_contained, total, out=np.zeros(n), where=total > 0), 6),
+        "confidence": rng.choice(CONFIDENCE_LEVELS, n, p=[0.7, 0.2, 0.1]),
+        "created_at": now,
+        "updated_at": now,
+    })
+
+
+def _bell_schedules(rng: np.random.Generator, districts: pd.DataFrame, year: str,
+                    fraction: float = 0.1) -> pd.DataFrame:
+    enriched = districts["nces_id"].to_numpy()[rng.random(len(districts)) < fraction]
+    # Each enriched district has one to three grade levels
+    has_level = rng.random((len(enriched), len(BELL_GRADE_LEVELS))) < 0.7
+    has_level[~has_level.any(axis=1), 2] = True
+    rows, levels = np.nonzero(has_level)
+    n = len(rows)
+
+    return pd.DataFrame({
+        "district_id": enriched[rows],
+        "year": year,
+        "grade_level": np.array(BELL_GRADE_LEVELS)[levels],
+        "instructional_minutes": rng.integers(300, 421, n),
+        "confidence": rng.choice(CONFIDENCE_LEVELS, n, p=[0.5, 0.4, 0.1]),
+        "method": "automated_enrichment",
+        "source_description": "synthetic",
+    })
+
+
+def generate(
+    scale: float = 1,
+    seed: int = 42,
+    year: str = "2023-24",
+    districts: Optional[int] = None,
+) -> Dict[str, pd.DataFrame]:
+    """
+    Generate every benchmark table.
+
+    Args:
+        scale: Multiple of national scale (1, 5, 20 are the standard runs)
+        seed: Random seed; the same seed and size give identical frames
+        year: School year stamped on every row
+        districts: Explicit district count (overrides scale, for tests)
+
+    Returns:
+        Dict of table name -> DataFrame with columns named after the
+        table's columns, in TABLES order
+    """
+    rng = np.random.default_rng(seed)
+    n = districts if districts is not None else district_count(scale)
+    # Fixed timestamp keeps the output a pure function of the arguments
+    now = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+    state_requirements = _state_requirements(rng, now)
+    district_df = _districts(rng, n, year, now)
+    staff = _staff(rng, district_df, year, now)
+    district_df["instructional_staff"] = staff["scope_instructional"].to_numpy()
+    district_df["total_staff"] = staff["scope_all"].to_numpy()
+
+    return {
+        "state_requirements": state_requirements,
+        "districts": district_df,
+        "staff_counts_effective": staff,
+        "enrollment_by_grade": _enrollment(rng, district_df, year, now),
+        "sped_estimates": _sped_estimates(rng, district_df, staff, year, now),
+        "ca_sped_district_environments": _ca_sped(rng, district_df, year, now),
+        "bell_schedules": _bell_schedules(rng, district_df, year),
+    }
@@ -4,8 +4,13 @@ Download NCES Common Core of Data (CCD) files
 
 NCES CCD provides comprehensive annual data about all public schools and school districts.
 
+Downloads run in parallel, resume interrupted transfers with HTTP Range
+requests, and record SHA-256 checksums so unchanged files are skipped on
+the next run.
+
 Usage:
     python fetch_nces_ccd.py --year 2023-24 [--tables district_directory district_staff]
+    python fetch_nces_ccd.py --year 2023-24 --workers 2 --force
     python fetch_nces_ccd.py --year 2022-23 --sample
     
 Available tables:
@@ -16,11 +21,15 @@ Available tables:
 """
 
 import argparse
+import hashlib
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from pathlib import Path
 import sys
 import requests
-from typing import List, Dict
+from typing import List, Dict, Optional
 import yaml
 
 logging.basicConfig(
@@ -29,6 +38,12 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Download tuning
+CHUNK_SIZE = 1024 * 1024  # 1 MB reads keep per-chunk overhead negligible
+PROGRESS_INTERVAL = 5.0  # Seconds between progress log lines per file
+DEFAULT_WORKERS = 4  # Concurrent table downloads (be polite to nces.ed.gov)
+CHECKSUM_FILE = "SHA256SUMS"
+
 
 # NCES CCD Data Catalog
 # Note: URLs need to be updated based on actual NCES data releases
@@ -90,37 +105,160 @@ def get_output_directory(year: str, base_path: Path = None) -> Path:
     return output_dir
 
 
-def download_file(url: str, output_path: Path) -> bool:
+def file_sha256(path: Path) -> str:
+    """
+    Compute the SHA-256 of a file
+    
+    Args:
+        path: File to hash
+    
+    Returns:
+        Hex digest
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(CHUNK_SIZE), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def load_recorded_checksums(output_dir: Path) -> Dict[str, str]:
+    """
+    Load checksums recorded by a previous create_metadata_file() run
+    
+    Args:
+        output_dir: Download directory
+    
+    Returns:
+        Mapping of filename -> SHA-256 (empty if none recorded)
+    """
+    checksum_path = output_dir / CHECKSUM_FILE
+    if not checksum_path.exists():
+        return {}
+    
+    checksums = {}
+    for line in checksum_path.read_text().splitlines():
+        parts = line.strip().split(None, 1)
+        if len(parts) == 2:
+            checksums[parts[1].lstrip('*')] = parts[0]
+    return checksums
+
+
+def response_validator(headers) -> Optional[str]:
+    """
+    Validator to send as If-Range when resuming a download of this response
+    
+    If-Range needs a strong ETag or a Last-Modified date; weak ETags
+    (W/"...") cannot be used.
+    
+    Returns:
+        ETag or Last-Modified value, or None if the server sent neither
+    """
+    etag = headers.get('ETag')
+    if etag and not etag.startswith('W/'):
+        return etag
+    return headers.get('Last-Modified')
+
+
+class _ProgressLogger:
+    """Log download progress at most every PROGRESS_INTERVAL seconds."""
+    
+    def __init__(self, name: str, total_size: int, already: int = 0):
+        self.name = name
+        self.total_size = total_size
+        self.downloaded = already
+        self.last_logged = time.monotonic()
+    
+    def update(self, n: int):
+        self.downloaded += n
+        now = time.monotonic()
+        if now - self.last_logged >= PROGRESS_INTERVAL:
+            self.last_logged = now
+            if self.total_size:
+                percent = (self.downloaded / self.total_size) * 100
+                logger.info(f"  {self.name}: {percent:.1f}% ({self.downloaded / 1e6:,.1f} MB)")
+            else:
+                logger.info(f"  {self.name}: {self.downloaded / 1e6:,.1f} MB")
+
+
+def download_file(
+    url: str,
+    output_path: Path,
+    expected_sha256: Optional[str] = None,
+    resume: bool = True,
+) -> bool:
     """
     Download a file from a URL
     
+    The body is streamed to `<output>.part` in CHUNK_SIZE blocks and renamed
+    into place when complete. The response's ETag (or Last-Modified) is kept
+    next to it in `<output>.part.validator`. An existing .part file is
+    resumed with an HTTP Range request guarded by If-Range, so a file that
+    changed on the server since the partial download is fetched whole;
+    servers that ignore the range get a clean restart, and .part files with
+    no recorded validator are not resumed.
+    
     Args:
         url: URL to download from
         output_path: Where to save the file
+        expected_sha256: If given, the download fails unless the file matches
+        resume: Resume from a partial download if one exists
     
     Returns:
         True if successful, False otherwise
     """
+    part_path = output_path.with_name(output_path.name + '.part')
+    validator_path = output_path.with_name(output_path.name + '.part.validator')
+    
     try:
         logger.info(f"Downloading: {url}")
         
-        response = requests.get(url, stream=True, timeout=60)
-        response.raise_for_status()
+        offset = part_path.stat().st_size if resume and part_path.exists() else 0
+        validator = validator_path.read_text().strip() if offset and validator_path.exists() else None
+        if offset and not validator:
+            logger.info("  No validator recorded for the partial download, restarting")
+            offset = 0
+        headers = {'Range': f'bytes={offset}-', 'If-Range': validator} if offset else {}
         
-        # Get file size if available
-        total_size = int(response.headers.get('content-length', 0))
-        
-        with open(output_path, 'wb') as f:
-            if total_size == 0:
-                f.write(response.content)
+        with requests.get(url, stream=True, timeout=60, headers=headers) as response:
+            if offset and response.status_code == 416:
+                # Requested range starts at/after EOF: the partial file is complete
+                logger.info(f"  Partial download already complete ({offset:,} bytes)")
             else:
-                downloaded = 0
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
-                    downloaded += len(chunk)
-                    percent = (downloaded / total_size) * 100
-                    logger.info(f"  Progress: {percent:.1f}%")
+                response.raise_for_status()
+                
+                if offset and response.status_code == 206:
+                    logger.info(f"  Resuming at {offset:,} bytes")
+                    mode = 'ab'
+                else:
+                    offset = 0
+                    mode = 'wb'
+                    validator = response_validator(response.headers)
+                    if validator:
+                        validator_path.write_text(validator)
+                    else:
+                        validator_path.unlink(missing_ok=True)
+                
+                # Get file size if available (for progress only)
+                remaining = int(response.headers.get('content-length', 0))
+                progress = _ProgressLogger(output_path.name, offset + remaining if remaining else 0, offset)
+                
+                with open(part_path, mode) as f:
+                    for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+                        if chunk:
+                            f.write(chunk)
+                            progress.update(len(chunk))
+        
+        if expected_sha256:
+            actual = file_sha256(part_path)
+            if actual != expected_sha256:
+                logger.error(f"✗ Checksum mismatch for {output_path.name}: {actual[:12]} != {expected_sha256[:12]}")
+                part_path.unlink()
+                validator_path.unlink(missing_ok=True)
+                return False
         
+        part_path.replace(output_path)
+        validator_path.unlink(missing_ok=True)
         logger.info(f"✓ Saved to: {output_path}")
         return True
         
@@ -129,15 +267,96 @@ def download_file(url: str, output_path: Path) -> bool:
         return False
 
 
-def create_metadata_file(output_dir: Path, year: str, tables: List[str]):
+def download_table(
+    table: str,
+    url: str,
+    output_dir: Path,
+    recorded_checksums: Optional[Dict[str, str]] = None,
+    force: bool = False,
+) -> Dict:
+    """
+    Download one CCD table unless an identical copy is already present
+    
+    Args:
+        table: Table name (e.g., "district_staff")
+        url: Source URL
+        output_dir: Download directory
+        recorded_checksums: Checksums from a previous run (filename -> sha256)
+        force: Download even if the existing file matches its checksum
+    
+    Returns:
+        Dict with table, file, status ('downloaded'/'skipped'/'failed') and sha256
+    """
+    filename = Path(url).name
+    output_path = output_dir / filename
+    recorded = (recorded_checksums or {}).get(filename)
+    
+    if output_path.exists() and not force:
+        if recorded and file_sha256(output_path) == recorded:
+            logger.info(f"✓ {filename} already present (checksum match), skipping")
+            return {'table': table, 'file': filename, 'status': 'skipped', 'sha256': recorded}
+        logger.warning(f"{filename} exists but does not match a recorded checksum, re-downloading")
+    
+    if not download_file(url, output_path):
+        return {'table': table, 'file': filename, 'status': 'failed', 'sha256': None}
+    
+    return {'table': table, 'file': filename, 'status': 'downloaded', 'sha256': file_sha256(output_path)}
+
+
+def download_tables(
+    year: str,
+    tables: List[str],
+    output_dir: Path,
+    max_workers: int = DEFAULT_WORKERS,
+    force: bool = False,
+) -> List[Dict]:
+    """
+    Download several CCD tables concurrently
+    
+    Args:
+        year: School year key in CCD_CATALOG
+        tables: Table names to download
+        output_dir: Download directory
+        max_workers: Maximum concurrent downloads
+        force: Re-download files even if their checksum matches
+    
+    Returns:
+        List of download_table() results, in the order of `tables`
+    """
+    recorded = load_recorded_checksums(output_dir)
+    
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+        futures = [
+            pool.submit(
+                download_table, table, CCD_CATALOG[year][table]['url'],
+                output_dir, recorded, force,
+            )
+            for table in tables
+        ]
+        return [future.result() for future in futures]
+
+
+def create_metadata_file(
+    output_dir: Path,
+    year: str,
+    tables: List[str],
+    checksums: Optional[Dict[str, str]] = None,
+):
     """
     Create a README with metadata about the downloaded files
     
+    Checksums are written both into the README and into a SHA256SUMS file
+    (sha256sum format) that later runs use to skip unchanged downloads.
+    SHA256SUMS is merged with the existing file, so entries for tables not
+    downloaded in this run are kept.
+    
     Args:
         output_dir: Directory containing the files
         year: School year
         tables: List of tables downloaded
+        checksums: Optional mapping of table -> SHA-256 of the downloaded file
     """
+    checksums = checksums or {}
     readme_path = output_dir / "README.md"
     
     content = f"""# NCES Common Core of Data (CCD) - {year}
@@ -150,17 +369,23 @@ https://nces.ed.gov/ccd/
 
 """
     
+    recorded = load_recorded_checksums(output_dir)
     for table in tables:
         if year in CCD_CATALOG and table in CCD_CATALOG[year]:
             info = CCD_CATALOG[year][table]
             content += f"### {table}\n"
             content += f"- **Description**: {info['description']}\n"
-            content += f"- **URL**: {info['url']}\n\n"
+            content += f"- **URL**: {info['url']}\n"
+            if table in checksums:
+                content += f"- **SHA-256**: {checksums[table]}\n"
+                recorded[Path(info['url']).name] = checksums[table]
+            content += "\n"
     
     content += f"""
 ## Download Information
-- **Date**: {Path(__file__).stat().st_mtime}
+- **Date**: {datetime.now().isoformat(timespec='seconds')}
 - **Script**: fetch_nces_ccd.py
+- **Checksums**: {CHECKSUM_FILE} (verify with `sha256sum -c {CHECKSUM_FILE}`)
 
 ## Next Steps
 1. Extract ZIP files if present
@@ -177,6 +402,10 @@ https://nces.ed.gov/ccd/
     with open(readme_path, 'w') as f:
         f.write(content)
     
+    if recorded:
+        with open(output_dir / CHECKSUM_FILE, 'w') as f:
+            f.write("".join(f"{sha}  {name}\n" for name, sha in sorted(recorded.items())))
+    
     logger.info(f"✓ Metadata file created: {readme_path}")
 
 
@@ -249,6 +478,17 @@ def main():
         type=Path,
         help="Custom output directory"
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help=f"Concurrent downloads (default: {DEFAULT_WORKERS})"
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Re-download files even if their recorded checksum matches"
+    )
     parser.add_argument(
         "--sample",
         action="store_true",
@@ -280,44 +520,31 @@ def main():
     logger.info(f"\nDownloading {len(tables_to_download)} table(s) for {args.year}")
     logger.info("="*60)
     
-    # Download each table
-    results = []
-    for table in tables_to_download:
-        info = CCD_CATALOG[args.year][table]
-        
-        logger.info(f"\n{table}: {info['description']}")
-        
-        # Determine output filename
-        filename = Path(info['url']).name
-        output_path = output_dir / filename
-        
-        # Check if already exists
-        if output_path.exists():
-            logger.warning(f"File already exists: {output_path.name}")
-            response = input("Re-download? (y/n): ").strip().lower()
-            if response != 'y':
-                logger.info("Skipping...")
-                continue
-        
-        # Download
-        success = download_file(info['url'], output_path)
-        results.append((table, success))
+    # Download tables concurrently
+    results = download_tables(
+        args.year, tables_to_download, output_dir,
+        max_workers=args.workers, force=args.force,
+    )
     
-    # Create metadata
-    successful_tables = [t for t, s in results if s]
-    if successful_tables:
-        create_metadata_file(output_dir, args.year, successful_tables)
+    # Create metadata (skipped files are still part of the local copy)
+    present = [r for r in results if r['status'] != 'failed']
+    if present:
+        create_metadata_file(
+            output_dir, args.year,
+            [r['table'] for r in present],
+            {r['table']: r['sha256'] for r in present},
+        )
     
     # Summary
     logger.info("\n" + "="*60)
     logger.info("DOWNLOAD SUMMARY")
     logger.info("="*60)
     
-    for table, success in results:
-        status = "✓" if success else "✗"
-        logger.info(f"{status} {table}")
+    for result in results:
+        status = "✗" if result['status'] == 'failed' else "✓"
+        logger.info(f"{status} {result['table']} ({result['status']})")
     
-    successful_count = sum(1 for _, s in results if s)
+    successful_count = sum(1 for r in results if r['status'] != 'failed')
     logger.info(f"\nSuccessful: {successful_count}/{len(results)}")
     
     return 0 if successful_count == len(results) else 1
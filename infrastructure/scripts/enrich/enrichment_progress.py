@@ -22,16 +22,22 @@ Usage:
     python enrichment_progress.py --campaign
 """
 
+from __future__ import annotations
+
 import argparse
 import json
 import sys
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Optional
-import pandas as pd
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 # Add utilities to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "utilities"))
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
 
 
 class EnrichmentProgressTracker:
@@ -44,8 +50,12 @@ class EnrichmentProgressTracker:
         Args:
             enrichment_ref_path: Path to enrichment reference CSV
         """
+        # Imported here (pulls in pandas) so --help stays fast
+        from infrastructure.utilities.district_reference import get_reference
+
         self.enrichment_ref_path = enrichment_ref_path
-        self.ref_df = pd.read_csv(enrichment_ref_path)
+        self.reference = get_reference(enrichment_ref_path)
+        self.ref_df = self.reference.df
 
         # Paths
         self.bell_schedules_dir = Path("data/enriched/bell-schedules")
@@ -95,26 +105,11 @@ class EnrichmentProgressTracker:
         Returns:
             DataFrame with state statistics
         """
+        # Per-state totals are computed once per reference load
+        state_stats = self.reference.state_stats()
         if state:
-            df = self.ref_df[self.ref_df['state'] == state.upper()]
-        else:
-            df = self.ref_df
-
-        # Group by state
-        state_stats = df.groupby('state').agg({
-            'district_id': 'count',
-            'enriched': 'sum',
-            'enrollment_total': 'sum'
-        }).rename(columns={
-            'district_id': 'total_districts',
-            'enriched': 'enriched_count',
-            'enrollment_total': 'total_enrollment'
-        })
-
-        state_stats['pending'] = state_stats['total_districts'] - state_stats['enriched_count']
-        state_stats['enrichment_rate'] = (
-            state_stats['enriched_count'] / state_stats['total_districts'] * 100
-        )
+            state_stats = state_stats[state_stats.index == state.upper()]
+        state_stats = state_stats.copy()
 
         # Sort by state order for campaign
         state_stats['priority'] = state_stats.index.map(
@@ -140,10 +135,8 @@ class EnrichmentProgressTracker:
         Returns:
             DataFrame of next districts
         """
-        pending = self.ref_df[~self.ref_df['enriched']]
-
-        if state:
-            pending = pending[pending['state'] == state.upper()]
+        districts = self.reference.for_state(state)
+        pending = districts[~districts['enriched']]
 
         # Sort by enrollment (largest first)
         pending = pending.sort_values('enrollment_total', ascending=False)
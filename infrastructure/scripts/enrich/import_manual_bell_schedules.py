@@ -31,8 +31,9 @@ PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
 from infrastructure.database.connection import session_scope
-from infrastructure.database.models import BellSchedule, District
+from infrastructure.database.models import BellSchedule
 from infrastructure.scripts.enrich.content_parser import ContentParser, BellScheduleData
+from infrastructure.utilities.district_names import DistrictNameIndex
 from sqlalchemy import text
 
 # Configure logging
@@ -45,6 +46,9 @@ logger = logging.getLogger(__name__)
 # Paths
 MANUAL_IMPORT_DIR = PROJECT_ROOT / "data" / "raw" / "manual_import_files"
 
+# Minimum name similarity (0-1) for a folder to be matched to a district
+MIN_MATCH_SCORE = 0.5
+
 # State name to abbreviation mapping
 STATE_ABBREV = {
     'Alabama': 'AL', 'Alaska': 'AK', 'Arizona': 'AZ', 'Arkansas': 'AR',
@@ -74,6 +78,7 @@ class DistrictMatch:
     clean_name: str
     nces_id: Optional[str] = None
     db_name: Optional[str] = None
+    match_score: Optional[float] = None
     files: List[Path] = field(default_factory=list)
 
 
@@ -226,36 +231,13 @@ def discover_districts() -> List[DistrictMatch]:
     return districts
 
 
-def normalize_district_name(name: str) -> str:
-    """Normalize district name for matching by removing common suffixes."""
-    # Remove common suffixes
-    suffixes = [
-        ' School District',
-        ' Public Schools',
-        ' Schools',
-        ' Unified School District',
-        ' Independent Comm School District',
-        ' Comm School District',
-        ' Community School District',
-        ' School District No. R-1',
-        ' School District No. Re 1',
-        ' Area Schools',
-        ' Area School District',
-        ' County Public Schools',
-        ' County Schools',
-        ' School District 49-5',
-    ]
-    normalized = name
-    for suffix in suffixes:
-        if normalized.endswith(suffix):
-            normalized = normalized[:-len(suffix)]
-    return normalized.strip()
-
-
 def match_districts_to_db(districts: List[DistrictMatch], session) -> List[DistrictMatch]:
     """
     Match discovered districts to database records.
 
+    Builds one trigram name index for the states involved and ranks every
+    folder against it, instead of issuing LIKE queries per folder.
+
     Args:
         districts: List of DistrictMatch objects
         session: Database session
@@ -263,63 +245,32 @@ def match_districts_to_db(districts: List[DistrictMatch], session) -> List[Distr
     Returns:
         List of DistrictMatch objects with nces_id populated
     """
-    matched = []
-
+    with_state = []
     for item in districts:
-        state = item.state
-        name = item.clean_name
-
-        if not state:
+        if item.state:
+            with_state.append(item)
+        else:
             logger.warning(f"No state for {item.folder_name}")
-            continue
 
-        # Try exact match first
-        district = session.query(District).filter(
-            District.state == state,
-            District.name == name
-        ).first()
-
-        if not district:
-            # Try contains match
-            district = session.query(District).filter(
-                District.state == state,
-                District.name.ilike(f'%{name}%')
-            ).first()
-
-        if not district:
-            # Try normalized name match (strip suffixes)
-            normalized = normalize_district_name(name)
-            if normalized != name:
-                district = session.query(District).filter(
-                    District.state == state,
-                    District.name.ilike(f'{normalized}%')
-                ).first()
-
-        if not district:
-            # Try first two words match (e.g., "Los Angeles" from "Los Angeles Unified School District")
-            words = name.split()[:2]
-            if len(words) >= 2:
-                prefix = ' '.join(words)
-                district = session.query(District).filter(
-                    District.state == state,
-                    District.name.ilike(f'{prefix}%')
-                ).first()
-
-        if not district:
-            # Try first word match
-            first_word = name.split()[0] if name else ""
-            if first_word and len(first_word) > 3:
-                district = session.query(District).filter(
-                    District.state == state,
-                    District.name.ilike(f'{first_word}%')
-                ).first()
-
-        if district:
-            item.nces_id = district.nces_id
-            item.db_name = district.name
+    index = DistrictNameIndex.from_session(session, states={item.state for item in with_state})
+    results = index.match_many(
+        [(item.clean_name, item.state) for item in with_state],
+        limit=1,
+        min_score=MIN_MATCH_SCORE,
+    )
+
+    matched = []
+    for item, candidates in zip(with_state, results):
+        if candidates:
+            best = candidates[0]
+            item.nces_id = best.district_id
+            item.db_name = best.name
+            item.match_score = best.score
+            if best.score < 1.0:
+                logger.debug(f"Matched {item.state}: {item.clean_name} -> {best.name} ({best.score:.2f})")
             matched.append(item)
         else:
-            logger.warning(f"No match for {state}: {name}")
+            logger.warning(f"No match for {item.state}: {item.clean_name}")
 
     return matched
 
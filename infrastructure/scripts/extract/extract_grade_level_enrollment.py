@@ -30,6 +30,12 @@ import sys
 from pathlib import Path
 import pandas as pd
 
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from infrastructure.utilities.ccd_parquet_cache import iter_ccd_chunks
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s'
@@ -71,11 +77,12 @@ def extract_grade_level_enrollment(membership_file: Path, output_file: Path):
     logger.info(f"Loading membership data from {membership_file}")
 
     # Read the membership file
-    # This file is very large, so we'll use chunking
+    # This file is very large, so we'll use chunking (Parquet cache when available)
     chunks = []
     chunksize = 100000
+    columns = ['LEAID', 'GRADE', 'TOTAL_INDICATOR', 'STUDENT_COUNT']
 
-    for chunk in pd.read_csv(membership_file, chunksize=chunksize, low_memory=False):
+    for chunk in iter_ccd_chunks(membership_file, chunksize=chunksize, columns=columns):
         # Filter for records we care about
         # We want records where TOTAL_INDICATOR is "Category Set A" (by grade/race/sex)
         # and where GRADE is one of our target grades
@@ -37,6 +37,12 @@ import sys
 from pathlib import Path
 import pandas as pd
 
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from infrastructure.utilities.ccd_parquet_cache import read_ccd
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s'
@@ -70,7 +76,7 @@ def extract_grade_level_staffing(
         'Teachers'  # Total for validation
     }
 
-    df_staff = pd.read_csv(staff_file, low_memory=False)
+    df_staff = read_ccd(staff_file)
 
     # Filter for target categories and Category Set A (most granular, non-derived)
     mask = (
@@ -3,27 +3,41 @@
 Handle multi-part files (_1, _2, _3, etc.)
 Concatenate them into single files for processing
 
+Parts are reassembled by streaming bytes in large blocks (no pandas), so
+multi-GB files need only a few MB of memory. Repeated headers are dropped
+and the output line count and SHA-256 are verified after writing.
+
 Usage:
-    python split_large_files.py <directory> [--output-dir <path>] [--pattern <separator>]
+    python split_large_files.py <directory> [--output-dir <path>] [--pattern <separator>] [--parquet]
     
 Example:
     python split_large_files.py data/raw/federal/nces-ccd/2023-24/
     python split_large_files.py data/raw/federal/crdc/2021-22/ --pattern "_part"
+    python split_large_files.py data/raw/federal/nces-ccd/2023-24/ --parquet
 """
 
 import argparse
+import csv
+import hashlib
 import logging
 from pathlib import Path
-import pandas as pd
 import sys
 import re
 
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger(__name__)
 
+# Bytes copied per read; bounds peak memory during reassembly
+COPY_BLOCK_SIZE = 16 * 1024 * 1024
+UTF8_BOM = b'\xef\xbb\xbf'
+
 
 def find_multipart_files(directory, pattern="_"):
     """
@@ -72,73 +86,239 @@ def find_multipart_files(directory, pattern="_"):
     return multipart_sets
 
 
-def concatenate_csv_files(file_list, output_path):
+def _normalize_line(line):
+    """Header comparison key: ignore BOM and line-ending differences."""
+    return line.lstrip(UTF8_BOM).rstrip(b'\r\n')
+
+
+def _count_lines(path):
+    """Count lines in a file by scanning raw blocks (no parsing)."""
+    lines = 0
+    last = b''
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(COPY_BLOCK_SIZE), b''):
+            lines += block.count(b'\n')
+            last = block
+    if last and not last.endswith(b'\n'):
+        lines += 1
+    return lines
+
+
+def _file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(COPY_BLOCK_SIZE), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def stream_concatenate(file_list, output_path, verify=True):
+    """
+    Concatenate files by copying raw bytes in large blocks
+
+    Memory use is bounded by COPY_BLOCK_SIZE regardless of file size. The
+    first line of every part after the first is dropped when it is identical
+    to the first part's header (repeated CSV headers); parts that continue
+    without a header are copied whole.
+
+    Row counts assume one record per line, which holds for NCES/CRDC files
+    (no quoted embedded newlines).
+
+    Args:
+        file_list: List of Path objects to concatenate, in order
+        output_path: Path where combined file will be saved
+        verify: Re-read the output and check line count and SHA-256
+
+    Returns:
+        Dict with lines, data_rows, headers_skipped, bytes, sha256
+
+    Raises:
+        ValueError: If verification fails
+    """
+    digest = hashlib.sha256()
+    total_lines = 0
+    headers_skipped = 0
+    total_bytes = 0
+    header_key = None
+
+    with open(output_path, 'wb') as outfile:
+        def write(data):
+            nonlocal total_bytes
+            outfile.write(data)
+            digest.update(data)
+            total_bytes += len(data)
+
+        for i, file in enumerate(file_list):
+            part_lines = 0
+            last = b''
+            with open(file, 'rb') as infile:
+                first_line = infile.readline()
+                if i == 0:
+                    header_key = _normalize_line(first_line)
+                if i > 0 and first_line and _normalize_line(first_line) == header_key:
+                    headers_skipped += 1
+                elif first_line:
+                    write(first_line)
+                    part_lines += first_line.count(b'\n')
+                    last = first_line
+
+                for block in iter(lambda: infile.read(COPY_BLOCK_SIZE), b''):
+                    write(block)
+                    part_lines += block.count(b'\n')
+                    last = block
+
+            # Keep the next part's first record on its own line
+            if last and not last.endswith(b'\n'):
+                write(b'\n')
+                part_lines += 1
+
+            total_lines += part_lines
+            logger.info(f"  ✓ Copied {file.name}: {part_lines:,} lines")
+
+    result = {
+        'lines': total_lines,
+        'data_rows': total_lines - 1 if total_lines else 0,
+        'headers_skipped': headers_skipped,
+        'bytes': total_bytes,
+        'sha256': digest.hexdigest(),
+    }
+
+    if verify:
+        on_disk_lines = _count_lines(output_path)
+        if on_disk_lines != total_lines:
+            raise ValueError(
+                f"Line count mismatch for {output_path.name}: "
+                f"copied {total_lines:,}, found {on_disk_lines:,}"
+            )
+        on_disk_sha = _file_sha256(output_path)
+        if on_disk_sha != result['sha256']:
+            raise ValueError(f"Checksum mismatch for {output_path.name}")
+        logger.info(f"  ✓ Verified {on_disk_lines:,} lines, sha256 {on_disk_sha[:12]}")
+
+    return result
+
+
+def concatenate_to_parquet(file_list, output_path):
+    """
+    Concatenate multipart CSVs straight into a single Parquet file
+
+    Parts are streamed through pyarrow's CSV reader; nothing is held in
+    memory beyond one block. Identifier columns (LEAID, ST_LEAID, ...) are
+    stored as strings, and later parts are read with the schema of the
+    first so the row groups stay consistent. If a later block or part
+    contradicts the inferred types, the file is rewritten with every
+    column as a string (as ccd_parquet_cache does).
+
+    Args:
+        file_list: List of CSV Path objects, in order
+        output_path: Destination .parquet path
+
+    Returns:
+        Number of rows written
+    """
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    import pyarrow.parquet as pq
+
+    from infrastructure.utilities.ccd_parquet_cache import CSV_BLOCK_SIZE, csv_convert_options
+
+    logger.info(f"Concatenating {len(file_list)} CSV files to Parquet...")
+
+    with open(file_list[0], 'rb') as f:
+        header_line = f.readline()
+    header = next(csv.reader([header_line.lstrip(UTF8_BOM).decode('utf-8', errors='replace')]))
+    header_key = _normalize_line(header_line)
+
+    def _write(all_strings):
+        writer = None
+        schema = None
+        rows = 0
+        try:
+            for file in file_list:
+                with open(file, 'rb') as f:
+                    has_header = _normalize_line(f.readline()) == header_key
+
+                reader = pacsv.open_csv(
+                    file,
+                    read_options=pacsv.ReadOptions(
+                        block_size=CSV_BLOCK_SIZE,
+                        column_names=None if has_header else header,
+                    ),
+                    convert_options=csv_convert_options(header, all_strings, schema),
+                )
+
+                part_rows = 0
+                for batch in reader:
+                    if writer is None:
+                        schema = batch.schema
+                        writer = pq.ParquetWriter(output_path, schema)
+                    writer.write_batch(batch)
+                    part_rows += batch.num_rows
+                rows += part_rows
+                logger.info(f"  ✓ Streamed {file.name}: {part_rows:,} rows")
+        finally:
+            if writer is not None:
+                writer.close()
+        return rows, writer is not None
+
+    try:
+        rows, wrote = _write(all_strings=False)
+    except pa.ArrowInvalid as e:
+        # A later block contradicted the types inferred from the first one
+        logger.warning(f"  Type inference failed ({e}); storing all columns as strings")
+        rows, wrote = _write(all_strings=True)
+
+    written = pq.ParquetFile(output_path).metadata.num_rows if wrote else 0
+    if written != rows:
+        raise ValueError(f"Row count mismatch for {output_path.name}: read {rows:,}, wrote {written:,}")
+
+    logger.info(f"✓ Combined Parquet file created: {rows:,} rows → {output_path.name}")
+    return rows
+
+
+def concatenate_csv_files(file_list, output_path, verify=True):
     """
     Concatenate multiple CSV files into one
     
+    Streams bytes rather than parsing, so peak memory stays at one block.
+    
     Args:
         file_list: List of Path objects to concatenate
         output_path: Path where combined file will be saved
+        verify: Check line count and checksum of the output
     
     Returns:
-        Number of total rows in combined file
+        Number of total rows in combined file (excluding header)
     """
     logger.info(f"Concatenating {len(file_list)} CSV files...")
     
-    dfs = []
-    for file in file_list:
-        try:
-            df = pd.read_csv(file, low_memory=False)
-            dfs.append(df)
-            logger.info(f"  ✓ Read {file.name}: {len(df):,} rows")
-        except Exception as e:
-            logger.error(f"  ✗ Error reading {file.name}: {e}")
-            raise
-    
-    combined = pd.concat(dfs, ignore_index=True)
-    combined.to_csv(output_path, index=False)
+    result = stream_concatenate(file_list, output_path, verify=verify)
     
-    logger.info(f"✓ Combined file created: {len(combined):,} rows → {output_path.name}")
-    return len(combined)
+    logger.info(f"✓ Combined file created: {result['data_rows']:,} rows → {output_path.name}")
+    return result['data_rows']
 
 
-def concatenate_text_files(file_list, output_path):
+def concatenate_text_files(file_list, output_path, verify=True):
     """
     Concatenate multiple text files into one
     
     Args:
         file_list: List of Path objects to concatenate
         output_path: Path where combined file will be saved
+        verify: Check line count and checksum of the output
     
     Returns:
         Number of total lines in combined file
     """
     logger.info(f"Concatenating {len(file_list)} text files...")
     
-    total_lines = 0
+    result = stream_concatenate(file_list, output_path, verify=verify)
     
-    with open(output_path, 'w', encoding='utf-8') as outfile:
-        for i, file in enumerate(file_list):
-            try:
-                with open(file, 'r', encoding='utf-8') as infile:
-                    lines = infile.readlines()
-                    
-                    # Skip header for all but first file
-                    if i > 0 and lines and not lines[0].strip().isdigit():
-                        lines = lines[1:]
-                    
-                    outfile.writelines(lines)
-                    total_lines += len(lines)
-                    logger.info(f"  ✓ Read {file.name}: {len(lines):,} lines")
-            except Exception as e:
-                logger.error(f"  ✗ Error reading {file.name}: {e}")
-                raise
-    
-    logger.info(f"✓ Combined file created: {total_lines:,} lines → {output_path.name}")
-    return total_lines
-
-
-def process_multipart_set(base_name, files, output_dir):
+    logger.info(f"✓ Combined file created: {result['lines']:,} lines → {output_path.name}")
+    return result['lines']
+
+
+def process_multipart_set(base_name, files, output_dir, parquet=False, verify=True, overwrite=False):
     """
     Process a set of multi-part files
     
@@ -146,6 +326,9 @@ def process_multipart_set(base_name, files, output_dir):
         base_name: Base filename (without part numbers)
         files: List of file paths in order
         output_dir: Directory for output file
+        parquet: Write CSV sets as a single Parquet file instead of CSV
+        verify: Check line counts and checksums of the output
+        overwrite: Replace an existing combined file without prompting
     
     Returns:
         Path to created combined file
@@ -156,10 +339,12 @@ def process_multipart_set(base_name, files, output_dir):
     
     # Determine output path
     first_file = files[0]
-    output_path = output_dir / f"{base_name}_combined{first_file.suffix}"
+    is_csv = first_file.suffix.lower() in ['.csv']
+    suffix = '.parquet' if parquet and is_csv else first_file.suffix
+    output_path = output_dir / f"{base_name}_combined{suffix}"
     
     # Check if output already exists
-    if output_path.exists():
+    if output_path.exists() and not overwrite:
         logger.warning(f"Output file already exists: {output_path.name}")
         response = input("Overwrite? (y/n): ").strip().lower()
         if response != 'y':
@@ -167,14 +352,16 @@ def process_multipart_set(base_name, files, output_dir):
             return None
     
     # Process based on file type
-    if first_file.suffix.lower() in ['.csv']:
-        concatenate_csv_files(files, output_path)
+    if is_csv and parquet:
+        concatenate_to_parquet(files, output_path)
+    elif is_csv:
+        concatenate_csv_files(files, output_path, verify=verify)
     elif first_file.suffix.lower() in ['.txt', '.dat']:
-        concatenate_text_files(files, output_path)
+        concatenate_text_files(files, output_path, verify=verify)
     else:
         logger.warning(f"Unsupported file type: {first_file.suffix}")
         logger.info("Attempting text concatenation...")
-        concatenate_text_files(files, output_path)
+        concatenate_text_files(files, output_path, verify=verify)
     
     return output_path
 
@@ -188,6 +375,7 @@ Examples:
   python split_large_files.py data/raw/federal/nces-ccd/2023-24/
   python split_large_files.py data/raw/federal/crdc/ --pattern "_part"
   python split_large_files.py data/raw/ --output-dir data/processed/normalized/
+  python split_large_files.py data/raw/federal/nces-ccd/2023-24/ --parquet
         """
     )
     
@@ -204,6 +392,21 @@ Examples:
         default="_",
         help="Part number separator pattern (default: '_')"
     )
+    parser.add_argument(
+        "--parquet",
+        action="store_true",
+        help="Write combined CSV sets as Parquet instead of CSV"
+    )
+    parser.add_argument(
+        "--overwrite",
+        action="store_true",
+        help="Replace existing combined files without prompting"
+    )
+    parser.add_argument(
+        "--no-verify",
+        action="store_true",
+        help="Skip the line count / checksum check of combined files"
+    )
     parser.add_argument(
         "--dry-run",
         action="store_true",
@@ -240,7 +443,11 @@ Examples:
             for i, f in enumerate(files, 1):
                 logger.info(f"    {i}. {f.name}")
         else:
-            output_path = process_multipart_set(base_name, files, output_dir)
+            output_path = process_multipart_set(
+                base_name, files, output_dir,
+                parquet=args.parquet, verify=not args.no_verify,
+                overwrite=args.overwrite
+            )
             if output_path:
                 results.append(output_path)
     
@@ -14,9 +14,11 @@ Usage:
 """
 
 import argparse
-import csv
 import sys
 from pathlib import Path
+from typing import List, Sequence, Tuple
+
+import pandas as pd
 
 # Add project root to path
 project_root = Path(__file__).parent.parent.parent
@@ -35,6 +37,9 @@ WEBSITE_COL = 24  # Column 25 in 1-based indexing
 GSLO_COL = 53     # Column 54 - Grade Span Low (PK, KG, 01-12)
 GSHI_COL = 54     # Column 55 - Grade Span High (PK, KG, 01-12)
 
+# Rows per UPDATE ... FROM (VALUES ...) statement
+UPDATE_PAGE_SIZE = 1000
+
 
 def normalize_url(url: str) -> str:
     """Normalize a URL for consistency."""
@@ -53,31 +58,43 @@ def normalize_url(url: str) -> str:
     return url
 
 
-def normalize_nces_id(nces_id: str) -> str:
-    """Normalize NCES ID to 7-digit format with leading zeros (NCES standard)."""
-    if not nces_id:
-        return None
-    # Pad to 7 digits with leading zeros (NCES standard format)
-    return nces_id.strip().zfill(7)
+def read_ccd_columns(columns: List[int]) -> pd.DataFrame:
+    """
+    Read only the given CCD columns, as strings, with LEAIDs normalized.
 
+    Values are kept verbatim (no NA parsing) so the normalizers see the
+    same text as csv.reader would; rows without a LEAID are dropped.
 
-def load_urls_from_csv() -> dict:
-    """Load NCES ID -> Website URL mapping from CSV."""
-    urls = {}
+    Args:
+        columns: 0-based column indices, including LEAID_COL
 
-    with open(NCES_CCD_FILE, 'r', encoding='utf-8') as f:
-        reader = csv.reader(f)
-        header = next(reader)  # Skip header
+    Returns:
+        DataFrame whose columns are the requested indices
+    """
+    df = pd.read_csv(
+        NCES_CCD_FILE,
+        usecols=columns,
+        dtype=str,
+        keep_default_na=False,
+        encoding='utf-8',
+    )
+    # usecols keeps file order
+    df.columns = sorted(columns)
+    df = df.fillna('')
 
-        for row in reader:
-            if len(row) > max(LEAID_COL, WEBSITE_COL):
-                leaid = normalize_nces_id(row[LEAID_COL].strip())
-                website = normalize_url(row[WEBSITE_COL])
+    # 7-digit LEAIDs with leading zeros (NCES standard format)
+    leaid = df[LEAID_COL].str.strip()
+    df = df[leaid != ''].copy()
+    df[LEAID_COL] = leaid[leaid != ''].str.zfill(7)
+    return df
 
-                if leaid and website:
-                    urls[leaid] = website
 
-    return urls
+def load_urls_from_csv() -> dict:
+    """Load NCES ID -> Website URL mapping from CSV."""
+    df = read_ccd_columns([LEAID_COL, WEBSITE_COL])
+    websites = df[WEBSITE_COL].map(normalize_url)
+    valid = websites.notna()
+    return dict(zip(df.loc[valid, LEAID_COL], websites[valid]))
 
 
 def normalize_grade(grade: str) -> str:
@@ -93,22 +110,55 @@ def normalize_grade(grade: str) -> str:
 
 def load_grade_spans_from_csv() -> dict:
     """Load NCES ID -> (GSLO, GSHI) mapping from CSV."""
-    grade_spans = {}
+    df = read_ccd_columns([LEAID_COL, GSLO_COL, GSHI_COL])
+    gslo = df[GSLO_COL].map(normalize_grade)
+    gshi = df[GSHI_COL].map(normalize_grade)
+    valid = gslo.notna() & gshi.notna()
+    return dict(zip(df.loc[valid, LEAID_COL], zip(gslo[valid], gshi[valid])))
+
+
+def district_update_sql(columns: Sequence[str]) -> str:
+    """
+    UPDATE districts from a VALUES list, for execute_values().
+
+    Args:
+        columns: districts columns to set; each VALUES row is
+            (nces_id, *columns)
+
+    Returns:
+        SQL with a single %s placeholder for the VALUES list
+    """
+    assignments = ", ".join(f"{c} = v.{c}" for c in columns)
+    return (
+        f"UPDATE districts AS d SET {assignments} "
+        f"FROM (VALUES %s) AS v(nces_id, {', '.join(columns)}) "
+        f"WHERE d.nces_id = v.nces_id"
+    )
+
+
+def update_districts(session, columns: Sequence[str], rows: List[Tuple]) -> int:
+    """
+    Apply per-district updates with one statement per UPDATE_PAGE_SIZE rows.
 
-    with open(NCES_CCD_FILE, 'r', encoding='utf-8') as f:
-        reader = csv.reader(f)
-        header = next(reader)  # Skip header
+    Args:
+        session: SQLAlchemy session (PostgreSQL/psycopg2); caller commits
+        columns: districts columns to set
+        rows: (nces_id, *values) tuples
 
-        for row in reader:
-            if len(row) > max(LEAID_COL, GSLO_COL, GSHI_COL):
-                leaid = normalize_nces_id(row[LEAID_COL].strip())
-                gslo = normalize_grade(row[GSLO_COL])
-                gshi = normalize_grade(row[GSHI_COL])
+    Returns:
+        Number of rows sent
+    """
+    from psycopg2.extras import execute_values
 
-                if leaid and gslo and gshi:
-                    grade_spans[leaid] = (gslo, gshi)
+    if not rows:
+        return 0
 
-    return grade_spans
+    cursor = session.connection().connection.cursor()
+    try:
+        execute_values(cursor, district_update_sql(columns), rows, page_size=UPDATE_PAGE_SIZE)
+    finally:
+        cursor.close()
+    return len(rows)
 
 
 def import_urls(dry_run: bool = False):
@@ -133,7 +183,7 @@ def import_urls(dry_run: bool = False):
             if nces_id in urls:
                 new_url = urls[nces_id]
                 if existing_url != new_url:
-                    updates.append((new_url, nces_id))
+                    updates.append((nces_id, new_url))
                     updated += 1
                 else:
                     already_set += 1
@@ -142,11 +192,7 @@ def import_urls(dry_run: bool = False):
 
         # Execute batch update
         if not dry_run and updates:
-            for url, nces_id in updates:
-                session.execute(
-                    text("UPDATE districts SET website_url = :url WHERE nces_id = :id"),
-                    {"url": url, "id": nces_id}
-                )
+            update_districts(session, ["website_url"], updates)
             session.commit()
             print(f"Committed {len(updates)} updates")
         elif dry_run:
@@ -163,7 +209,7 @@ def import_urls(dry_run: bool = False):
     # Sample of updated URLs
     if updates and not dry_run:
         print("\nSample updated URLs:")
-        for url, nces_id in updates[:5]:
+        for nces_id, url in updates[:5]:
             print(f"  {nces_id}: {url}")
 
 
@@ -189,7 +235,7 @@ def import_grade_spans(dry_run: bool = False):
             if nces_id in grade_spans:
                 new_low, new_high = grade_spans[nces_id]
                 if existing_low != new_low or existing_high != new_high:
-                    updates.append((new_low, new_high, nces_id))
+                    updates.append((nces_id, new_low, new_high))
                     updated += 1
                 else:
                     already_set += 1
@@ -198,11 +244,7 @@ def import_grade_spans(dry_run: bool = False):
 
         # Execute batch update
         if not dry_run and updates:
-            for gslo, gshi, nces_id in updates:
-                session.execute(
-                    text("UPDATE districts SET grade_span_low = :gslo, grade_span_high = :gshi WHERE nces_id = :id"),
-                    {"gslo": gslo, "gshi": gshi, "id": nces_id}
-                )
+            update_districts(session, ["grade_span_low", "grade_span_high"], updates)
             session.commit()
             print(f"Committed {len(updates)} updates")
         elif dry_run:
@@ -219,7 +261,7 @@ def import_grade_spans(dry_run: bool = False):
     # Sample of updated grade spans
     if updates and not dry_run:
         print("\nSample updated grade spans:")
-        for gslo, gshi, nces_id in updates[:5]:
+        for nces_id, gslo, gshi in updates[:5]:
             print(f"  {nces_id}: {gslo} - {gshi}")
 
 
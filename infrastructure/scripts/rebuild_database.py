@@ -7,40 +7,62 @@ It coordinates all import scripts in the correct order with verification gates.
 
 Phases:
 1. Reset database (preserve schema)
-2. Load foundation tables (state requirements)
-3. Load districts from NCES CCD
-4. Load staff counts and enrollment
-5. Load SPED baseline data
-6. Apply SPED estimates
-7. Import bell schedules (if available)
-8. Calculate LCT variants
+2. Load foundation tables (state requirements, districts, URLs)
+3. Load staff counts and enrollment (with --sea: state SEA imports and the
+   SEA precedence merge)
+4. Load SPED baseline data
+5. Apply SPED estimates
+6. Import bell schedules (if available)
+7. Calculate LCT variants
+
+Each phase is split into import tasks with explicit dependencies. Tasks whose
+dependencies are done run concurrently (the per-state SEA importers touch
+disjoint tables, and SPED baseline / bell schedules don't wait for staff
+data). SEA tasks are non-blocking: an importer whose state files are missing
+fails on its own without stopping the merge or the LCT calculation. Task
+status, per-phase durations and row counts are saved to
+data/processed/pipeline_state/rebuild_database.json as the run progresses, so
+a failed rebuild can be resumed without redoing completed tasks. At the end
+of the run the per-phase durations and row counts are also written to the
+rebuild_phase_runs table (migration 018) for comparison across rebuilds.
 
 Usage:
     python infrastructure/scripts/rebuild_database.py [--phase N] [--skip-reset] [--dry-run]
 
 Options:
-    --phase N       Start from phase N (1-8)
+    --phase N       Start from phase N (1-7)
     --skip-reset    Skip database reset (for incremental runs)
     --skip-lct      Skip LCT calculation
+    --sea           Also run the state SEA imports and precedence merge
     --dry-run       Preview without making changes
     --sample N      Limit records for testing
+    --workers N     Maximum concurrent import tasks (default: 4)
+    --resume        Skip tasks completed by the previous (failed) run
 
 Author: Claude (AI Assistant)
 Date: January 24, 2026
 """
 
 import argparse
+import json
 import subprocess
 import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import Callable, Dict, List, Optional
 
 # Add project root to path
 project_root = Path(__file__).resolve().parent.parent.parent
 sys.path.insert(0, str(project_root))
 
 from infrastructure.database.connection import session_scope, get_engine
+from infrastructure.database.models import RebuildPhaseRun
 from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
 
 
 # Script paths (relative to project root)
@@ -53,17 +75,87 @@ SCRIPTS = {
     "apply_sped_estimates": "infrastructure/database/migrations/apply_sped_estimates.py",
     "import_manual_schedules": "infrastructure/scripts/enrich/import_manual_bell_schedules.py",
     "calculate_lct": "infrastructure/scripts/analyze/calculate_lct_variants.py",
+    "merge_sea_precedence": "infrastructure/database/migrations/merge_sea_precedence.py",
 }
 
+# Per-state SEA importers: task name -> (script, tasks it must wait for
+# besides the foundation import). Each writes only its own <st>_* tables.
+SEA_IMPORTS = {
+    "sea_fl": ("infrastructure/database/migrations/import_florida_data.py", []),
+    "sea_il": ("infrastructure/database/migrations/import_illinois_data.py", []),
+    "sea_ma": ("infrastructure/database/migrations/import_massachusetts_data.py", []),
+    "sea_mi": ("infrastructure/database/migrations/import_michigan_data.py", []),
+    "sea_ny": ("infrastructure/database/migrations/import_new_york_data.py", []),
+    "sea_pa": ("infrastructure/database/migrations/import_pennsylvania_data.py", []),
+    "sea_va": ("infrastructure/database/migrations/import_virginia_data.py", []),
+    "sea_tx_crosswalk": ("infrastructure/database/migrations/import_tx_crosswalk.py", []),
+    "sea_tx": ("infrastructure/database/migrations/import_texas_tapr_data.py", ["sea_tx_crosswalk"]),
+    "sea_ca_staff": ("infrastructure/database/migrations/import_california_staff_data.py", []),
+    "sea_ca_frpm": ("infrastructure/database/migrations/import_ca_frpm.py", []),
+    "sea_ca_lcff": ("infrastructure/database/migrations/import_ca_lcff.py", []),
+    "sea_ca_sped": ("infrastructure/database/migrations/import_ca_sped.py", []),
+}
+
+PHASE_NAMES = {
+    1: "Reset",
+    2: "Foundation",
+    3: "Staff/Enrollment",
+    4: "SPED Baseline",
+    5: "SPED Estimates",
+    6: "Bell Schedules",
+    7: "LCT Calculation",
+}
+
+# Tables whose row counts are recorded when a phase completes
+PHASE_TABLES = {
+    2: ["districts", "state_requirements"],
+    3: ["staff_counts", "staff_counts_effective", "enrollment_by_grade"],
+    4: ["sped_state_baseline", "sped_lea_baseline"],
+    5: ["sped_estimates"],
+    6: ["bell_schedules"],
+    7: ["lct_calculations"],
+}
+
+# Tasks that write each counted table. A table is counted only once all of
+# its writers in the graph have finished, since concurrent tasks from other
+# phases may still be inserting rows when its phase completes.
+TABLE_WRITERS = {
+    "districts": ["import_all", "import_district_urls", "sea_tx_crosswalk"],
+    "state_requirements": ["import_all"],
+    "staff_counts": ["import_staff_enrollment"],
+    "staff_counts_effective": ["import_staff_enrollment", "merge_sea_precedence"],
+    "enrollment_by_grade": ["import_staff_enrollment"],
+    "sped_state_baseline": ["import_sped_baseline"],
+    "sped_lea_baseline": ["import_sped_baseline"],
+    "sped_estimates": ["apply_sped_estimates"],
+    "bell_schedules": ["import_all", "import_manual_schedules"],
+    "lct_calculations": ["calculate_lct"],
+}
+
+STATE_FILE = project_root / "data" / "processed" / "pipeline_state" / "rebuild_database.json"
+
+# Keeps output lines from concurrent tasks from interleaving mid-line
+_print_lock = threading.Lock()
+
+
+def log(message: str):
+    """Print a line without interleaving with concurrent tasks."""
+    with _print_lock:
+        print(message, flush=True)
+
 
-def run_script(script_path: str, args: list = None, dry_run: bool = False) -> bool:
+def run_script(script_path: str, args: list = None, dry_run: bool = False, label: str = None) -> bool:
     """
     Run a Python script and return success/failure.
 
+    Output is streamed line by line, prefixed with the task label so
+    concurrent imports stay readable.
+
     Args:
         script_path: Path to script relative to project root
         args: Additional command line arguments
         dry_run: If True, print command but don't execute
+        label: Prefix for output lines (default: script name)
 
     Returns:
         True if successful, False otherwise
@@ -72,22 +164,35 @@ def run_script(script_path: str, args: list = None, dry_run: bool = False) -> bo
     cmd = ["python3", str(full_path)]
     if args:
         cmd.extend(args)
+    label = label or full_path.stem
 
-    print(f"\n{'DRY RUN: ' if dry_run else ''}Running: {' '.join(cmd)}")
+    log(f"\n{'DRY RUN: ' if dry_run else ''}[{label}] Running: {' '.join(cmd)}")
 
     if dry_run:
         return True
 
-    try:
-        result = subprocess.run(cmd, check=True, capture_output=False)
-        return result.returncode == 0
-    except subprocess.CalledProcessError as e:
-        print(f"Error running {script_path}: {e}")
+    if not full_path.exists():
+        log(f"Script not found: {full_path}")
         return False
+
+    try:
+        process = subprocess.Popen(
+            cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1
+        )
     except FileNotFoundError:
-        print(f"Script not found: {full_path}")
+        log(f"Script not found: {full_path}")
         return False
 
+    with process.stdout:
+        for line in process.stdout:
+            log(f"[{label}] {line.rstrip()}")
+
+    returncode = process.wait()
+    if returncode != 0:
+        log(f"Error running {script_path}: exit code {returncode}")
+        return False
+    return True
+
 
 def verify_table_counts(session, expected: dict = None) -> dict:
     """Get current table counts."""
@@ -120,99 +225,382 @@ def print_counts(counts: dict, phase: str = ""):
             print(f"  {table}: {count}")
 
 
-def phase_1_reset(dry_run: bool = False) -> bool:
-    """Phase 1: Reset database (preserve schema)."""
-    print("\n" + "=" * 60)
-    print("PHASE 1: RESET DATABASE")
-    print("=" * 60)
-
-    return run_script(SCRIPTS["reset"], ["--force", "--no-backup"], dry_run=dry_run)
-
-
-def phase_2_foundation(dry_run: bool = False) -> bool:
-    """Phase 2: Load foundation tables (state requirements, districts)."""
-    print("\n" + "=" * 60)
-    print("PHASE 2: LOAD FOUNDATION DATA")
-    print("=" * 60)
-
-    # import_all_data handles state requirements, districts, crosswalk
-    args = []
-    if dry_run:
-        args.append("--dry-run")
-
-    if not run_script(SCRIPTS["import_all"], args, dry_run=False):  # Script handles dry-run internally
-        return False
-
-    # Import district website URLs and grade spans from NCES CCD
-    print("\nImporting district URLs and grade spans...")
-    url_args = []
-    if dry_run:
-        url_args.append("--dry-run")
-    return run_script(SCRIPTS["import_district_urls"], url_args, dry_run=dry_run)
-
-
-def phase_3_staff_enrollment(dry_run: bool = False, year: str = "2023-24") -> bool:
-    """Phase 3: Load staff counts and enrollment."""
-    print("\n" + "=" * 60)
-    print("PHASE 3: LOAD STAFF COUNTS AND ENROLLMENT")
-    print("=" * 60)
-
-    args = ["--year", year]
-    return run_script(SCRIPTS["import_staff_enrollment"], args, dry_run=dry_run)
-
-
-def phase_4_sped_baseline(dry_run: bool = False, sample: int = None) -> bool:
-    """Phase 4: Load SPED baseline data."""
-    print("\n" + "=" * 60)
-    print("PHASE 4: LOAD SPED BASELINE DATA")
-    print("=" * 60)
-
-    args = []
-    if sample:
-        args.extend(["--sample", str(sample)])
-
-    return run_script(SCRIPTS["import_sped_baseline"], args, dry_run=dry_run)
-
+@dataclass
+class RebuildTask:
+    """
+    One import script in the rebuild graph.
+
+    Attributes:
+        name: Unique task name (used for resume state)
+        phase: Phase number (1-7) the task belongs to
+        script: Script path relative to project root
+        args: Command line arguments
+        after: Task names that must complete first
+        optional: Missing script is skipped instead of failing the rebuild
+        blocking: False if a failure should be reported without blocking the
+            tasks that depend on it (or failing the rebuild)
+        handles_dry_run: Script takes --dry-run and is executed in dry-run mode
+    """
+    name: str
+    phase: int
+    script: str
+    args: List[str] = field(default_factory=list)
+    after: List[str] = field(default_factory=list)
+    optional: bool = False
+    blocking: bool = True
+    handles_dry_run: bool = False
+
+
+def build_tasks(
+    year: str = "2023-24",
+    sample: int = None,
+    start_phase: int = 1,
+    skip_reset: bool = False,
+    skip_lct: bool = False,
+    sea: bool = False,
+) -> List[RebuildTask]:
+    """
+    Build the rebuild task graph.
 
-def phase_5_sped_estimates(dry_run: bool = False) -> bool:
-    """Phase 5: Apply SPED estimates."""
-    print("\n" + "=" * 60)
-    print("PHASE 5: APPLY SPED ESTIMATES")
-    print("=" * 60)
+    Tasks excluded by the options are dropped, and dependencies on them are
+    treated as already satisfied. State SEA imports and the precedence merge
+    only run with sea=True.
 
-    # Check if script exists
-    script_path = project_root / SCRIPTS["apply_sped_estimates"]
-    if not script_path.exists():
-        print(f"Script not found: {SCRIPTS['apply_sped_estimates']}")
-        print("Skipping SPED estimates (script may need to be created)")
+    Returns:
+        List of RebuildTask in declaration order
+    """
+    sea_tasks = [
+        RebuildTask(name, 3, script, after=["import_all"] + deps, blocking=False)
+        for name, (script, deps) in SEA_IMPORTS.items()
+    ]
+    sped_args = ["--sample", str(sample)] if sample else []
+
+    tasks = [
+        RebuildTask("reset", 1, SCRIPTS["reset"], ["--force", "--no-backup"]),
+        # import_all_data handles state requirements, districts, crosswalk
+        RebuildTask("import_all", 2, SCRIPTS["import_all"], after=["reset"], handles_dry_run=True),
+        # District website URLs and grade spans from NCES CCD
+        RebuildTask("import_district_urls", 2, SCRIPTS["import_district_urls"], after=["import_all"]),
+        RebuildTask("import_staff_enrollment", 3, SCRIPTS["import_staff_enrollment"],
+                    ["--year", year], after=["import_all"]),
+        *sea_tasks,
+        RebuildTask("merge_sea_precedence", 3, SCRIPTS["merge_sea_precedence"], ["--year", year],
+                    after=["import_staff_enrollment"] + [t.name for t in sea_tasks], blocking=False),
+        RebuildTask("import_sped_baseline", 4, SCRIPTS["import_sped_baseline"], sped_args,
+                    after=["import_all"]),
+        RebuildTask("apply_sped_estimates", 5, SCRIPTS["apply_sped_estimates"],
+                    after=["import_sped_baseline", "import_staff_enrollment", "merge_sea_precedence"],
+                    optional=True),
+        RebuildTask("import_manual_schedules", 6, SCRIPTS["import_manual_schedules"],
+                    after=["import_district_urls"], optional=True),
+    ]
+    tasks.append(RebuildTask(
+        "calculate_lct", 7, SCRIPTS["calculate_lct"],
+        after=[t.name for t in tasks if t.phase >= 2],
+    ))
+
+    def excluded(task):
+        return (
+            task.phase < start_phase
+            or (skip_reset and task.name == "reset")
+            or (skip_lct and task.name == "calculate_lct")
+            or (not sea and (task.name in SEA_IMPORTS or task.name == "merge_sea_precedence"))
+        )
+
+    kept = [t for t in tasks if not excluded(t)]
+    names = {t.name for t in kept}
+    for task in kept:
+        task.after = [dep for dep in task.after if dep in names]
+    return kept
+
+
+def run_task(task: RebuildTask, dry_run: bool = False) -> bool:
+    """Run one task's script, honoring dry-run and optional scripts."""
+    if task.optional and not (project_root / task.script).exists():
+        log(f"Script not found: {task.script}")
+        log(f"Skipping {task.name} (script may need to be created)")
         return True  # Don't fail the whole rebuild
 
-    return run_script(SCRIPTS["apply_sped_estimates"], dry_run=dry_run)
-
-
-def phase_6_bell_schedules(dry_run: bool = False) -> bool:
-    """Phase 6: Import bell schedules."""
-    print("\n" + "=" * 60)
-    print("PHASE 6: IMPORT BELL SCHEDULES")
-    print("=" * 60)
+    if dry_run and task.handles_dry_run:
+        # Script handles dry-run internally
+        return run_script(task.script, task.args + ["--dry-run"], label=task.name)
+    return run_script(task.script, task.args, dry_run=dry_run, label=task.name)
 
-    # Check if script exists
-    script_path = project_root / SCRIPTS["import_manual_schedules"]
-    if not script_path.exists():
-        print(f"Script not found: {SCRIPTS['import_manual_schedules']}")
-        print("Skipping manual bell schedule import")
-        return True  # Don't fail the whole rebuild
 
-    return run_script(SCRIPTS["import_manual_schedules"], dry_run=dry_run)
+class RebuildScheduler:
+    """
+    Run rebuild tasks in dependency order with bounded concurrency.
 
+    Progress is saved after every task so a failed rebuild can be resumed.
+    Bookkeeping happens on the calling thread; only scripts run on the pool.
+    """
 
-def phase_7_calculate_lct(dry_run: bool = False) -> bool:
-    """Phase 7: Calculate LCT variants."""
-    print("\n" + "=" * 60)
-    print("PHASE 7: CALCULATE LCT VARIANTS")
-    print("=" * 60)
+    def __init__(
+        self,
+        tasks: List[RebuildTask],
+        workers: int = 4,
+        dry_run: bool = False,
+        state_path: Path = STATE_FILE,
+        run_options: Dict = None,
+        resume: bool = False,
+        runner: Callable[[RebuildTask, bool], bool] = run_task,
+        count_rows: Optional[Callable[[List[str]], Dict]] = None,
+        table_writers: Dict[str, List[str]] = TABLE_WRITERS,
+    ):
+        """
+        Args:
+            tasks: Tasks from build_tasks()
+            workers: Maximum concurrent tasks
+            dry_run: Preview without making changes (state is not saved)
+            state_path: JSON file for task status and phase report
+            run_options: Options recorded with the state (year, sample, ...)
+            resume: Skip tasks completed by the previous run
+            runner: Callable(task, dry_run) -> bool
+            count_rows: Callable(tables) -> {table: count}, called for a
+                completed phase's tables once their writers have finished
+            table_writers: {table: task names that write it}
+        """
+        self.tasks = {t.name: t for t in tasks}
+        for task in tasks:
+            unknown = set(task.after) - set(self.tasks)
+            if unknown:
+                raise ValueError(f"Task {task.name!r} depends on unknown task(s): {sorted(unknown)}")
+
+        self.workers = max(1, workers)
+        self.dry_run = dry_run
+        self.state_path = Path(state_path)
+        self.run_options = run_options or {}
+        self.runner = runner
+        self.count_rows = count_rows
+        self.table_writers = table_writers
+        self.run_id = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+        self.status: Dict[str, str] = {}
+        self.durations: Dict[str, float] = {}
+        self.phases: Dict[int, Dict] = {}
+        self.resumed: List[str] = []
+        self._phases_finished = set()
+
+        if resume:
+            self._load_previous()
+
+    def _load_previous(self):
+        if not self.state_path.exists():
+            log(f"No previous rebuild state at {self.state_path}; running all tasks")
+            return
+
+        with open(self.state_path) as f:
+            previous = json.load(f)
+
+        if previous.get("options") != self.run_options:
+            log(f"WARNING: Resuming a run started with different options: {previous.get('options')}")
+        self.run_id = previous.get("run_id", self.run_id)
+
+        for name, info in previous.get("tasks", {}).items():
+            if name in self.tasks and info.get("status") == "completed":
+                self.status[name] = "completed"
+                self.durations[name] = info.get("seconds", 0.0)
+                self.resumed.append(name)
+        for phase, info in previous.get("phases", {}).items():
+            # Tables whose writers rerun are counted again
+            if "rows" in info:
+                info["rows"] = {t: n for t, n in info["rows"].items() if self._writers_done(t)}
+            self.phases[int(phase)] = info
+
+    def _save(self):
+        if self.dry_run:
+            return
+        state = {
+            "run_id": self.run_id,
+            "options": self.run_options,
+            "updated_at": datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ'),
+            "tasks": {
+                name: {
+                    "phase": self.tasks[name].phase,
+                    "status": status,
+                    "seconds": round(self.durations.get(name, 0.0), 2),
+                }
+                for name, status in self.status.items()
+            },
+            "phases": {str(p): info for p, info in sorted(self.phases.items())},
+        }
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.state_path.with_suffix(".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(state, f, indent=2)
+        tmp_path.replace(self.state_path)
+
+    def _timed(self, task: RebuildTask):
+        start = time.perf_counter()
+        try:
+            ok = bool(self.runner(task, self.dry_run))
+        except Exception as e:  # Reported as a failed task, not a crash
+            log(f"ERROR: {task.name} raised {type(e).__name__}: {e}")
+            ok = False
+        return ok, start, time.perf_counter()
+
+    def _dependency_status(self, name: str) -> Optional[str]:
+        """Status as seen by dependents: non-blocking failures count as done."""
+        status = self.status.get(name)
+        if status == "failed" and not self.tasks[name].blocking:
+            return "completed"
+        return status
+
+    def _writers_done(self, table: str) -> bool:
+        """True once every task in the graph that writes table has finished."""
+        return all(
+            self.status.get(name) in ("completed", "failed", "blocked")
+            for name in self.table_writers.get(table, []) if name in self.tasks
+        )
+
+    def _count_finished_tables(self):
+        """Record row counts for completed phases' tables whose writers are all done."""
+        if not self.count_rows or self.dry_run:
+            return
+        for phase in sorted(self._phases_finished):
+            rows = self.phases[phase].setdefault("rows", {}) if phase in PHASE_TABLES else {}
+            ready = [t for t in PHASE_TABLES.get(phase, []) if t not in rows and self._writers_done(t)]
+            if ready:
+                rows.update(self.count_rows(ready))
+
+    def _finish_phase(self, phase: int):
+        tasks = [t for t in self.tasks.values() if t.phase == phase]
+        statuses = [self.status.get(t.name) for t in tasks]
+        if phase in self._phases_finished or any(s is None or s == "running" for s in statuses):
+            return
+        self._phases_finished.add(phase)
+
+        info = self.phases.setdefault(phase, {})
+        if all(s == "completed" for s in statuses):
+            info["status"] = "completed"
+        elif all(self._dependency_status(t.name) == "completed" for t in tasks):
+            info["status"] = "partial"
+        else:
+            info["status"] = "failed"
+
+        log(f"\n--- Phase {phase} ({PHASE_NAMES[phase]}) {info['status']}"
+            f" in {info.get('seconds', 0.0):.1f}s ---")
+
+    def run(self) -> bool:
+        """
+        Run all remaining tasks.
+
+        Returns:
+            True if every blocking task completed
+        """
+        pending = [name for name in self.tasks if name not in self.status]
+        phase_spans = {}
+        running = {}
+
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            while pending or running:
+                for name in list(pending):
+                    task = self.tasks[name]
+                    deps = [self._dependency_status(d) for d in task.after]
+                    if any(s in ("failed", "blocked") for s in deps):
+                        pending.remove(name)
+                        self.status[name] = "blocked"
+                        log(f"\nERROR: {name} blocked (upstream task failed)")
+                        self._finish_phase(task.phase)
+                        continue
+                    if not all(s == "completed" for s in deps):
+                        continue
+
+                    pending.remove(name)
+                    self.status[name] = "running"
+                    running[pool.submit(self._timed, task)] = name
+
+                if not running:
+                    continue
+
+                finished, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                for future in finished:
+                    name = running.pop(future)
+                    task = self.tasks[name]
+                    ok, started, ended = future.result()
+
+                    self.status[name] = "completed" if ok else "failed"
+                    self.durations[name] = ended - started
+                    if not ok and task.blocking:
+                        log(f"\nERROR: {name} (phase {task.phase}) failed")
+                    elif not ok:
+                        log(f"\nWARNING: {name} (phase {task.phase}) failed; continuing without it")
+
+                    # Phase duration is wall clock from first task start to last task end
+                    span = phase_spans.setdefault(task.phase, [started, ended])
+                    span[0], span[1] = min(span[0], started), max(span[1], ended)
+                    info = self.phases.setdefault(task.phase, {})
+                    info["seconds"] = round(span[1] - span[0], 2)
+                    info["tasks"] = len([t for t in self.tasks.values() if t.phase == task.phase])
+
+                    self._finish_phase(task.phase)
+                    self._count_finished_tables()
+                    self._save()
+
+        self._count_finished_tables()
+        self._save()
+        return all(self._dependency_status(name) == "completed" for name in self.status)
+
+    def report(self) -> str:
+        """Format per-phase durations and row counts as a table."""
+        lines = [
+            f"{'Phase':<22} {'Tasks':>5}  {'Status':<10} {'Seconds':>8}  Rows",
+            "-" * 72,
+        ]
+        for phase in sorted({t.phase for t in self.tasks.values()}):
+            info = self.phases.get(phase, {})
+            names = [t.name for t in self.tasks.values() if t.phase == phase]
+            done = sum(1 for n in names if self.status.get(n) == "completed")
+            rows = ", ".join(
+                f"{table}={count:,}" if isinstance(count, int) else f"{table}={count}"
+                for table, count in info.get("rows", {}).items()
+            )
+            lines.append(
+                f"{str(phase) + ' ' + PHASE_NAMES[phase]:<22} {f'{done}/{len(names)}':>5}  "
+                f"{info.get('status', 'pending'):<10} {info.get('seconds', 0.0):>8.1f}  {rows}"
+            )
+
+        lines.append("-" * 72)
+        slowest = sorted(self.durations.items(), key=lambda kv: kv[1], reverse=True)[:5]
+        if slowest:
+            lines.append("Slowest tasks: " + ", ".join(f"{n} ({s:.1f}s)" for n, s in slowest))
+        skipped = [n for n, st in self.status.items() if st == "failed" and not self.tasks[n].blocking]
+        if skipped:
+            lines.append(f"Failed, continued without: {', '.join(skipped)}")
+        if self.resumed:
+            lines.append(f"Resumed (not rerun): {', '.join(self.resumed)}")
+        return "\n".join(lines)
+
+
+def record_phase_runs(scheduler: RebuildScheduler) -> int:
+    """
+    Upsert the scheduler's per-phase durations and row counts into rebuild_phase_runs.
 
-    return run_script(SCRIPTS["calculate_lct"], dry_run=dry_run)
+    Returns:
+        Number of phases recorded
+    """
+    with session_scope() as session:
+        RebuildPhaseRun.__table__.create(session.connection(), checkfirst=True)
+        for phase, info in sorted(scheduler.phases.items()):
+            session.merge(RebuildPhaseRun(
+                run_id=scheduler.run_id,
+                phase=phase,
+                phase_name=PHASE_NAMES[phase],
+                status=info.get("status", "pending"),
+                tasks=info.get("tasks"),
+                seconds=info.get("seconds"),
+                row_counts=info.get("rows"),
+                options=scheduler.run_options,
+                recorded_at=datetime.now(timezone.utc),
+            ))
+    return len(scheduler.phases)
+
+
+def count_tables(tables: List[str]) -> Dict:
+    """Row counts for the given tables."""
+    with session_scope() as session:
+        counts = verify_table_counts(session)
+    return {table: counts.get(table, "N/A") for table in tables}
 
 
 def main():
@@ -235,6 +623,11 @@ def main():
         action="store_true",
         help="Skip LCT calculation"
     )
+    parser.add_argument(
+        "--sea",
+        action="store_true",
+        help="Also run the state SEA imports and the SEA precedence merge (needs the state data files)"
+    )
     parser.add_argument(
         "--dry-run",
         action="store_true",
@@ -250,6 +643,17 @@ def main():
         default="2023-24",
         help="School year for staff/enrollment data"
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="Maximum concurrent import tasks (default: 4)"
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Skip tasks completed by the previous run (e.g. after a failure)"
+    )
 
     args = parser.parse_args()
 
@@ -263,112 +667,55 @@ def main():
     print(f"Dry run: {args.dry_run}")
     print(f"Skip reset: {args.skip_reset}")
     print(f"Skip LCT: {args.skip_lct}")
+    print(f"SEA imports: {args.sea}")
+    print(f"Workers: {args.workers}")
+    print(f"Resume: {args.resume}")
 
     # Show initial state
     with session_scope() as session:
         counts = verify_table_counts(session)
         print_counts(counts, "Initial State")
 
-    success = True
-    phases_completed = []
-
-    # Phase 1: Reset
-    if start_phase <= 1 and not args.skip_reset:
-        if not phase_1_reset(args.dry_run):
-            print("\nERROR: Phase 1 (Reset) failed")
-            success = False
-        else:
-            phases_completed.append("1-Reset")
+    tasks = build_tasks(
+        year=args.year,
+        sample=args.sample,
+        start_phase=start_phase,
+        skip_reset=args.skip_reset,
+        skip_lct=args.skip_lct,
+        sea=args.sea,
+    )
+    scheduler = RebuildScheduler(
+        tasks,
+        workers=args.workers,
+        dry_run=args.dry_run,
+        run_options={"year": args.year, "sample": args.sample, "sea": args.sea},
+        resume=args.resume,
+        count_rows=count_tables,
+    )
+    success = scheduler.run()
 
-    # Phase 2: Foundation
-    if success and start_phase <= 2:
-        if not phase_2_foundation(args.dry_run):
-            print("\nERROR: Phase 2 (Foundation) failed")
-            success = False
-        else:
-            phases_completed.append("2-Foundation")
-
-            # Verify checkpoint
-            if not args.dry_run:
-                with session_scope() as session:
-                    counts = verify_table_counts(session)
-                    if counts.get("districts", 0) < 17000:
-                        print(f"\nWARNING: Expected ~17,842 districts, got {counts.get('districts', 0)}")
-                    print_counts(counts, "Phase 2")
-
-    # Phase 3: Staff/Enrollment
-    if success and start_phase <= 3:
-        if not phase_3_staff_enrollment(args.dry_run, args.year):
-            print("\nERROR: Phase 3 (Staff/Enrollment) failed")
-            success = False
-        else:
-            phases_completed.append("3-Staff/Enrollment")
-
-            # Verify checkpoint
-            if not args.dry_run:
-                with session_scope() as session:
-                    counts = verify_table_counts(session)
-                    print_counts(counts, "Phase 3")
-
-    # Phase 4: SPED Baseline
-    if success and start_phase <= 4:
-        if not phase_4_sped_baseline(args.dry_run, args.sample):
-            print("\nERROR: Phase 4 (SPED Baseline) failed")
-            success = False
-        else:
-            phases_completed.append("4-SPED Baseline")
-
-            # Verify checkpoint
-            if not args.dry_run:
-                with session_scope() as session:
-                    counts = verify_table_counts(session)
-                    print_counts(counts, "Phase 4")
-
-    # Phase 5: SPED Estimates
-    if success and start_phase <= 5:
-        if not phase_5_sped_estimates(args.dry_run):
-            print("\nERROR: Phase 5 (SPED Estimates) failed")
-            success = False
-        else:
-            phases_completed.append("5-SPED Estimates")
-
-            # Verify checkpoint
-            if not args.dry_run:
-                with session_scope() as session:
-                    counts = verify_table_counts(session)
-                    print_counts(counts, "Phase 5")
-
-    # Phase 6: Bell Schedules
-    if success and start_phase <= 6:
-        if not phase_6_bell_schedules(args.dry_run):
-            print("\nERROR: Phase 6 (Bell Schedules) failed")
-            success = False
-        else:
-            phases_completed.append("6-Bell Schedules")
-
-            # Verify checkpoint
-            if not args.dry_run:
-                with session_scope() as session:
-                    counts = verify_table_counts(session)
-                    print_counts(counts, "Phase 6")
-
-    # Phase 7: Calculate LCT
-    if success and start_phase <= 7 and not args.skip_lct:
-        if not phase_7_calculate_lct(args.dry_run):
-            print("\nERROR: Phase 7 (LCT Calculation) failed")
-            success = False
-        else:
-            phases_completed.append("7-LCT Calculation")
+    # Verify checkpoint
+    districts = scheduler.phases.get(2, {}).get("rows", {}).get("districts")
+    if isinstance(districts, int) and districts < 17000:
+        print(f"\nWARNING: Expected ~17,842 districts, got {districts}")
 
     # Final summary
     print("\n" + "=" * 60)
     print("REBUILD SUMMARY")
     print("=" * 60)
     print(f"Completed: {datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')}")
-    print(f"Phases completed: {', '.join(phases_completed) if phases_completed else 'None'}")
+    print(scheduler.report())
     print(f"Status: {'SUCCESS' if success else 'FAILED'}")
+    if not success and not args.dry_run:
+        print(f"Fix the failure, then rerun with --resume (state: {scheduler.state_path})")
 
     if not args.dry_run:
+        try:
+            recorded = record_phase_runs(scheduler)
+            print(f"Recorded {recorded} phases in rebuild_phase_runs (run {scheduler.run_id})")
+        except SQLAlchemyError as e:
+            print(f"WARNING: Could not record phase runs in the database: {e}")
+
         with session_scope() as session:
             counts = verify_table_counts(session)
             print_counts(counts, "Final State")
@@ -10,12 +10,17 @@ This script combines the three core NCES CCD files for a given year:
 Output is a single CSV with one row per district containing all needed data for LCT calculation.
 """
 
-import pandas as pd
 import argparse
 import logging
 from pathlib import Path
 import sys
 
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from infrastructure.utilities.ccd_parquet_cache import read_ccd
+
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
@@ -35,12 +40,12 @@ def merge_nces_ccd_files(directory_file, membership_file, staff_file, output_fil
 
     # Read directory file
     logger.info(f"Reading directory: {directory_file}")
-    directory = pd.read_csv(directory_file)
+    directory = read_ccd(directory_file)
     logger.info(f"  Loaded {len(directory):,} districts")
 
     # Read membership file and get total enrollment
     logger.info(f"Reading membership: {membership_file}")
-    membership = pd.read_csv(membership_file)
+    membership = read_ccd(membership_file)
     logger.info(f"  Loaded {len(membership):,} membership records")
 
     # Filter for total enrollment (Education Unit Total)
@@ -52,7 +57,7 @@ def merge_nces_ccd_files(directory_file, membership_file, staff_file, output_fil
 
     # Read staff file and get total teachers
     logger.info(f"Reading staff: {staff_file}")
-    staff = pd.read_csv(staff_file)
+    staff = read_ccd(staff_file)
     logger.info(f"  Loaded {len(staff):,} staff records")
 
     # Filter for teachers (Derived - Major Staffing Category)
@@ -18,36 +18,42 @@ Usage:
     python district_lookup.py --search "County" --state AL
 """
 
-import pandas as pd
 import argparse
 import sys
 from pathlib import Path
-from difflib import get_close_matches
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
 
 
 def load_reference_data():
-    """Load the enrichment reference CSV."""
-    ref_path = Path('data/processed/normalized/enrichment_reference.csv')
+    """Load the indexed enrichment reference (Parquet snapshot of the CSV)."""
+    # Imported here (pulls in pandas) so --help and usage errors stay fast
+    from infrastructure.utilities.district_reference import REFERENCE_CSV, get_reference
 
-    if not ref_path.exists():
-        print(f"Error: Reference file not found at {ref_path}", file=sys.stderr)
+    if not REFERENCE_CSV.exists():
+        print(f"Error: Reference file not found at {REFERENCE_CSV}", file=sys.stderr)
         print("Run the normalization script first to generate this file.", file=sys.stderr)
         sys.exit(1)
 
-    df = pd.read_csv(ref_path)
-    return df
+    return get_reference(REFERENCE_CSV)
 
 
-def lookup_by_id(df, district_id):
+def lookup_by_id(ref, district_id):
     """Look up district by ID."""
-    result = df[df['district_id'].astype(str) == str(district_id)]
-    return result
+    return ref.lookup([district_id])
+
 
+def lookup_by_name(ref, name, state=None, fuzzy=True, limit=3):
+    """
+    Look up district by name with optional fuzzy matching.
 
-def lookup_by_name(df, name, state=None, fuzzy=True):
-    """Look up district by name with optional fuzzy matching."""
+    Fuzzy results are ranked by trigram similarity and carry a match_score
+    column.
+    """
     # Filter by state first if provided
-    search_df = df[df['state'] == state.upper()] if state else df
+    search_df = ref.for_state(state)
 
     # Try exact match first
     exact = search_df[search_df['district_name'].str.lower() == name.lower()]
@@ -55,18 +61,18 @@ def lookup_by_name(df, name, state=None, fuzzy=True):
         return exact
 
     # Try contains match
-    contains = search_df[search_df['district_name'].str.contains(name, case=False, na=False)]
+    contains = search_df[search_df['district_name'].str.contains(name, case=False, na=False, regex=False)]
     if not contains.empty:
         return contains
 
     # Try fuzzy match if enabled
     if fuzzy:
-        all_names = search_df['district_name'].tolist()
-        matches = get_close_matches(name, all_names, n=3, cutoff=0.6)
-        if matches:
-            return search_df[search_df['district_name'].isin(matches)]
+        candidates = ref.name_index.match(name, state, limit=limit)
+        if candidates:
+            result = ref.lookup(c.district_id for c in candidates)
+            return result.assign(match_score=[c.score for c in candidates])
 
-    return pd.DataFrame()
+    return search_df.iloc[0:0]
 
 
 def format_output(df, verbose=False):
@@ -79,6 +85,8 @@ def format_output(df, verbose=False):
         print(f"ID: {row['district_id']}")
         print(f"Name: {row['district_name']}")
         print(f"State: {row['state']}")
+        if 'match_score' in row:
+            print(f"Match Score: {row['match_score']:.2f}")
         enrollment = row.get('enrollment_total', row.get('enrollment', 0))
         print(f"Enrollment: {int(enrollment):,}")
 
@@ -90,9 +98,9 @@ def format_output(df, verbose=False):
         print()  # Blank line between results
 
 
-def search_districts(df, search_term, state=None):
+def search_districts(ref, search_term, state=None):
     """Search for districts matching a term."""
-    search_df = df[df['state'] == state.upper()] if state else df
+    search_df = ref.for_state(state)
     results = search_df[search_df['district_name'].str.contains(search_term, case=False, na=False)]
     return results
 
@@ -116,12 +124,12 @@ def main():
     args = parser.parse_args()
 
     # Load reference data
-    df = load_reference_data()
+    ref = load_reference_data()
 
     # Handle different lookup modes
     if args.district_id:
         # Lookup by ID
-        result = lookup_by_id(df, args.district_id)
+        result = lookup_by_id(ref, args.district_id)
         format_output(result, args.verbose)
 
     elif args.input_file:
@@ -138,13 +146,13 @@ def main():
                 state = parts[1] if len(parts) > 1 else None
 
                 print(f"Looking up: {name} ({state or 'any state'})")
-                result = lookup_by_name(df, name, state)
+                result = lookup_by_name(ref, name, state)
                 format_output(result, args.verbose)
                 print("-" * 50)
 
     elif args.search:
         # Search mode
-        result = search_districts(df, args.search, args.state_filter)
+        result = search_districts(ref, args.search, args.state_filter)
         print(f"Found {len(result)} districts matching '{args.search}'")
         if args.state_filter:
             print(f"in state {args.state_filter}")
@@ -153,8 +161,8 @@ def main():
 
     elif args.top and args.state_filter:
         # Top N districts in a state
-        state_df = df[df['state'] == args.state_filter.upper()]
-        enrollment_col = 'enrollment_total' if 'enrollment_total' in df.columns else 'enrollment'
+        state_df = ref.for_state(args.state_filter)
+        enrollment_col = 'enrollment_total' if 'enrollment_total' in ref.df.columns else 'enrollment'
         top_districts = state_df.nlargest(args.top, enrollment_col)
         print(f"Top {args.top} districts in {args.state_filter}:")
         print()
@@ -162,7 +170,7 @@ def main():
 
     elif args.name:
         # Name-based lookup
-        result = lookup_by_name(df, args.name, args.state)
+        result = lookup_by_name(ref, args.name, args.state)
         format_output(result, args.verbose)
 
     else:
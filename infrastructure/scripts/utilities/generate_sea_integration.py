@@ -346,7 +346,7 @@ import logging
 # Import shared SEA utilities
 from infrastructure.database.migrations.sea_import_utils import (
     safe_float, safe_int,
-    load_state_crosswalk, get_district_name,
+    load_state_crosswalk, get_state_crosswalk, StateCrosswalk, get_district_name,
     format_state_id, log_import_summary,
 )
 
@@ -367,19 +367,15 @@ STATE_CODE = '{state_code}'
 # ENROLLMENT_FILE = {state_var.upper()}_DATA_DIR / "{state_lower}_enrollment_{year.replace('-', '_')}.xlsx"
 
 
-def load_{state_var}_crosswalk(session) -> dict:
+def load_{state_var}_crosswalk(session) -> StateCrosswalk:
     """Load {state_name} crosswalk from database.
 
+    Use crosswalk.resolve(df[id_column]) to map a whole column at once.
+
     Returns:
-        Dict mapping {agency_name} state district ID -> NCES ID
+        Cached StateCrosswalk mapping {agency_name} state district ID -> NCES ID
     """
-    result = session.execute(text("""
-        SELECT state_district_id, nces_id
-        FROM state_district_crosswalk
-        WHERE state = :state
-          AND id_system = 'st_leaid'
-    """), {{"state": STATE_CODE}})
-    return {{row[0]: row[1] for row in result.fetchall()}}
+    return get_state_crosswalk(session, STATE_CODE)
 
 
 def create_{state_var}_tables():
@@ -31,15 +31,8 @@ from pathlib import Path
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
 
-from infrastructure.database.connection import session_scope
-from infrastructure.database.verification import (
-    generate_handoff_report,
-    check_audit_integrity,
-    detect_count_discrepancy,
-    validate_date_range,
-    find_lineage_gaps
-)
-from infrastructure.database.queries import get_enrichment_summary
+# Database modules (SQLAlchemy + models) are imported after argument parsing
+# so --help and usage errors return immediately.
 
 
 def main():
@@ -69,6 +62,8 @@ def main():
 
     args = parser.parse_args()
 
+    from infrastructure.database.connection import session_scope
+
     with session_scope() as session:
         if args.quick:
             run_quick_check(session, args)
@@ -82,6 +77,8 @@ def main():
 
 def run_quick_check(session, args):
     """Quick count verification"""
+    from infrastructure.database.queries import get_enrichment_summary
+
     summary = get_enrichment_summary(session, args.year)
 
     if args.json:
@@ -106,6 +103,8 @@ def run_quick_check(session, args):
 
 def run_date_range_check(session, args):
     """Check records in date range"""
+    from infrastructure.database.verification import validate_date_range
+
     start = datetime.strptime(args.date_range[0], '%Y-%m-%d')
     end = datetime.strptime(args.date_range[1], '%Y-%m-%d')
 
@@ -132,6 +131,9 @@ def run_date_range_check(session, args):
 
 def run_claim_validation(session, args):
     """Validate a specific count claim"""
+    from infrastructure.database.queries import get_enrichment_summary
+    from infrastructure.database.verification import detect_count_discrepancy
+
     summary = get_enrichment_summary(session, args.year)
     actual = summary['enriched_districts']
     claimed = args.validate_claim
@@ -162,6 +164,12 @@ def run_claim_validation(session, args):
 
 def run_full_verification(session, args):
     """Full verification report"""
+    from infrastructure.database.verification import (
+        check_audit_integrity,
+        find_lineage_gaps,
+        generate_handoff_report,
+    )
+
     report = generate_handoff_report(session)
     integrity = check_audit_integrity(session)
     gaps = find_lineage_gaps(session)
@@ -0,0 +1,487 @@
+#!/usr/bin/env python3
+"""
+Columnar Parquet cache for raw NCES CCD files
+
+The raw CCD files in data/raw/federal are large CSVs (the LEA membership
+file alone is several GB once reassembled) and every pipeline stage used to
+re-parse them. This module converts each raw CSV once into a Parquet
+dataset partitioned by state (ST) with typed columns, and records the
+conversion in a manifest keyed by the SHA-256 of the source file.
+
+Readers call read_ccd() / iter_ccd_chunks() with the original CSV path.
+When a fresh Parquet copy exists it is loaded instead of the CSV; otherwise
+the CSV is read exactly as before, so the cache is always optional.
+
+Column typing:
+- Identifier columns (LEAID, ST_LEAID, FIPST, ...) are stored as strings so
+  leading zeros survive. On read they are converted back to numbers unless
+  the caller asks for str, matching what pd.read_csv would have inferred.
+- Other columns keep the types pyarrow infers (counts become numeric).
+  If a later block contradicts those types, the file is stored with every
+  column as a string and numeric columns are converted back on read.
+
+Usage:
+    from infrastructure.utilities.ccd_parquet_cache import read_ccd
+
+    df = read_ccd(membership_file, dtype={"LEAID": str})
+
+    # One-time conversion of every raw CCD file
+    python infrastructure/utilities/ccd_parquet_cache.py
+    python infrastructure/utilities/ccd_parquet_cache.py --force
+"""
+
+import argparse
+import csv
+import hashlib
+import json
+import logging
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Union
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+RAW_CCD_DIR = PROJECT_ROOT / "data" / "raw" / "federal"
+CACHE_DIR = PROJECT_ROOT / "data" / "processed" / "parquet" / "ccd"
+MANIFEST_NAME = "manifest.json"
+
+PARTITION_COLUMN = "ST"
+ROW_NUMBER_COLUMN = "_ccd_row"
+
+# Columns that look numeric but are identifiers (leading zeros matter)
+IDENTIFIER_COLUMNS = {
+    "FIPST", "LEAID", "ST_LEAID", "STATE_AGENCY_NO", "UNION",
+    "NCESSCH", "SCHID", "ST_SCHID", "PHONE",
+}
+
+HASH_BLOCK_SIZE = 8 * 1024 * 1024
+CSV_BLOCK_SIZE = 64 * 1024 * 1024
+
+
+def file_sha256(path: Path) -> str:
+    """
+    Compute the SHA-256 of a file in large blocks
+
+    Args:
+        path: File to hash
+
+    Returns:
+        Hex digest
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def is_identifier_column(column: str) -> bool:
+    """Return True if a CCD column holds an identifier that must stay a string."""
+    name = column.upper()
+    return name in IDENTIFIER_COLUMNS or name.endswith("ZIP") or name.endswith("ZIP4")
+
+
+def csv_convert_options(header: List[str], all_strings: bool = False, schema=None):
+    """
+    pyarrow CSV conversion options for a raw CCD file
+
+    Empty fields are null in string columns too, as with pd.read_csv.
+
+    Args:
+        header: CSV column names
+        all_strings: Read every column as a string (fallback when a later
+            block contradicts the types inferred from the first)
+        schema: Arrow schema to read with instead (e.g. that of an earlier part)
+
+    Returns:
+        pyarrow.csv.ConvertOptions
+    """
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+
+    if schema is not None:
+        column_types = {col: schema.field(col).type for col in header}
+    else:
+        column_types = {col: pa.string() for col in header if all_strings or is_identifier_column(col)}
+    return pacsv.ConvertOptions(column_types=column_types, strings_can_be_null=True)
+
+
+def _source_key(csv_path: Path) -> str:
+    """Manifest lookup key for a source file (resolved absolute path)."""
+    return str(Path(csv_path).resolve())
+
+
+def load_manifest(cache_dir: Path = CACHE_DIR) -> Dict:
+    """
+    Load the conversion manifest
+
+    Returns:
+        Manifest dict with a 'files' mapping of source SHA-256 -> entry
+    """
+    manifest_path = Path(cache_dir) / MANIFEST_NAME
+    if not manifest_path.exists():
+        return {"files": {}}
+    with open(manifest_path) as f:
+        manifest = json.load(f)
+    manifest.setdefault("files", {})
+    return manifest
+
+
+def save_manifest(manifest: Dict, cache_dir: Path = CACHE_DIR):
+    """Write the manifest atomically (temp file + rename)."""
+    cache_dir = Path(cache_dir)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    manifest_path = cache_dir / MANIFEST_NAME
+    tmp_path = manifest_path.with_suffix(".json.tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    tmp_path.replace(manifest_path)
+
+
+def _find_entry(csv_path: Path, cache_dir: Path) -> Optional[Dict]:
+    """Return the manifest entry for a fresh Parquet copy of csv_path, if any."""
+    csv_path = Path(csv_path)
+    if not csv_path.exists():
+        return None
+
+    manifest = load_manifest(cache_dir)
+    source = _source_key(csv_path)
+    entries = [
+        (sha, entry) for sha, entry in manifest["files"].items()
+        if entry.get("source") == source
+    ]
+    if not entries:
+        return None
+
+    stat = csv_path.stat()
+    for sha, entry in entries:
+        if not (Path(cache_dir) / entry["parquet"]).exists():
+            continue
+        if entry.get("size") == stat.st_size and entry.get("mtime") == stat.st_mtime:
+            return entry
+        # Touched but possibly unchanged: fall back to the content hash
+        if entry.get("size") == stat.st_size and file_sha256(csv_path) == sha:
+            entry["mtime"] = stat.st_mtime
+            save_manifest(manifest, cache_dir)
+            return entry
+
+    return None
+
+
+def find_cached(csv_path: Path, cache_dir: Path = CACHE_DIR) -> Optional[Path]:
+    """
+    Find a fresh Parquet copy of a raw CSV
+
+    A copy is fresh when the manifest has an entry for this source path and
+    the source file still hashes to the manifest key. Size and mtime are
+    checked first so the common case does not rehash a multi-GB file.
+
+    Args:
+        csv_path: Original CSV path
+        cache_dir: Cache root containing the manifest
+
+    Returns:
+        Path to the Parquet dataset directory, or None if missing/stale
+    """
+    entry = _find_entry(csv_path, cache_dir)
+    if entry is None:
+        return None
+    return Path(cache_dir) / entry["parquet"]
+
+
+def _csv_batches(csv_path: Path, all_strings: bool):
+    """Stream a CSV as Arrow record batches with identifier columns as strings."""
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+
+    with open(csv_path, "r", encoding="utf-8", errors="replace", newline="") as f:
+        header = next(csv.reader(f), [])
+
+    reader = pacsv.open_csv(
+        csv_path,
+        read_options=pacsv.ReadOptions(block_size=CSV_BLOCK_SIZE),
+        convert_options=csv_convert_options(header, all_strings),
+    )
+    offset = 0
+    for batch in reader:
+        row_numbers = pa.array(range(offset, offset + batch.num_rows), type=pa.int64())
+        offset += batch.num_rows
+        yield pa.RecordBatch.from_arrays(
+            list(batch.columns) + [row_numbers],
+            names=list(batch.schema.names) + [ROW_NUMBER_COLUMN],
+        )
+
+
+def convert_to_parquet(
+    csv_path: Path,
+    cache_dir: Path = CACHE_DIR,
+    force: bool = False,
+) -> Path:
+    """
+    Convert a raw CCD CSV into a state-partitioned Parquet dataset
+
+    Args:
+        csv_path: Raw CSV file
+        cache_dir: Cache root (dataset and manifest are written here)
+        force: Reconvert even if a fresh copy exists
+
+    Returns:
+        Path to the Parquet dataset directory
+    """
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+
+    csv_path = Path(csv_path)
+    cache_dir = Path(cache_dir)
+
+    if not force:
+        cached = find_cached(csv_path, cache_dir)
+        if cached is not None:
+            logger.info(f"Parquet cache fresh, skipping: {csv_path.name}")
+            return cached
+
+    sha = file_sha256(csv_path)
+    dataset_name = f"{csv_path.stem}_{sha[:12]}"
+    dataset_dir = cache_dir / dataset_name
+
+    logger.info(f"Converting {csv_path.name} -> {dataset_dir}")
+
+    column_order: List[str] = []
+
+    def _write(all_strings: bool) -> int:
+        batches = _csv_batches(csv_path, all_strings)
+        first = next(batches, None)
+        if first is None:
+            raise ValueError(f"No rows in {csv_path}")
+
+        rows = 0
+        column_order[:] = [n for n in first.schema.names if n != ROW_NUMBER_COLUMN]
+
+        def _counted():
+            nonlocal rows
+            rows += first.num_rows
+            yield first
+            for batch in batches:
+                rows += batch.num_rows
+                yield batch
+
+        partitioning = None
+        if PARTITION_COLUMN in first.schema.names:
+            partitioning = ds.partitioning(
+                pa.schema([(PARTITION_COLUMN, first.schema.field(PARTITION_COLUMN).type)]),
+                flavor="hive",
+            )
+
+        ds.write_dataset(
+            _counted(),
+            dataset_dir,
+            schema=first.schema,
+            format="parquet",
+            partitioning=partitioning,
+            existing_data_behavior="delete_matching",
+        )
+        return rows
+
+    all_strings = False
+    try:
+        rows = _write(all_strings=False)
+    except pa.ArrowInvalid as e:
+        # A later block contradicted the types inferred from the first one
+        logger.warning(f"  Type inference failed ({e}); storing all columns as strings")
+        all_strings = True
+        rows = _write(all_strings=True)
+
+    stat = csv_path.stat()
+    schema = _open_dataset(dataset_dir).schema
+    manifest = load_manifest(cache_dir)
+    source = _source_key(csv_path)
+    manifest["files"] = {
+        k: v for k, v in manifest["files"].items() if v.get("source") != source
+    }
+    manifest["files"][sha] = {
+        "source": source,
+        "parquet": dataset_name,
+        "size": stat.st_size,
+        "mtime": stat.st_mtime,
+        "rows": rows,
+        "partitioned_by": PARTITION_COLUMN if PARTITION_COLUMN in schema.names else None,
+        "columns": [[name, str(schema.field(name).type)] for name in column_order],
+        "all_strings": all_strings,
+        "created": datetime.now(timezone.utc).isoformat(),
+    }
+    save_manifest(manifest, cache_dir)
+
+    logger.info(f"  ✓ {rows:,} rows written")
+    return dataset_dir
+
+
+def _open_dataset(dataset_dir: Path):
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+
+    partitioning = ds.partitioning(pa.schema([(PARTITION_COLUMN, pa.string())]), flavor="hive")
+    return ds.dataset(dataset_dir, format="parquet", partitioning=partitioning)
+
+
+def _dataset_filter(states: Optional[List[str]]):
+    import pyarrow.dataset as ds
+
+    if not states:
+        return None
+    return ds.field(PARTITION_COLUMN).isin([s.upper() for s in states])
+
+
+def _scan_columns(dataset, entry: Dict, columns: Optional[List[str]]) -> List[str]:
+    if columns is None:
+        # Original CSV column order (the partition column would otherwise move last)
+        return [name for name, _ in entry["columns"]]
+    missing = [c for c in columns if c not in dataset.schema.names]
+    if missing:
+        raise ValueError(f"Usecols do not match columns, columns expected but not found: {missing}")
+    return list(columns)
+
+
+def _apply_dtypes(df: pd.DataFrame, dtype, all_strings: bool = False) -> pd.DataFrame:
+    """
+    Match pd.read_csv typing and honour dtype overrides
+
+    Identifier columns are stored as strings, and so is every column of an
+    all_strings fallback copy; read_csv would have inferred numbers for
+    those that are all numeric.
+    """
+    for col in df.columns:
+        requested = dtype.get(col) if isinstance(dtype, dict) else dtype
+        if requested is str:
+            df[col] = df[col].map(lambda v: v if pd.isna(v) else str(v))
+        elif requested is not None:
+            df[col] = df[col].astype(requested)
+        elif all_strings or is_identifier_column(col):
+            try:
+                df[col] = pd.to_numeric(df[col])
+            except (ValueError, TypeError):
+                pass
+    return df
+
+
+def read_ccd(
+    csv_path: Union[str, Path],
+    columns: Optional[List[str]] = None,
+    dtype=None,
+    states: Optional[List[str]] = None,
+    cache_dir: Path = CACHE_DIR,
+) -> pd.DataFrame:
+    """
+    Read a raw CCD file, preferring its Parquet cache
+
+    Args:
+        csv_path: Original CSV path (the cache is looked up from it)
+        columns: Subset of columns to load (like read_csv usecols)
+        dtype: Type or per-column mapping (like read_csv dtype)
+        states: Optional list of ST codes to load (Parquet only)
+        cache_dir: Cache root
+
+    Returns:
+        DataFrame in original CSV row order
+    """
+    csv_path = Path(csv_path)
+    entry = _find_entry(csv_path, cache_dir)
+
+    if entry is None:
+        df = pd.read_csv(csv_path, usecols=columns, dtype=dtype, low_memory=False)
+        if states and PARTITION_COLUMN in df.columns:
+            df = df[df[PARTITION_COLUMN].isin([s.upper() for s in states])]
+        return df
+
+    logger.info(f"Reading Parquet cache for {csv_path.name}")
+    dataset = _open_dataset(Path(cache_dir) / entry["parquet"])
+    scan_columns = _scan_columns(dataset, entry, columns) + [ROW_NUMBER_COLUMN]
+    table = dataset.to_table(columns=scan_columns, filter=_dataset_filter(states))
+    table = table.sort_by(ROW_NUMBER_COLUMN).drop_columns([ROW_NUMBER_COLUMN])
+    df = table.to_pandas()
+    return _apply_dtypes(df, dtype, entry.get("all_strings", False))
+
+
+def iter_ccd_chunks(
+    csv_path: Union[str, Path],
+    chunksize: int = 100000,
+    columns: Optional[List[str]] = None,
+    dtype=None,
+    cache_dir: Path = CACHE_DIR,
+) -> Iterator[pd.DataFrame]:
+    """
+    Iterate over a raw CCD file in chunks, preferring its Parquet cache
+
+    Row order across chunks is not guaranteed when reading from Parquet;
+    callers aggregate per chunk, so only the totals matter.
+
+    Yields:
+        DataFrame chunks of at most roughly `chunksize` rows
+    """
+    csv_path = Path(csv_path)
+    entry = _find_entry(csv_path, cache_dir)
+
+    if entry is None:
+        yield from pd.read_csv(
+            csv_path, chunksize=chunksize, usecols=columns, dtype=dtype, low_memory=False
+        )
+        return
+
+    logger.info(f"Reading Parquet cache for {csv_path.name}")
+    dataset = _open_dataset(Path(cache_dir) / entry["parquet"])
+    scan_columns = _scan_columns(dataset, entry, columns)
+    for batch in dataset.to_batches(columns=scan_columns, batch_size=chunksize):
+        if batch.num_rows:
+            yield _apply_dtypes(batch.to_pandas(), dtype, entry.get("all_strings", False))
+
+
+def convert_directory(raw_dir: Path = RAW_CCD_DIR, cache_dir: Path = CACHE_DIR, force: bool = False) -> int:
+    """
+    Convert every CSV under a raw data directory
+
+    Returns:
+        Number of files converted or confirmed fresh
+    """
+    csv_files = sorted(Path(raw_dir).rglob("*.csv"))
+    if not csv_files:
+        logger.warning(f"No CSV files found under {raw_dir}")
+        return 0
+
+    for csv_path in csv_files:
+        convert_to_parquet(csv_path, cache_dir, force=force)
+    return len(csv_files)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Convert raw NCES CCD CSVs to a state-partitioned Parquet cache",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__,
+    )
+    parser.add_argument(
+        "files", nargs="*", type=Path,
+        help="Specific CSV files to convert (default: everything under --raw-dir)",
+    )
+    parser.add_argument("--raw-dir", type=Path, default=RAW_CCD_DIR, help="Raw data directory")
+    parser.add_argument("--cache-dir", type=Path, default=CACHE_DIR, help="Parquet cache directory")
+    parser.add_argument("--force", action="store_true", help="Reconvert even if fresh")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+    if args.files:
+        for csv_path in args.files:
+            convert_to_parquet(csv_path, args.cache_dir, force=args.force)
+        count = len(args.files)
+    else:
+        count = convert_directory(args.raw_dir, args.cache_dir, force=args.force)
+
+    logger.info(f"✓ {count} file(s) cached in {args.cache_dir}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
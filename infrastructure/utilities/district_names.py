@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+District Name Matching
+
+Ranks districts by name similarity using an in-memory trigram index, so a
+batch of free-text names (manual import folders, lookup requests) can be
+matched against every district in a state without one LIKE scan per guess.
+
+Names are normalized once when the index is built:
+- case, punctuation and "&" are folded ("St. Mary's" -> "st marys")
+- generic suffixes are stripped ("Austin Public Schools" -> "austin")
+
+Scores follow pg_trgm: names are split into three-character shingles and
+compared by Jaccard similarity. A query whose trigrams are all contained in
+a longer name (e.g. "Bismarck" in "Bismarck 1") still ranks highly.
+
+Usage:
+    from infrastructure.utilities.district_names import DistrictNameIndex
+
+    index = DistrictNameIndex.from_session(session, states=['CA', 'TX'])
+    index.match("Los Angeles Unified School District", "CA")
+    # [NameCandidate(district_id='0622710', name='Los Angeles Unified', state='CA', score=1.0)]
+
+    # Hundreds of names in one call
+    results = index.match_many([("Austin ISD", "TX"), ("Fresno Unified", "CA")], limit=3)
+"""
+
+import re
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, Iterable, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+# Applied in order, so "Baldwin County Public Schools" keeps "County"
+DISTRICT_NAME_SUFFIXES = [
+    'School District',
+    'Public Schools',
+    'Schools',
+    'Unified School District',
+    'Independent Comm School District',
+    'Comm School District',
+    'Community School District',
+    'School District No. R-1',
+    'School District No. Re 1',
+    'Area Schools',
+    'Area School District',
+    'County Public Schools',
+    'County Schools',
+    'School District 49-5',
+]
+
+# Weight for a query fully contained in a longer name (below an exact match)
+CONTAINMENT_WEIGHT = 0.9
+
+
+def normalize_district_name(name: str) -> str:
+    """
+    Strip common district suffixes (case-insensitive), keeping the original case.
+
+    Examples:
+        >>> normalize_district_name("Denver Public Schools")
+        'Denver'
+        >>> normalize_district_name("Baldwin County Public Schools")
+        'Baldwin County'
+    """
+    normalized = name.strip()
+    for suffix in DISTRICT_NAME_SUFFIXES:
+        if normalized.lower().endswith(' ' + suffix.lower()):
+            normalized = normalized[:-len(suffix)].strip()
+    return normalized
+
+
+def name_key(name: str) -> str:
+    """
+    Comparison key for a district name: suffix-stripped, lowercase, no punctuation.
+
+    Examples:
+        >>> name_key("St. Mary's County Public Schools")
+        'st marys county'
+        >>> name_key("BISMARCK 1")
+        'bismarck 1'
+    """
+    if not isinstance(name, str):
+        return ''
+    key = normalize_district_name(name).lower().replace('&', ' and ')
+    key = re.sub(r"['’.]", '', key)
+    key = re.sub(r'[^a-z0-9]+', ' ', key)
+    return key.strip()
+
+
+def trigrams(key: str) -> FrozenSet[str]:
+    """
+    pg_trgm-style trigrams of a name key (each word padded with two leading
+    spaces and one trailing space).
+
+    Examples:
+        >>> sorted(trigrams('ab'))
+        ['  a', ' ab', 'ab ']
+    """
+    grams = set()
+    for word in key.split():
+        padded = f'  {word} '
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return frozenset(grams)
+
+
+@dataclass(frozen=True)
+class NameCandidate:
+    """A ranked district match for a name query."""
+    district_id: str
+    name: str
+    state: str
+    score: float
+
+
+class DistrictNameIndex:
+    """
+    Trigram inverted index over district names, partitioned by state.
+
+    Args:
+        records: (district_id, name, state) tuples
+    """
+
+    def __init__(self, records: Iterable[Tuple[str, str, str]]):
+        self._ids: List[str] = []
+        self._names: List[str] = []
+        self._states: List[str] = []
+        self._keys: List[str] = []
+        self._grams: List[FrozenSet[str]] = []
+        # state -> key -> [row]
+        self._exact: Dict[str, Dict[str, List[int]]] = defaultdict(lambda: defaultdict(list))
+        # state -> trigram -> [row]
+        self._postings: Dict[str, Dict[str, List[int]]] = defaultdict(lambda: defaultdict(list))
+
+        for district_id, name, state in records:
+            key = name_key(name)
+            if not key:
+                continue
+            row = len(self._ids)
+            grams = trigrams(key)
+            state = (state or '').upper()
+            self._ids.append(str(district_id))
+            self._names.append(name)
+            self._states.append(state)
+            self._keys.append(key)
+            self._grams.append(grams)
+            self._exact[state][key].append(row)
+            for gram in grams:
+                self._postings[state][gram].append(row)
+
+    @classmethod
+    def from_dataframe(
+        cls,
+        df: pd.DataFrame,
+        id_column: str = 'district_id',
+        name_column: str = 'district_name',
+        state_column: str = 'state',
+    ) -> 'DistrictNameIndex':
+        """Build from a DataFrame such as enrichment_reference.csv."""
+        return cls(zip(df[id_column].astype(str), df[name_column], df[state_column]))
+
+    @classmethod
+    def from_session(cls, session, states: Optional[Iterable[str]] = None) -> 'DistrictNameIndex':
+        """
+        Build from the districts table with a single query.
+
+        Args:
+            session: SQLAlchemy session
+            states: Only index these states (default: all)
+        """
+        from sqlalchemy import select
+        from infrastructure.database.models import District
+
+        query = select(District.nces_id, District.name, District.state)
+        if states is not None:
+            query = query.where(District.state.in_(sorted({s for s in states if s})))
+        return cls(session.execute(query).all())
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def _candidate(self, row: int, score: float) -> NameCandidate:
+        return NameCandidate(self._ids[row], self._names[row], self._states[row], round(score, 4))
+
+    def match(
+        self,
+        name: str,
+        state: Optional[str] = None,
+        limit: int = 5,
+        min_score: float = 0.3,
+    ) -> List[NameCandidate]:
+        """
+        Rank districts by similarity to name.
+
+        Args:
+            name: Free-text district name
+            state: Two-letter state code (default: search every state)
+            limit: Maximum candidates returned
+            min_score: Drop candidates scoring below this (0-1)
+
+        Returns:
+            Candidates, best first. An exact normalized match scores 1.0.
+        """
+        key = name_key(name)
+        if not key:
+            return []
+        states = [state.upper()] if state else list(self._postings)
+
+        exact_rows = [row for s in states for row in self._exact.get(s, {}).get(key, [])]
+        if exact_rows:
+            return [self._candidate(row, 1.0) for row in exact_rows[:limit]]
+
+        grams = trigrams(key)
+        shared = Counter()
+        for s in states:
+            postings = self._postings.get(s)
+            if not postings:
+                continue
+            for gram in grams:
+                shared.update(postings.get(gram, ()))
+
+        ranked = []
+        for row, common in shared.items():
+            similarity = common / (len(grams) + len(self._grams[row]) - common)
+            containment = CONTAINMENT_WEIGHT * common / len(grams)
+            score = max(similarity, containment)
+            if score >= min_score:
+                # Ties (e.g. several names containing the query) go to the closest length
+                ranked.append((-score, -similarity, self._keys[row], row))
+
+        ranked.sort()
+        return [self._candidate(row, -neg_score) for neg_score, _, _, row in ranked[:limit]]
+
+    def match_many(
+        self,
+        queries: Sequence[Tuple[str, Optional[str]]],
+        limit: int = 1,
+        min_score: float = 0.3,
+    ) -> List[List[NameCandidate]]:
+        """
+        Match a batch of (name, state) queries.
+
+        Returns:
+            One ranked candidate list per query, in query order
+        """
+        cache: Dict[Tuple[str, str], List[NameCandidate]] = {}
+        results = []
+        for name, state in queries:
+            cache_key = (name_key(name), (state or '').upper())
+            if cache_key not in cache:
+                cache[cache_key] = self.match(name, state, limit=limit, min_score=min_score)
+            results.append(cache[cache_key])
+        return results
@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+Indexed District Reference
+
+Fast lookups over enrichment_reference.csv for the interactive enrichment
+tools (district_lookup.py, enrichment_progress.py) and the API.
+
+The CSV is parsed once into an Arrow/Parquet snapshot next to it
+(enrichment_reference.parquet). Later loads memory-map the snapshot instead
+of re-parsing the CSV; the snapshot records the CSV's size and mtime and is
+rebuilt automatically when the CSV changes.
+
+On load, DistrictReference builds:
+- an ID index (O(1) lookup by district ID, with or without leading zeros)
+- a state index (row positions per state)
+- per-state enrichment statistics, computed once
+- a trigram name index (built on first fuzzy lookup)
+
+get_reference() keeps one DistrictReference per process and reloads only
+when the CSV changes, so a long-lived process (the API's /districts routes)
+answers queries without touching disk.
+
+Usage:
+    from infrastructure.utilities.district_reference import get_reference
+
+    ref = get_reference()
+    ref.get('0100270')          # dict for one district, or None
+    ref.for_state('AL')         # DataFrame of AL districts
+    ref.state_stats()           # totals/enriched/pending by state
+
+    # Rebuild the snapshot explicitly
+    python infrastructure/utilities/district_reference.py
+"""
+
+import argparse
+import logging
+import os
+import sys
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+REFERENCE_CSV = PROJECT_ROOT / "data" / "processed" / "normalized" / "enrichment_reference.csv"
+
+SOURCE_SIZE_KEY = b"source_size"
+SOURCE_MTIME_KEY = b"source_mtime_ns"
+
+
+def snapshot_path(csv_path: Path) -> Path:
+    """Parquet snapshot stored alongside the reference CSV."""
+    return csv_path.with_suffix(".parquet")
+
+
+def _source_signature(csv_path: Path) -> Tuple[str, str]:
+    stat = csv_path.stat()
+    return str(stat.st_size), str(stat.st_mtime_ns)
+
+
+def write_snapshot(csv_path: Path) -> pd.DataFrame:
+    """
+    Parse the reference CSV and write its Parquet snapshot.
+
+    Args:
+        csv_path: enrichment_reference.csv
+
+    Returns:
+        The parsed DataFrame
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    size, mtime = _source_signature(csv_path)
+    df = pd.read_csv(csv_path)
+
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    metadata = dict(table.schema.metadata or {})
+    metadata.update({SOURCE_SIZE_KEY: size.encode(), SOURCE_MTIME_KEY: mtime.encode()})
+    table = table.replace_schema_metadata(metadata)
+
+    target = snapshot_path(csv_path)
+    tmp = target.with_suffix(".parquet.tmp")
+    pq.write_table(table, tmp)
+    os.replace(tmp, target)
+    logger.info(f"Wrote reference snapshot {target} ({len(df):,} rows)")
+    return df
+
+
+def load_reference_frame(csv_path: Path = REFERENCE_CSV) -> pd.DataFrame:
+    """
+    Load the reference data, preferring a fresh Parquet snapshot.
+
+    Falls back to pd.read_csv when pyarrow is unavailable or the snapshot
+    can't be written (read-only checkout).
+    """
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        return pd.read_csv(csv_path)
+
+    target = snapshot_path(csv_path)
+    if target.exists():
+        try:
+            metadata = pq.read_schema(target).metadata or {}
+            signature = (
+                metadata.get(SOURCE_SIZE_KEY, b"").decode(),
+                metadata.get(SOURCE_MTIME_KEY, b"").decode(),
+            )
+            if signature == _source_signature(csv_path):
+                return pq.read_table(target, memory_map=True).to_pandas()
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable snapshot {target}: {e}")
+
+    try:
+        return write_snapshot(csv_path)
+    except OSError as e:
+        logger.warning(f"Could not write reference snapshot: {e}")
+        return pd.read_csv(csv_path)
+
+
+def _id_keys(district_id: Union[str, int]) -> List[str]:
+    """ID variants to try: as given and without leading zeros."""
+    key = str(district_id).strip()
+    stripped = key.lstrip("0") or key
+    return [key] if stripped == key else [key, stripped]
+
+
+class DistrictReference:
+    """
+    In-memory indexes over the enrichment reference table.
+
+    Args:
+        df: Reference rows (district_id, district_name, state, enriched, ...)
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        self.df = df.reset_index(drop=True)
+
+        ids = self.df["district_id"].astype(str)
+        self._by_id: Dict[str, int] = {}
+        for row, district_id in enumerate(ids):
+            self._by_id.setdefault(district_id, row)
+            self._by_id.setdefault(district_id.lstrip("0") or district_id, row)
+
+        states = self.df["state"].fillna("").astype(str).to_numpy()
+        order = np.argsort(states, kind="stable")
+        unique, starts = np.unique(states[order], return_index=True)
+        bounds = list(starts[1:]) + [len(order)]
+        self._by_state: Dict[str, np.ndarray] = {
+            state: order[start:end] for state, start, end in zip(unique, starts, bounds)
+        }
+
+        self._state_stats: Optional[pd.DataFrame] = None
+        self._name_index = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, csv_path: Path = REFERENCE_CSV) -> "DistrictReference":
+        """Load from the reference CSV (via its snapshot)."""
+        return cls(load_reference_frame(csv_path))
+
+    def __len__(self) -> int:
+        return len(self.df)
+
+    @property
+    def states(self) -> List[str]:
+        return list(self._by_state)
+
+    def row_of(self, district_id: Union[str, int]) -> Optional[int]:
+        """Row position for a district ID, or None."""
+        for key in _id_keys(district_id):
+            if key in self._by_id:
+                return self._by_id[key]
+        return None
+
+    def get(self, district_id: Union[str, int]) -> Optional[dict]:
+        """One district as a dict, or None if unknown."""
+        row = self.row_of(district_id)
+        return None if row is None else self.df.iloc[row].to_dict()
+
+    def lookup(self, district_ids: Iterable[Union[str, int]]) -> pd.DataFrame:
+        """Rows for the given IDs (unknown IDs are skipped)."""
+        rows = [row for row in map(self.row_of, district_ids) if row is not None]
+        return self.df.iloc[rows]
+
+    def for_state(self, state: Optional[str]) -> pd.DataFrame:
+        """All districts in a state (every district when state is None)."""
+        if not state:
+            return self.df
+        rows = self._by_state.get(state.upper())
+        if rows is None:
+            return self.df.iloc[0:0]
+        return self.df.iloc[rows]
+
+    def state_stats(self) -> pd.DataFrame:
+        """
+        Enrichment statistics by state, computed once.
+
+        Returns:
+            DataFrame indexed by state with total_districts, enriched_count,
+            total_enrollment, pending, enrichment_rate
+        """
+        if self._state_stats is None:
+            with self._lock:
+                if self._state_stats is None:
+                    stats = self.df.groupby("state").agg(
+                        total_districts=("district_id", "count"),
+                        enriched_count=("enriched", "sum"),
+                        total_enrollment=("enrollment_total", "sum"),
+                    )
+                    stats["pending"] = stats["total_districts"] - stats["enriched_count"]
+                    stats["enrichment_rate"] = stats["enriched_count"] / stats["total_districts"] * 100
+                    self._state_stats = stats
+        return self._state_stats
+
+    @property
+    def name_index(self):
+        """Trigram DistrictNameIndex over every district (built on first use)."""
+        if self._name_index is None:
+            from infrastructure.utilities.district_names import DistrictNameIndex
+            with self._lock:
+                if self._name_index is None:
+                    self._name_index = DistrictNameIndex.from_dataframe(self.df)
+        return self._name_index
+
+
+_cache: Dict[Path, Tuple[Tuple[str, str], DistrictReference]] = {}
+_cache_lock = threading.Lock()
+
+
+def get_reference(csv_path: Path = REFERENCE_CSV) -> DistrictReference:
+    """
+    Shared DistrictReference for this process, reloaded when the CSV changes.
+
+    Raises:
+        FileNotFoundError: If the reference CSV doesn't exist
+    """
+    csv_path = Path(csv_path).resolve()
+    signature = _source_signature(csv_path)
+    with _cache_lock:
+        cached = _cache.get(csv_path)
+        if cached and cached[0] == signature:
+            return cached[1]
+        reference = DistrictReference.load(csv_path)
+        _cache[csv_path] = (signature, reference)
+        return reference
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the enrichment reference Parquet snapshot")
+    parser.add_argument("--csv", type=Path, default=REFERENCE_CSV, help="Reference CSV path")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+    if not args.csv.exists():
+        logger.error(f"Reference file not found: {args.csv}")
+        return 1
+
+    write_snapshot(args.csv)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -34,6 +34,7 @@ Usage:
 import re
 from typing import Optional
 
+import pandas as pd
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
@@ -109,6 +110,30 @@ def normalize_cds_code(cds_code: str) -> str:
     return cds_code
 
 
+def normalize_cds_codes(cds_codes: pd.Series) -> pd.Series:
+    """
+    Vectorized normalize_cds_code() for a whole column.
+
+    Invalid codes become NA instead of raising, so a column can be
+    normalized and joined in one pass.
+
+    Args:
+        cds_codes: Series of CDS codes in any format
+
+    Returns:
+        Series of 7-digit CDS codes (NA where invalid), same index
+
+    Example:
+        >>> normalize_cds_codes(pd.Series(["6275796", "62757960000000", "CA-6275796", "bad"])).tolist()
+        ['6275796', '6275796', '6275796', None]
+    """
+    codes = pd.Series(cds_codes, dtype=object).astype("string").str.strip()
+    codes = codes.str.removeprefix("CA-")
+    codes = codes.where(codes.str.len() != 14, codes.str[:7])
+    valid = codes.str.fullmatch(r"\d{7}").fillna(False).astype(bool)
+    return codes.astype(object).where(valid, None)
+
+
 def cds_to_st_leaid(cds_code: str) -> str:
     """
     Convert CDS code to NCES ST_LEAID format.
@@ -0,0 +1,167 @@
+"""
+Lightweight per-stage timing and memory profile for pipeline runs.
+
+Records, for each named stage:
+- wall_s: elapsed wall-clock seconds
+- cpu_s: CPU seconds used by this process (user + system)
+- peak_rss_mb: process peak resident set size at the end of the stage
+- rss_growth_mb: how much the stage raised that peak
+- traced_peak_mb: peak Python allocations during the stage (only with
+  trace_memory=True, which starts tracemalloc and slows allocation-heavy
+  code noticeably)
+
+to_dict() is JSON-ready and is what calculate_lct_variants stores in
+calculation_runs.stage_profile; compare_profiles() lines up two of them.
+
+Usage:
+    profiler = StageProfiler()
+
+    with profiler.stage("load_enrollment"):
+        enrollment = get_most_recent_enrollment(session)
+
+    profiler.start("compute_variants")
+    ...
+    profiler.stop()
+
+    run.complete(..., stage_profile=profiler.to_dict())
+"""
+
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+# resource is Unix-only; peak RSS is omitted elsewhere
+try:
+    import resource
+    RESOURCE_AVAILABLE = True
+except ImportError:
+    RESOURCE_AVAILABLE = False
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Peak resident set size of this process in MB (None if unavailable)."""
+    if not RESOURCE_AVAILABLE:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS, kilobytes on Linux
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+class StageProfiler:
+    """
+    Collect wall time, CPU time and peak memory per named stage.
+
+    Stages may nest; re-entering a stage name adds to its times and keeps
+    the larger memory figures.
+
+    Args:
+        trace_memory: Also record tracemalloc peaks per stage
+    """
+
+    def __init__(self, trace_memory: bool = False):
+        self.trace_memory = trace_memory
+        self.stages: Dict[str, Dict] = {}
+        self._open: List[list] = []
+        self._top_level: List[str] = []
+        self._started_tracing = False
+
+    def start(self, name: str) -> None:
+        """Begin stage `name` (end it with stop())."""
+        if self.trace_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracing = True
+            # reset_peak() forgets the peak so far, which the enclosing
+            # stages still need: fold it into theirs first
+            traced_peak = tracemalloc.get_traced_memory()[1]
+            for entry in self._open:
+                entry[4] = max(entry[4], traced_peak)
+            tracemalloc.reset_peak()
+        self._open.append([name, time.perf_counter(), time.process_time(), peak_rss_mb(), 0])
+
+    def stop(self) -> Dict:
+        """
+        End the most recently started stage.
+
+        Returns:
+            The stage's accumulated measurements
+        """
+        name, wall_start, cpu_start, rss_start, traced_before = self._open.pop()
+        rss_end = peak_rss_mb()
+        if not self._open and name not in self._top_level:
+            self._top_level.append(name)
+
+        stage = self.stages.setdefault(name, {"wall_s": 0.0, "cpu_s": 0.0})
+        stage["wall_s"] = round(stage["wall_s"] + time.perf_counter() - wall_start, 4)
+        stage["cpu_s"] = round(stage["cpu_s"] + time.process_time() - cpu_start, 4)
+        if rss_end is not None:
+            stage["peak_rss_mb"] = round(max(stage.get("peak_rss_mb", 0.0), rss_end), 1)
+            stage["rss_growth_mb"] = round(max(stage.get("rss_growth_mb", 0.0), rss_end - rss_start), 1)
+        if self.trace_memory:
+            traced = max(traced_before, tracemalloc.get_traced_memory()[1]) / (1024 * 1024)
+            stage["traced_peak_mb"] = round(max(stage.get("traced_peak_mb", 0.0), traced), 1)
+            if not self._open and self._started_tracing:
+                tracemalloc.stop()
+                self._started_tracing = False
+        return stage
+
+    @contextmanager
+    def stage(self, name: str):
+        """Profile the enclosed block as stage `name`."""
+        self.start(name)
+        try:
+            yield
+        finally:
+            self.stop()
+
+    def to_dict(self) -> Dict:
+        """
+        JSON-ready profile.
+
+        Returns:
+            Dict with 'stages' (name -> measurements, in first-use order),
+            'total_wall_s'/'total_cpu_s' over top-level stages, overall
+            'peak_rss_mb' and 'trace_memory'
+        """
+        top_level = [self.stages[name] for name in self._top_level]
+        peak = peak_rss_mb()
+        return {
+            "stages": self.stages,
+            "total_wall_s": round(sum(s["wall_s"] for s in top_level), 4),
+            "total_cpu_s": round(sum(s["cpu_s"] for s in top_level), 4),
+            "peak_rss_mb": round(peak, 1) if peak is not None else None,
+            "trace_memory": self.trace_memory,
+        }
+
+
+def compare_profiles(baseline: Dict, current: Dict) -> pd.DataFrame:
+    """
+    Line up the stages of two profiles.
+
+    Args:
+        baseline: Earlier StageProfiler.to_dict()
+        current: Later StageProfiler.to_dict()
+
+    Returns:
+        DataFrame indexed by stage with wall/CPU seconds and peak RSS for
+        each run and wall_change_pct (negative is faster); stages missing
+        from one run have NaN on that side
+    """
+    columns = ["wall_s", "cpu_s", "peak_rss_mb"]
+
+    def frame(profile: Dict) -> pd.DataFrame:
+        stages = (profile or {}).get("stages", {})
+        return pd.DataFrame.from_dict(stages, orient="index").reindex(columns=columns)
+
+    merged = frame(baseline).join(frame(current), how="outer", lsuffix="_baseline", rsuffix="_current", sort=False)
+    order = list((baseline or {}).get("stages", {})) + [
+        s for s in (current or {}).get("stages", {}) if s not in (baseline or {}).get("stages", {})
+    ]
+    merged = merged.reindex(order)
+    merged.index.name = "stage"
+    merged["wall_change_pct"] = ((merged["wall_s_current"] / merged["wall_s_baseline"] - 1) * 100).round(1)
+    return merged
@@ -0,0 +1,367 @@
+#!/usr/bin/env python3
+"""
+Dependency-aware step runner with artifact fingerprinting
+
+Steps declare the artifacts they read (inputs) and write (outputs). Before a
+step runs, its inputs are fingerprinted; if the fingerprint matches the last
+successful run and its outputs are still exactly what that run produced, the
+step is skipped. Steps whose dependencies are satisfied run concurrently on
+a bounded thread pool, and every run ends with a per-step timing report.
+
+Artifact specs:
+    "data/processed/normalized/districts_2023_24_nces.csv"   single file
+    "data/raw/federal/nces-ccd/2023_24/*.csv"                glob (sorted matches)
+    "db:bell_schedules"                                      table watermark
+
+File fingerprints are SHA-256 digests cached by (size, mtime_ns), so a no-op
+rerun only stats files. Table watermarks use PostgreSQL's cumulative
+insert/update/delete counters from pg_stat_user_tables.
+
+Usage:
+    from dag_runner import DagStep, DagRunner
+
+    runner = DagRunner(
+        [
+            DagStep("Extract", extract, inputs=["raw/*.csv"], outputs=["combined.csv"]),
+            DagStep("Normalize", normalize, inputs=["combined.csv"],
+                    outputs=["normalized.csv"], after=["Extract"]),
+        ],
+        state_path=Path("pipeline_state.json"),
+        max_workers=4,
+    )
+    ok = runner.run()
+    print(runner.timing_report())
+"""
+
+import glob
+import hashlib
+import json
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DB_PREFIX = "db:"
+HASH_BLOCK_SIZE = 8 * 1024 * 1024
+
+# Step statuses
+RAN = "ran"
+SKIPPED = "skipped"
+FAILED = "failed"
+BLOCKED = "blocked"
+
+
+@dataclass
+class DagStep:
+    """
+    One unit of pipeline work
+
+    Attributes:
+        name: Unique step name
+        action: Callable returning True on success
+        inputs: Artifact specs the step reads
+        outputs: Artifact specs the step writes
+        after: Names of steps that must finish first
+        params: Configuration that affects the result (part of the fingerprint)
+        always_run: Never skip this step
+    """
+    name: str
+    action: Callable[[], bool]
+    inputs: List[str] = field(default_factory=list)
+    outputs: List[str] = field(default_factory=list)
+    after: List[str] = field(default_factory=list)
+    params: Dict = field(default_factory=dict)
+    always_run: bool = False
+
+
+@dataclass
+class StepResult:
+    """Outcome and timing of one step."""
+    name: str
+    status: str
+    duration: float = 0.0
+    reason: str = ""
+
+
+class ArtifactFingerprinter:
+    """
+    Fingerprint files, globs and database tables
+
+    File hashes are cached by (size, mtime_ns); the cache dict is persisted
+    by the caller between runs.
+    """
+
+    def __init__(self, root: Path, hash_cache: Optional[Dict] = None, engine_factory: Optional[Callable] = None):
+        self.root = Path(root)
+        self.hash_cache = hash_cache if hash_cache is not None else {}
+        self._engine_factory = engine_factory
+
+    def _resolve(self, spec: str) -> Path:
+        path = Path(spec)
+        return path if path.is_absolute() else self.root / path
+
+    def file_hash(self, path: Path) -> str:
+        stat = path.stat()
+        key = str(path)
+        cached = self.hash_cache.get(key)
+        if cached and cached[0] == stat.st_size and cached[1] == stat.st_mtime_ns:
+            return cached[2]
+
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b""):
+                digest.update(block)
+        sha = digest.hexdigest()
+        self.hash_cache[key] = [stat.st_size, stat.st_mtime_ns, sha]
+        return sha
+
+    def table_watermark(self, table: str) -> str:
+        from sqlalchemy import text
+
+        if self._engine_factory is None:
+            from infrastructure.database.connection import get_engine
+            self._engine_factory = get_engine
+
+        with self._engine_factory().connect() as conn:
+            row = conn.execute(
+                text(
+                    "SELECT n_tup_ins, n_tup_upd, n_tup_del, n_live_tup "
+                    "FROM pg_stat_user_tables WHERE relname = :table"
+                ),
+                {"table": table},
+            ).fetchone()
+        return "missing" if row is None else ":".join(str(v) for v in row)
+
+    def fingerprint(self, spec: str) -> Optional[str]:
+        """
+        Fingerprint one artifact spec
+
+        Returns:
+            Fingerprint string, or None if the artifact does not exist
+        """
+        if spec.startswith(DB_PREFIX):
+            return self.table_watermark(spec[len(DB_PREFIX):])
+
+        if glob.has_magic(spec):
+            matches = sorted(glob.glob(str(self._resolve(spec))))
+            files = [Path(m) for m in matches if Path(m).is_file()]
+            if not files:
+                return None
+            digest = hashlib.sha256()
+            for path in files:
+                digest.update(f"{path.name}:{self.file_hash(path)}\n".encode())
+            return digest.hexdigest()
+
+        path = self._resolve(spec)
+        if not path.is_file():
+            return None
+        return self.file_hash(path)
+
+    def fingerprint_all(self, specs: List[str]) -> Dict[str, Optional[str]]:
+        return {spec: self.fingerprint(spec) for spec in specs}
+
+
+def _params_key(params: Dict) -> str:
+    return hashlib.sha256(json.dumps(params, sort_keys=True, default=str).encode()).hexdigest()
+
+
+class DagRunner:
+    """
+    Run DagSteps in dependency order, concurrently where possible
+
+    Fingerprinting and state bookkeeping happen on the calling thread; only
+    step actions run on the pool.
+    """
+
+    def __init__(
+        self,
+        steps: List[DagStep],
+        state_path: Path,
+        root: Path = Path("."),
+        max_workers: int = 4,
+        force: bool = False,
+        engine_factory: Optional[Callable] = None,
+    ):
+        names = [s.name for s in steps]
+        if len(names) != len(set(names)):
+            raise ValueError("Step names must be unique")
+        for step in steps:
+            unknown = set(step.after) - set(names)
+            if unknown:
+                raise ValueError(f"Step {step.name!r} depends on unknown step(s): {sorted(unknown)}")
+
+        self.steps = {s.name: s for s in steps}
+        self.order = names
+        self.state_path = Path(state_path)
+        self.max_workers = max(1, max_workers)
+        self.force = force
+        self.state = self._load_state()
+        self.fingerprinter = ArtifactFingerprinter(
+            root, self.state.setdefault("file_hashes", {}), engine_factory
+        )
+        self.results: Dict[str, StepResult] = {}
+        self.total_duration = 0.0
+
+        self._check_acyclic()
+
+    def _check_acyclic(self):
+        visiting, done = set(), set()
+
+        def visit(name):
+            if name in done:
+                return
+            if name in visiting:
+                raise ValueError(f"Dependency cycle involving step {name!r}")
+            visiting.add(name)
+            for dep in self.steps[name].after:
+                visit(dep)
+            visiting.discard(name)
+            done.add(name)
+
+        for name in self.order:
+            visit(name)
+
+    def _load_state(self) -> Dict:
+        if self.state_path.exists():
+            try:
+                with open(self.state_path) as f:
+                    return json.load(f)
+            except (OSError, json.JSONDecodeError) as e:
+                logger.warning(f"Ignoring unreadable pipeline state {self.state_path}: {e}")
+        return {"steps": {}}
+
+    def _save_state(self):
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.state_path.with_suffix(".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(self.state, f, indent=2, sort_keys=True)
+        tmp_path.replace(self.state_path)
+
+    def _skip_reason(self, step: DagStep, input_prints: Dict) -> Optional[str]:
+        """Return why a step can be skipped, or None if it must run."""
+        if self.force or step.always_run:
+            return None
+        if not step.inputs and not step.outputs:
+            return None
+
+        previous = self.state.setdefault("steps", {}).get(step.name)
+        if not previous:
+            return None
+        if previous.get("params") != _params_key(step.params):
+            return None
+        if previous.get("inputs") != input_prints:
+            return None
+
+        output_prints = self.fingerprinter.fingerprint_all(step.outputs)
+        if any(v is None for v in output_prints.values()):
+            return None
+        if previous.get("outputs") != output_prints:
+            return None
+
+        return "inputs and outputs unchanged"
+
+    @staticmethod
+    def _invoke(step: DagStep):
+        start = time.perf_counter()
+        try:
+            ok = bool(step.action())
+            error = "" if ok else "step returned failure"
+        except Exception as e:  # Reported as a failed step, not a crash
+            logger.exception(f"✗ {step.name} raised")
+            ok, error = False, f"{type(e).__name__}: {e}"
+        return ok, time.perf_counter() - start, error
+
+    def run(self) -> bool:
+        """
+        Run all steps
+
+        Returns:
+            True if no step failed or was blocked
+        """
+        run_start = time.perf_counter()
+        pending = list(self.order)
+        running = {}
+        input_prints = {}
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            while pending or running:
+                for name in list(pending):
+                    step = self.steps[name]
+                    dep_status = [self.results.get(d) for d in step.after]
+                    if any(r is not None and r.status in (FAILED, BLOCKED) for r in dep_status):
+                        pending.remove(name)
+                        self.results[name] = StepResult(name, BLOCKED, reason="upstream step failed")
+                        logger.error(f"✗ {name} blocked (upstream failure)")
+                        continue
+                    if any(r is None for r in dep_status):
+                        continue
+
+                    pending.remove(name)
+                    input_prints[name] = self.fingerprinter.fingerprint_all(step.inputs)
+                    reason = self._skip_reason(step, input_prints[name])
+                    if reason:
+                        self.results[name] = StepResult(name, SKIPPED, reason=reason)
+                        logger.info(f"↷ {name} skipped ({reason})")
+                        continue
+
+                    logger.info(f"▶ {name} started")
+                    running[pool.submit(self._invoke, step)] = name
+
+                if not running:
+                    continue
+
+                finished, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                for future in finished:
+                    name = running.pop(future)
+                    step = self.steps[name]
+                    ok, duration, error = future.result()
+
+                    if ok:
+                        self.results[name] = StepResult(name, RAN, duration)
+                        self.state["steps"][name] = {
+                            "params": _params_key(step.params),
+                            "inputs": input_prints[name],
+                            "outputs": self.fingerprinter.fingerprint_all(step.outputs),
+                            "completed_at": datetime.now().isoformat(timespec="seconds"),
+                            "duration": round(duration, 3),
+                        }
+                        logger.info(f"✓ {name} completed in {duration:.1f}s")
+                    else:
+                        self.results[name] = StepResult(name, FAILED, duration, error)
+                        self.state["steps"].pop(name, None)
+                        logger.error(f"✗ {name} failed after {duration:.1f}s: {error}")
+
+                    self._save_state()
+
+        self.total_duration = time.perf_counter() - run_start
+        self.state["last_run"] = {
+            "finished_at": datetime.now().isoformat(timespec="seconds"),
+            "duration": round(self.total_duration, 3),
+            "steps": {
+                r.name: {"status": r.status, "duration": round(r.duration, 3)}
+                for r in self.results.values()
+            },
+        }
+        self._save_state()
+
+        return all(r.status in (RAN, SKIPPED) for r in self.results.values())
+
+    def timing_report(self) -> str:
+        """Format a per-step timing table for the last run."""
+        lines = [
+            f"{'Step':<28} {'Status':<8} {'Seconds':>8}  Note",
+            "-" * 60,
+        ]
+        for name in self.order:
+            result = self.results.get(name)
+            if result is None:
+                continue
+            lines.append(f"{name:<28} {result.status:<8} {result.duration:>8.2f}  {result.reason}")
+        lines.append("-" * 60)
+        lines.append(f"{'Total (wall clock)':<37} {self.total_duration:>8.2f}")
+        return "\n".join(lines)
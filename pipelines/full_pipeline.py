@@ -10,28 +10,47 @@ This pipeline orchestrates the complete data flow:
 5. Calculate LCT metrics
 6. Generate reports
 
+DAG mode (--dag) declares each step's input and output artifacts, skips
+steps whose inputs and outputs are unchanged since the last successful run,
+runs independent steps concurrently, runs scripts in-process where possible
+and prints a per-step timing report. A no-op rerun only stats files.
+
 Usage:
     python full_pipeline.py --year 2023-24 [--skip-download] [--sample] [--enrich-bell-schedules]
+    python full_pipeline.py --year 2023-24 --dag [--workers 4] [--force]
 
 Example:
     python full_pipeline.py --year 2023-24 --sample
     python full_pipeline.py --year 2023-24 --skip-download
     python full_pipeline.py --year 2023-24 --enrich-bell-schedules --tier 1
+    python full_pipeline.py --year 2023-24 --skip-download --dag
 """
 
 import argparse
+import importlib.util
 import logging
 from pathlib import Path
 import sys
 import subprocess
+import threading
 from datetime import datetime
 
 # Add utilities to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "infrastructure" / "utilities"))
+sys.path.insert(0, str(Path(__file__).parent))
 from common import get_project_root, setup_logging
+from dag_runner import DagRunner, DagStep
 
 logger = logging.getLogger(__name__)
 
+# Scripts read their arguments from sys.argv, so in-process runs take turns.
+# Steps that run alongside another step use a subprocess instead.
+_INPROCESS_LOCK = threading.Lock()
+
+# Multi-part files from the CCD download (<name>_1.csv, <name>_12.csv, ...);
+# the *_combined.* files written by Extract don't match
+MULTIPART_GLOBS = ["*_[0-9].*", "*_[0-9][0-9].*"]
+
 
 class PipelineRunner:
     """
@@ -61,10 +80,27 @@ class PipelineRunner:
 
         self.steps_completed = []
         self.steps_failed = []
+
+        # Set by run_dag(): run scripts in this interpreter, never prompt
+        self.inprocess = False
+        self._script_modules = {}
+    
+    def normalized_file(self) -> Path:
+        """
+        Normalized district file written by Step 3 (normalize_districts.py --source nces)
+        
+        Enrichment and LCT calculation run concurrently and write their own
+        outputs next to this file, so both read it by exact name: a glob
+        could pick up a half-written *_with_lct* file instead.
+        
+        Returns:
+            Path to the normalized CSV
+        """
+        return self.root / "data" / "processed" / "normalized" / f"districts_{self.year.replace('-', '_')}_nces.csv"
     
     def run_script(self, script_path: Path, args: list = None) -> bool:
         """
-        Run a Python script and capture output
+        Run a Python script, streaming its output to the log
         
         Args:
             script_path: Path to script
@@ -73,6 +109,11 @@ class PipelineRunner:
         Returns:
             True if script succeeded
         """
+        if self.inprocess:
+            return self.run_script_inprocess(script_path, args)
+        return self._run_subprocess(script_path, args)
+
+    def _run_subprocess(self, script_path: Path, args: list = None) -> bool:
         cmd = [sys.executable, str(script_path)]
         if args:
             cmd.extend(args)
@@ -80,26 +121,75 @@ class PipelineRunner:
         logger.info(f"Running: {' '.join(cmd)}")
         
         try:
-            result = subprocess.run(
+            process = subprocess.Popen(
                 cmd,
-                capture_output=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
                 text=True,
-                check=True
+                bufsize=1
             )
-            
-            # Log output
-            if result.stdout:
-                for line in result.stdout.split('\n'):
-                    if line.strip():
-                        logger.info(f"  | {line}")
-            
-            return True
-            
-        except subprocess.CalledProcessError as e:
-            logger.error(f"Script failed with exit code {e.returncode}")
-            if e.stderr:
-                logger.error(f"Error output:\n{e.stderr}")
+        except OSError as e:
+            logger.error(f"Could not start script: {e}")
+            return False
+
+        # Log output line by line as it arrives (nothing buffered in memory)
+        with process.stdout:
+            for line in process.stdout:
+                if line.strip():
+                    logger.info(f"  [{script_path.stem}] {line.rstrip()}")
+
+        returncode = process.wait()
+        if returncode != 0:
+            logger.error(f"Script failed with exit code {returncode}")
             return False
+
+        return True
+
+    def run_script_inprocess(self, script_path: Path, args: list = None) -> bool:
+        """
+        Run a script's main() in this interpreter
+        
+        Avoids re-importing pandas/SQLAlchemy for every step. Scripts
+        without a main() fall back to a subprocess.
+        
+        Args:
+            script_path: Path to script
+            args: List of command-line arguments
+        
+        Returns:
+            True if script succeeded
+        """
+        if not script_path.exists():
+            logger.error(f"Script not found: {script_path}")
+            return False
+
+        module = self._script_modules.get(script_path)
+        if module is None:
+            spec = importlib.util.spec_from_file_location(f"_pipeline_{script_path.stem}", script_path)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            self._script_modules[script_path] = module
+
+        main_func = getattr(module, "main", None)
+        if main_func is None:
+            return self._run_subprocess(script_path, args)
+
+        logger.info(f"Running in-process: {script_path.name} {' '.join(args or [])}")
+
+        with _INPROCESS_LOCK:
+            saved_argv = sys.argv
+            sys.argv = [str(script_path)] + list(args or [])
+            try:
+                code = main_func()
+            except SystemExit as e:
+                code = e.code
+            finally:
+                sys.argv = saved_argv
+
+        if code not in (None, 0):
+            logger.error(f"Script failed with exit code {code}")
+            return False
+        return True
     
     def step_download(self) -> bool:
         """
@@ -142,21 +232,16 @@ class PipelineRunner:
             logger.info("Use --enrich-bell-schedules to enable")
             return True
 
-        # Find normalized file to enrich - CRITICAL: Must exist
-        normalized_dir = self.root / "data" / "processed" / "normalized"
-
-        # Look for latest normalized file
-        input_files = list(normalized_dir.glob(f"districts_{self.year.replace('-', '_')}*.csv"))
+        # Normalized file to enrich - CRITICAL: Must exist
+        input_file = self.normalized_file()
 
-        if not input_files:
+        if not input_file.exists():
             logger.error("ERROR: Cannot enrich bell schedules - normalized file not found")
-            logger.error(f"Expected file matching: {normalized_dir}/districts_{self.year.replace('-', '_')}*.csv")
+            logger.error(f"Expected file: {input_file}")
             logger.error("Normalization must complete before enrichment")
             logger.error("This is a pipeline ordering error - enrichment requires normalized data")
             return False  # Fail loudly instead of silently skipping
 
-        input_file = input_files[0]
-
         script = self.scripts_dir / "enrich" / "fetch_bell_schedules.py"
         args = [
             str(input_file),
@@ -164,7 +249,9 @@ class PipelineRunner:
             "--tier", str(self.tier)
         ]
 
-        return self.run_script(script, args)
+        # Always a separate process: in DAG mode this runs alongside Calculate
+        # LCT, and in-process scripts take turns on sys.argv
+        return self._run_subprocess(script, args)
 
     def step_extract(self) -> bool:
         """
@@ -186,7 +273,7 @@ class PipelineRunner:
             return True
         
         # Look for multi-part files
-        multipart_files = list(data_dir.glob("*_[0-9]*.*"))
+        multipart_files = [f for pattern in MULTIPART_GLOBS for f in data_dir.glob(pattern)]
         
         if not multipart_files:
             logger.info("No multi-part files found, skipping extraction")
@@ -194,6 +281,8 @@ class PipelineRunner:
         
         script = self.scripts_dir / "extract" / "split_large_files.py"
         args = [str(data_dir)]
+        if self.inprocess:
+            args.append("--overwrite")
         
         return self.run_script(script, args)
     
@@ -245,16 +334,13 @@ class PipelineRunner:
         logger.info("STEP 5: CALCULATE LEARNING CONNECTION TIME")
         logger.info("="*60)
 
-        # Find normalized file
-        normalized_dir = self.root / "data" / "processed" / "normalized"
-        input_files = list(normalized_dir.glob(f"districts_{self.year.replace('-', '_')}*.csv"))
+        # Normalized file from Step 3
+        input_file = self.normalized_file()
 
-        if not input_files:
-            logger.error(f"No normalized files found in {normalized_dir}")
+        if not input_file.exists():
+            logger.error(f"Normalized file not found: {input_file}")
             return False
 
-        input_file = input_files[0]
-
         script = self.scripts_dir / "analyze" / "calculate_lct.py"
         args = [
             str(input_file),
@@ -450,6 +536,113 @@ For questions about methodology or data quality, see project documentation in th
 
         return True
 
+    def build_dag_steps(self) -> list:
+        """
+        Declare the pipeline as DagSteps with input/output artifacts
+        
+        Paths are relative to the project root.
+        
+        Returns:
+            List of DagStep
+        """
+        year_dir = self.year.replace("-", "_")
+        raw_dir = f"data/raw/federal/nces-ccd/{year_dir}"
+        normalized = str(self.normalized_file().relative_to(self.root))
+        lct_outputs = f"data/processed/normalized/districts_{year_dir}*_with_lct*"
+        enriched = f"data/enriched/bell-schedules/*enriched_{year_dir}*"
+        params = {"year": self.year, "sample": self.sample}
+        # Only the downloaded data files: README.md/SHA256SUMS are rewritten
+        # on every run and the directory also holds Extract's outputs
+        downloaded = f"{raw_dir}/sample_districts.csv" if self.sample else f"{raw_dir}/ccd_*.zip"
+
+        return [
+            DagStep(
+                "Download", self.step_download,
+                outputs=[downloaded],
+                params={**params, "skip_download": self.skip_download},
+            ),
+            DagStep(
+                "Extract", self.step_extract,
+                inputs=[f"{raw_dir}/{pattern}" for pattern in MULTIPART_GLOBS],
+                outputs=[f"{raw_dir}/*_combined.*"],
+                after=["Download"], params=params,
+            ),
+            DagStep(
+                "Normalize", self.step_normalize,
+                inputs=[f"{raw_dir}/*.csv"],
+                outputs=[normalized],
+                after=["Extract"], params=params,
+            ),
+            # Enrichment and LCT calculation both read only the normalized
+            # file, so they run concurrently (enrichment in a subprocess)
+            DagStep(
+                "Enrich Bell Schedules", self.step_enrich_bell_schedules,
+                inputs=[normalized],
+                outputs=[enriched] if self.enrich_bell_schedules else [],
+                after=["Normalize"],
+                params={**params, "enabled": self.enrich_bell_schedules, "tier": self.tier},
+            ),
+            DagStep(
+                "Calculate LCT", self.step_calculate_lct,
+                inputs=[normalized],
+                outputs=[lct_outputs],
+                after=["Normalize"], params=params,
+            ),
+            DagStep(
+                "Export Deliverables", self.step_export_deliverables,
+                inputs=[normalized, lct_outputs] + ([enriched] if self.enrich_bell_schedules else []),
+                outputs=[f"outputs/datasets/{year_dir}/*.csv"],
+                after=["Enrich Bell Schedules", "Calculate LCT"], params=params,
+            ),
+        ]
+
+    def run_dag(self, max_workers: int = 4, force: bool = False) -> bool:
+        """
+        Run the pipeline as a DAG with artifact fingerprinting
+        
+        Args:
+            max_workers: Maximum concurrent steps
+            force: Run every step even if its fingerprints are unchanged
+        
+        Returns:
+            True if all steps succeeded or were skipped
+        """
+        self.inprocess = True
+
+        logger.info("="*60)
+        logger.info("LEARNING CONNECTION TIME DATA PIPELINE (DAG MODE)")
+        logger.info("="*60)
+        logger.info(f"Year: {self.year}  Workers: {max_workers}  Force: {force}")
+
+        state_path = self.root / "data" / "processed" / "pipeline_state" / f"full_pipeline_{self.year.replace('-', '_')}.json"
+        runner = DagRunner(
+            self.build_dag_steps(),
+            state_path=state_path,
+            root=self.root,
+            max_workers=max_workers,
+            force=force,
+        )
+        success = runner.run()
+
+        for result in runner.results.values():
+            if result.status in ("ran", "skipped"):
+                self.steps_completed.append(result.name)
+            else:
+                self.steps_failed.append(result.name)
+
+        logger.info("\n" + "="*60)
+        logger.info("PIPELINE TIMING REPORT")
+        logger.info("="*60)
+        for line in runner.timing_report().splitlines():
+            logger.info(line)
+        logger.info(f"\nState: {state_path}")
+
+        if success:
+            logger.info("\n✓ Pipeline completed successfully!")
+        else:
+            logger.error("\n✗ Pipeline failed")
+        return success
+
     def run(self) -> bool:
         """
         Run the complete pipeline
@@ -566,6 +759,22 @@ def main():
         default=2,
         help="Bell schedule quality tier: 1=detailed, 2=automated, 3=statutory (default: 2)"
     )
+    parser.add_argument(
+        "--dag",
+        action="store_true",
+        help="Run as a DAG: skip unchanged steps, run independent steps concurrently"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="Maximum concurrent steps in --dag mode (default: 4)"
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="In --dag mode, run every step even if nothing changed"
+    )
     parser.add_argument(
         "--log-file",
         type=Path,
@@ -586,7 +795,10 @@ def main():
         tier=args.tier
     )
     
-    success = pipeline.run()
+    if args.dag:
+        success = pipeline.run_dag(max_workers=args.workers, force=args.force)
+    else:
+        success = pipeline.run()
     
     return 0 if success else 1
 
@@ -7,6 +7,7 @@ minutes of potential individual attention per student per day.
 """
 
 from typing import Union, Dict
+import numpy as np
 import pandas as pd
 
 
@@ -158,28 +159,142 @@ class LCTCalculator:
         """
         Calculate LCT for multiple districts at once
         
+        Vectorized equivalent of calling calculate_district_lct on every
+        row: daily minutes are resolved per state once and mapped onto the
+        rows, and the LCT columns are computed as array operations. Rows
+        that fail validation get NaN results and a message in an 'error'
+        column (only added when at least one row fails).
+        
         Args:
             districts_df: DataFrame with columns:
                 - enrollment
                 - instructional_staff
-                - daily_minutes (or state for lookup)
+                - daily_minutes (or state for lookup; rows with a missing
+                  daily_minutes value fall back to the state lookup)
+                - grade_enrollments (optional dicts, for states with
+                  grade-level requirements)
                 
         Returns:
             DataFrame with original data plus LCT calculations
         """
-        results = []
-        
-        for idx, row in districts_df.iterrows():
-            try:
-                district_data = row.to_dict()
-                lct_result = self.calculate_district_lct(district_data)
-                results.append({**row.to_dict(), **lct_result})
-            except Exception as e:
-                # Log error but continue processing
-                print(f"Error processing district at index {idx}: {e}")
-                results.append({**row.to_dict(), 'lct_minutes': None, 'error': str(e)})
-        
-        return pd.DataFrame(results)
+        n = len(districts_df)
+        errors = np.full(n, None, dtype=object)
+        
+        missing = [c for c in ('enrollment', 'instructional_staff') if c not in districts_df.columns]
+        if missing:
+            errors[:] = str(KeyError(missing[0]))
+            enrollment = staff = daily_minutes = np.full(n, np.nan)
+        else:
+            enrollment = pd.to_numeric(districts_df['enrollment'], errors='coerce').to_numpy(dtype=float)
+            staff = pd.to_numeric(districts_df['instructional_staff'], errors='coerce').to_numpy(dtype=float)
+            daily_minutes, minutes_errors = self._resolve_batch_minutes(districts_df)
+            
+            # Same checks and messages as calculate_lct; assigned last-to-first
+            # so each row reports the first check it fails
+            with np.errstate(invalid='ignore'):
+                bad_minutes = ~((180 <= daily_minutes) & (daily_minutes <= 480))
+            if 'daily_minutes' in districts_df.columns:
+                raw_minutes = districts_df['daily_minutes'].to_numpy()
+            else:
+                raw_minutes = np.full(n, np.nan)
+            for i in np.flatnonzero(bad_minutes):
+                shown = raw_minutes[i] if pd.notna(raw_minutes[i]) else f"{daily_minutes[i]:g}"
+                errors[i] = (
+                    f"Daily minutes should be between 180 and 480, got {shown}. "
+                    "Check if this is a reasonable instructional time value."
+                )
+            raw_staff = districts_df['instructional_staff'].to_numpy()
+            for i in np.flatnonzero(staff < 0):
+                errors[i] = f"Instructional staff cannot be negative, got {raw_staff[i]}"
+            raw_enrollment = districts_df['enrollment'].to_numpy()
+            for i in np.flatnonzero(enrollment <= 0):
+                errors[i] = f"Enrollment must be positive, got {raw_enrollment[i]}"
+            has_minutes_error = pd.notna(minutes_errors)
+            errors[has_minutes_error] = minutes_errors[has_minutes_error]
+        
+        failed = pd.notna(errors)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            lct = _round(daily_minutes * staff / enrollment, 2)
+            ratio = np.where(staff > 0, _round(enrollment / staff, 1), np.nan)
+        
+        result = districts_df.copy()
+        result['lct_minutes'] = np.where(failed, np.nan, lct)
+        result['lct_hours'] = _round(result['lct_minutes'] / 60, 2)
+        result['lct_yearly_hours'] = _round((result['lct_minutes'] * 180) / 60, 1)  # Assuming 180-day year
+        result['student_teacher_ratio'] = np.where(failed, np.nan, ratio)
+        result['daily_minutes_used'] = np.where(failed, np.nan, daily_minutes)
+        
+        if failed.any():
+            # Log error but keep the rest of the batch
+            print(f"Error processing {int(failed.sum())} of {n} districts (see 'error' column)")
+            result['error'] = errors
+        
+        return result
+    
+    def _resolve_batch_minutes(self, districts_df: pd.DataFrame):
+        """
+        Daily minutes for every row of a batch
+        
+        Uses the daily_minutes column where present, otherwise the state
+        requirement (grade-weighted where the state has grade-level
+        requirements and the row has grade_enrollments).
+        
+        Returns:
+            (float array of minutes, object array of per-row error messages)
+        """
+        n = len(districts_df)
+        errors = np.full(n, None, dtype=object)
+        
+        if 'daily_minutes' in districts_df.columns:
+            minutes = pd.to_numeric(districts_df['daily_minutes'], errors='coerce').to_numpy(dtype=float, copy=True)
+        else:
+            minutes = np.full(n, np.nan)
+        needs_lookup = np.isnan(minutes)
+        if not needs_lookup.any():
+            return minutes, errors
+        
+        if 'state' not in districts_df.columns or not self.state_requirements:
+            errors[needs_lookup] = "Must provide either daily_minutes or state code with requirements"
+            return minutes, errors
+        
+        states = districts_df['state']
+        state_minutes = {state: self._get_state_minutes(state) for state in states[needs_lookup].unique()}
+        minutes[needs_lookup] = states[needs_lookup].map(state_minutes).to_numpy(dtype=float)
+        
+        if 'grade_enrollments' not in districts_df.columns:
+            return minutes, errors
+        
+        # Grade-weighted states: expand the grade_enrollments dicts into a
+        # matrix per state and weight by that state's grade minutes
+        weighted_states = []
+        for state in state_minutes:
+            state_reqs = self.state_requirements.get(state, {})
+            if 'all_grades' not in state_reqs and 'requirements' in state_reqs:
+                weighted_states.append(state)
+        if not weighted_states:
+            return minutes, errors
+        
+        grades = districts_df['grade_enrollments']
+        has_grades = grades.map(lambda g: isinstance(g, dict) and bool(g)).to_numpy(dtype=bool)
+        for state in weighted_states:
+            rows = np.flatnonzero(needs_lookup & has_grades & (states == state).to_numpy())
+            if not len(rows):
+                continue
+            grade_minutes = {
+                grade: data['minutes_per_day']
+                for grade, data in self.state_requirements[state]['requirements'].items()
+            }
+            matrix = pd.DataFrame.from_records(list(grades.iloc[rows])).fillna(0)
+            weights = matrix.columns.map(lambda grade: grade_minutes.get(grade, 0)).to_numpy(dtype=float)
+            total = matrix.sum(axis=1).to_numpy(dtype=float)
+            weighted_sum = matrix.to_numpy(dtype=float) @ weights
+            with np.errstate(divide='ignore', invalid='ignore'):
+                minutes[rows] = np.trunc(_round(weighted_sum / total, 2))
+            zero_total = rows[total == 0]
+            minutes[zero_total] = np.nan
+            errors[zero_total] = "Total enrollment cannot be zero"
+        
+        return minutes, errors
     
     def _get_state_minutes(
         self,
@@ -223,6 +338,17 @@ class LCTCalculator:
 
 # Utility functions
 
+def _round(values, ndigits: int) -> np.ndarray:
+    """
+    Element-wise built-in round(), so batch results match the scalar path
+    
+    np.round scales by 10**ndigits before rounding and can land on the
+    other side of a tie: an LCT of 9.45 gives 28.349999999999998 yearly
+    hours, which round() makes 28.3 and np.round makes 28.4.
+    """
+    return np.vectorize(lambda v: round(float(v), ndigits), otypes=[float])(values)
+
+
 def lct_to_ratio(lct_minutes: float, daily_minutes: int = 360) -> float:
     """
     Convert LCT back to traditional student-teacher ratio
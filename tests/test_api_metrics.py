@@ -0,0 +1,41 @@
+"""
+Tests for the acquisition API's Prometheus metrics.
+"""
+
+import pytest
+
+pytest.importorskip("prometheus_client")
+
+from prometheus_client import REGISTRY, generate_latest
+
+from infrastructure.api import metrics
+
+
+def sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+def test_acquisition_metrics_registered():
+    text = generate_latest().decode()
+    for name in ("acquisitions_in_flight", "acquisitions_total", "crawlee_map_duration_seconds",
+                 "crawlee_pages_visited", "ollama_call_duration_seconds", "heuristic_fallbacks_total",
+                 "pdf_captures_total", "pdf_triage_outcomes_total"):
+        assert f"# TYPE {name} " in text
+
+
+def test_labelled_counter_exported():
+    before = sample("pdf_captures_total", method="direct", outcome="success")
+    metrics.PDF_CAPTURES.labels(method="direct", outcome="success").inc()
+
+    assert sample("pdf_captures_total", method="direct", outcome="success") == before + 1
+    assert 'pdf_captures_total{method="direct",outcome="success"}' in generate_latest().decode()
+
+
+def test_ollama_latency_recorded_even_on_error():
+    labels = {"model": "phi3:mini", "prompt": "test_error"}
+    with pytest.raises(RuntimeError):
+        with metrics.OLLAMA_CALL_SECONDS.labels(**labels).time():
+            raise RuntimeError("ollama down")
+
+    assert sample("ollama_call_duration_seconds_count", **labels) == 1
+    assert sample("ollama_call_duration_seconds_bucket", le="+Inf", **labels) == 1
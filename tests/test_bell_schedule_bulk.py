@@ -0,0 +1,115 @@
+"""
+Tests for queries.add_bell_schedules_bulk.
+
+A fake session answers the district lookup and the upsert statements, so
+the outcome bookkeeping and the generated SQL can be checked without
+PostgreSQL.
+"""
+
+import re
+from types import SimpleNamespace
+
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.sql import Select
+
+from infrastructure.database.queries import add_bell_schedules_bulk
+
+
+class FakeResult(list):
+    def scalars(self):
+        return iter(self)
+
+
+class FakeSession:
+    """Knows a set of districts and which schedules already exist."""
+
+    def __init__(self, districts, existing=()):
+        self.districts = set(districts)
+        self.existing = set(existing)
+        self.upserts = []
+        self.lineage = []
+        self.next_id = 100
+
+    def execute(self, statement, params=None):
+        if isinstance(statement, Select):
+            return FakeResult(sorted(self.districts))
+        if params is not None:  # LineageBatch executemany
+            self.lineage.extend(params)
+            return FakeResult()
+
+        compiled = statement.compile(dialect=postgresql.dialect())
+        self.upserts.append(str(compiled))
+        values = compiled.params
+        rows = FakeResult()
+        for suffix in sorted({m.group(1) for k in values if (m := re.match(r"district_id_m(\d+)", k))}, key=int):
+            key = (values[f"district_id_m{suffix}"], values[f"year_m{suffix}"], values[f"grade_level_m{suffix}"])
+            self.next_id += 1
+            rows.append(SimpleNamespace(
+                id=self.next_id, district_id=key[0], year=key[1], grade_level=key[2],
+                inserted=key not in self.existing,
+            ))
+        return rows
+
+
+def schedule(district_id="0622710", grade_level="elementary", minutes=360, **extra):
+    return {"district_id": district_id, "year": "2025-26", "grade_level": grade_level,
+            "instructional_minutes": minutes, **extra}
+
+
+def test_upserts_valid_records_and_reports_outcomes():
+    session = FakeSession({"622710", "100005"}, existing={("622710", "2025-26", "middle")})
+    records = [
+        schedule(),
+        schedule(grade_level="middle", start_time="8:00 AM", end_time="3:00 PM", minutes=380),
+        schedule("9999999"),
+        schedule(grade_level="high", minutes=50),
+        schedule("100005", start_time="3:00 PM", end_time="8:00 AM"),
+    ]
+
+    outcomes = add_bell_schedules_bulk(session, records, page_size=2)
+
+    assert [o["status"] for o in outcomes] == ["create", "update", "rejected", "rejected", "rejected"]
+    assert outcomes[0]["district_id"] == "622710"
+    assert outcomes[0]["id"] and outcomes[1]["id"]
+    assert "District 9999999 not found in database" in outcomes[2]["errors"]
+    assert "instructional_minutes must be between" in outcomes[3]["errors"][0]
+    assert any("must be before end time" in e for e in outcomes[4]["errors"])
+
+    # Two accepted rows in one page
+    assert len(session.upserts) == 1
+    sql = session.upserts[0]
+    assert "ON CONFLICT (district_id, year, grade_level) DO UPDATE" in sql
+    assert "coalesce(excluded.raw_import, bell_schedules.raw_import)" in sql
+    assert "RETURNING" in sql
+
+    assert [(l["entity_id"], l["operation"]) for l in session.lineage] == [
+        ("622710/2025-26/elementary", "create"),
+        ("622710/2025-26/middle", "update"),
+    ]
+
+
+def test_later_record_supersedes_same_key():
+    session = FakeSession({"622710"})
+    outcomes = add_bell_schedules_bulk(session, [schedule(minutes=300), schedule(minutes=330)])
+
+    assert [o["status"] for o in outcomes] == ["superseded", "create"]
+    assert len(session.lineage) == 1
+    assert session.lineage[0]["details"]["instructional_minutes"] == 330
+
+
+def test_pages_statements():
+    session = FakeSession({"622710"})
+    records = [schedule(grade_level=g) for g in ("elementary", "middle", "high")]
+
+    outcomes = add_bell_schedules_bulk(session, records, page_size=2)
+
+    assert len(session.upserts) == 2
+    assert all(o["status"] == "create" for o in outcomes)
+
+
+def test_validation_can_be_skipped():
+    session = FakeSession({"622710"})
+    record = schedule(start_time="08:00", end_time="15:00")
+
+    assert add_bell_schedules_bulk(session, [record])[0]["status"] == "rejected"
+    assert add_bell_schedules_bulk(session, [record], validate=False)[0]["status"] == "create"
@@ -0,0 +1,136 @@
+"""
+Tests for the raw CCD Parquet cache.
+
+Verifies that cached reads are indistinguishable from pd.read_csv and that
+stale caches are detected from the source file hash.
+"""
+
+import json
+import os
+import time
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from infrastructure.utilities import ccd_parquet_cache
+from infrastructure.utilities.ccd_parquet_cache import (
+    MANIFEST_NAME,
+    convert_to_parquet,
+    file_sha256,
+    find_cached,
+    iter_ccd_chunks,
+    read_ccd,
+)
+
+
+RAW_CSV = (
+    "SCHOOL_YEAR,FIPST,ST,LEAID,ST_LEAID,GRADE,STUDENT_COUNT,TOTAL_INDICATOR\n"
+    "2023-2024,01,AL,0100005,AL-101,Grade 1,10,Education Unit Total\n"
+    "2023-2024,06,CA,0600001,CA-6275796,Grade 2,,Education Unit Total\n"
+    "2023-2024,01,AL,0100006,AL-102,Grade 1,5,Education Unit Total\n"
+)
+
+
+@pytest.fixture
+def raw_file(tmp_path):
+    path = tmp_path / "ccd_lea_052_2324_l_1a_073124.csv"
+    path.write_text(RAW_CSV)
+    return path
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    return tmp_path / "cache"
+
+
+class TestConversion:
+    """Tests for convert_to_parquet()."""
+
+    def test_writes_state_partitions(self, raw_file, cache_dir):
+        dataset_dir = convert_to_parquet(raw_file, cache_dir)
+        partitions = sorted(p.name for p in dataset_dir.iterdir() if p.is_dir())
+        assert partitions == ["ST=AL", "ST=CA"]
+
+    def test_manifest_keyed_by_source_hash(self, raw_file, cache_dir):
+        convert_to_parquet(raw_file, cache_dir)
+        manifest = json.loads((cache_dir / MANIFEST_NAME).read_text())
+        entry = manifest["files"][file_sha256(raw_file)]
+        assert entry["rows"] == 3
+        assert entry["partitioned_by"] == "ST"
+        assert dict(entry["columns"])["LEAID"] == "string"
+
+    def test_second_conversion_reuses_cache(self, raw_file, cache_dir):
+        first = convert_to_parquet(raw_file, cache_dir)
+        mtime = first.stat().st_mtime
+        second = convert_to_parquet(raw_file, cache_dir)
+        assert second == first
+        assert second.stat().st_mtime == mtime
+
+
+class TestCachedReads:
+    """Cached reads must match what pd.read_csv returns."""
+
+    def test_full_read_matches_csv(self, raw_file, cache_dir):
+        convert_to_parquet(raw_file, cache_dir)
+        expected = pd.read_csv(raw_file, low_memory=False)
+        actual = read_ccd(raw_file, cache_dir=cache_dir)
+        pd.testing.assert_frame_equal(actual, expected)
+
+    def test_string_ids_keep_leading_zeros(self, raw_file, cache_dir):
+        convert_to_parquet(raw_file, cache_dir)
+        df = read_ccd(raw_file, columns=["LEAID", "ST_LEAID"], dtype=str, cache_dir=cache_dir)
+        assert list(df["LEAID"]) == ["0100005", "0600001", "0100006"]
+        assert list(df.columns) == ["LEAID", "ST_LEAID"]
+
+    def test_state_filter(self, raw_file, cache_dir):
+        convert_to_parquet(raw_file, cache_dir)
+        df = read_ccd(raw_file, dtype={"LEAID": str}, states=["ca"], cache_dir=cache_dir)
+        assert list(df["LEAID"]) == ["0600001"]
+
+    def test_chunks_cover_all_rows(self, raw_file, cache_dir):
+        convert_to_parquet(raw_file, cache_dir)
+        chunks = list(iter_ccd_chunks(raw_file, chunksize=2, columns=["LEAID"], cache_dir=cache_dir))
+        assert sorted(pd.concat(chunks)["LEAID"]) == [100005, 100006, 600001]
+
+    def test_all_strings_fallback_restores_numbers(self, tmp_path, cache_dir, monkeypatch):
+        # NOTE is inferred as int64 from the first block and a later block
+        # has text, so the copy is stored as all strings
+        rows = [f"01{i:05d},AL,{i},{'' if i % 7 else i},{i}" for i in range(200)]
+        path = tmp_path / "ccd_lea_059_2324_l_1a_073124.csv"
+        path.write_text("LEAID,ST,TEACHERS,STAFF_COUNT,NOTE\n" + "\n".join(rows) + "\n0199999,CA,1,2,see footnote\n")
+        monkeypatch.setattr(ccd_parquet_cache, "CSV_BLOCK_SIZE", 1024)
+
+        convert_to_parquet(path, cache_dir)
+        entry = json.loads((cache_dir / MANIFEST_NAME).read_text())["files"][file_sha256(path)]
+        assert entry["all_strings"] is True
+
+        expected = pd.read_csv(path, low_memory=False)
+        actual = read_ccd(path, cache_dir=cache_dir)
+        pd.testing.assert_frame_equal(actual, expected)
+        assert str(actual["TEACHERS"].dtype) == "int64"
+        assert str(actual["STAFF_COUNT"].dtype) == "float64"
+        chunk = next(iter_ccd_chunks(path, columns=["TEACHERS"], cache_dir=cache_dir))
+        assert str(chunk["TEACHERS"].dtype) == "int64"
+
+    def test_falls_back_to_csv_without_cache(self, raw_file, cache_dir):
+        df = read_ccd(raw_file, dtype={"LEAID": str}, cache_dir=cache_dir)
+        assert len(df) == 3
+        assert find_cached(raw_file, cache_dir) is None
+
+
+class TestFreshness:
+    """Cache invalidation follows the source content, not the timestamp."""
+
+    def test_touched_file_still_fresh(self, raw_file, cache_dir):
+        dataset_dir = convert_to_parquet(raw_file, cache_dir)
+        later = time.time() + 10
+        os.utime(raw_file, (later, later))
+        assert find_cached(raw_file, cache_dir) == dataset_dir
+
+    def test_modified_file_is_stale(self, raw_file, cache_dir):
+        convert_to_parquet(raw_file, cache_dir)
+        raw_file.write_text(RAW_CSV + "2023-2024,01,AL,0100007,AL-103,Grade 1,5,X\n")
+        assert find_cached(raw_file, cache_dir) is None
+        assert len(read_ccd(raw_file, cache_dir=cache_dir)) == 4
@@ -0,0 +1,197 @@
+"""
+Tests for the columnar Postgres -> pandas loader.
+"""
+
+import io
+
+import pytest
+from sqlalchemy import (
+    Boolean, Column, Float, Integer, MetaData, Numeric, String, Table, column, create_engine, literal_column,
+    select, text,
+)
+from sqlalchemy.dialects.postgresql import psycopg2 as pg_psycopg2
+
+from infrastructure.database import columnar
+from infrastructure.database.columnar import column_dtypes, iter_records, parse_copy_csv, read_frame, read_latest
+from infrastructure.database.models import StaffCountsEffective
+
+metadata = MetaData()
+staff = Table(
+    "staff", metadata,
+    Column("district_id", String(10)),
+    Column("teachers_k12", Numeric(10, 2)),
+    Column("enrollment_k12", Integer),
+    Column("is_shared_service_entity", Boolean),
+)
+enrollment = Table(
+    "enrollment", metadata,
+    Column("district_id", String(10)),
+    Column("source_year", String(10)),
+    Column("enrollment_k12", Integer),
+)
+
+COPY_OUTPUT = (
+    b"district_id,teachers_k12,enrollment_k12,is_shared_service_entity\n"
+    b'0100270,125.50,2400,f\n'
+    b'0100300,\\N,\\N,t\n'
+)
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(staff.insert(), [
+            {"district_id": "0100270", "teachers_k12": 125.5, "enrollment_k12": 2400,
+             "is_shared_service_entity": False},
+            {"district_id": "0100300", "teachers_k12": None, "enrollment_k12": None,
+             "is_shared_service_entity": True},
+        ])
+        conn.execute(enrollment.insert(), [
+            {"district_id": "0100300", "source_year": "2022-23", "enrollment_k12": 900},
+            {"district_id": "0100270", "source_year": "2023-24", "enrollment_k12": 2400},
+            {"district_id": "0100300", "source_year": "2024-25", "enrollment_k12": 950},
+            {"district_id": "0100270", "source_year": "2021-22", "enrollment_k12": 2300},
+        ])
+    return engine
+
+
+def test_column_dtypes_from_models():
+    names, dtypes = column_dtypes(select(
+        StaffCountsEffective.district_id,
+        StaffCountsEffective.teachers_k12,
+    ))
+    assert names == ["district_id", "teachers_k12"]
+    assert dtypes == {"district_id": "str", "teachers_k12": "float64"}
+
+
+@pytest.mark.parametrize("use_pyarrow", [True, False])
+def test_parse_copy_csv(monkeypatch, use_pyarrow):
+    if not use_pyarrow:
+        monkeypatch.setattr(columnar, "PYARROW_AVAILABLE", False)
+    names, dtypes = column_dtypes(select(staff))
+
+    df = parse_copy_csv(io.BytesIO(COPY_OUTPUT), names, dtypes)
+
+    assert df["district_id"].tolist() == ["0100270", "0100300"]  # leading zeros kept
+    assert str(df["teachers_k12"].dtype) == "float64"
+    assert df["teachers_k12"].iloc[0] == 125.5
+    assert str(df["enrollment_k12"].dtype) == "Int64"
+    assert df["enrollment_k12"].isna().tolist() == [False, True]
+    assert df["is_shared_service_entity"].tolist() == [False, True]
+
+
+def test_read_frame_fallback(engine):
+    with engine.connect() as conn:
+        df = read_frame(conn, select(staff.c.district_id, staff.c.teachers_k12, staff.c.enrollment_k12))
+
+    assert df.dtypes.astype(str).to_dict() == {
+        "district_id": "str", "teachers_k12": "float64", "enrollment_k12": "Int64",
+    }
+    assert df["teachers_k12"].iloc[0] == 125.5
+
+
+def test_read_frame_text_columns_are_positional(engine):
+    query = text("SELECT district_id, SUM(teachers_k12) FROM staff GROUP BY district_id").columns(
+        column("district_id", String), column("teachers", Float))
+
+    with engine.connect() as conn:
+        df = read_frame(conn, query)
+
+    assert list(df.columns) == ["district_id", "teachers"]
+
+
+class FakeCursor:
+    def __init__(self):
+        self.sql = None
+
+    def mogrify(self, sql, params):
+        # psycopg2-style: quote parameters, %% -> %, return bytes
+        quoted = {name: "'%s'" % str(value).replace("'", "''") if isinstance(value, str) else str(value)
+                  for name, value in params.items()}
+        return (sql % quoted).encode()
+
+    def copy_expert(self, sql, buffer):
+        self.sql = sql.decode()
+        buffer.write(COPY_OUTPUT)
+
+    def close(self):
+        pass
+
+
+class FakePostgresConnection:
+    """Connection stand-in: psycopg2 dialect, raw connection returning FakeCursor."""
+
+    dialect = pg_psycopg2.dialect()
+
+    def __init__(self):
+        self.last_cursor = FakeCursor()
+        self.connection = self
+
+    def cursor(self):
+        return self.last_cursor
+
+
+def test_read_frame_streams_copy_on_postgres():
+    conn = FakePostgresConnection()
+
+    df = read_frame(conn, select(staff).where(staff.c.district_id == "0100270"))
+
+    sql = conn.last_cursor.sql
+    assert sql.startswith("COPY (SELECT staff.district_id")
+    assert "WHERE staff.district_id = '0100270'" in sql
+    assert sql.endswith("TO STDOUT WITH (FORMAT csv, HEADER true, NULL '\\N')")
+    assert df["district_id"].tolist() == ["0100270", "0100300"]
+
+
+def test_read_frame_copy_keeps_percent_literals():
+    conn = FakePostgresConnection()
+
+    read_frame(conn, select(staff)
+               .where(staff.c.district_id.like("01%"))
+               .where(literal_column("'50%'", String) != staff.c.district_id))
+
+    sql = conn.last_cursor.sql
+    assert "staff.district_id != '50%'" in sql
+    assert "LIKE '01%'" in sql
+    assert "%%" not in sql
+
+
+def test_read_frame_fallback_keeps_missing_strings(engine):
+    query = text("SELECT NULL AS name, '50%' AS share").columns(column("name", String), column("share", String))
+
+    with engine.connect() as conn:
+        df = read_frame(conn, query)
+
+    assert df["name"].isna().all()
+    assert df["share"].tolist() == ["50%"]
+
+
+def test_iter_records_uses_none_for_missing(engine):
+    with engine.connect() as conn:
+        records = list(iter_records(read_frame(conn, select(staff))))
+
+    assert records[0].teachers_k12 == 125.5
+    assert records[0].enrollment_k12 == 2400
+    assert records[1].teachers_k12 is None
+    assert records[1].enrollment_k12 is None
+    assert (records[1].enrollment_k12 or 0) == 0
+
+
+def test_read_latest_fallback(engine):
+    with engine.connect() as conn:
+        df = read_latest(conn, select(enrollment), enrollment.c.district_id, enrollment.c.source_year.desc())
+
+    assert df.values.tolist() == [["0100270", "2023-24", 2400], ["0100300", "2024-25", 950]]
+    assert str(df["enrollment_k12"].dtype) == "Int64"
+
+
+def test_read_latest_uses_distinct_on_for_postgres():
+    conn = FakePostgresConnection()
+
+    read_latest(conn, select(staff), staff.c.district_id, staff.c.teachers_k12.desc())
+
+    sql = conn.last_cursor.sql
+    assert sql.startswith("COPY (SELECT DISTINCT ON (staff.district_id) staff.district_id")
+    assert "ORDER BY staff.district_id, staff.teachers_k12 DESC) TO STDOUT" in sql
@@ -0,0 +1,183 @@
+"""
+Tests for the COPY-based Docker export/import scripts.
+"""
+
+import json
+
+import pytest
+
+from infrastructure.database.docker.export_database import (
+    copy_options,
+    export_table,
+    load_waves,
+    model_tables,
+)
+from infrastructure.database.docker import import_to_docker
+from infrastructure.database.docker.import_to_docker import import_export, load_table, verify_export
+
+PAYLOAD = b"PGCOPY\n\xff\r\n\x00" + b"row data " * 1000
+
+
+class FakeCursor:
+    """Streams PAYLOAD for COPY TO and captures input for COPY FROM."""
+
+    def __init__(self, columns, rowcount):
+        self.columns = columns
+        self.rowcount = rowcount
+        self.executed = []
+        self.copied = []
+        self.received = None
+
+    def execute(self, sql, params=None):
+        self.executed.append((sql, params))
+
+    def fetchall(self):
+        return [(c,) for c in self.columns]
+
+    def copy_expert(self, sql, f):
+        self.copied.append(sql)
+        if "TO STDOUT" in sql:
+            for i in range(0, len(PAYLOAD), 4096):
+                f.write(PAYLOAD[i:i + 4096])
+        else:
+            self.received = f.read()
+
+
+class FakeConnection:
+    def __init__(self, cursor):
+        self._cursor = cursor
+        self.committed = False
+        self.rolled_back = False
+
+    def set_session(self, **kwargs):
+        self.session = kwargs
+
+    def cursor(self):
+        return self._cursor
+
+    def commit(self):
+        self.committed = True
+
+    def rollback(self):
+        self.rolled_back = True
+
+    def close(self):
+        pass
+
+
+class FakeEngine:
+    def __init__(self, cursor):
+        self.cursor = cursor
+        self.connections = []
+
+    def raw_connection(self):
+        conn = FakeConnection(self.cursor)
+        self.connections.append(conn)
+        return conn
+
+    def dispose(self):
+        pass
+
+
+def test_model_tables_cover_models_in_fk_order():
+    tables = model_tables()
+    names = [t["name"] for t in tables]
+
+    assert {"districts", "bell_schedules", "lct_calculations", "enrichment_queue"} <= set(names)
+    assert names.index("districts") < names.index("bell_schedules") < names.index("lct_calculations")
+    bell = next(t for t in tables if t["name"] == "bell_schedules")
+    assert bell["after"] == ["districts"]
+
+
+def test_load_waves_respects_references():
+    waves = load_waves([
+        {"name": "lct_calculations", "after": ["districts", "bell_schedules"]},
+        {"name": "bell_schedules", "after": ["districts"]},
+        {"name": "districts", "after": []},
+        {"name": "state_requirements", "after": []},
+        {"name": "orphan", "after": ["not_exported"]},
+    ])
+
+    assert waves == [
+        ["districts", "orphan", "state_requirements"],
+        ["bell_schedules"],
+        ["lct_calculations"],
+    ]
+
+    with pytest.raises(ValueError, match="cycle"):
+        load_waves([{"name": "a", "after": ["b"]}, {"name": "b", "after": ["a"]}])
+
+
+def test_copy_options():
+    assert copy_options("binary") == "FORMAT binary"
+    assert "csv" in copy_options("csv")
+    with pytest.raises(ValueError):
+        copy_options("sql")
+
+
+def test_export_verify_and_load_round_trip(tmp_path):
+    cursor = FakeCursor(["nces_id", "name"], rowcount=2)
+    entry = export_table(
+        FakeEngine(cursor), "00000003-1", {"name": "districts", "after": []}, tmp_path, "binary", 1,
+    )
+
+    assert entry["rows"] == 2
+    assert entry["columns"] == ["nces_id", "name"]
+    assert cursor.executed[0] == ("SET TRANSACTION SNAPSHOT %s", ("00000003-1",))
+    assert cursor.copied[0] == 'COPY districts ("nces_id", "name") TO STDOUT WITH (FORMAT binary)'
+    assert (tmp_path / entry["file"]).stat().st_size == entry["bytes"] < len(PAYLOAD)
+
+    manifest = {"format": "binary", "tables": [entry]}
+    assert verify_export(tmp_path, manifest) == []
+
+    load_cursor = FakeCursor([], rowcount=2)
+    engine = FakeEngine(load_cursor)
+    assert load_table(engine, tmp_path, entry, "binary") == 2
+    assert load_cursor.received == PAYLOAD
+    assert load_cursor.copied[0].startswith('COPY districts ("nces_id", "name") FROM STDIN')
+    assert engine.connections[0].committed
+
+
+def test_export_skips_missing_table(tmp_path):
+    cursor = FakeCursor([], rowcount=0)
+    assert export_table(FakeEngine(cursor), "snap", {"name": "gone", "after": []}, tmp_path, "csv", 1) is None
+    assert not cursor.copied
+
+
+def test_verify_detects_tampering_and_missing_files(tmp_path):
+    entry = export_table(
+        FakeEngine(FakeCursor(["id"], rowcount=1)), "snap", {"name": "t", "after": []}, tmp_path, "binary", 1,
+    )
+    missing = dict(entry, name="u", file="u.copy.gz")
+    (tmp_path / entry["file"]).write_bytes(b"corrupt")
+
+    problems = verify_export(tmp_path, {"tables": [entry, missing]})
+
+    assert problems == ["t: checksum mismatch for t.copy.gz", "u: missing u.copy.gz"]
+
+
+def test_load_rejects_row_count_mismatch(tmp_path):
+    entry = export_table(
+        FakeEngine(FakeCursor(["id"], rowcount=5)), "snap", {"name": "t", "after": []}, tmp_path, "binary", 1,
+    )
+    engine = FakeEngine(FakeCursor([], rowcount=4))
+
+    with pytest.raises(RuntimeError, match="loaded 4 rows, manifest has 5"):
+        load_table(engine, tmp_path, entry, "binary")
+    assert engine.connections[0].rolled_back and not engine.connections[0].committed
+
+
+def test_truncate_refuses_when_other_tables_reference_export(tmp_path, monkeypatch):
+    entry = export_table(
+        FakeEngine(FakeCursor(["nces_id"], rowcount=1)), "snap", {"name": "districts", "after": []},
+        tmp_path, "binary", 1,
+    )
+    (tmp_path / "manifest.json").write_text(json.dumps({"format": "binary", "tables": [entry]}))
+    # pg_constraint lookup: a SEA table outside models.py references districts
+    cursor = FakeCursor([], rowcount=1)
+    cursor.fetchall = lambda: [("tx_staff_data", "districts")]
+    monkeypatch.setattr(import_to_docker, "create_engine", lambda *args, **kwargs: FakeEngine(cursor))
+
+    with pytest.raises(RuntimeError, match="tx_staff_data -> districts"):
+        import_export(tmp_path, "postgresql://target/lct", truncate=True)
+    assert not any(sql.startswith("TRUNCATE") for sql, _ in cursor.executed)
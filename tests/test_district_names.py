@@ -0,0 +1,126 @@
+"""
+Tests for the trigram district name index used by manual bell schedule
+import and district_lookup.py.
+"""
+
+from pathlib import Path
+
+import pandas as pd
+
+from infrastructure.utilities.district_names import (
+    DistrictNameIndex,
+    name_key,
+    normalize_district_name,
+)
+
+RECORDS = [
+    ("0622710", "Los Angeles Unified", "CA"),
+    ("0622500", "Los Alamitos Unified", "CA"),
+    ("3800014", "BISMARCK 1", "ND"),
+    ("0100270", "Baldwin County", "AL"),
+    ("0100271", "Baldwin Park", "AL"),
+    ("1200390", "St. Lucie", "FL"),
+]
+
+
+def test_normalize_district_name_strips_suffixes():
+    assert normalize_district_name("Denver Public Schools") == "Denver"
+    assert normalize_district_name("Los Angeles Unified School District") == "Los Angeles Unified"
+    assert normalize_district_name("Baldwin County Public Schools") == "Baldwin County"
+    assert normalize_district_name("BALDWIN COUNTY SCHOOLS") == "BALDWIN COUNTY"
+
+
+def test_name_key_folds_case_and_punctuation():
+    assert name_key("St. Lucie Public Schools") == "st lucie"
+    assert name_key("Ware & Harrison") == "ware and harrison"
+    assert name_key(None) == ""
+
+
+def test_exact_normalized_match_scores_one():
+    index = DistrictNameIndex(RECORDS)
+    [best] = index.match("Los Angeles Unified School District", "CA", limit=1)
+
+    assert best.district_id == "0622710"
+    assert best.score == 1.0
+
+
+def test_fuzzy_matches_are_ranked_and_state_scoped():
+    index = DistrictNameIndex(RECORDS)
+
+    candidates = index.match("Los Angelas Unified", "CA")
+    assert candidates[0].district_id == "0622710"
+    assert candidates == sorted(candidates, key=lambda c: -c.score)
+
+    assert index.match("Bismarck", "ND")[0].district_id == "3800014"
+    assert index.match("Bismarck", "CA") == []
+    assert index.match("Bismarck")[0].state == "ND"
+
+
+def test_min_score_filters_weak_candidates():
+    index = DistrictNameIndex(RECORDS)
+    assert index.match("Zzyzx Valley", "CA", min_score=0.3) == []
+
+
+def test_match_many_preserves_order():
+    index = DistrictNameIndex(RECORDS)
+    results = index.match_many([
+        ("St Lucie County Schools", "FL"),
+        ("Nowhere", "AL"),
+        ("Baldwin County Public Schools", "AL"),
+    ])
+
+    assert [r[0].district_id if r else None for r in results] == ["1200390", None, "0100270"]
+
+
+def test_from_dataframe_and_lookup_by_name():
+    from infrastructure.scripts.utilities.district_lookup import lookup_by_name
+    from infrastructure.utilities.district_reference import DistrictReference
+
+    df = pd.DataFrame(RECORDS, columns=["district_id", "district_name", "state"])
+    assert len(DistrictNameIndex.from_dataframe(df)) == len(RECORDS)
+
+    result = lookup_by_name(DistrictReference(df), "Los Angelas Unified", "CA")
+    assert result.iloc[0]["district_id"] == "0622710"
+    assert result["match_score"].is_monotonic_decreasing
+
+
+class FakeResult:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def all(self):
+        return self.rows
+
+
+class FakeSession:
+    def __init__(self, rows):
+        self.rows = rows
+        self.statements = []
+
+    def execute(self, statement):
+        self.statements.append(statement)
+        return FakeResult(self.rows)
+
+
+def test_match_districts_to_db_uses_one_query():
+    from infrastructure.scripts.enrich.import_manual_bell_schedules import (
+        DistrictMatch,
+        match_districts_to_db,
+    )
+
+    session = FakeSession(RECORDS)
+    folders = [
+        DistrictMatch("Los Angeles Unified School District", Path("."), "CA", "Los Angeles Unified School District"),
+        DistrictMatch("Bismarck Public Schools (ND)", Path("."), "ND", "Bismarck Public Schools"),
+        DistrictMatch("Unknown", Path("."), "AL", "Completely Different"),
+        DistrictMatch("No State", Path("."), None, "Baldwin County"),
+    ]
+
+    matched = match_districts_to_db(folders, session)
+
+    assert len(session.statements) == 1
+    assert [(m.nces_id, m.db_name) for m in matched] == [
+        ("0622710", "Los Angeles Unified"),
+        ("3800014", "BISMARCK 1"),
+    ]
+    assert matched[0].match_score == 1.0
@@ -0,0 +1,97 @@
+"""
+Tests for the indexed enrichment reference used by district_lookup.py,
+enrichment_progress.py and the /districts API routes.
+"""
+
+import os
+
+import pandas as pd
+import pytest
+
+from infrastructure.utilities import district_reference
+from infrastructure.utilities.district_reference import (
+    DistrictReference,
+    get_reference,
+    snapshot_path,
+)
+
+
+@pytest.fixture
+def reference_csv(tmp_path):
+    path = tmp_path / "enrichment_reference.csv"
+    pd.DataFrame({
+        "district_id": [100270, 3800014, 3800015, 622710],
+        "district_name": ["Baldwin County", "BISMARCK 1", "WEST FARGO 6", "Los Angeles Unified"],
+        "state": ["AL", "ND", "ND", "CA"],
+        "enrollment_total": [30000, 13000, 11000, 420000],
+        "enriched": [True, False, True, False],
+        "enrollment_elementary": [15000, 6500, 5500, 210000],
+        "enrollment_middle": [7000, 3000, 2500, 100000],
+        "enrollment_high": [8000, 3500, 3000, 110000],
+    }).to_csv(path, index=False)
+    return path
+
+
+def test_id_lookup_with_and_without_leading_zeros(reference_csv):
+    ref = DistrictReference.load(reference_csv)
+
+    assert ref.get("0100270")["district_name"] == "Baldwin County"
+    assert ref.get(100270)["state"] == "AL"
+    assert ref.get("9999999") is None
+    assert ref.lookup(["3800015", "missing", "0622710"])["state"].tolist() == ["ND", "CA"]
+
+
+def test_state_index_and_stats(reference_csv):
+    ref = DistrictReference.load(reference_csv)
+
+    assert ref.for_state("nd")["district_name"].tolist() == ["BISMARCK 1", "WEST FARGO 6"]
+    assert ref.for_state("ZZ").empty
+    assert len(ref.for_state(None)) == 4
+
+    stats = ref.state_stats()
+    assert stats.loc["ND", "total_districts"] == 2
+    assert stats.loc["ND", "enriched_count"] == 1
+    assert stats.loc["ND", "enrichment_rate"] == 50.0
+    assert ref.state_stats() is stats
+
+
+def test_snapshot_written_then_reused(reference_csv, mocker):
+    first = DistrictReference.load(reference_csv)
+    assert snapshot_path(reference_csv).exists()
+
+    read_csv = mocker.patch.object(district_reference.pd, "read_csv")
+    second = DistrictReference.load(reference_csv)
+
+    read_csv.assert_not_called()
+    pd.testing.assert_frame_equal(first.df, second.df)
+
+
+def test_snapshot_rebuilt_when_csv_changes(reference_csv):
+    DistrictReference.load(reference_csv)
+
+    df = pd.read_csv(reference_csv)
+    df.loc[len(df)] = [5600001, "Laramie 1", "WY", 14000, False, 7000, 3000, 4000]
+    df.to_csv(reference_csv, index=False)
+    os.utime(reference_csv, ns=(0, 10**18))
+
+    assert DistrictReference.load(reference_csv).get("5600001")["state"] == "WY"
+
+
+def test_get_reference_cached_per_process(reference_csv):
+    first = get_reference(reference_csv)
+    assert get_reference(reference_csv) is first
+
+    os.utime(reference_csv, ns=(0, 10**18))
+    assert get_reference(reference_csv) is not first
+
+
+def test_enrichment_progress_uses_reference(reference_csv):
+    from infrastructure.scripts.enrich.enrichment_progress import EnrichmentProgressTracker
+
+    tracker = EnrichmentProgressTracker(reference_csv)
+
+    assert tracker.get_overall_stats()["enriched"] == 2
+    assert tracker.get_state_stats("ND")["pending"].tolist() == [1]
+    assert tracker.get_next_districts(5, "ND")["district_id"].tolist() == [3800014]
+    # State order puts ND ahead of AL and CA
+    assert tracker.get_state_stats().index.tolist() == ["ND", "AL", "CA"]
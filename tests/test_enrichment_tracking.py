@@ -0,0 +1,119 @@
+"""
+Tests for enrichment attempt tracking: response mapping, buffered logging
+and set-based auto-flagging.
+"""
+
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from infrastructure.database import enrichment_tracking
+from infrastructure.database.enrichment_tracking import (
+    ATTEMPT_COLUMNS,
+    AttemptLogger,
+    attempt_record,
+    auto_flag_repeat_failures,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def inserted(mocker):
+    """Capture insert_attempts batches instead of writing to a database."""
+    batches = []
+
+    def fake_insert(session, records, page_size=500):
+        batches.append(records)
+        start = sum(len(b) for b in batches[:-1])
+        return list(range(start + 1, start + len(records) + 1))
+
+    mocker.patch.object(enrichment_tracking, "insert_attempts", side_effect=fake_insert)
+    return batches
+
+
+class TestAttemptRecord:
+    def test_blocked_response(self):
+        response = {"errorCode": "BLOCKED", "error": "Cloudflare challenge", "statusCode": 403, "timing": 812.6}
+        record = attempt_record("0622710", "https://lausd.org", response, "tier1")
+
+        assert set(record) == set(ATTEMPT_COLUMNS)
+        assert record["status"] == "blocked"
+        assert record["block_type"] == "cloudflare"
+        assert record["timing_ms"] == 812
+        assert json.loads(record["response_details"]) == response
+
+    def test_status_mapping(self):
+        assert attempt_record("1", "u", {})["status"] == "success"
+        assert attempt_record("1", "u", {"errorCode": "NOT_FOUND"})["status"] == "not_found"
+        assert attempt_record("1", "u", {"errorCode": "SOMETHING_NEW"})["status"] == "error"
+        assert attempt_record("1", "u", {"blocked": True, "statusCode": 403})["block_type"] == "waf"
+
+
+class TestAttemptLogger:
+    def test_flushes_on_batch_size(self, inserted):
+        session = MagicMock()
+        attempts = AttemptLogger(session, batch_size=3, flush_seconds=3600)
+
+        for i in range(7):
+            attempts.log_scraper_response(f"{i:07d}", {"url": f"https://d{i}.org"})
+
+        assert [len(b) for b in inserted] == [3, 3]
+        assert len(attempts.pending) == 1
+        assert session.commit.call_count == 2
+
+    def test_flushes_on_elapsed_time(self, inserted):
+        clock = FakeClock()
+        attempts = AttemptLogger(MagicMock(), batch_size=100, flush_seconds=30, clock=clock)
+
+        attempts.log("0000001", "https://a.org", {})
+        clock.now = 10
+        attempts.log("0000002", "https://b.org", {})
+        assert inserted == []
+
+        clock.now = 31
+        attempts.log("0000003", "https://c.org", {})
+        assert [len(b) for b in inserted] == [3]
+        assert attempts.pending == []
+
+    def test_context_manager_flushes_remainder(self, inserted):
+        with AttemptLogger(MagicMock(), batch_size=100) as attempts:
+            attempts.log("0000001", "https://a.org", {"errorCode": "TIMEOUT"})
+
+        assert inserted[0][0]["status"] == "timeout"
+        assert attempts.logged == 1
+
+    def test_context_manager_flushes_on_error(self, inserted):
+        with pytest.raises(RuntimeError):
+            with AttemptLogger(MagicMock(), batch_size=100) as attempts:
+                attempts.log("0000001", "https://a.org", {})
+                raise RuntimeError("scraper crashed")
+
+        assert len(inserted) == 1
+
+    def test_empty_flush_skips_database(self, inserted):
+        session = MagicMock()
+        assert AttemptLogger(session).flush() == []
+        assert inserted == []
+        session.commit.assert_not_called()
+
+
+def test_auto_flag_is_one_statement():
+    session = MagicMock()
+    session.execute.return_value.fetchall.return_value = [("0100001",), ("0100001",), ("0200002",)]
+
+    assert auto_flag_repeat_failures(session, block_threshold=3, not_found_threshold=4) == 2
+
+    session.execute.assert_called_once()
+    sql, params = session.execute.call_args.args
+    assert "UPDATE enrichment_attempts" in str(sql) and "HAVING" in str(sql)
+    assert params["block_reason"] == "auto_flag_3_blocks"
+    assert params["not_found_reason"] == "auto_flag_4_not_found"
+    session.commit.assert_called_once()
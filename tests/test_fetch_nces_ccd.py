@@ -0,0 +1,210 @@
+"""
+Tests for the resumable, checksum-verified CCD downloader.
+
+Runs against a local HTTP server that supports Range requests.
+"""
+
+import hashlib
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from infrastructure.scripts.download import fetch_nces_ccd
+from infrastructure.scripts.download.fetch_nces_ccd import (
+    CHECKSUM_FILE,
+    create_metadata_file,
+    download_file,
+    download_table,
+    download_tables,
+    load_recorded_checksums,
+)
+
+
+PAYLOAD = bytes(range(256)) * 4096  # 1 MB
+
+
+class _RangeHandler(BaseHTTPRequestHandler):
+    """Serves PAYLOAD at any path, honouring 'Range: bytes=N-' and If-Range."""
+
+    requests_seen = []
+    support_ranges = True
+    etag = '"v1"'
+
+    def do_GET(self):
+        range_header = self.headers.get("Range")
+        if_range = self.headers.get("If-Range")
+        type(self).requests_seen.append((self.path, range_header, if_range))
+
+        if self.path.endswith("missing.zip"):
+            self.send_response(404)
+            self.end_headers()
+            return
+
+        start = 0
+        if range_header and self.support_ranges and if_range in (None, self.etag):
+            start = int(range_header.split("=")[1].rstrip("-"))
+            if start >= len(PAYLOAD):
+                self.send_response(416)
+                self.end_headers()
+                return
+            self.send_response(206)
+        else:
+            self.send_response(200)
+        body = PAYLOAD[start:]
+        self.send_header("ETag", self.etag)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def http_server():
+    _RangeHandler.requests_seen = []
+    _RangeHandler.support_ranges = True
+    _RangeHandler.etag = '"v1"'
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _RangeHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}", _RangeHandler
+    server.shutdown()
+    server.server_close()
+
+
+class TestDownloadFile:
+    """Single-file download behaviour."""
+
+    def test_full_download(self, http_server, tmp_path):
+        base_url, _ = http_server
+        output = tmp_path / "ccd_lea_staff_2024.zip"
+        assert download_file(f"{base_url}/ccd_lea_staff_2024.zip", output)
+        assert output.read_bytes() == PAYLOAD
+        assert not (tmp_path / "ccd_lea_staff_2024.zip.part").exists()
+        assert not (tmp_path / "ccd_lea_staff_2024.zip.part.validator").exists()
+
+    def test_resumes_partial_download(self, http_server, tmp_path):
+        base_url, handler = http_server
+        output = tmp_path / "data.zip"
+        (tmp_path / "data.zip.part").write_bytes(PAYLOAD[:1000])
+        (tmp_path / "data.zip.part.validator").write_text('"v1"')
+
+        assert download_file(f"{base_url}/data.zip", output)
+        assert output.read_bytes() == PAYLOAD
+        assert handler.requests_seen[-1][1:] == ("bytes=1000-", '"v1"')
+
+    def test_restarts_when_file_changed(self, http_server, tmp_path):
+        base_url, handler = http_server
+        handler.etag = '"v2"'
+        output = tmp_path / "data.zip"
+        (tmp_path / "data.zip.part").write_bytes(b"old version")
+        (tmp_path / "data.zip.part.validator").write_text('"v1"')
+
+        assert download_file(f"{base_url}/data.zip", output)
+        assert output.read_bytes() == PAYLOAD
+        assert handler.requests_seen[-1][1:] == ("bytes=11-", '"v1"')
+
+    def test_partial_without_validator_restarts(self, http_server, tmp_path):
+        base_url, handler = http_server
+        output = tmp_path / "data.zip"
+        (tmp_path / "data.zip.part").write_bytes(b"unknown origin")
+
+        assert download_file(f"{base_url}/data.zip", output)
+        assert output.read_bytes() == PAYLOAD
+        assert handler.requests_seen[-1][1] is None
+
+    def test_interrupted_download_records_validator(self, http_server, tmp_path, monkeypatch):
+        base_url, _ = http_server
+        output = tmp_path / "data.zip"
+        monkeypatch.setattr(fetch_nces_ccd, "CHUNK_SIZE", 1000)
+
+        def interrupt(self, n):
+            raise KeyboardInterrupt
+
+        monkeypatch.setattr(fetch_nces_ccd._ProgressLogger, "update", interrupt)
+        with pytest.raises(KeyboardInterrupt):
+            download_file(f"{base_url}/data.zip", output)
+        assert (tmp_path / "data.zip.part.validator").read_text() == '"v1"'
+
+    def test_restarts_when_range_ignored(self, http_server, tmp_path):
+        base_url, handler = http_server
+        handler.support_ranges = False
+        output = tmp_path / "data.zip"
+        (tmp_path / "data.zip.part").write_bytes(b"stale bytes")
+
+        assert download_file(f"{base_url}/data.zip", output)
+        assert output.read_bytes() == PAYLOAD
+
+    def test_complete_partial_file(self, http_server, tmp_path):
+        base_url, _ = http_server
+        output = tmp_path / "data.zip"
+        (tmp_path / "data.zip.part").write_bytes(PAYLOAD)
+        (tmp_path / "data.zip.part.validator").write_text('"v1"')
+
+        assert download_file(f"{base_url}/data.zip", output)
+        assert output.read_bytes() == PAYLOAD
+
+    def test_checksum_mismatch_fails(self, http_server, tmp_path):
+        base_url, _ = http_server
+        output = tmp_path / "data.zip"
+        assert not download_file(f"{base_url}/data.zip", output, expected_sha256="0" * 64)
+        assert not output.exists()
+
+    def test_http_error_returns_false(self, http_server, tmp_path):
+        base_url, _ = http_server
+        assert not download_file(f"{base_url}/missing.zip", tmp_path / "missing.zip")
+
+
+class TestChecksumSkipping:
+    """Checksums recorded in metadata let later runs skip unchanged files."""
+
+    @pytest.fixture
+    def catalog(self, http_server, monkeypatch):
+        base_url, _ = http_server
+        catalog = {
+            "2023-24": {
+                "district_staff": {"url": f"{base_url}/staff.zip", "description": "Staff"},
+                "district_directory": {"url": f"{base_url}/directory.zip", "description": "Directory"},
+            }
+        }
+        monkeypatch.setattr(fetch_nces_ccd, "CCD_CATALOG", catalog)
+        return catalog
+
+    def test_parallel_download_and_metadata(self, catalog, tmp_path):
+        results = download_tables("2023-24", ["district_staff", "district_directory"], tmp_path, max_workers=2)
+        assert [r["status"] for r in results] == ["downloaded", "downloaded"]
+
+        create_metadata_file(tmp_path, "2023-24", [r["table"] for r in results],
+                             {r["table"]: r["sha256"] for r in results})
+
+        expected = hashlib.sha256(PAYLOAD).hexdigest()
+        assert load_recorded_checksums(tmp_path) == {"staff.zip": expected, "directory.zip": expected}
+        assert f"**SHA-256**: {expected}" in (tmp_path / "README.md").read_text()
+
+    def test_metadata_keeps_other_checksums(self, catalog, tmp_path):
+        (tmp_path / CHECKSUM_FILE).write_text(f"{'a' * 64}  membership.zip\n{'b' * 64}  staff.zip\n")
+
+        create_metadata_file(tmp_path, "2023-24", ["district_staff"], {"district_staff": "c" * 64})
+
+        assert load_recorded_checksums(tmp_path) == {"membership.zip": "a" * 64, "staff.zip": "c" * 64}
+
+    def test_matching_file_is_skipped(self, catalog, http_server, tmp_path):
+        _, handler = http_server
+        (tmp_path / "staff.zip").write_bytes(PAYLOAD)
+        (tmp_path / CHECKSUM_FILE).write_text(f"{hashlib.sha256(PAYLOAD).hexdigest()}  staff.zip\n")
+
+        result = download_table("district_staff", catalog["2023-24"]["district_staff"]["url"],
+                                tmp_path, load_recorded_checksums(tmp_path))
+        assert result["status"] == "skipped"
+        assert handler.requests_seen == []
+
+    def test_changed_file_is_redownloaded(self, catalog, tmp_path):
+        (tmp_path / "staff.zip").write_bytes(b"corrupted")
+        (tmp_path / CHECKSUM_FILE).write_text(f"{hashlib.sha256(PAYLOAD).hexdigest()}  staff.zip\n")
+
+        result = download_table("district_staff", catalog["2023-24"]["district_staff"]["url"],
+                                tmp_path, load_recorded_checksums(tmp_path))
+        assert result["status"] == "downloaded"
+        assert (tmp_path / "staff.zip").read_bytes() == PAYLOAD
@@ -0,0 +1,105 @@
+"""
+Tests for the NCES CCD URL / grade span importer's CSV loaders and
+set-based district updates.
+"""
+
+import csv
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from infrastructure.scripts import import_district_urls as urls_script
+from infrastructure.scripts.import_district_urls import (
+    GSHI_COL,
+    GSLO_COL,
+    LEAID_COL,
+    WEBSITE_COL,
+    district_update_sql,
+    load_grade_spans_from_csv,
+    load_urls_from_csv,
+    update_districts,
+)
+
+
+def ccd_row(leaid, website="", gslo="", gshi=""):
+    row = [""] * (GSHI_COL + 1)
+    row[LEAID_COL] = leaid
+    row[WEBSITE_COL] = website
+    row[GSLO_COL] = gslo
+    row[GSHI_COL] = gshi
+    return row
+
+
+@pytest.fixture
+def ccd_file(tmp_path, monkeypatch):
+    path = tmp_path / "ccd_lea.csv"
+    rows = [
+        ccd_row("100005", "www.albertk12.org/", "PK", "12"),
+        ccd_row("0622710", "https://lausd.org", "KG", "12"),
+        ccd_row("0100006", "NA", "M", "8"),
+        ccd_row("", "https://no-leaid.org", "01", "05"),
+        ccd_row("0100007", "  -  ", "1", "N"),
+        ccd_row("0622710", "", "", ""),  # Later blank row doesn't erase the first
+    ]
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow([f"COL{i}" for i in range(GSHI_COL + 1)])
+        writer.writerows(rows)
+    monkeypatch.setattr(urls_script, "NCES_CCD_FILE", path)
+    return path
+
+
+def test_load_urls(ccd_file):
+    assert load_urls_from_csv() == {
+        "0100005": "https://www.albertk12.org",
+        "0622710": "https://lausd.org",
+    }
+
+
+def test_load_grade_spans(ccd_file):
+    assert load_grade_spans_from_csv() == {
+        "0100005": ("PK", "12"),
+        "0622710": ("KG", "12"),
+    }
+
+
+def test_district_update_sql():
+    assert district_update_sql(["grade_span_low", "grade_span_high"]) == (
+        "UPDATE districts AS d SET grade_span_low = v.grade_span_low, grade_span_high = v.grade_span_high "
+        "FROM (VALUES %s) AS v(nces_id, grade_span_low, grade_span_high) "
+        "WHERE d.nces_id = v.nces_id"
+    )
+
+
+class FakeCursor:
+    """Enough of a psycopg2 cursor for execute_values."""
+
+    connection = SimpleNamespace(encoding="UTF8")
+
+    def __init__(self):
+        self.statements = []
+
+    def mogrify(self, template, args):
+        return (template.decode() % tuple(repr(a) for a in args)).encode()
+
+    def execute(self, sql):
+        self.statements.append(sql.decode() if isinstance(sql, bytes) else sql)
+
+    def close(self):
+        pass
+
+
+def test_update_districts_pages_rows(monkeypatch):
+    cursor = FakeCursor()
+    session = MagicMock()
+    session.connection.return_value.connection.cursor.return_value = cursor
+    monkeypatch.setattr(urls_script, "UPDATE_PAGE_SIZE", 2)
+
+    rows = [(f"010000{i}", f"https://d{i}.org") for i in range(5)]
+    assert update_districts(session, ["website_url"], rows) == 5
+
+    assert len(cursor.statements) == 3
+    assert cursor.statements[0].startswith("UPDATE districts AS d SET website_url = v.website_url FROM (VALUES (")
+    assert "'0100004'" in cursor.statements[2]
+    assert update_districts(session, ["website_url"], []) == 0
@@ -0,0 +1,51 @@
+"""
+Tests for multi-mode LCT calculation (calculate_lct_variants.py --modes).
+"""
+
+import argparse
+
+import pytest
+
+from infrastructure.scripts.analyze import calculate_lct_variants
+from infrastructure.scripts.analyze.calculate_lct_variants import SharedInputs, parse_modes
+
+
+def test_parse_modes():
+    assert parse_modes("blended,2023-24, 2022-23") == [None, "2023-24", "2022-23"]
+    assert parse_modes("2023-24,BLENDED,2023-24,") == ["2023-24", None]
+
+
+@pytest.mark.parametrize("value", ["", ",", "2023", "blended,latest"])
+def test_parse_modes_rejects_invalid(value):
+    with pytest.raises(argparse.ArgumentTypeError):
+        parse_modes(value)
+
+
+def test_shared_inputs_resolve_once(monkeypatch):
+    calls = []
+
+    def fake_minutes(session, district_id, state, grade_level):
+        calls.append(("minutes", district_id))
+        return 360, "state_requirement", "2023-24"
+
+    def fake_sped(session, target_year=None):
+        calls.append(("sped", target_year))
+        return {"0100270": ("estimate", "2023-24")}
+
+    monkeypatch.setattr(calculate_lct_variants, "get_instructional_minutes", fake_minutes)
+    monkeypatch.setattr(calculate_lct_variants, "get_most_recent_sped", fake_sped)
+    inputs = SharedInputs(session=None)
+
+    for target_year in (None, "2023-24", None):
+        assert inputs.instructional_minutes("0100270", "AL")[0] == 360
+        inputs.sped(target_year)
+
+    assert calls == [("minutes", "0100270"), ("sped", None), ("sped", "2023-24")]
+
+
+def test_shared_inputs_load_once():
+    inputs = SharedInputs(session=None)
+    inputs.staff_records = []
+
+    # Already loaded: no queries against the (absent) session
+    assert inputs.load() is inputs
@@ -0,0 +1,134 @@
+"""
+Tests for the vectorized LCTCalculator.calculate_batch_lct.
+
+Each batch result is checked against calculate_district_lct on the same row.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.python.calculators.lct_calculator import LCTCalculator
+
+STATE_REQUIREMENTS = {
+    "CA": {"all_grades": {"minutes_per_day": 360}},
+    "TX": {"requirements": {
+        "K-8": {"minutes_per_day": 240},
+        "9-12": {"minutes_per_day": 360},
+    }},
+}
+
+RESULT_COLUMNS = ["lct_minutes", "lct_hours", "lct_yearly_hours", "student_teacher_ratio", "daily_minutes_used"]
+
+
+def per_row(calculator, df):
+    """Reference results from calculate_district_lct, row by row."""
+    rows = []
+    for _, row in df.iterrows():
+        data = {k: v for k, v in row.to_dict().items() if not (k == "daily_minutes" and pd.isna(v))}
+        try:
+            rows.append(calculator.calculate_district_lct(data))
+        except ValueError as e:
+            rows.append({"error": str(e)})
+    return rows
+
+
+def assert_matches_per_row(calculator, df):
+    result = calculator.calculate_batch_lct(df)
+    expected = per_row(calculator, df)
+
+    assert list(result.columns[:len(df.columns)]) == list(df.columns)
+    for i, exp in enumerate(expected):
+        row = result.iloc[i]
+        if "error" in exp:
+            assert row["error"] == exp["error"]
+            assert row[RESULT_COLUMNS].isna().all()
+            continue
+        for column in RESULT_COLUMNS:
+            if exp[column] is None:
+                assert pd.isna(row[column])
+            else:
+                assert row[column] == pytest.approx(exp[column])
+        if "error" in result.columns:
+            assert pd.isna(row["error"])
+    return result
+
+
+def test_explicit_daily_minutes():
+    df = pd.DataFrame({
+        "nces_id": ["0100001", "0100002", "0100003"],
+        "enrollment": [5000, 8500, 120],
+        "instructional_staff": [250.0, 425.0, 0.0],
+        "daily_minutes": [360, 300, 330],
+    })
+
+    result = assert_matches_per_row(LCTCalculator(), df)
+
+    assert "error" not in result.columns
+    assert result["lct_minutes"].tolist() == [18.0, 15.0, 0.0]
+    assert pd.isna(result.loc[2, "student_teacher_ratio"])
+
+
+def test_state_lookup_including_grade_weighted():
+    df = pd.DataFrame({
+        "state": ["CA", "TX", "TX", "TX", "NV"],
+        "enrollment": [5000, 8500, 8500, 900, 700],
+        "instructional_staff": [250.0, 425.0, 425.0, 50.0, 40.0],
+        "daily_minutes": [np.nan, np.nan, np.nan, 300, np.nan],
+        "grade_enrollments": [None, {"K-8": 6000, "9-12": 2500}, {}, None, None],
+    })
+
+    result = assert_matches_per_row(LCTCalculator(STATE_REQUIREMENTS), df)
+
+    # Weighted (6000*240 + 2500*360) / 8500 = 275.29 -> 275
+    assert result["daily_minutes_used"].tolist() == [360, 275, 240, 300, 300]
+
+
+def test_row_errors_do_not_stop_batch(capsys):
+    df = pd.DataFrame({
+        "state": ["TX", "TX", "CA", "CA", "CA"],
+        "enrollment": [0, 1000, 1000, 1000, 1000],
+        "instructional_staff": [10.0, -1.0, 50.0, 50.0, 50.0],
+        "daily_minutes": [360, 360, 600, np.nan, 300],
+        "grade_enrollments": [None, None, None, None, None],
+    })
+
+    result = assert_matches_per_row(LCTCalculator(STATE_REQUIREMENTS), df)
+
+    assert result["error"].notna().tolist() == [True, True, True, False, False]
+    assert "3 of 5" in capsys.readouterr().out
+
+
+def test_zero_grade_enrollment_and_missing_minutes():
+    weighted = pd.DataFrame({
+        "state": ["TX"],
+        "enrollment": [100],
+        "instructional_staff": [5.0],
+        "grade_enrollments": [{"K-8": 0}],
+    })
+    result = LCTCalculator(STATE_REQUIREMENTS).calculate_batch_lct(weighted)
+    assert result.loc[0, "error"] == "Total enrollment cannot be zero"
+
+    no_minutes = pd.DataFrame({"enrollment": [100], "instructional_staff": [5.0]})
+    result = LCTCalculator().calculate_batch_lct(no_minutes)
+    assert result.loc[0, "error"] == "Must provide either daily_minutes or state code with requirements"
+
+
+def test_rounding_ties_match_scalar_round():
+    # Non-integer LCTs whose derived columns sit on rounding ties, where
+    # np.round and round() disagree
+    df = pd.DataFrame({
+        "enrollment": [800, 8, 63],
+        "instructional_staff": [21.0, 0.3, 20.0],
+        "daily_minutes": [360, 360, 360],
+    })
+
+    result = assert_matches_per_row(LCTCalculator(), df)
+
+    # 9.45 * 3 = 28.349999999999998 yearly hours
+    assert result["lct_minutes"].tolist() == [9.45, 13.5, 114.29]
+    assert result.loc[0, "lct_yearly_hours"] == 28.3
+    # 13.5 / 60 = 0.225 (0.22500000000000000555 as a double)
+    assert result.loc[1, "lct_hours"] == 0.23
+    # 63 / 20 = 3.15 (3.14999999999999991118 as a double)
+    assert result.loc[2, "student_teacher_ratio"] == 3.1
@@ -0,0 +1,76 @@
+"""
+Tests for LineageBatch, the batched DataLineage writer.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from infrastructure.database.models import DataLineage, LineageBatch
+
+
+def written_rows(session):
+    """Rows passed to the single INSERT statement."""
+    session.execute.assert_called_once()
+    statement, rows = session.execute.call_args.args
+    assert statement.table.name == DataLineage.__tablename__
+    return rows
+
+
+def test_writes_all_records_in_one_insert():
+    session = MagicMock()
+
+    with LineageBatch(session, created_by="migration") as lineage:
+        for grade in ("elementary", "middle", "high"):
+            lineage.log("bell_schedule", f"0622710/2025-26/{grade}", "import",
+                        source_file="bell_schedules.json", details={"minutes": 360})
+        lineage.log("state_requirement", "CA", "import", created_by="someone_else")
+
+    rows = written_rows(session)
+    assert [r["entity_id"] for r in rows] == [
+        "0622710/2025-26/elementary", "0622710/2025-26/middle", "0622710/2025-26/high", "CA",
+    ]
+    assert rows[0]["created_by"] == "migration"
+    assert rows[3]["created_by"] == "someone_else"
+    assert all(r["created_at"] is not None for r in rows)
+    assert lineage.written == 4
+    session.add.assert_not_called()
+
+
+def test_collapse_writes_one_summary_row_per_group():
+    session = MagicMock()
+
+    with LineageBatch(session, collapse=True) as lineage:
+        lineage.log("district", "0100001", "import", source_file="districts.csv")
+        lineage.log("district", "0100002", "import", source_file="districts.csv", details={"enrollment": 10})
+        lineage.log("district", "0100003", "update", source_file="districts.csv")
+
+    rows = written_rows(session)
+    assert len(rows) == 2
+    imported = rows[0]
+    assert imported["entity_id"] == "*"
+    assert imported["operation"] == "import"
+    assert imported["details"] == {
+        "count": 2,
+        "entity_ids": ["0100001", "0100002"],
+        "entity_details": {"0100002": {"enrollment": 10}},
+    }
+    assert rows[1]["details"] == {"count": 1, "entity_ids": ["0100003"]}
+
+
+def test_failed_block_discards_records():
+    session = MagicMock()
+
+    with pytest.raises(ValueError):
+        with LineageBatch(session) as lineage:
+            lineage.log("district", "0100001", "import")
+            raise ValueError("import failed")
+
+    session.execute.assert_not_called()
+    assert lineage.records == []
+
+
+def test_empty_batch_skips_insert():
+    session = MagicMock()
+    assert LineageBatch(session).flush() == 0
+    session.execute.assert_not_called()
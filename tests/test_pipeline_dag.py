@@ -0,0 +1,186 @@
+"""
+Tests for the fingerprinting DAG runner used by full_pipeline --dag.
+"""
+
+import threading
+import time
+
+import pytest
+
+from pipelines.dag_runner import BLOCKED, FAILED, RAN, SKIPPED, DagRunner, DagStep
+
+
+@pytest.fixture
+def workspace(tmp_path):
+    (tmp_path / "raw.csv").write_text("LEAID,ST\n0100005,AL\n")
+    return tmp_path
+
+
+def copy_step(root, calls, name="Copy", after=None, params=None):
+    def action():
+        calls.append(name)
+        (root / "out.csv").write_text((root / "raw.csv").read_text().upper())
+        return True
+
+    return DagStep(name, action, inputs=["raw.csv"], outputs=["out.csv"],
+                   after=after or [], params=params or {})
+
+
+def make_runner(root, steps, **kwargs):
+    return DagRunner(steps, state_path=root / "state.json", root=root, **kwargs)
+
+
+def test_noop_rerun_skips_step(workspace):
+    calls = []
+    assert make_runner(workspace, [copy_step(workspace, calls)]).run()
+
+    runner = make_runner(workspace, [copy_step(workspace, calls)])
+    assert runner.run()
+
+    assert calls == ["Copy"]
+    assert runner.results["Copy"].status == SKIPPED
+    assert "Copy" in runner.timing_report()
+
+
+def test_changed_input_reruns_step(workspace):
+    calls = []
+    make_runner(workspace, [copy_step(workspace, calls)]).run()
+
+    (workspace / "raw.csv").write_text("LEAID,ST\n0600001,CA\n")
+    runner = make_runner(workspace, [copy_step(workspace, calls)])
+    runner.run()
+
+    assert calls == ["Copy", "Copy"]
+    assert runner.results["Copy"].status == RAN
+    assert (workspace / "out.csv").read_text() == "LEAID,ST\n0600001,CA\n"
+
+
+def test_missing_or_modified_output_reruns_step(workspace):
+    calls = []
+    make_runner(workspace, [copy_step(workspace, calls)]).run()
+
+    (workspace / "out.csv").unlink()
+    make_runner(workspace, [copy_step(workspace, calls)]).run()
+    (workspace / "out.csv").write_text("tampered\n")
+    make_runner(workspace, [copy_step(workspace, calls)]).run()
+
+    assert calls == ["Copy", "Copy", "Copy"]
+
+
+def test_params_change_and_force_rerun_step(workspace):
+    calls = []
+    make_runner(workspace, [copy_step(workspace, calls, params={"year": "2023-24"})]).run()
+    make_runner(workspace, [copy_step(workspace, calls, params={"year": "2024-25"})]).run()
+    make_runner(workspace, [copy_step(workspace, calls, params={"year": "2024-25"})], force=True).run()
+
+    assert len(calls) == 3
+
+
+def test_independent_steps_run_concurrently(workspace):
+    barrier = threading.Barrier(2, timeout=5)
+
+    def waits_for_sibling():
+        barrier.wait()
+        return True
+
+    steps = [
+        DagStep("A", waits_for_sibling, always_run=True),
+        DagStep("B", waits_for_sibling, always_run=True),
+    ]
+    runner = make_runner(workspace, steps, max_workers=2)
+
+    assert runner.run()
+    assert {r.status for r in runner.results.values()} == {RAN}
+
+
+def test_dependencies_run_in_order(workspace):
+    order = []
+
+    def record(name, delay=0.0):
+        def action():
+            time.sleep(delay)
+            order.append(name)
+            return True
+        return action
+
+    steps = [
+        DagStep("Export", record("Export"), after=["Calc", "Enrich"]),
+        DagStep("Calc", record("Calc", 0.05), after=["Normalize"]),
+        DagStep("Enrich", record("Enrich"), after=["Normalize"]),
+        DagStep("Normalize", record("Normalize")),
+    ]
+    assert make_runner(workspace, steps).run()
+
+    assert order[0] == "Normalize"
+    assert order[-1] == "Export"
+
+
+def test_failure_blocks_downstream_and_is_not_recorded(workspace):
+    calls = []
+
+    def boom():
+        raise RuntimeError("bad input")
+
+    steps = [
+        DagStep("Normalize", boom, inputs=["raw.csv"], outputs=["norm.csv"]),
+        copy_step(workspace, calls, after=["Normalize"]),
+    ]
+    runner = make_runner(workspace, steps)
+
+    assert runner.run() is False
+    assert runner.results["Normalize"].status == FAILED
+    assert runner.results["Copy"].status == BLOCKED
+    assert calls == []
+    assert "Normalize" not in runner.state["steps"]
+
+
+def test_invalid_graphs_rejected(workspace):
+    with pytest.raises(ValueError, match="unknown"):
+        make_runner(workspace, [DagStep("A", lambda: True, after=["Missing"])])
+
+    with pytest.raises(ValueError, match="cycle"):
+        make_runner(workspace, [
+            DagStep("A", lambda: True, after=["B"]),
+            DagStep("B", lambda: True, after=["A"]),
+        ])
+
+
+def test_full_pipeline_artifacts_do_not_overlap(tmp_path):
+    from pipelines.full_pipeline import PipelineRunner
+
+    raw = tmp_path / "data/raw/federal/nces-ccd/2023_24"
+    raw.mkdir(parents=True)
+    for name in ("ccd_lea_directory_2024.zip", "ccd_lea_staff_1.csv", "ccd_lea_staff_2.csv",
+                 "ccd_lea_staff_combined.csv", "README.md", "SHA256SUMS"):
+        (raw / name).write_text(name)
+
+    def matches(specs):
+        return {p.name for spec in specs for p in tmp_path.glob(spec)}
+
+    steps = {s.name: s for s in PipelineRunner("2023-24").build_dag_steps()}
+
+    assert matches(steps["Download"].outputs) == {"ccd_lea_directory_2024.zip"}
+    assert matches(steps["Extract"].inputs) == {"ccd_lea_staff_1.csv", "ccd_lea_staff_2.csv"}
+    assert matches(steps["Extract"].outputs) == {"ccd_lea_staff_combined.csv"}
+
+
+def test_concurrent_steps_read_exact_normalized_file(tmp_path):
+    from pipelines.full_pipeline import PipelineRunner
+
+    normalized = tmp_path / "data/processed/normalized"
+    normalized.mkdir(parents=True)
+    # A half-written LCT output sorts before the normalized file
+    (normalized / "districts_2023_24_nces_with_lct.csv").write_text("partial")
+
+    runner = PipelineRunner("2023-24", enrich_bell_schedules=True)
+    runner.root = tmp_path
+    calls = []
+    runner.run_script = runner._run_subprocess = lambda script, args: calls.append(args[0]) or True
+
+    assert not runner.step_calculate_lct()
+    assert not runner.step_enrich_bell_schedules()
+    assert calls == []
+
+    (normalized / "districts_2023_24_nces.csv").write_text("nces_id\n")
+    assert runner.step_calculate_lct() and runner.step_enrich_bell_schedules()
+    assert calls == [str(normalized / "districts_2023_24_nces.csv")] * 2
@@ -0,0 +1,135 @@
+"""
+Tests for the thread-pooled, data-versioned query cache used by the MCP server.
+"""
+
+import asyncio
+import threading
+from contextlib import contextmanager
+
+from infrastructure.database.query_cache import QueryLayer, cache_key
+
+
+class FakeDatabase:
+    """Session factory whose data version can be bumped by tests."""
+
+    def __init__(self):
+        self.version = 1
+        self.sessions = 0
+        self.lock = threading.Lock()
+
+    @contextmanager
+    def session_scope(self):
+        with self.lock:
+            self.sessions += 1
+        yield self
+
+    def layer(self, **kwargs):
+        kwargs.setdefault("version_interval", 0)
+        return QueryLayer(
+            session_factory=self.session_scope,
+            version_fn=lambda session: session.version,
+            **kwargs,
+        )
+
+
+def test_cache_key_ignores_argument_order():
+    assert cache_key("t", {"a": 1, "b": 2}) == cache_key("t", {"b": 2, "a": 1})
+    assert cache_key("t", {"a": 1}) != cache_key("u", {"a": 1})
+
+
+def test_results_cached_per_tool_and_arguments():
+    db = FakeDatabase()
+    layer = db.layer()
+    calls = []
+
+    def progress(session, year):
+        calls.append(year)
+        return {"year": year}
+
+    async def scenario():
+        first = await layer.cached("progress", {"year": "2025-26"}, progress, "2025-26")
+        second = await layer.cached("progress", {"year": "2025-26"}, progress, "2025-26")
+        other = await layer.cached("progress", {"year": "2024-25"}, progress, "2024-25")
+        return first, second, other
+
+    first, second, other = asyncio.run(scenario())
+
+    assert first == second == {"year": "2025-26"}
+    assert other == {"year": "2024-25"}
+    assert calls == ["2025-26", "2024-25"]
+    assert (layer.hits, layer.misses) == (1, 2)
+
+
+def test_data_version_change_invalidates():
+    db = FakeDatabase()
+    layer = db.layer()
+    calls = []
+
+    def summary(session):
+        calls.append(session.version)
+        return session.version
+
+    async def scenario():
+        await layer.cached("summary", {}, summary)
+        db.version = 2  # e.g. a calculation run completed
+        return await layer.cached("summary", {}, summary)
+
+    assert asyncio.run(scenario()) == 2
+    assert calls == [1, 2]
+
+
+def test_ttl_expiry():
+    db = FakeDatabase()
+    layer = db.layer(ttl_seconds=0)
+    calls = []
+
+    async def scenario():
+        for _ in range(3):
+            await layer.cached("summary", {}, lambda session: calls.append(1))
+
+    asyncio.run(scenario())
+    assert len(calls) == 3
+
+
+def test_queries_run_concurrently_off_the_event_loop():
+    db = FakeDatabase()
+    layer = db.layer(max_workers=2)
+    barrier = threading.Barrier(2, timeout=5)
+
+    def slow(session, name):
+        barrier.wait()  # Deadlocks unless both queries run at once
+        return name
+
+    async def scenario():
+        return await asyncio.gather(
+            layer.cached("a", {}, slow, "a"),
+            layer.cached("b", {}, slow, "b"),
+        )
+
+    assert asyncio.run(scenario()) == ["a", "b"]
+    assert db.sessions >= 2
+
+
+def test_identical_concurrent_calls_share_one_query():
+    db = FakeDatabase()
+    layer = db.layer()
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def expensive(session):
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return "done"
+
+    async def scenario():
+        first = asyncio.ensure_future(layer.cached("x", {}, expensive))
+        await asyncio.get_running_loop().run_in_executor(None, started.wait, 5)
+        second = asyncio.ensure_future(layer.cached("x", {}, expensive))
+        await asyncio.sleep(0)
+        release.set()
+        return await asyncio.gather(first, second)
+
+    assert asyncio.run(scenario()) == ["done", "done"]
+    assert calls == [1]
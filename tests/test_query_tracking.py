@@ -0,0 +1,121 @@
+"""
+Tests for per-stage SQL statement tracking and N+1 detection.
+
+Uses an in-memory SQLite engine; the event hooks are dialect-independent.
+"""
+
+import logging
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from infrastructure.database import query_tracking
+from infrastructure.database.query_tracking import QueryTracker, normalize_statement
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE bell_schedules (district_id TEXT, minutes INTEGER)"))
+        conn.execute(text("INSERT INTO bell_schedules VALUES ('0100001', 360), ('0100002', 330)"))
+    return engine
+
+
+def lookup(conn, district_id):
+    return conn.execute(
+        text("SELECT minutes FROM bell_schedules WHERE district_id = :district_id"),
+        {"district_id": district_id},
+    ).scalar()
+
+
+def test_normalize_statement():
+    assert normalize_statement(
+        "SELECT *\n  FROM districts WHERE state = 'CA' AND enrollment > 100 AND nces_id IN (%(id_1)s, %(id_2)s)"
+    ) == "SELECT * FROM districts WHERE state = ? AND enrollment > ? AND nces_id IN (?, ...)"
+    assert normalize_statement("SELECT enrollment_grade_12, x::jsonb FROM t WHERE a = :a") == \
+        "SELECT enrollment_grade_12, x::jsonb FROM t WHERE a = ?"
+
+
+def test_counts_statements_per_stage(engine):
+    tracker = QueryTracker(n_plus_one_threshold=100)
+    tracker.attach(engine)
+
+    with engine.connect() as conn:
+        lookup(conn, "untracked")
+        with tracker.track("lookups") as stage:
+            for i in range(5):
+                lookup(conn, f"{i:07d}")
+            conn.execute(text("SELECT COUNT(*) FROM bell_schedules"))
+
+    assert stage.count == 6
+    summary = tracker.summary()["lookups"]
+    assert summary["statements"] == 6
+    assert {e["sql"]: e["count"] for e in summary["top"]} == {
+        "SELECT minutes FROM bell_schedules WHERE district_id = ?": 5,
+        "SELECT COUNT(*) FROM bell_schedules": 1,
+    }
+    assert summary["probable_n_plus_one"] == []
+
+
+def test_failed_statements_leave_no_timing_state(engine):
+    tracker = QueryTracker()
+    tracker.attach(engine)
+
+    with engine.connect() as conn:
+        with tracker.track("lookups") as stage:
+            for _ in range(3):
+                with pytest.raises(Exception):
+                    conn.execute(text("SELECT minutes FROM missing_table"))
+            lookup(conn, "0100001")
+        leftover = dict(conn.info)
+
+    # Only the statement that completed is recorded; nothing piles up per connection
+    assert stage.count == 1
+    assert leftover == {}
+
+
+def test_flags_repeated_statements(engine, caplog):
+    tracker = QueryTracker(n_plus_one_threshold=10)
+    tracker.attach(engine)
+
+    with caplog.at_level(logging.WARNING, logger=query_tracking.__name__):
+        with engine.connect() as conn, tracker.track("calculate_all_variants"):
+            for i in range(12):
+                lookup(conn, f"{i:07d}")
+
+    flagged = tracker.summary()["calculate_all_variants"]["probable_n_plus_one"]
+    assert [(e["sql"], e["count"]) for e in flagged] == [
+        ("SELECT minutes FROM bell_schedules WHERE district_id = ?", 12),
+    ]
+    assert "Probable N+1 in calculate_all_variants: 12 executions" in caplog.text
+
+
+def test_nested_stages_and_detach(engine):
+    tracker = QueryTracker()
+    tracker.attach(engine)
+    tracker.attach(engine)  # no double counting
+
+    with engine.connect() as conn:
+        with tracker.track("pipeline"):
+            lookup(conn, "0100001")
+            with tracker.track("export"):
+                lookup(conn, "0100002")
+
+        tracker.detach()
+        with tracker.track("pipeline"):
+            lookup(conn, "0100001")
+
+    assert tracker.stages["pipeline"].count == 2
+    assert tracker.stages["export"].count == 1
+
+
+def test_track_queries_uses_process_wide_tracker(engine, monkeypatch):
+    monkeypatch.setattr(query_tracking, "_tracker", None)
+    assert query_tracking.query_summary() == {}
+
+    with engine.connect() as conn, query_tracking.track_queries("write_calculations_to_db", engine):
+        lookup(conn, "0100001")
+
+    assert query_tracking.query_summary()["write_calculations_to_db"]["statements"] == 1
+    query_tracking._tracker.detach()
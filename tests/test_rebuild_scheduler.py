@@ -0,0 +1,150 @@
+"""
+Tests for the dependency-aware rebuild scheduler in rebuild_database.py.
+"""
+
+import json
+import threading
+
+from infrastructure.scripts.rebuild_database import (
+    SEA_IMPORTS,
+    RebuildScheduler,
+    RebuildTask,
+    build_tasks,
+)
+
+
+def test_build_tasks_dependencies():
+    tasks = {t.name: t for t in build_tasks(sea=True)}
+
+    assert tasks["import_all"].after == ["reset"]
+    assert tasks["sea_tx"].after == ["import_all", "sea_tx_crosswalk"]
+    assert set(SEA_IMPORTS) <= set(tasks["merge_sea_precedence"].after)
+    # SPED baseline does not wait for staff/enrollment or state imports
+    assert tasks["import_sped_baseline"].after == ["import_all"]
+    assert "reset" not in tasks["calculate_lct"].after
+    assert not tasks["sea_fl"].blocking and not tasks["merge_sea_precedence"].blocking
+
+
+def test_sea_imports_are_opt_in():
+    tasks = {t.name: t for t in build_tasks()}
+
+    assert not any(name.startswith("sea_") for name in tasks)
+    assert "merge_sea_precedence" not in tasks
+    assert "merge_sea_precedence" not in tasks["calculate_lct"].after
+
+
+def test_build_tasks_filters_and_prunes_dependencies():
+    tasks = {t.name: t for t in build_tasks(start_phase=3, skip_lct=True)}
+
+    assert "reset" not in tasks and "import_all" not in tasks
+    assert "calculate_lct" not in tasks
+    assert not any(name.startswith("sea_") for name in tasks)
+    assert tasks["import_staff_enrollment"].after == []
+    assert tasks["apply_sped_estimates"].after == ["import_sped_baseline", "import_staff_enrollment"]
+
+
+def make_tasks():
+    return [
+        RebuildTask("foundation", 2, "a.py"),
+        RebuildTask("sea_x", 3, "b.py", after=["foundation"]),
+        RebuildTask("sea_y", 3, "c.py", after=["foundation"]),
+        RebuildTask("lct", 7, "d.py", after=["sea_x", "sea_y"]),
+    ]
+
+
+def test_state_imports_run_concurrently_and_rows_recorded(tmp_path):
+    barrier = threading.Barrier(2, timeout=5)
+    order = []
+
+    def runner(task, dry_run):
+        if task.name.startswith("sea_"):
+            barrier.wait()  # Deadlocks unless both state imports run at once
+        order.append(task.name)
+        return True
+
+    scheduler = RebuildScheduler(
+        make_tasks(), workers=2, state_path=tmp_path / "state.json",
+        runner=runner, count_rows=lambda tables: {t: 10 for t in tables},
+    )
+
+    assert scheduler.run()
+    assert order[0] == "foundation" and order[-1] == "lct"
+    assert scheduler.phases[2]["rows"] == {"districts": 10, "state_requirements": 10}
+    assert scheduler.phases[3]["status"] == "completed"
+    assert "3 Staff/Enrollment" in scheduler.report()
+
+    state = json.loads((tmp_path / "state.json").read_text())
+    assert state["tasks"]["lct"]["status"] == "completed"
+
+
+def test_rows_counted_after_later_phase_writers_finish(tmp_path):
+    counted = {}
+
+    def count_rows(tables):
+        for table in tables:
+            counted[table] = scheduler.status.get("sea_x")
+        return {t: 10 for t in tables}
+
+    scheduler = RebuildScheduler(
+        make_tasks(), state_path=tmp_path / "state.json",
+        runner=lambda task, dry_run: True, count_rows=count_rows,
+        table_writers={"districts": ["foundation", "sea_x"]},
+    )
+
+    assert scheduler.run()
+    # districts is a phase 2 table also written by the phase 3 sea_x task
+    assert counted["districts"] == "completed"
+    assert counted["state_requirements"] is None
+    assert scheduler.phases[2]["rows"] == {"districts": 10, "state_requirements": 10}
+
+
+def test_failure_blocks_dependents_and_resume_skips_completed(tmp_path):
+    calls = []
+
+    def failing_runner(task, dry_run):
+        calls.append(task.name)
+        return task.name != "sea_y"
+
+    state_path = tmp_path / "state.json"
+    scheduler = RebuildScheduler(make_tasks(), state_path=state_path, runner=failing_runner)
+
+    assert scheduler.run() is False
+    assert scheduler.status["sea_y"] == "failed"
+    assert scheduler.status["lct"] == "blocked"
+    assert scheduler.status["sea_x"] == "completed"
+
+    calls.clear()
+    resumed = RebuildScheduler(
+        make_tasks(), state_path=state_path, resume=True,
+        runner=lambda task, dry_run: calls.append(task.name) or True,
+    )
+
+    assert resumed.run()
+    assert sorted(calls) == ["lct", "sea_y"]
+    assert sorted(resumed.resumed) == ["foundation", "sea_x"]
+    assert resumed.run_id == scheduler.run_id
+
+
+def test_dry_run_does_not_save_state(tmp_path):
+    scheduler = RebuildScheduler(
+        make_tasks(), dry_run=True, state_path=tmp_path / "state.json",
+        runner=lambda task, dry_run: dry_run,
+    )
+
+    assert scheduler.run()
+    assert not (tmp_path / "state.json").exists()
+
+
+def test_non_blocking_failure_does_not_block_dependents(tmp_path):
+    tasks = make_tasks()
+    tasks[2].blocking = False  # sea_y
+    scheduler = RebuildScheduler(
+        tasks, state_path=tmp_path / "state.json",
+        runner=lambda task, dry_run: task.name != "sea_y",
+    )
+
+    assert scheduler.run() is True
+    assert scheduler.status["sea_y"] == "failed"
+    assert scheduler.status["lct"] == "completed"
+    assert scheduler.phases[3]["status"] == "partial"
+    assert "Failed, continued without: sea_y" in scheduler.report()
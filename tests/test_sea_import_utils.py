@@ -10,6 +10,9 @@ import numpy as np
 from infrastructure.database.migrations.sea_import_utils import (
     safe_float, safe_int, safe_pct,
     format_state_id, get_state_id_info, SEA_ID_FORMATS,
+    format_state_ids, StateCrosswalk, get_state_crosswalk, clear_crosswalk_cache,
+    safe_numeric, build_upsert_sql, dataframe_rows, bulk_upsert, match_to_crosswalk,
+    numeric_column, text_column, upsert_mapped, resolve_cds_nces_ids, check_crosswalk_coverage,
     validate_enrollment_staff_ratio, is_sped_intensive,
     is_covid_year, validate_data_year,
     COVID_EXCLUDED_YEARS, VALID_DATA_YEARS,
@@ -161,6 +164,311 @@ class TestFormatStateId:
             assert callable(info['converter']), f"{state} converter not callable"
 
 
+class TestFormatStateIds:
+    """Tests for column-wise format_state_ids()."""
+
+    def test_matches_scalar_format(self):
+        """Each value formats the same as format_state_id()."""
+        raw = pd.Series([1, '13', 13, 67])
+        assert format_state_ids('FL', raw).tolist() == ['01', '13', '13', '67']
+
+    def test_missing_and_invalid_become_none(self):
+        """NaN and values the converter rejects map to None."""
+        raw = pd.Series([29, None, '*', np.nan], index=[10, 11, 12, 13])
+        result = format_state_ids('VA', raw)
+        assert result.tolist() == ['029', None, None, None]
+        assert list(result.index) == [10, 11, 12, 13]
+
+
+# =============================================================================
+# BULK CROSSWALK TESTS
+# =============================================================================
+
+class FakeResult:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def fetchall(self):
+        return self.rows
+
+
+class FakeSession:
+    """Records executed queries and returns fixed crosswalk rows."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.queries = []
+
+    def execute(self, statement, params=None):
+        self.queries.append((str(statement), params))
+        return FakeResult(self.rows)
+
+
+class TestStateCrosswalk:
+    """Tests for StateCrosswalk and get_state_crosswalk()."""
+
+    def setup_method(self):
+        clear_crosswalk_cache()
+
+    def teardown_method(self):
+        clear_crosswalk_cache()
+
+    def test_behaves_like_dict(self):
+        """Drop-in replacement for the dict from load_state_crosswalk()."""
+        crosswalk = StateCrosswalk('MI', {'82015': '2601103'})
+        assert crosswalk['82015'] == '2601103'
+        assert crosswalk.get('99999') is None
+        assert '82015' in crosswalk
+        assert len(crosswalk) == 1
+        assert dict(crosswalk) == {'82015': '2601103'}
+
+    def test_resolve_series(self):
+        """Raw IDs are formatted then mapped; unmatched become None."""
+        crosswalk = StateCrosswalk('VA', {'029': '5101260', '001': '5100060'})
+        raw = pd.Series([29, 1, 999, None])
+        assert crosswalk.resolve(raw).tolist() == ['5101260', '5100060', None, None]
+
+    def test_california_uses_cds_normalization(self):
+        """CA keys are 7-digit CDS codes; 14-digit and CA- prefixed codes resolve."""
+        crosswalk = StateCrosswalk('CA', {'1964733': '0622710'})
+        df = pd.DataFrame({'cds': ['19647330000000', 'CA-1964733', '0100000']})
+        result = crosswalk.attach(df, 'cds', key_column='cds7')
+        assert result['nces_id'].tolist() == ['0622710', '0622710', None]
+        assert result['cds7'].tolist() == ['1964733', '1964733', '0100000']
+        assert 'nces_id' not in df.columns
+
+    def test_resolve_cds_nces_ids(self):
+        """CDE county/district code columns resolve through the CA crosswalk."""
+        session = FakeSession([('1964733', '0622710')])
+        df = pd.DataFrame({'County Code': [19, '1'], 'District Code': ['64733', 2]})
+        result = resolve_cds_nces_ids(df, session)
+        assert result['cds_code'].tolist() == ['1964733', '0100002']
+        assert result['nces_id'].tolist() == ['0622710', None]
+
+    def test_coverage(self):
+        """Coverage reports matched/unmatched formatted IDs."""
+        crosswalk = StateCrosswalk('FL', {'13': '1200390'})
+        coverage = crosswalk.coverage([13, '13', 99])
+        assert coverage['matched'] == 2
+        assert coverage['unmatched'] == 1
+        assert coverage['unmatched_ids'] == ['99']
+
+    def test_loaded_once_and_cached(self):
+        """Repeated lookups share one query per state."""
+        session = FakeSession([('13', '1200390')])
+        first = get_state_crosswalk(session, 'FL')
+        second = get_state_crosswalk(session, 'FL')
+        assert first is second
+        assert len(session.queries) == 1
+        assert session.queries[0][1] == {'state': 'FL'}
+
+        get_state_crosswalk(session, 'FL', refresh=True)
+        assert len(session.queries) == 2
+
+    def test_cache_is_per_database(self):
+        """Sessions bound to different databases load their own crosswalks."""
+        class BoundSession(FakeSession):
+            def __init__(self, rows, url):
+                super().__init__(rows)
+                self.url = url
+
+            def get_bind(self):
+                return self
+
+        main = BoundSession([('13', '1200390')], 'postgresql://db/main')
+        other = BoundSession([('13', '1299999')], 'postgresql://db/other')
+        assert get_state_crosswalk(main, 'FL')['13'] == '1200390'
+        assert get_state_crosswalk(other, 'FL')['13'] == '1299999'
+        assert get_state_crosswalk(main, 'FL')['13'] == '1200390'
+        assert len(main.queries) == len(other.queries) == 1
+
+        clear_crosswalk_cache('FL')
+        get_state_crosswalk(main, 'FL')
+        get_state_crosswalk(other, 'FL')
+        assert len(main.queries) == len(other.queries) == 2
+
+    def test_coverage_check_reloads_crosswalk(self):
+        """check_crosswalk_coverage() never reports from a stale cache."""
+        session = FakeSession([('13', '1200390')])
+        get_state_crosswalk(session, 'FL')
+        session.rows = [('13', '1200390'), ('99', '1299999')]
+        assert check_crosswalk_coverage(session, 'FL', [13, 99])['matched'] == 2
+
+    def test_texas_uses_tea_identifier_table(self):
+        """TX crosswalk comes from tx_district_identifiers."""
+        session = FakeSession([('101912', '4823640')])
+        crosswalk = get_state_crosswalk(session, 'TX')
+        assert 'tx_district_identifiers' in session.queries[0][0]
+        assert crosswalk.resolve(pd.Series([101912])).tolist() == ['4823640']
+
+
+# =============================================================================
+# BULK WRITE TESTS
+# =============================================================================
+
+class TestSafeNumeric:
+    """Tests for column-wise safe_numeric()."""
+
+    def test_matches_scalar_conversions(self):
+        """Same results as safe_float()/safe_int() applied per value."""
+        raw = pd.Series(['42.5', '*', None, '', 'N/A', 17, -3.7])
+        floats = safe_numeric(raw)
+        ints = safe_numeric(raw, integer=True)
+        for value, f, i in zip(raw, floats, ints):
+            expected_f, expected_i = safe_float(value), safe_int(value)
+            assert (pd.isna(f) and expected_f is None) or f == expected_f
+            assert (pd.isna(i) and expected_i is None) or i == expected_i
+
+    def test_integer_dtype(self):
+        """Integer output is nullable Int64."""
+        assert str(safe_numeric(pd.Series(['1', '<5']), integer=True).dtype) == 'Int64'
+
+
+class FakeCursor:
+    def __init__(self):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class FakeConnection:
+    def __init__(self, cursor):
+        self.connection = self
+        self._cursor = cursor
+
+    def cursor(self):
+        return self._cursor
+
+
+class WriteSession:
+    """Exposes the raw DBAPI cursor the way session.connection() does."""
+
+    def __init__(self):
+        self.cursor = FakeCursor()
+
+    def connection(self):
+        return FakeConnection(self.cursor)
+
+
+class TestBulkUpsert:
+    """Tests for build_upsert_sql(), bulk_upsert() and match_to_crosswalk()."""
+
+    def test_build_upsert_sql(self):
+        sql = build_upsert_sql('tx_staff_data', ['nces_id', 'year', 'total_fte'], ['nces_id', 'year'])
+        assert sql == (
+            "INSERT INTO tx_staff_data (nces_id, year, total_fte) VALUES %s "
+            "ON CONFLICT (nces_id, year) DO UPDATE SET total_fte = EXCLUDED.total_fte, "
+            "updated_at = NOW() RETURNING (xmax = 0) AS inserted"
+        )
+
+    def test_build_upsert_sql_do_nothing(self):
+        sql = build_upsert_sql('t', ['nces_id'], ['nces_id'])
+        assert 'DO NOTHING' in sql and 'updated_at' not in sql
+
+    def test_build_upsert_sql_rejects_bad_identifiers(self):
+        with pytest.raises(ValueError, match='Invalid SQL identifier'):
+            build_upsert_sql('t; DROP TABLE districts', ['a'], ['a'])
+
+    def test_dataframe_rows_converts_na(self):
+        df = pd.DataFrame({
+            'nces_id': ['0100005', '0100006'],
+            'fte': [12.5, np.nan],
+            'count': pd.array([3, None], dtype='Int64'),
+        })
+        rows = dataframe_rows(df)
+        assert rows == [('0100005', 12.5, 3), ('0100006', None, None)]
+        assert type(rows[0][2]) is int
+
+    def test_bulk_upsert_counts_and_dedupes(self, mocker):
+        execute_values = mocker.patch(
+            'psycopg2.extras.execute_values', return_value=[(True,), (False,)]
+        )
+        session = WriteSession()
+        df = pd.DataFrame({
+            'nces_id': ['4823640', '4823640', '4812345'],
+            'year': ['2023-24'] * 3,
+            'total_fte': [1.0, 2.0, 3.0],
+        })
+
+        counts = bulk_upsert(session, 'tx_staff_data', df, ['nces_id', 'year'], page_size=500)
+
+        assert counts == {'inserted': 1, 'updated': 1}
+        cursor, sql, rows = execute_values.call_args.args
+        assert cursor is session.cursor and session.cursor.closed
+        assert rows == [('4823640', '2023-24', 2.0), ('4812345', '2023-24', 3.0)]
+        assert execute_values.call_args.kwargs == {'page_size': 500, 'fetch': True}
+
+    def test_bulk_upsert_empty_skips_database(self):
+        assert bulk_upsert(None, 't', pd.DataFrame(), ['nces_id']) == {'inserted': 0, 'updated': 0}
+
+    def test_match_to_crosswalk(self):
+        crosswalk = StateCrosswalk('TX', {'101912': '4823640'})
+        df = pd.DataFrame({'district': ['101912', '999999'], 'fte': [1.0, 2.0]})
+        matched, stats = match_to_crosswalk(df, df['district'], crosswalk)
+        assert matched['nces_id'].tolist() == ['4823640']
+        assert matched['state_id'].tolist() == ['101912']
+        assert stats == {'total': 2, 'matched': 1, 'skipped': 1, 'inserted': 0, 'updated': 0}
+
+    def test_state_normalizers_match_scalar_formatters(self):
+        """The crosswalk normalizer produces the keys the per-row formatters did."""
+        from infrastructure.database.migrations.import_massachusetts_data import format_ma_district_code
+        from infrastructure.database.migrations.import_virginia_data import format_division_number
+
+        ma_codes = [350000, '00350000', 10000.0]
+        assert StateCrosswalk('MA', {}).normalize(pd.Series(ma_codes + [None])).tolist() == (
+            [format_ma_district_code(code) for code in ma_codes] + [None]
+        )
+        va_numbers = [29, '7', 128.0]
+        assert StateCrosswalk('VA', {}).normalize(pd.Series(va_numbers + ['n/a'])).tolist() == (
+            [format_division_number(number) for number in va_numbers] + [None]
+        )
+
+    def test_numeric_column(self):
+        df = pd.DataFrame({'fte': ['12.5', '*'], 'count': ['1,234', None]})
+        assert numeric_column('fte')(df).tolist()[0] == 12.5
+        assert numeric_column('fte', default=0)(df).tolist() == [12.5, 0.0]
+        assert numeric_column('count', integer=True, thousands=True)(df).tolist() == [1234, pd.NA]
+
+    def test_upsert_mapped(self, mocker):
+        bulk = mocker.patch(
+            'infrastructure.database.migrations.sea_import_utils.bulk_upsert',
+            return_value={'inserted': 1, 'updated': 1},
+        )
+        session = mocker.Mock()
+        crosswalk = StateCrosswalk('VA', {'029': '5101260', '001': '5100060'})
+        df = pd.DataFrame({
+            'Division Number': [29, 1, 999],
+            'Division Name': [' Fairfax ', None, 'Unknown'],
+            'Teachers': ['14,000', '*', '5'],
+        })
+
+        result = upsert_mapped(
+            session, 'va_staff_data', df, df['Division Number'], crosswalk,
+            {
+                'year': '2025-26',
+                'division_number': lambda d: d['state_id'],
+                'name': text_column('Division Name'),
+                'teachers_fte': numeric_column('Teachers', thousands=True),
+            },
+            ['nces_id', 'year'],
+            update_columns=['teachers_fte'],
+        )
+
+        assert result == (2, 1)
+        _, table, records, conflict_columns = bulk.call_args.args
+        assert (table, conflict_columns) == ('va_staff_data', ['nces_id', 'year'])
+        assert bulk.call_args.kwargs == {'update_columns': ['teachers_fte']}
+        assert records.to_dict('list') == {
+            'nces_id': ['5101260', '5100060'],
+            'year': ['2025-26', '2025-26'],
+            'division_number': ['029', '001'],
+            'name': ['Fairfax', ''],
+            'teachers_fte': [14000.0, pytest.approx(float('nan'), nan_ok=True)],
+        }
+        session.commit.assert_called_once()
+
+
 class TestGetStateIdInfo:
     """Tests for get_state_id_info() function."""
 
@@ -403,6 +403,101 @@ class TestSpedLCTValidation:
         assert capped_lct == 360
 
 
+class TestApplySpedEstimates:
+    """Vectorized apply_sped_estimates matches the per-district rules."""
+
+    TEACHER = {"CA": 0.145, "TX": 0.12, "NY": 0.2, "ZZ": 0.1, "WA": 0.0125}
+    INSTRUCTIONAL = {"CA": 0.3, "NY": 0.5}
+    SELF_CONTAINED = {"CA": 0.067, "TX": 0.08, "NY": 0.9, "WA": 1.0}
+    NATIONAL = {"teacher_ratio": 0.13, "instructional_ratio": 0.25, "self_contained_ratio": 0.07}
+    STATE_AVGS = {"CA": 0.13, "TX": 0.11, "ME": 0.16}
+    LEA = {"0600001": 0.15, "4800001": 0.09, "3600001": 0.4, "5300001": 1.0}
+
+    @staticmethod
+    def reference(district, year, teacher_ratios, instructional_ratios, self_contained_ratios,
+                  national_averages, state_avgs, lea_proportions):
+        """The original one-district-at-a-time rules."""
+        state, lea_id = district["state"], district["district_id"]
+        teacher_ratio = teacher_ratios.get(state)
+        self_contained_ratio = self_contained_ratios.get(state)
+        instructional_ratio = instructional_ratios.get(state)
+        national = False
+        if not teacher_ratio or not self_contained_ratio:
+            teacher_ratio = national_averages["teacher_ratio"]
+            self_contained_ratio = national_averages["self_contained_ratio"]
+            instructional_ratio = national_averages["instructional_ratio"]
+            national = True
+        if lea_id in lea_proportions:
+            sped_proportion, used_state_avg = lea_proportions[lea_id], False
+        elif state in state_avgs:
+            sped_proportion, used_state_avg = state_avgs[state], True
+        else:
+            return None
+
+        total = int(district["enrollment"])
+        teachers = float(district["instructional_staff"])
+        sped = int(round(total * sped_proportion))
+        self_contained = int(round(sped * self_contained_ratio))
+        sped_teachers = round(self_contained * teacher_ratio, 2)
+        instructional = round(self_contained * instructional_ratio, 2) if instructional_ratio else None
+        gened_teachers = round(teachers - sped_teachers, 2)
+        notes = []
+        if national:
+            notes.append(f"State {state} missing SPED ratios; used national averages")
+        if gened_teachers < 0:
+            notes.append("WARNING: Negative GenEd teachers (ratio mismatch)")
+        return {
+            "district_id": lea_id,
+            "used_state_average_for_proportion": used_state_avg,
+            "estimated_sped_enrollment": sped,
+            "estimated_self_contained_sped": self_contained,
+            "estimated_gened_enrollment": total - self_contained,
+            "estimated_sped_teachers": sped_teachers,
+            "estimated_sped_instructional": instructional or None,
+            "estimated_gened_teachers": gened_teachers,
+            "estimation_method": "national_average_fallback" if national else "self_contained_ratio",
+            "confidence": "low" if gened_teachers < 0 else "medium",
+            "notes": "; ".join(notes) or None,
+        }
+
+    def test_matches_reference_and_counters(self):
+        import pandas as pd
+        from infrastructure.database.migrations.apply_sped_estimates import compute_estimates
+
+        districts = pd.DataFrame([
+            ("0600001", "CA", 5000, 250.0),    # LEA proportion
+            ("0600002", "CA", 12345, 600.5),   # State average
+            ("4800001", "TX", 800, 40.0),      # No instructional ratio
+            ("2300001", "ME", 1500, 90.0),     # National fallback + state average
+            ("3600001", "NY", 1000, 5.0),      # Negative GenEd teachers
+            ("5600001", "ZZ", 900, 45.0),      # National fallback, then skipped
+            ("5300001", "WA", 178, 500.0),     # 178 x 0.0125 = 2.225: rounding tie
+        ], columns=["district_id", "state", "enrollment", "instructional_staff"])
+        args = ("2023-24", self.TEACHER, self.INSTRUCTIONAL, self.SELF_CONTAINED,
+                self.NATIONAL, self.STATE_AVGS, self.LEA)
+
+        estimates, counts = compute_estimates(districts, *args)
+
+        expected = [
+            self.reference(row, *args) for row in districts.to_dict("records")
+        ]
+        expected = [e for e in expected if e is not None]
+        actual = estimates.astype(object).where(estimates.notna(), None).to_dict("records")
+        assert len(actual) == len(expected) == 6
+        for got, want in zip(actual, expected):
+            assert {k: got[k] for k in want} == pytest.approx(want)
+
+        assert counts == {
+            "skipped_no_ratio": 1,
+            "used_lea_ratio": 4,
+            "used_state_avg": 2,
+            "used_national_avg": 2,
+            "negative_gened": 1,
+        }
+        assert set(estimates["estimate_year"]) == {"2023-24"}
+        assert set(estimates["baseline_year"]) == {"2017-18"}
+
+
 # --- Fixtures ---
 
 @pytest.fixture
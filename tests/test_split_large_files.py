@@ -0,0 +1,107 @@
+"""
+Tests for streaming multipart reassembly in split_large_files.
+"""
+
+import hashlib
+
+import pytest
+
+from infrastructure.scripts.extract.split_large_files import (
+    concatenate_csv_files,
+    concatenate_text_files,
+    concatenate_to_parquet,
+    stream_concatenate,
+)
+
+
+@pytest.fixture
+def csv_parts(tmp_path):
+    parts = [
+        ("membership_1.csv", b"LEAID,ST,STUDENT_COUNT\n0100005,AL,10\n0100006,AL,20\n"),
+        # Repeated header with CRLF ending, no trailing newline
+        ("membership_2.csv", b"LEAID,ST,STUDENT_COUNT\r\n0600001,CA,30\n0600002,CA,40"),
+        # Continuation part without a header
+        ("membership_3.csv", b"0600003,CA,50\n"),
+    ]
+    paths = []
+    for name, content in parts:
+        path = tmp_path / name
+        path.write_bytes(content)
+        paths.append(path)
+    return paths
+
+
+class TestStreamConcatenate:
+    """Byte-level reassembly."""
+
+    def test_skips_repeated_headers_only(self, csv_parts, tmp_path):
+        output = tmp_path / "combined.csv"
+        result = stream_concatenate(csv_parts, output)
+
+        assert output.read_bytes() == (
+            b"LEAID,ST,STUDENT_COUNT\n"
+            b"0100005,AL,10\n0100006,AL,20\n"
+            b"0600001,CA,30\n0600002,CA,40\n"
+            b"0600003,CA,50\n"
+        )
+        assert result["headers_skipped"] == 1
+        assert result["data_rows"] == 5
+
+    def test_checksum_matches_output(self, csv_parts, tmp_path):
+        output = tmp_path / "combined.csv"
+        result = stream_concatenate(csv_parts, output)
+        assert result["sha256"] == hashlib.sha256(output.read_bytes()).hexdigest()
+        assert result["bytes"] == output.stat().st_size
+
+    def test_small_block_size(self, csv_parts, tmp_path, monkeypatch):
+        """Block boundaries inside lines do not affect the result."""
+        from infrastructure.scripts.extract import split_large_files
+
+        monkeypatch.setattr(split_large_files, "COPY_BLOCK_SIZE", 3)
+        output = tmp_path / "combined.csv"
+        assert stream_concatenate(csv_parts, output)["data_rows"] == 5
+
+
+class TestConcatenateWrappers:
+    """Public wrappers keep their original return values."""
+
+    def test_csv_returns_data_rows(self, csv_parts, tmp_path):
+        assert concatenate_csv_files(csv_parts, tmp_path / "out.csv") == 5
+
+    def test_text_returns_lines(self, tmp_path):
+        first = tmp_path / "notes_1.txt"
+        second = tmp_path / "notes_2.txt"
+        first.write_text("header\nline a\n")
+        second.write_text("header\nline b\n")
+        output = tmp_path / "notes.txt"
+        assert concatenate_text_files([first, second], output) == 3
+        assert output.read_text() == "header\nline a\nline b\n"
+
+
+class TestParquetOutput:
+    """Direct Parquet emission."""
+
+    def test_parquet_rows_and_ids(self, csv_parts, tmp_path):
+        pd = pytest.importorskip("pandas")
+        pytest.importorskip("pyarrow")
+
+        output = tmp_path / "combined.parquet"
+        assert concatenate_to_parquet(csv_parts, output) == 5
+
+        df = pd.read_parquet(output)
+        assert list(df["LEAID"]) == ["0100005", "0100006", "0600001", "0600002", "0600003"]
+        assert df["STUDENT_COUNT"].sum() == 150
+
+    def test_parquet_falls_back_to_strings(self, csv_parts, tmp_path):
+        pd = pytest.importorskip("pandas")
+        pytest.importorskip("pyarrow")
+
+        # STUDENT_COUNT was int64 in the first part; empty fields stay null
+        csv_parts[2].write_bytes(b"0600003,CA,<5\n0600004,CA,\n")
+        output = tmp_path / "combined.parquet"
+        assert concatenate_to_parquet(csv_parts, output) == 6
+
+        df = pd.read_parquet(output)
+        assert df["STUDENT_COUNT"].tolist()[-3:-1] == ["40", "<5"]
+        assert pd.isna(df["STUDENT_COUNT"].iloc[-1])
+        assert list(df["LEAID"])[:2] == ["0100005", "0100006"]
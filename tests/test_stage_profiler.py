@@ -0,0 +1,97 @@
+"""
+Tests for StageProfiler and profile comparison.
+"""
+
+import json
+import time
+
+import pandas as pd
+import pytest
+
+from infrastructure.utilities.stage_profiler import StageProfiler, compare_profiles
+
+
+def test_records_time_and_memory_per_stage():
+    profiler = StageProfiler()
+
+    with profiler.stage("load_enrollment"):
+        time.sleep(0.01)
+    profiler.start("compute_variants")
+    sum(i * i for i in range(20000))
+    profiler.stop()
+
+    profile = profiler.to_dict()
+    assert list(profile["stages"]) == ["load_enrollment", "compute_variants"]
+    assert profile["stages"]["load_enrollment"]["wall_s"] >= 0.01
+    assert profile["stages"]["compute_variants"]["cpu_s"] >= 0
+    assert profile["stages"]["load_enrollment"]["peak_rss_mb"] > 0
+    assert profile["total_wall_s"] == pytest.approx(
+        sum(s["wall_s"] for s in profile["stages"].values()), abs=1e-3)
+    json.dumps(profile)  # stored as JSONB
+
+
+def test_nested_and_repeated_stages():
+    profiler = StageProfiler()
+
+    with profiler.stage("calculate"):
+        with profiler.stage("load"):
+            pass
+    with profiler.stage("calculate"):
+        pass
+
+    profile = profiler.to_dict()
+    assert set(profile["stages"]) == {"calculate", "load"}
+    # Totals count top-level stages only
+    assert profile["total_wall_s"] == pytest.approx(profile["stages"]["calculate"]["wall_s"], abs=1e-3)
+
+
+def test_stage_recorded_when_block_raises():
+    profiler = StageProfiler()
+    with pytest.raises(RuntimeError):
+        with profiler.stage("db_write"):
+            raise RuntimeError("connection lost")
+    assert "db_write" in profiler.stages
+
+
+def test_trace_memory():
+    profiler = StageProfiler(trace_memory=True)
+    with profiler.stage("allocate"):
+        data = [bytes(1024) for _ in range(2000)]
+    del data
+
+    assert profiler.stages["allocate"]["traced_peak_mb"] >= 1.5
+    assert profiler.to_dict()["trace_memory"] is True
+
+
+def test_trace_memory_nested_keeps_parent_peak():
+    profiler = StageProfiler(trace_memory=True)
+    with profiler.stage("load"):
+        data = [bytes(1024) for _ in range(4000)]
+        del data
+        # The child allocates little; its start must not erase the parent's peak
+        with profiler.stage("small"):
+            small = bytes(1024)
+        del small
+
+    assert profiler.stages["load"]["traced_peak_mb"] >= 3.5
+    assert profiler.stages["small"]["traced_peak_mb"] < 1
+
+
+def test_compare_profiles():
+    baseline = {"stages": {
+        "load_enrollment": {"wall_s": 2.0, "cpu_s": 1.0, "peak_rss_mb": 300.0},
+        "compute_variants": {"wall_s": 10.0, "cpu_s": 9.0, "peak_rss_mb": 800.0},
+    }}
+    current = {"stages": {
+        "load_enrollment": {"wall_s": 2.0, "cpu_s": 1.0, "peak_rss_mb": 300.0},
+        "compute_variants": {"wall_s": 4.0, "cpu_s": 3.5, "peak_rss_mb": 500.0},
+        "export": {"wall_s": 1.0, "cpu_s": 0.5},
+    }}
+
+    comparison = compare_profiles(baseline, current)
+
+    assert list(comparison.index) == ["load_enrollment", "compute_variants", "export"]
+    assert comparison.loc["compute_variants", "wall_change_pct"] == -60.0
+    assert comparison.loc["load_enrollment", "wall_change_pct"] == 0.0
+    assert pd.isna(comparison.loc["export", "wall_s_baseline"])
+    assert pd.isna(comparison.loc["export", "peak_rss_mb_current"])
@@ -0,0 +1,96 @@
+"""
+Startup-cost regression checks for the CLI entry points.
+
+Runs each script's --help under `python -X importtime` and fails if a
+heavy dependency (pandas, SQLAlchemy, pyarrow, the ORM models) is imported
+before argument parsing. Module lists are checked rather than timings so
+the tests are stable on slow CI machines.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from infrastructure.database import connection
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+HEAVY_MODULES = {"pandas", "numpy", "pyarrow", "sqlalchemy", "infrastructure.database.models"}
+
+ENTRY_POINTS = [
+    "infrastructure/scripts/analyze/calculate_lct_variants.py",
+    "infrastructure/scripts/utilities/district_lookup.py",
+    "infrastructure/scripts/enrich/enrichment_progress.py",
+    "infrastructure/scripts/verify_enrichment.py",
+]
+
+
+def imported_modules(*args) -> set:
+    """Modules imported by `python -X importtime <args>`."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        cwd=PROJECT_ROOT, capture_output=True, text=True, timeout=60,
+    )
+    modules = set()
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            modules.add(line.rsplit("|", 1)[1].strip())
+    return modules
+
+
+@pytest.mark.parametrize("script", ENTRY_POINTS)
+def test_help_skips_heavy_imports(script):
+    modules = imported_modules(script, "--help")
+
+    assert "argparse" in modules
+    assert not modules & HEAVY_MODULES
+
+
+def test_connection_import_skips_models_and_pandas():
+    modules = imported_modules("-c", "import infrastructure.database.connection")
+
+    assert "sqlalchemy" in modules
+    assert not modules & {"infrastructure.database.models", "pandas"}
+
+
+def test_package_exports_resolve_lazily():
+    import infrastructure.database as database
+    from infrastructure.database.models import District
+
+    assert database.District is District
+    with pytest.raises(AttributeError):
+        database.NotAModel
+
+
+@pytest.fixture
+def docker_checks(monkeypatch):
+    calls = []
+    monkeypatch.setattr(connection, "_check_docker_postgres", lambda: calls.append(1))
+    monkeypatch.setattr(connection, "_docker_check_done", False)
+    monkeypatch.setattr(connection, "_engine", None)
+    monkeypatch.delenv("LCT_CHECK_DOCKER", raising=False)
+    return calls
+
+
+def test_docker_check_deferred_to_failed_connection(docker_checks, tmp_path):
+    engine = connection.get_engine(f"sqlite:///{tmp_path}/ok.db")
+    with engine.connect():
+        pass
+    assert docker_checks == []
+
+    engine = connection.get_engine(f"sqlite:///{tmp_path}/missing/dir/lct.db")
+    for _ in range(2):
+        with pytest.raises(Exception):
+            engine.connect()
+    assert docker_checks == [1]
+
+
+def test_docker_check_opt_in(docker_checks, monkeypatch, tmp_path):
+    monkeypatch.setenv("LCT_CHECK_DOCKER", "1")
+
+    connection.get_engine(f"sqlite:///{tmp_path}/ok.db")
+    connection.get_engine(f"sqlite:///{tmp_path}/ok.db")
+
+    assert docker_checks == [1]
@@ -0,0 +1,177 @@
+"""
+Tests for the benchmark synthetic-data generator and results comparison.
+
+The benchmarks themselves need PostgreSQL; these check that the generated
+tables are deterministic and satisfy the schema's keys and constraints.
+"""
+
+import importlib
+import sys
+
+import pandas as pd
+import pytest
+
+from infrastructure.database.migrations import import_staff_and_enrollment
+from infrastructure.database.migrations.sea_import_utils import StateCrosswalk
+from infrastructure.scripts.benchmark import run_benchmarks
+from infrastructure.scripts.benchmark.fixture_files import DIRECTORY_FILE, write_fixture_files
+from infrastructure.scripts.benchmark.run_benchmarks import (
+    CONFLICT_COLUMNS,
+    IMPORTERS,
+    benchmark_database_url,
+    compare_results,
+    entry_point,
+)
+from infrastructure.scripts.benchmark.synthetic_data import TABLES, district_count, generate
+
+
+@pytest.fixture(scope="module")
+def tables():
+    return generate(districts=2000, seed=7)
+
+
+def test_same_seed_same_data(tables):
+    again = generate(districts=2000, seed=7)
+    for table in TABLES:
+        pd.testing.assert_frame_equal(tables[table], again[table])
+
+    other = generate(districts=2000, seed=8)
+    assert not other["districts"]["enrollment"].equals(tables["districts"]["enrollment"])
+
+
+def test_scale_sets_district_count():
+    assert district_count(5) == 5 * district_count(1)
+    assert len(generate(districts=50)["districts"]) == 50
+
+
+def test_keys_are_unique_and_reference_districts(tables):
+    nces_ids = set(tables["districts"]["nces_id"])
+    assert len(nces_ids) == len(tables["districts"])
+    assert all(len(i) == 7 for i in nces_ids)
+
+    for table, key in CONFLICT_COLUMNS.items():
+        assert not tables[table].duplicated(subset=key).any(), table
+
+    bell = tables["bell_schedules"]
+    assert not bell.duplicated(subset=["district_id", "year", "grade_level"]).any()
+    for table, column in [("staff_counts_effective", "district_id"), ("enrollment_by_grade", "district_id"),
+                          ("sped_estimates", "district_id"), ("bell_schedules", "district_id"),
+                          ("ca_sped_district_environments", "nces_id")]:
+        assert set(tables[table][column]) <= nces_ids, table
+
+
+def test_values_satisfy_check_constraints(tables):
+    bell = tables["bell_schedules"]
+    assert bell["instructional_minutes"].between(100, 600).all()
+    assert set(bell["grade_level"]) <= {"elementary", "middle", "high"}
+
+    ca = tables["ca_sped_district_environments"]
+    assert (tables["districts"].set_index("nces_id").loc[ca["nces_id"], "state"] == "CA").all()
+    assert (ca["cds_code"].str.len() == 7).all()
+
+    for table in ("sped_estimates", "ca_sped_district_environments", "bell_schedules"):
+        assert set(tables[table]["confidence"]) <= {"high", "medium", "low"}
+
+
+def test_staff_scopes_are_nested(tables):
+    staff = tables["staff_counts_effective"]
+    scopes = ["scope_teachers_only", "scope_teachers_core", "scope_instructional",
+              "scope_instructional_plus_support", "scope_all"]
+    for narrow, wide in zip(scopes, scopes[1:]):
+        assert (staff[narrow] <= staff[wide]).all()
+    assert (staff["teachers_k12"] > 0).all()
+
+
+def test_enrollment_totals_add_up(tables):
+    enrollment = tables["enrollment_by_grade"]
+    grades = enrollment.filter(regex=r"enrollment_(kindergarten|grade_\d+)$")
+    assert (grades.sum(axis=1) == enrollment["enrollment_k12"]).all()
+    assert (enrollment["enrollment_elementary"] + enrollment["enrollment_secondary"]
+            == enrollment["enrollment_k12"]).all()
+
+
+@pytest.fixture(scope="module")
+def fixture_paths(tables, tmp_path_factory):
+    pytest.importorskip("openpyxl")
+    return write_fixture_files(tables, tmp_path_factory.mktemp("fixtures"))
+
+
+# Column holding the state district ID in each SEA importer's loaded frames
+SEA_ID_COLUMNS = {
+    "sea_fl": {"load_staff_data": "Dist #", "load_enrollment_data": "District #"},
+    "sea_il": {"load_report_card_data": "RCDTS"},
+    "sea_ma": {"load_teacher_data": "district_code", "load_enrollment_data": "DIST_CODE"},
+    "sea_mi": {"load_staffing_data": "DCODE", "load_enrollment_data": "District Code",
+               "load_special_ed_data": "DCODE.1"},
+    "sea_ny": {"load_staff_data": "STATE_DISTRICT_ID", "load_enrollment_data": "State District Identifier",
+               "load_sped_enrollment_data": "State District Identifier"},
+    "sea_pa": {"load_staffing_data": "AUN", "load_enrollment_data": "AUN"},
+    "sea_va": {"load_enrollment_data": "Division Number", "load_staffing_data": "Division Number",
+               "load_special_ed_data": "Division Number"},
+}
+
+
+def test_sea_fixtures_load_and_resolve_through_crosswalk(tables, fixture_paths):
+    directory = pd.read_csv(fixture_paths["import_all_data"]["NCES_RAW_DIR"] / DIRECTORY_FILE, dtype=str)
+    state_ids = directory["ST_LEAID"].str.split("-", n=1).str[1]
+
+    for importer, loaders in SEA_ID_COLUMNS.items():
+        module = importlib.import_module(IMPORTERS[importer])
+        state = importer[-2:].upper()
+        in_state = directory["ST"] == state
+        crosswalk = StateCrosswalk(state, dict(zip(state_ids[in_state], directory["LEAID"][in_state])))
+
+        with entry_point(module, [], **fixture_paths[importer]):
+            for loader, column in loaders.items():
+                df = getattr(module, loader)()
+                assert df is not None and len(df) > 0, (importer, loader)
+                assert crosswalk.resolve(df[column]).notna().all(), (importer, loader)
+
+
+def test_ccd_fixtures_round_trip_through_loaders(tables, fixture_paths):
+    ccd = fixture_paths["import_staff_and_enrollment"]
+    staff = import_staff_and_enrollment.load_staff_data(ccd["staff_file"], "2023-24")
+    enrollment = import_staff_and_enrollment.load_enrollment_data(ccd["enrollment_file"], "2023-24")
+
+    expected = tables["enrollment_by_grade"].assign(district_id=lambda df: df["district_id"].str.lstrip("0"))
+    merged = enrollment.merge(expected, on="district_id", suffixes=("", "_expected"))
+    assert len(merged) == len(expected)
+    # Subtotal rows are excluded, so counts are not doubled
+    assert (merged["enrollment_k12"] == merged["enrollment_k12_expected"]).all()
+    assert len(staff) == len(tables["districts"])
+
+
+def test_entry_point_restores_module_and_argv(tmp_path):
+    module = importlib.import_module(IMPORTERS["sea_va"])
+    original, argv = module.ENROLLMENT_FILE, sys.argv
+
+    with pytest.raises(RuntimeError):
+        with entry_point(module, ["--year", "2023-24"], ENROLLMENT_FILE=tmp_path / "x.csv"):
+            assert module.ENROLLMENT_FILE == tmp_path / "x.csv"
+            assert sys.argv[1:] == ["--year", "2023-24"]
+            raise RuntimeError
+
+    assert module.ENROLLMENT_FILE == original and sys.argv is argv
+
+
+def test_refuses_main_database(monkeypatch):
+    monkeypatch.setattr(run_benchmarks, "get_database_url", lambda: "postgresql://me@localhost:5432/lct")
+
+    with pytest.raises(ValueError, match="main database"):
+        benchmark_database_url("postgresql://me@localhost:5432/lct")
+    assert benchmark_database_url("postgresql://me@localhost:5432/lct_bench").endswith("lct_bench")
+
+
+def test_compare_results():
+    baseline = {"results": [{"scale": 1, "timings": {"calculate_all_variants": 10.0, "generate": 0.5}}]}
+    current = {"results": [
+        {"scale": 1, "timings": {"calculate_all_variants": 4.0, "export_lct_from_db": 1.0}},
+        {"scale": 5, "timings": {"calculate_all_variants": 20.0}},
+    ]}
+
+    comparison = compare_results(baseline, current)
+
+    assert comparison.to_dict("records") == [{
+        "scale": 1, "scenario": "calculate_all_variants",
+        "baseline_s": 10.0, "current_s": 4.0, "change_pct": -60.0,
+    }]